@@ -6,6 +6,7 @@ This launcher detects the current project structure and either runs the GUI
 or guides you through the organization process.
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -23,10 +24,10 @@ def check_dependencies():
         print("❌ PyQt6 not found")
         missing_deps.append('PyQt6')
 
-    try:
-        import selenium  # noqa: F401
+    # Located, not imported: importing Selenium would delay the window
+    if importlib.util.find_spec("selenium") is not None:
         print("✅ Selenium found")
-    except ImportError:
+    else:
         print("❌ Selenium not found")
         missing_deps.append('selenium')
 
@@ -330,18 +331,22 @@ def check_dependencies():
         missing.append("PyQt6")
         print("❌ PyQt6 not found")
 
-    try:
-        import selenium
+    # Selenium and the browser client are only located here; they are
+    # imported by the sync thread, not before the window shows
+    if importlib.util.find_spec("selenium") is not None:
         print("✅ Selenium found")
-    except ImportError:
+    else:
         missing.append("selenium")
         print("❌ Selenium not found")
 
     try:
-        from poe_search.api.browser_client import PoeApiClient
+        browser_client = importlib.util.find_spec("poe_search.api.browser_client")
+    except ImportError:
+        browser_client = None
+    if browser_client is not None:
         print("✅ Enhanced browser client found")
-    except ImportError as e:
-        print(f"❌ Enhanced browser client not found: {e}")
+    else:
+        print("❌ Enhanced browser client not found")
         missing.append("poe_search.api.browser_client")
 
     return missing
@@ -367,33 +372,50 @@ class ConversationSyncThread:
 
             def run(self):
                 try:
-                    from poe_search.api.browser_client import PoeApiClient
+                    from poe_search.storage.database import Database
+                    from poe_search.sync.daemon import SyncLock, SyncLockError
+                    from poe_search.utils.config import load_config
+
+                    # Same lock as the CLI sync and the daemon: one sync per database
+                    database = Database(load_config().database_url)
+                    lock = SyncLock(database.db_path)
+                    try:
+                        lock.acquire()
+                    except SyncLockError as e:
+                        self.error.emit(f"Sync already running: {e}")
+                        return
 
-                    client = PoeApiClient(
-                        token=self.token,
-                        lat_token=self.lat_token,
-                        headless=self.headless
-                    )
+                    with lock:
+                        self.sync()
 
-                    def progress_callback(message, percentage):
-                        self.progress.emit(message, percentage)
+                except Exception as e:
+                    self.error.emit(str(e))
 
-                    if not client.authenticate(progress_callback):
-                        self.error.emit("Authentication failed. Please check your tokens.")
-                        return
+            def sync(self):
+                from poe_search.api.browser_client import PoeApiClient
 
-                    # Get conversations with categories
-                    conversations = client.get_conversations(
-                        limit=self.limit,
-                        progress_callback=progress_callback
-                    )
+                client = PoeApiClient(
+                    token=self.token,
+                    lat_token=self.lat_token,
+                    headless=self.headless
+                )
 
-                    # Return conversations directly (they now include categories)
-                    self.finished.emit(conversations)
-                    client.close()
+                def progress_callback(message, percentage):
+                    self.progress.emit(message, percentage)
 
-                except Exception as e:
-                    self.error.emit(str(e))
+                if not client.authenticate(progress_callback):
+                    self.error.emit("Authentication failed. Please check your tokens.")
+                    return
+
+                # Get conversations with categories
+                conversations = client.get_conversations(
+                    limit=self.limit,
+                    progress_callback=progress_callback
+                )
+
+                # Return conversations directly (they now include categories)
+                self.finished.emit(conversations)
+                client.close()
 
         self.worker = SyncWorker(token, lat_token, headless, limit)
 
@@ -412,6 +434,8 @@ class FixedLayoutMainWindow:
         )
         from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSettings, QTimer, QSize, QStringListModel
         from PyQt6.QtGui import QFont, QIcon, QAction, QPixmap
+        from poe_search.gui.catalog import ConversationCatalog
+        from poe_search.gui.startup import DeferredTabs
 
         # Store PyQt6 classes
         self.QMainWindow = QMainWindow
@@ -445,9 +469,12 @@ class FixedLayoutMainWindow:
         self.Qt = Qt
         self.QSettings = QSettings
         self.QSize = QSize
+        self.DeferredTabs = DeferredTabs
 
-        # Application state
-        self.conversations = []
+        # Application state: conversations are held once, column by column,
+        # and the list shows rows of the catalog in self.conversation_order
+        self.catalog = ConversationCatalog(defaults={'bot': 'Assistant', 'category': 'General'})
+        self.conversation_order = None
         self.current_conversation = None
         self.loaded_tokens = {}
         self.sync_thread = None
@@ -487,11 +514,13 @@ class FixedLayoutMainWindow:
         self.tab_widget.setMinimumHeight(700)
         main_layout.addWidget(self.tab_widget, 1)  # Give it stretch factor
 
-        # Create tabs
+        # Create tabs: only the first is built before the window shows,
+        # the others when first opened or once the window is interactive
         self.create_conversations_tab()
-        self.create_search_tab()
-        self.create_analytics_tab()
-        self.create_settings_tab()
+        self.deferred_tabs = self.DeferredTabs(self.tab_widget)
+        self.deferred_tabs.add(self.create_search_tab, "🔍 Advanced Search")
+        self.deferred_tabs.add(self.create_analytics_tab, "📊 Analytics")
+        self.deferred_tabs.add(self.create_settings_tab, "⚙️ Settings")
 
         # Status bar (fixed height)
         self.status_bar = self.QStatusBar()
@@ -1058,7 +1087,6 @@ class FixedLayoutMainWindow:
     def create_search_tab(self):
         """Create search tab with proper layout."""
         search_widget = self.QWidget()
-        self.tab_widget.addTab(search_widget, "🔍 Advanced Search")
 
         layout = self.QVBoxLayout(search_widget)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -1144,10 +1172,11 @@ class FixedLayoutMainWindow:
 
         layout.addWidget(results_group, 1)
 
+        return search_widget
+
     def create_analytics_tab(self):
         """Create analytics tab with category support."""
         analytics_widget = self.QWidget()
-        self.tab_widget.addTab(analytics_widget, "📊 Analytics")
 
         layout = self.QVBoxLayout(analytics_widget)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -1215,6 +1244,11 @@ class FixedLayoutMainWindow:
 
         layout.addWidget(content_splitter, 1)
 
+        # Show what was synced before the tab was first opened
+        self.update_analytics()
+
+        return analytics_widget
+
     def create_stat_card(self, icon: str, label: str, value: str):
         """Create a stat card widget."""
         card = self.QFrame()
@@ -1256,7 +1290,6 @@ class FixedLayoutMainWindow:
     def create_settings_tab(self):
         """Create settings tab with proper layout."""
         settings_widget = self.QWidget()
-        self.tab_widget.addTab(settings_widget, "⚙️ Settings")
 
         # Scroll area for settings
         scroll = self.QScrollArea()
@@ -1354,6 +1387,8 @@ class FixedLayoutMainWindow:
         settings_layout.setContentsMargins(0, 0, 0, 0)
         settings_layout.addWidget(scroll)
 
+        return settings_widget
+
     def create_menu_bar(self):
         """Create application menu bar."""
         menubar = self.window.menuBar()
@@ -1387,254 +1422,30 @@ class FixedLayoutMainWindow:
 
     def apply_fixed_styling(self):
         """Apply styling optimized for fixed layouts."""
-        self.window.setStyleSheet("""
-            /* Main Window */
-            QMainWindow {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', sans-serif;
-            }
+        from poe_search.gui.resources.styles import FIXED_LAYOUT
 
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', sans-serif;
-                font-size: 12px;
-            }
+        self.window.setStyleSheet(FIXED_LAYOUT)
 
-            /* Tabs */
-            QTabWidget::pane {
-                border: 1px solid #404040;
-                background-color: #2b2b2b;
-                border-radius: 6px;
-            }
+    def finish_startup(self, timeline=None):
+        """Start the work deferred until the window is interactive."""
+        from poe_search.gui.startup import warm_up_database
 
-            QTabBar::tab {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                padding: 12px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-weight: bold;
-                min-width: 100px;
-            }
-
-            QTabBar::tab:selected {
-                background-color: #0078d4;
-                color: white;
-            }
+        # Only warms the schema and the SQLite page cache; the tabs open
+        # their own connections
+        def database_ready(database, counts):
+            if timeline is not None:
+                timeline.mark("database_ready")
+            logging.info(
+                f"Database ready: {counts['conversations']} conversations, "
+                f"{counts['messages']} messages"
+            )
 
-            QTabBar::tab:hover {
-                background-color: #4a4a4a;
-            }
+        def tabs_built():
+            if timeline is not None:
+                timeline.mark("tabs_built")
 
-            /* Group Boxes */
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #404040;
-                border-radius: 6px;
-                margin-top: 0.5ex;
-                padding-top: 15px;
-                background-color: #2a2a2a;
-                font-size: 13px;
-            }
-
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 8px 0 8px;
-                color: #0078d4;
-                font-weight: bold;
-                background-color: #2a2a2a;
-            }
-
-            /* Input Fields */
-            QLineEdit {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px 10px;
-                font-size: 12px;
-            }
-
-            QLineEdit:focus {
-                border-color: #0078d4;
-                background-color: #404040;
-            }
-
-            QSpinBox {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-            }
-
-            QSpinBox:focus {
-                border-color: #0078d4;
-            }
-
-            /* Buttons */
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 12px;
-                min-width: 60px;
-            }
-
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-
-            QPushButton:disabled {
-                background-color: #404040;
-                color: #888888;
-            }
-
-            /* List Widget */
-            QListWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                font-size: 12px;
-                alternate-background-color: #323232;
-            }
-
-            QListWidget::item {
-                padding: 10px;
-                border-bottom: 1px solid #3a3a3a;
-                margin: 1px;
-            }
-
-            QListWidget::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-
-            QListWidget::item:hover {
-                background-color: #404040;
-            }
-
-            /* Text Browser */
-            QTextBrowser {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 15px;
-                font-size: 13px;
-                line-height: 1.5;
-            }
-
-            /* Progress Bar */
-            QProgressBar {
-                border: 1px solid #404040;
-                border-radius: 4px;
-                text-align: center;
-                font-weight: bold;
-                background-color: #2a2a2a;
-                color: #ffffff;
-                font-size: 11px;
-            }
-
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                border-radius: 3px;
-            }
-
-            /* Status Bar */
-            QStatusBar {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border-top: 1px solid #404040;
-                font-size: 11px;
-            }
-
-            /* Menu Bar */
-            QMenuBar {
-                background-color: #2a2a2a;
-                color: #ffffff;
-                border-bottom: 1px solid #404040;
-                font-size: 12px;
-            }
-
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 8px 12px;
-                border-radius: 3px;
-            }
-
-            QMenuBar::item:selected {
-                background-color: #0078d4;
-            }
-
-            /* Checkboxes */
-            QCheckBox {
-                spacing: 8px;
-                font-size: 12px;
-            }
-
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                background-color: #3c3c3c;
-            }
-
-            QCheckBox::indicator:checked {
-                background-color: #0078d4;
-                border-color: #0078d4;
-            }
-
-            /* Splitter */
-            QSplitter::handle {
-                background-color: #404040;
-                border-radius: 2px;
-            }
-
-            QSplitter::handle:horizontal {
-                width: 3px;
-            }
-
-            QSplitter::handle:hover {
-                background-color: #0078d4;
-            }
-
-            /* Scroll Area */
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-
-            QScrollBar:vertical {
-                background-color: #2a2a2a;
-                width: 10px;
-                border-radius: 5px;
-            }
-
-            QScrollBar::handle:vertical {
-                background-color: #555555;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-
-            QScrollBar::handle:vertical:hover {
-                background-color: #0078d4;
-            }
-        """)
+        warm_up_database(on_ready=database_ready)
+        self.deferred_tabs.build_when_idle(on_done=tabs_built)
 
     # Event handlers and core functionality
 
@@ -1787,7 +1598,8 @@ class FixedLayoutMainWindow:
         logging.info(f"Received {len(conversations)} conversations from browser client")
 
         # Store conversations directly (they're already in the right format with categories)
-        self.conversations = conversations
+        self.catalog.load(conversations)
+        self.conversation_order = None
 
         # Debug: Print first conversation to verify structure
         if conversations:
@@ -1840,13 +1652,8 @@ class FixedLayoutMainWindow:
 
         current_selection = self.category_filter.currentText()
 
-        # Extract unique categories from conversations
-        categories = set()
-        for conv in self.conversations:
-            if isinstance(conv, dict):
-                categories.add(conv.get('category', 'General'))
-            else:
-                categories.add(getattr(conv, 'category', 'General'))
+        # Unique categories, from the catalog's category column
+        categories = set(self.catalog.counts('category'))
 
         self.category_filter.clear()
         self.category_filter.addItem("All Categories")
@@ -1867,34 +1674,22 @@ class FixedLayoutMainWindow:
         bot_filter = self.bot_filter.currentText() if hasattr(self, 'bot_filter') else "All Bots"
         category_filter = self.category_filter.currentText() if hasattr(self, 'category_filter') else "All Categories"
 
-        # Filter conversations
-        filtered_conversations = []
-
-        for conv in self.conversations:
-            # Extract data safely
-            if isinstance(conv, dict):
-                title = conv.get('title', '').lower()
-                bot = conv.get('bot', 'Assistant')
-                category = conv.get('category', 'General')
-            else:
-                title = getattr(conv, 'title', '').lower()
-                bot = getattr(conv, 'bot', 'Assistant')
-                category = getattr(conv, 'category', 'General')
-
-            # Apply filters
-            if search_text and search_text not in title:
-                continue
-
-            if bot_filter != "All Bots" and f"🤖 {bot}" != bot_filter:
-                continue
-
-            if category_filter != "All Categories" and f"📂 {category}" != category_filter:
-                continue
-
-            filtered_conversations.append(conv)
+        # Filter conversations (rows of the catalog, in display order)
+        rows = self.catalog.select(
+            bot=bot_filter.replace("🤖 ", "", 1) if bot_filter != "All Bots" else None,
+            category=category_filter.replace("📂 ", "", 1) if category_filter != "All Categories" else None,
+            title=search_text or None,
+            rows=self.conversation_rows(),
+        )
 
         # Update display
-        self.display_filtered_conversations(filtered_conversations)
+        self.display_filtered_conversations(self.catalog.view(rows))
+
+    def conversation_rows(self):
+        """Catalog rows in display order."""
+        if self.conversation_order is None:
+            return range(len(self.catalog))
+        return self.conversation_order
 
     def display_filtered_conversations(self, conversations):
         """Display filtered conversations in the list."""
@@ -1949,7 +1744,7 @@ class FixedLayoutMainWindow:
     def update_filter_stats(self, filtered_count: int):
         """Update stats to show filtered results."""
         if hasattr(self, 'list_stats'):
-            total_count = len(self.conversations)
+            total_count = len(self.catalog)
             if filtered_count == total_count:
                 self.list_stats.setText(f"📊 {total_count} conversations")
             else:
@@ -1963,16 +1758,16 @@ class FixedLayoutMainWindow:
 
         self.conversation_list.clear()
 
-        if not self.conversations:
+        if not len(self.catalog):
             # Add helpful message when no conversations
             item = self.QListWidgetItem("📭 No conversations loaded yet.\n\nClick '🚀 Enhanced Sync' to fetch your conversations from Poe.com")
             item.setData(self.Qt.ItemDataRole.UserRole, None)
             self.conversation_list.addItem(item)
             return
 
-        logging.info(f"Populating list with {len(self.conversations)} conversations")
+        logging.info(f"Populating list with {len(self.catalog)} conversations")
 
-        for i, conv in enumerate(self.conversations):
+        for i, conv in enumerate(self.catalog.view(self.conversation_rows())):
             try:
                 item = self.QListWidgetItem()
 
@@ -2017,13 +1812,8 @@ class FixedLayoutMainWindow:
 
         current_selection = self.bot_filter.currentText()
 
-        # Extract unique bots from conversations
-        bots = set()
-        for conv in self.conversations:
-            if isinstance(conv, dict):
-                bots.add(conv.get('bot', 'Assistant'))
-            else:
-                bots.add(getattr(conv, 'bot', 'Assistant'))
+        # Unique bots, from the catalog's bot column
+        bots = set(self.catalog.counts('bot'))
 
         self.bot_filter.clear()
         self.bot_filter.addItem("All Bots")
@@ -2036,24 +1826,16 @@ class FixedLayoutMainWindow:
 
     def update_analytics(self):
         """Update analytics with category information."""
-        if not self.conversations:
+        if not len(self.catalog):
             return
 
         # Basic stats
-        total_conversations = len(self.conversations)
-        total_messages = sum(len(conv.get('messages', [])) if isinstance(conv, dict) else len(getattr(conv, 'messages', [])) for conv in self.conversations)
+        total_conversations = len(self.catalog)
+        total_messages = sum(len(conv.get('messages', [])) if isinstance(conv, dict) else len(getattr(conv, 'messages', [])) for conv in self.catalog.view())
 
-        # Bot analysis
-        bots = {}
-        for conv in self.conversations:
-            bot = conv.get('bot', 'Assistant') if isinstance(conv, dict) else getattr(conv, 'bot', 'Assistant')
-            bots[bot] = bots.get(bot, 0) + 1
-
-        # Category analysis (NEW)
-        categories = {}
-        for conv in self.conversations:
-            category = conv.get('category', 'General') if isinstance(conv, dict) else getattr(conv, 'category', 'General')
-            categories[category] = categories.get(category, 0) + 1
+        # Bot and category analysis, counted on the encoded columns
+        bots = self.catalog.counts('bot')
+        categories = self.catalog.counts('category')
 
         # Update overview cards
         if hasattr(self, 'total_conv_card'):
@@ -2084,7 +1866,7 @@ class FixedLayoutMainWindow:
     def update_stats(self):
         """Update header stats display."""
         if hasattr(self, 'stats_label'):
-            self.stats_label.setText(f"📊 {len(self.conversations)} conversations")
+            self.stats_label.setText(f"📊 {len(self.catalog)} conversations")
 
     # Essential functionality implementations
     def save_current_tokens(self):
@@ -2195,22 +1977,24 @@ class FixedLayoutMainWindow:
 
     def sort_conversations(self):
         """Sort conversations based on selected criteria."""
-        if not self.conversations:
+        if not len(self.catalog):
             return
 
         sort_option = self.sort_combo.currentText()
+        rows = self.conversation_rows()
 
         try:
+            # Only the row order changes; the catalog is not copied
             if "Date (Newest)" in sort_option:
-                self.conversations.sort(key=lambda x: x.get('extracted_at', ''), reverse=True)
+                self.conversation_order = self.catalog.sort(rows, lambda x: x.get('extracted_at', ''), descending=True)
             elif "Date (Oldest)" in sort_option:
-                self.conversations.sort(key=lambda x: x.get('extracted_at', ''))
+                self.conversation_order = self.catalog.sort(rows, lambda x: x.get('extracted_at', ''))
             elif "Title (A-Z)" in sort_option:
-                self.conversations.sort(key=lambda x: x.get('title', '').lower())
+                self.conversation_order = self.catalog.sort(rows, lambda x: x.get('title', '').lower())
             elif "Messages (Most)" in sort_option:
-                self.conversations.sort(key=lambda x: len(x.get('messages', [])), reverse=True)
+                self.conversation_order = self.catalog.sort(rows, lambda x: len(x.get('messages', [])), descending=True)
             elif "Category (A-Z)" in sort_option:
-                self.conversations.sort(key=lambda x: x.get('category', 'General').lower())
+                self.conversation_order = self.catalog.sort(rows, lambda x: x.get('category', 'General').lower())
 
             # Refresh the display
             self.populate_conversation_list()
@@ -2297,6 +2081,9 @@ class FixedLayoutMainWindow:
 def main():
     """Main function with fixed layout GUI."""
     try:
+        from poe_search.gui.startup import StartupTimeline
+
+        timeline = StartupTimeline("Launcher")
         print("🚀 Starting Poe Search GUI v1.3 (Fixed Layout with Categories)...")
         setup_logging()
 
@@ -2304,6 +2091,7 @@ def main():
         if missing:
             print(f"❌ Missing dependencies: {missing}")
             return 1
+        timeline.mark("dependencies")
 
         tokens = load_poe_tokens()
         if tokens.get('p-b'):
@@ -2320,11 +2108,14 @@ def main():
 
         font = QFont("Segoe UI", 9)
         app.setFont(font)
+        timeline.mark("application")
 
         print("✅ Creating fixed layout GUI with categories...")
 
         main_window = FixedLayoutMainWindow()
         window = main_window.create_window()
+        timeline.mark("window")
+        timeline.watch(window, on_interactive=lambda: main_window.finish_startup(timeline))
         window.show()
 
         print("🎉 Fixed layout GUI with categories launched successfully!")
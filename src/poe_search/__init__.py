@@ -1,2 +1,13 @@
 """Poe Search package."""
 __version__ = "1.3.0"
+
+__all__ = ["PoeSearchClient", "__version__"]
+
+
+def __getattr__(name):
+    # Resolved lazily so that ``import poe_search`` stays cheap and does not
+    # pull in the browser client and storage layers.
+    if name == "PoeSearchClient":
+        from poe_search.client import PoeSearchClient
+        return PoeSearchClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
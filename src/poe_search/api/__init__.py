@@ -4,6 +4,13 @@ Poe Search API Module
 This module provides API clients for interacting with Poe.com
 """
 
-from .browser_client import PoeApiClient
-
 __all__ = ['PoeApiClient']
+
+
+def __getattr__(name):
+    # Resolved lazily so that importing lightweight submodules such as
+    # ``poe_search.api.waits`` does not require Selenium.
+    if name == 'PoeApiClient':
+        from .clients.browser_client import PoeApiClient
+        return PoeApiClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
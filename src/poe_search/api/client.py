@@ -17,19 +17,21 @@ from pathlib import Path
 try:
     from selenium import webdriver
     from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options as ChromeOptions
     from selenium.webdriver.firefox.options import Options as FirefoxOptions
     from selenium.webdriver.common.action_chains import ActionChains
     from selenium.common.exceptions import (
-        TimeoutException, NoSuchElementException, 
+        NoSuchElementException,
         WebDriverException, ElementClickInterceptedException
     )
     SELENIUM_AVAILABLE = True
 except ImportError:
     SELENIUM_AVAILABLE = False
 
+from .extraction import DomExtractor, chat_urls_from_source
+from .network_capture import GraphQLCapture
+from .waits import StepTimings, WaitStrategy
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -103,9 +105,18 @@ class PoeAPIClient:
         lat_token: Optional[str] = None,
         formkey_token: Optional[str] = None,
         headless: bool = True,
-        browser: str = "chrome"
+        browser: str = "chrome",
+        capture_network: bool = False,
+        request_delay: float = 1.0
     ):
-        """Initialize the Poe client with real browser automation"""
+        """Initialize the Poe client with real browser automation.
+
+        With ``capture_network`` (Chrome only) conversation details are read
+        from the page's gql_POST responses via CDP network logging, keeping
+        Poe's real message IDs and timestamps; DOM scraping is the fallback.
+        ``request_delay`` is the pause in seconds between conversation
+        fetches in :meth:`get_conversations`, Poe's rate limit.
+        """
         if not SELENIUM_AVAILABLE:
             raise ImportError("Selenium is required for Poe integration. Install with: pip install selenium")
 
@@ -114,7 +125,13 @@ class PoeAPIClient:
         self.formkey_token = formkey_token
         self.headless = headless
         self.browser = browser
+        self.capture_network = capture_network
+        self.request_delay = request_delay
+        self.capture: Optional[GraphQLCapture] = None
         self.driver = None
+        self.waits: Optional[WaitStrategy] = None
+        self.extractor: Optional[DomExtractor] = None
+        self.timings = StepTimings()
         self.conversations: List[Conversation] = []
 
         # Rate limiting
@@ -150,6 +167,8 @@ class PoeAPIClient:
                     "profile.managed_default_content_settings.images": 1
                 }
                 options.add_experimental_option("prefs", prefs)
+                # CDP performance log drives the network-idle wait
+                options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
                 self.driver = webdriver.Chrome(options=options)
             elif self.browser.lower() == "firefox":
                 options = FirefoxOptions()
@@ -167,8 +186,18 @@ class PoeAPIClient:
                     "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
                 )
 
-            self.driver.implicitly_wait(15)
+            # Explicit event-driven waits replace implicit waits, which would
+            # otherwise stall every find_elements() that matches nothing
+            self.driver.implicitly_wait(0)
             self.driver.set_page_load_timeout(30)
+            self.waits = WaitStrategy(self.driver, timings=self.timings)
+            self.extractor = DomExtractor(self.driver, timings=self.timings)
+            if self.capture_network and self.browser.lower() == "chrome":
+                self.capture = GraphQLCapture(self.driver)
+                if self.capture.enable():
+                    self.capture.attach(self.waits)
+                else:
+                    self.capture = None
             logger.info(f"Successfully initialized {self.browser} driver")
             return self.driver
 
@@ -197,15 +226,12 @@ class PoeAPIClient:
             logger.warning("Could not auto-extract formkey; consider supplying it manually")
 
     def _scroll_to_bottom(self, pause: float = 1.0, max_loops: int = 5):
-        """Scroll to bottom to lazy-load all conversations."""
-        last_h = self.driver.execute_script("return document.body.scrollHeight")
-        for _ in range(max_loops):
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(pause)
-            new_h = self.driver.execute_script("return document.body.scrollHeight")
-            if new_h == last_h:
-                break
-            last_h = new_h
+        """Scroll to bottom to lazy-load all conversations.
+
+        ``pause`` is the maximum time to wait for new content after each
+        scroll; the loop moves on as soon as the page height grows.
+        """
+        self.waits.scroll_until_stable(max_loops=max_loops, step_timeout=pause)
 
     def connect(self, progress_callback: Optional[Callable[[str, int], None]] = None) -> bool:
         """Enhanced connection method with proven authentication"""
@@ -217,7 +243,7 @@ class PoeAPIClient:
                 progress_callback("Connecting to Poe.com...", 10)
             logger.info("Connecting to Poe.com...")
             self.driver.get("https://poe.com")
-            time.sleep(2)
+            self.waits.document_ready()
 
             if not self.formkey_token:
                 # Attempt to auto-extract formkey before setting cookies
@@ -253,7 +279,6 @@ class PoeAPIClient:
                 progress_callback("Verifying authentication...", 50)
             logger.info("Navigating to chats page...")
             self.driver.get("https://poe.com/chats")
-            time.sleep(5)
 
             # Check for auth indicators
             auth_indicators = [
@@ -261,6 +286,7 @@ class PoeAPIClient:
                 "[data-testid*='chat']",
                 "main[role='main']",
             ]
+            self.waits.page_loaded(auth_indicators, timeout=15)
             authenticated = False
             for sel in auth_indicators:
                 if self.driver.find_elements(By.CSS_SELECTOR, sel):
@@ -303,91 +329,71 @@ class PoeAPIClient:
         # Ensure on chats page
         if "/chats" not in self.driver.current_url:
             self.driver.get("https://poe.com/chats")
-            time.sleep(3)
+            self.waits.page_loaded(["a[href*='/chat/']"], timeout=15)
 
         # lazy-load all entries
         self._scroll_to_bottom()
 
         conversations: List[Dict[str, Any]] = []
+        seen_urls = set()
 
-        # Method 1: direct links
+        # Methods 1 & 2: direct links and chat containers, read in a single
+        # script round trip instead of per-element WebDriver calls
         selectors = [
             "a[href*='/chat/']",
             "a[href*='/conversation/']",
             "[data-testid*='chat'] a",
             "[data-testid*='conversation'] a"
         ]
-        for sel in selectors:
-            elements = self.driver.find_elements(By.CSS_SELECTOR, sel)
-            for elem in elements:
-                href = elem.get_attribute('href')
-                if not href or not ('/chat/' in href or '/conversation/' in href):
-                    continue
-                title = (elem.text.strip()
-                         or elem.get_attribute('title')
-                         or elem.get_attribute('aria-label')
-                         or "Untitled Conversation")
-                if not any(c['url'] == href for c in conversations):
-                    conversations.append({
-                        'url': href,
-                        'title': title[:100],
-                        'id': self._extract_conversation_id(href),
-                        'method': f'direct-{sel}'
-                    })
-
-        # Method 2: container detection
         container_selectors = [
             "[data-testid*='chat']",
             "[class*='chat']",
             "[class*='Chat']",
             "[class*='conversation']"
         ]
-        for sel in container_selectors:
-            elements = self.driver.find_elements(By.CSS_SELECTOR, sel)
-            for elem in elements:
-                links = elem.find_elements(By.TAG_NAME, 'a')
-                href = None
-                for link in links:
-                    link_href = link.get_attribute('href')
-                    if link_href and '/chat/' in link_href:
-                        href = link_href
-                        break
-                if href and not any(c['url'] == href for c in conversations):
-                    title = elem.text.strip()[:100] or "Container Conversation"
-                    conversations.append({
-                        'url': href,
-                        'title': title,
-                        'id': self._extract_conversation_id(href),
-                        'method': f'container-{sel}'
-                    })
+        records = self.extractor.elements(
+            selectors + container_selectors, container_link="a[href*='/chat/']"
+        )
+        direct = [r for r in records if r['s'] < len(selectors)]
+        containers = [r for r in records if r['s'] >= len(selectors)]
+        for rec in direct:
+            href = rec['href']
+            if not href or not ('/chat/' in href or '/conversation/' in href):
+                continue
+            if href in seen_urls:
+                continue
+            seen_urls.add(href)
+            title = rec['text'] or rec['title'] or rec['aria'] or "Untitled Conversation"
+            conversations.append({
+                'url': href,
+                'title': title[:100],
+                'id': self._extract_conversation_id(href),
+                'method': f"direct-{selectors[rec['s']]}"
+            })
+        for rec in containers:
+            href = rec['link']
+            if not href or href in seen_urls:
+                continue
+            seen_urls.add(href)
+            conversations.append({
+                'url': href,
+                'title': rec['text'][:100] or "Container Conversation",
+                'id': self._extract_conversation_id(href),
+                'method': f"container-{container_selectors[rec['s'] - len(selectors)]}"
+            })
 
         # Method 3: source analysis fallback
-        page_src = self.driver.page_source
-        patterns = [r'href="([^"]*\/chat\/[^"]*)"', r'"url":"([^"]*\/chat\/[^"]*)"', r'\/chat\/([A-Za-z0-9_-]+)']
-        for pat in patterns:
-            matches = re.findall(pat, page_src)
-            for m in matches:
-                if m.startswith("http"):
-                    url = m
-                else:
-                    url = f"https://poe.com{m}"
-                if not any(c['url'] == url for c in conversations):
-                    conversations.append({
-                        'url': url,
-                        'title': url.split("/")[-1],
-                        'id': self._extract_conversation_id(url),
-                        'method': f'source-{pat}'
-                    })
-
-        # Dedupe & limit & sort
-        seen = set()
-        unique = []
-        for c in conversations:
-            if c['url'] not in seen:
-                seen.add(c['url'])
-                unique.append(c)
-                if len(unique) >= limit:
-                    break
+        patterns = [r'href="([^"]*\/chat\/[^"]*)"', r'"url":"([^"]*\/chat\/[^"]*)"', r'(\/chat\/[A-Za-z0-9_-]+)']
+        for url, pat in chat_urls_from_source(self.driver.page_source, patterns, seen_urls):
+            conversations.append({
+                'url': url,
+                'title': url.split("/")[-1],
+                'id': self._extract_conversation_id(url),
+                'method': f'source-{pat}'
+            })
+
+        # Limit & sort (entries are already unique by URL)
+        unique = conversations[:limit]
         unique.sort(key=lambda x: x['title'].lower())
 
         if progress_callback:
@@ -395,6 +401,35 @@ class PoeAPIClient:
         logger.info(f"✅ Found {len(unique)} unique conversations")
         return unique
 
+    def _get_captured_conversation(self, conversation_url: str) -> Optional[Conversation]:
+        """Build a Conversation from captured GraphQL responses, if any."""
+        self.waits.network_idle(timeout=10)
+        self.capture.poll()
+        conv_id = self._extract_conversation_id(conversation_url)
+        data = self.capture.get_conversation(conv_id)
+        if not data or not data['messages']:
+            return None
+        now = datetime.now()
+        messages = [
+            Message(
+                role="user" if m['role'] == "user" else "assistant",
+                content=m['content'],
+                timestamp=datetime.fromisoformat(m['timestamp']) if m['timestamp'] else now,
+                bot_name=m['bot'],
+                message_id=m['id']
+            )
+            for m in data['messages']
+        ]
+        return Conversation(
+            id=conv_id,
+            title=data['title'],
+            bot=data['bot'],
+            messages=messages,
+            created_at=datetime.fromisoformat(data['created_at']) if data.get('created_at') else messages[0].timestamp,
+            updated_at=datetime.fromisoformat(data['updated_at']) if data.get('updated_at') else messages[-1].timestamp,
+            url=conversation_url
+        )
+
     def _extract_conversation_id(self, url: str) -> str:
         m = re.search(r'/(?:chat|conversation)/([A-Za-z0-9_-]+)', url)
         return m.group(1) if m else url.split("/")[-1]
@@ -415,67 +450,59 @@ class PoeAPIClient:
                 progress_callback("Loading conversation...", 10)
             logger.info(f"Fetching conversation: {conversation_url}")
             self.driver.get(conversation_url)
-            time.sleep(4)
 
             if progress_callback:
                 progress_callback("Analyzing conversation structure...", 30)
-            try:
-                WebDriverWait(self.driver, 20).until(
-                    EC.any_of(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "[class*='message']")),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid*='message']")),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "article"))
-                    )
-                )
-            except TimeoutException:
+            loaded = self.waits.page_loaded(
+                ["[class*='message']", "[data-testid*='message']", "article"],
+                timeout=20,
+            )
+            if not loaded:
                 logger.warning("Conversation content didn't load in time")
 
+            if self.capture:
+                conv = self._get_captured_conversation(conversation_url)
+                if conv:
+                    if progress_callback:
+                        progress_callback("Conversation extracted!", 100)
+                    logger.info(f"✅ Captured conversation '{conv.title}' from network responses")
+                    return conv
+
+            # Title, bot name and messages in one script round trip
+            page = self.extractor.page(
+                message_selectors=["[class*='message'],[data-testid*='message']"],
+                title_selectors=["h1", "[class*='title']", "[data-testid*='title']", "title"],
+                bot_selectors=["[class*='bot']", "[data-testid*='bot']"],
+                min_length=4,
+                bot_name_length=(4, 49),
+                user_indicators=["user", "you", "me", "question"],
+                assistant_indicators=["bot", "assistant", "ai", "response"],
+            )
+
             # Title detection
             title = "Untitled Conversation"
-            for sel in ["h1","[class*='title']","[data-testid*='title']","title"]:
-                try:
-                    elem = self.driver.find_element(By.CSS_SELECTOR, sel)
-                    txt = elem.text.strip()
-                    if txt and "Poe" not in txt:
-                        title = txt
-                        break
-                except:
-                    continue
+            for txt in page['titles']:
+                if txt and "Poe" not in txt:
+                    title = txt
+                    break
             if title == "Untitled Conversation":
-                page_title = self.driver.title
+                page_title = page['pageTitle']
                 if page_title and "Poe" not in page_title:
                     title = page_title
 
             # Bot name detection
-            bot_name = "Assistant"
-            for pat in ["[class*='bot']","[data-testid*='bot']"]:
-                elems = self.driver.find_elements(By.CSS_SELECTOR, pat)
-                for el in elems:
-                    txt = el.text.strip()
-                    if 3 < len(txt) < 50:
-                        bot_name = txt
-                        break
-                if bot_name != "Assistant":
-                    break
+            bot_name = page['bot'] or "Assistant"
 
             if progress_callback:
                 progress_callback("Extracting messages...", 70)
 
             # Message extraction
             messages: List[Message] = []
-            # Try standard selectors
-            elems = self.driver.find_elements(By.CSS_SELECTOR, "[class*='message'],[data-testid*='message']")
+            elems = page['messages']
             for i, elem in enumerate(elems):
-                txt = elem.text.strip()
-                if not txt or len(txt) < 5:
-                    continue
+                txt = elem['text']
                 # Heuristic role
-                role = "assistant"
-                cls_html = elem.get_attribute('class') + elem.get_attribute('outerHTML')
-                if any(u in cls_html.lower() for u in ["user","you","me","question"]):
-                    role = "user"
-                elif any(a in cls_html.lower() for a in ["bot","assistant","ai","response"]):
-                    role = "assistant"
+                role = elem['hint'] or "assistant"
                 # Alternate if ambiguous
                 if i % 2 == 0:
                     role = "user"
@@ -506,6 +533,7 @@ class PoeAPIClient:
             if progress_callback:
                 progress_callback("Conversation extracted!", 100)
             logger.info(f"✅ Extracted conversation '{title}'")
+            logger.debug(f"Scrape timings so far: {self.timings.summary()}")
             return conv
 
         except Exception as e:
@@ -538,11 +566,15 @@ class PoeAPIClient:
             conv = self.get_conversation_details(info['url'])
             if conv:
                 result.append(conv)
-            if i < total - 1:
-                time.sleep(1)
+            # Page-condition waits don't pace requests; this delay does
+            if i < total - 1 and self.request_delay > 0:
+                time.sleep(self.request_delay)
         if progress_callback:
             progress_callback(f"Complete! Retrieved {len(result)} conversations", 100)
-        logger.info(f"✅ Successfully retrieved {len(result)} conversations")
+        logger.info(
+            f"✅ Successfully retrieved {len(result)} conversations "
+            f"({self.timings.total():.1f}s waiting on page conditions)"
+        )
         self.conversations = result
         return result
 
@@ -556,6 +588,9 @@ class PoeAPIClient:
                 logger.warning(f"Error closing driver: {e}")
             finally:
                 self.driver = None
+                self.waits = None
+                self.extractor = None
+                self.capture = None
 
     def __enter__(self):
         return self
@@ -46,12 +46,9 @@ from pathlib import Path
 # Selenium imports
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
-    TimeoutException,
     NoSuchElementException,
     WebDriverException,
     ElementClickInterceptedException
@@ -65,9 +62,46 @@ except ImportError:
     WEBDRIVER_MANAGER_AVAILABLE = False
     logging.warning("webdriver-manager not available. Please ensure chromedriver is in PATH.")
 
+from poe_search.api.extraction import DomExtractor, dedupe_by
+from poe_search.api.network_capture import GraphQLCapture
+from poe_search.api.waits import StepTimings, WaitStrategy
+from poe_search.search.keywords import KeywordMatcher
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Keywords of the title-based GUI categories, in order of precedence
+_CATEGORY_KEYWORDS = {
+    # Technical/Programming categories
+    "Technical": [
+        'code', 'programming', 'python', 'javascript', 'html', 'css',
+        'api', 'database', 'sql', 'git', 'github', 'debug', 'error',
+        'function', 'algorithm', 'data structure', 'software',
+        'development'
+    ],
+    # Creative categories
+    "Creative": [
+        'write', 'story', 'poem', 'creative', 'art', 'design', 'music',
+        'drawing', 'painting', 'novel', 'character', 'plot', 'narrative'
+    ],
+    # Educational categories
+    "Educational": [
+        'learn', 'study', 'explain', 'teach', 'lesson', 'homework',
+        'assignment', 'research', 'analysis', 'definition', 'concept'
+    ],
+    # Business categories
+    "Business": [
+        'business', 'marketing', 'sales', 'strategy', 'management',
+        'finance', 'budget', 'proposal', 'meeting', 'presentation'
+    ],
+    # Science categories
+    "Science": [
+        'science', 'physics', 'chemistry', 'biology', 'math', 'formula',
+        'experiment', 'hypothesis', 'theory', 'research', 'data'
+    ],
+}
+_CATEGORY_MATCHER = KeywordMatcher(_CATEGORY_KEYWORDS)
+
 
 class PoeApiClient:
     """
@@ -89,7 +123,8 @@ class PoeApiClient:
         ...     print(f"Title: {conv['title']}, Bot: {conv['bot']}")
     """
 
-    def __init__(self, token: str = None, lat_token: str = None, headless: bool = True):
+    def __init__(self, token: str = None, lat_token: str = None, headless: bool = True,
+                 capture_network: bool = False):
         """
         Initialize the Poe API client.
 
@@ -100,6 +135,10 @@ class PoeApiClient:
                                      Improves authentication reliability.
             headless (bool): Run browser in headless mode. Defaults to True.
                            Set to False for debugging or manual intervention.
+            capture_network (bool): Read conversations and messages from the
+                           page's gql_POST responses via Chrome DevTools
+                           Protocol network logging, falling back to DOM
+                           scraping when nothing was captured. Defaults to False.
 
         Raises:
             WebDriverException: If browser setup fails
@@ -108,7 +147,12 @@ class PoeApiClient:
         self.token = token
         self.lat_token = lat_token
         self.headless = headless
+        self.capture_network = capture_network
+        self.capture: Optional[GraphQLCapture] = None
         self.driver = None
+        self.waits: Optional[WaitStrategy] = None
+        self.extractor: Optional[DomExtractor] = None
+        self.timings = StepTimings()
         self.authenticated = False
 
         # Rate limiting
@@ -160,6 +204,9 @@ class PoeApiClient:
             }
             chrome_options.add_experimental_option("prefs", prefs)
 
+            # CDP performance log drives the network-idle wait
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
             # Initialize driver
             if WEBDRIVER_MANAGER_AVAILABLE:
                 service = webdriver.chrome.service.Service(ChromeDriverManager().install())
@@ -173,9 +220,21 @@ class PoeApiClient:
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             )
 
-            # Set timeouts
-            self.driver.implicitly_wait(10)
+            # Set timeouts. Implicit waits stay off: every find_elements()
+            # that matched nothing would otherwise block for the full timeout.
+            # Page readiness is handled by the explicit WaitStrategy instead.
+            self.driver.implicitly_wait(0)
             self.driver.set_page_load_timeout(30)
+            self.waits = WaitStrategy(self.driver, timings=self.timings)
+            self.extractor = DomExtractor(self.driver, timings=self.timings)
+
+            if self.capture_network:
+                self.capture = GraphQLCapture(self.driver)
+                if self.capture.enable():
+                    self.capture.attach(self.waits)
+                    logger.info("📡 GraphQL network capture enabled")
+                else:
+                    self.capture = None
 
             logger.info("✅ Browser setup completed successfully")
 
@@ -231,7 +290,7 @@ class PoeApiClient:
 
             logger.info("🌐 Navigating to Poe.com...")
             self.driver.get("https://poe.com")
-            time.sleep(2)
+            self.waits.document_ready()
 
             if self.token:
                 if progress_callback:
@@ -266,7 +325,7 @@ class PoeApiClient:
                     progress_callback("Verifying authentication...", 60)
 
                 self.driver.refresh()
-                time.sleep(3)
+                self.waits.document_ready()
 
             else:
                 # Manual login required
@@ -282,7 +341,6 @@ class PoeApiClient:
 
             # Navigate to chats page to verify access
             self.driver.get("https://poe.com/chats")
-            time.sleep(3)
 
             # Check for authentication indicators
             auth_indicators = [
@@ -292,6 +350,10 @@ class PoeApiClient:
                 "nav",
                 "[class*='App']"
             ]
+            self.waits.page_loaded(
+                auth_indicators + ["input[type='email']", "input[type='password']"],
+                timeout=15
+            )
 
             authenticated = False
             for indicator in auth_indicators:
@@ -386,18 +448,28 @@ class PoeApiClient:
             # Navigate to main Poe page first, then to chats
             logger.info("🌐 Navigating to Poe.com main page...")
             self.driver.get("https://poe.com")
-            time.sleep(3)
+            self.waits.document_ready()
 
             # Now go to chats page
             logger.info("🌐 Navigating to chats page...")
             self.driver.get("https://poe.com/chats")
-            time.sleep(8)  # Longer wait to ensure page loads
+            # Wait for the chat list to render and the sidebar requests to finish
+            self.waits.page_loaded(["a[href*='/chat/']", "a[href*='/c/']"], timeout=20)
+            self.waits.network_idle(timeout=10)
 
             # Debug: Check what's on the page
-            page_source = self.driver.page_source
             logger.info(f"Page title: {self.driver.title}")
             logger.info(f"Current URL: {self.driver.current_url}")
 
+            if self.capture:
+                captured = self._get_captured_conversations(limit)
+                if captured:
+                    if progress_callback:
+                        progress_callback("Extraction complete!", 100)
+                    logger.info(f"✅ Captured {len(captured)} conversations from network responses")
+                    return captured
+                logger.info("No GraphQL chat data captured, falling back to DOM extraction")
+
             conversations = []
 
             # Try multiple selectors that are commonly used in Poe
@@ -413,96 +485,88 @@ class PoeApiClient:
             ]
 
             total_found = 0
+            seen_ids = set()
+
+            skip_texts = [
+                'sign in', 'log in', 'sign up', 'menu', 'settings',
+                'help', 'home', 'back', 'next', 'previous', 'search',
+                'explore', 'create', 'view all', 'bots and apps',
+                'upgrade', 'creators', 'profile', 'download', 'feedback',
+                'terms', 'privacy', 'about', 'contact', 'support'
+            ]
+            skip_url_patterns = [
+                '/explore', '/create', '/settings', '/profile',
+                '/help', '/terms', '/privacy', '/chats#',
+                '/kevinhildebrand', 'help.poe.com', 'sng.link'
+            ]
 
-            for selector_idx, selector in enumerate(chat_selectors):
-                if progress_callback:
-                    progress_callback(f"Trying selector {selector_idx + 1}/{len(chat_selectors)}: {selector[:30]}...", 40 + (selector_idx * 5))
+            if progress_callback:
+                progress_callback(f"Reading {len(chat_selectors)} selectors in one pass...", 40)
 
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    logger.info(f"Selector '{selector}' found {len(elements)} elements")
-
-                    for i, element in enumerate(elements):
-                        if len(conversations) >= limit:
-                            break
-
-                        try:
-                            # Get text and href
-                            text = element.text.strip()
-                            href = element.get_attribute('href')                            # Skip empty or irrelevant elements
-                            if not text or len(text) < 3:
-                                continue
-
-                            # Skip non-chat URLs - ONLY allow actual chat URLs
-                            if href and not any(pattern in href for pattern in ['/chat/', '/c/']):
-                                continue
-
-                            # Skip very long text (likely page content, not conversation titles)
-                            if len(text) > 300:
-                                continue
-
-                            # Skip common UI elements and navigation links
-                            skip_texts = [
-                                'sign in', 'log in', 'sign up', 'menu', 'settings',
-                                'help', 'home', 'back', 'next', 'previous', 'search',
-                                'explore', 'create', 'view all', 'bots and apps',
-                                'upgrade', 'creators', 'profile', 'download', 'feedback',
-                                'terms', 'privacy', 'about', 'contact', 'support'
-                            ]
-                            if any(skip_text in text.lower() for skip_text in skip_texts):
-                                continue
-
-                            # Skip URLs that are clearly not conversations
-                            if href:
-                                skip_url_patterns = [
-                                    '/explore', '/create', '/settings', '/profile',
-                                    '/help', '/terms', '/privacy', '/chats#',
-                                    '/kevinhildebrand', 'help.poe.com', 'sng.link'
-                                ]
-                                if any(pattern in href for pattern in skip_url_patterns):
-                                    continue
-
-                            # Extract conversation ID
-                            if href:
-                                conv_id = self._extract_conversation_id(href)
-                            else:
-                                conv_id = f"no_url_{selector_idx}_{i}"
-
-                            # Check for duplicates
-                            if any(conv['id'] == conv_id for conv in conversations):
-                                continue
-
-                            # Extract bot name
-                            bot_name = self._extract_bot_name(text)
+            # All selectors are evaluated in-page and returned in one round trip
+            records = self.extractor.elements(chat_selectors)
+            logger.info(f"Single-pass extraction returned {len(records)} elements")
 
-                            # Create conversation object
-                            conversation = {
-                                'id': conv_id,
-                                'title': text[:100] if text else f"Conversation {len(conversations) + 1}",
-                                'url': href or 'No direct URL',
-                                'bot': bot_name,
-                                'category': self._categorize_conversation(text, bot_name),
-                                'method': f'selector_{selector_idx}_{selector[:20]}',
-                                'extracted_at': datetime.now().isoformat(),
-                                'messages': []
-                            }
+            for i, record in enumerate(records):
+                if len(conversations) >= limit:
+                    break
 
-                            conversations.append(conversation)
-                            total_found += 1
+                selector_idx = record['s']
+                selector = chat_selectors[selector_idx]
+                text = record['text']
+                href = record['href']
 
-                            logger.debug(f"Found conversation: {text[:50]} -> {href}")
+                # Skip empty or irrelevant elements
+                if not text or len(text) < 3:
+                    continue
 
-                        except Exception as e:
-                            logger.debug(f"Error processing element {i} with selector '{selector}': {e}")
-                            continue
+                # Skip non-chat URLs - ONLY allow actual chat URLs
+                if href and not any(pattern in href for pattern in ['/chat/', '/c/']):
+                    continue
 
-                except Exception as e:
-                    logger.debug(f"Error with selector '{selector}': {e}")
+                # Skip very long text (likely page content, not conversation titles)
+                if len(text) > 300:
+                    continue
+
+                # Skip common UI elements and navigation links
+                text_lower = text.lower()
+                if any(skip_text in text_lower for skip_text in skip_texts):
+                    continue
+
+                # Skip URLs that are clearly not conversations
+                if href and any(pattern in href for pattern in skip_url_patterns):
+                    continue
+
+                # Extract conversation ID
+                if href:
+                    conv_id = self._extract_conversation_id(href)
+                else:
+                    conv_id = f"no_url_{selector_idx}_{i}"
+
+                # Check for duplicates
+                if conv_id in seen_ids:
                     continue
+                seen_ids.add(conv_id)
+
+                # Extract bot name
+                bot_name = self._extract_bot_name(text)
+
+                # Create conversation object
+                conversation = {
+                    'id': conv_id,
+                    'title': text[:100] if text else f"Conversation {len(conversations) + 1}",
+                    'url': href or 'No direct URL',
+                    'bot': bot_name,
+                    'category': self._categorize_conversation(text, bot_name),
+                    'method': f'selector_{selector_idx}_{selector[:20]}',
+                    'extracted_at': datetime.now().isoformat(),
+                    'messages': []
+                }
 
-                # If we found some conversations, we can continue, but let's try all selectors
-                if conversations:
-                    logger.info(f"Found {len(conversations)} conversations so far using selector: {selector}")
+                conversations.append(conversation)
+                total_found += 1
+
+                logger.debug(f"Found conversation: {text[:50]} -> {href}")
 
             logger.info(f"Total elements processed: {total_found}, conversations found: {len(conversations)}")
 
@@ -513,14 +577,16 @@ class PoeApiClient:
                 if progress_callback:
                     progress_callback("Trying aggressive extraction...", 80)
 
-                # Get all clickable elements
-                all_clickable = self.driver.find_elements(By.CSS_SELECTOR, "a, button, div[role='button'], [tabindex]")
+                # Get all clickable elements (first 200) in one round trip
+                all_clickable = self.extractor.elements(
+                    ["a, button, div[role='button'], [tabindex]"], max_per_selector=200
+                )
                 logger.info(f"Found {len(all_clickable)} clickable elements")
 
-                for i, element in enumerate(all_clickable[:200]):  # Limit to first 200 elements
+                for i, element in enumerate(all_clickable):
                     try:
-                        text = element.text.strip()
-                        href = element.get_attribute('href')
+                        text = element['text']
+                        href = element['href']
 
                         # Look for anything that might be a conversation
                         if (text and 10 <= len(text) <= 200 and
@@ -548,13 +614,7 @@ class PoeApiClient:
                 progress_callback("Removing duplicates...", 80)
 
             # Remove duplicates by URL (EXACT same as working script)
-            seen_urls = set()
-            unique_conversations = []
-
-            for conv in conversations:
-                if conv['url'] not in seen_urls:
-                    seen_urls.add(conv['url'])
-                    unique_conversations.append(conv)
+            unique_conversations = dedupe_by(conversations, 'url')
 
             # Limit results
             final_conversations = unique_conversations[:limit]
@@ -616,30 +676,49 @@ class PoeApiClient:
             logger.info(f"🔍 Extracting messages from: {url}")
 
             self.driver.get(url)
-            time.sleep(3)
 
             if progress_callback:
                 progress_callback("Waiting for messages to load...", 30)
 
-            # Wait for conversation messages to load
-            try:
-                WebDriverWait(self.driver, 15).until(
-                    EC.any_of(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid*="message"]')),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="message"]')),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="Message"]')),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'main'))
-                    )
-                )
-            except TimeoutException:
+            # Wait for conversation messages to load and stop streaming in
+            loaded = self.waits.page_loaded(
+                [
+                    '[data-testid*="message"]',
+                    '[class*="message"]',
+                    '[class*="Message"]',
+                ],
+                timeout=15
+            )
+            if not loaded:
                 logger.warning("Messages didn't load within timeout, proceeding anyway")
 
+            if self.capture:
+                self.waits.network_idle(timeout=10)
+                self.capture.poll()
+                captured = self.capture.get_messages(conversation_id)
+                if captured:
+                    if progress_callback:
+                        progress_callback("Messages extracted!", 100)
+                    logger.info(f"✅ Captured {len(captured)} messages from network responses")
+                    return [
+                        {
+                            'role': 'user' if msg['role'] == 'user' else 'assistant',
+                            'content': msg['content'],
+                            'timestamp': msg['timestamp'],
+                            'bot_name': msg['bot'],
+                            'message_id': msg['id'],
+                            'extraction_method': 'network_capture'
+                        }
+                        for msg in captured
+                    ]
+                logger.info("No GraphQL messages captured, falling back to DOM extraction")
+
             if progress_callback:
                 progress_callback("Extracting messages...", 50)
 
             messages = []
 
-            # Multiple strategies for message detection
+            # Multiple strategies for message detection, in priority order
             message_strategies = [
                 # Strategy 1: Official message elements
                 {
@@ -669,46 +748,44 @@ class PoeApiClient:
                     'name': 'role_based'
                 }
             ]
+            strategy_names = {
+                selector: strategy['name']
+                for strategy in message_strategies
+                for selector in strategy['selectors']
+            }
 
-            message_elements = []
-            successful_strategy = None
-
-            for strategy in message_strategies:
-                for selector in strategy['selectors']:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        # Filter for elements with substantial content
-                        valid_elements = [
-                            elem for elem in elements
-                            if elem.text and len(elem.text.strip()) > 5
-                        ]
-
-                        if len(valid_elements) >= 1:
-                            message_elements = valid_elements
-                            successful_strategy = f"{strategy['name']}-{selector}"
-                            logger.info(f"Found {len(message_elements)} messages using {successful_strategy}")
-                            break
-                    except Exception as e:
-                        logger.debug(f"Strategy {selector} failed: {e}")
-                        continue
-
-                if message_elements:
-                    break
+            # Strategies, role hints, bot name and title in one round trip
+            page = self.extractor.page(
+                message_selectors=list(strategy_names),
+                bot_selectors=[
+                    '[data-testid*="bot"]',
+                    '[class*="bot"]',
+                    '[class*="Bot"]',
+                    '[class*="assistant"]',
+                    '[class*="model"]'
+                ],
+                min_length=5,
+                bot_name_length=(3, 50),
+            )
+            message_elements = page['messages']
 
             if not message_elements:
                 logger.warning("No message elements found")
                 return []
 
+            successful_strategy = f"{strategy_names[page['selector']]}-{page['selector']}"
+            logger.info(f"Found {len(message_elements)} messages using {successful_strategy}")
+
             if progress_callback:
                 progress_callback("Processing messages...", 80)
 
             # Extract bot name for the conversation
-            bot_name = self._extract_conversation_bot_name()
+            bot_name = page['bot'] or self._extract_bot_name(page['pageTitle'])
 
             # Process each message
             for i, elem in enumerate(message_elements):
                 try:
-                    content = elem.text.strip()
+                    content = elem['text']
                     if not content or len(content) < 3:
                         continue
 
@@ -735,6 +812,7 @@ class PoeApiClient:
                 progress_callback("Messages extracted!", 100)
 
             logger.info(f"✅ Extracted {len(messages)} messages using {successful_strategy}")
+            logger.debug(f"Scrape timings so far: {self.timings.summary()}")
             return messages
 
         except Exception as e:
@@ -743,6 +821,49 @@ class PoeApiClient:
                 progress_callback(f"Failed: {str(e)}", 0)
             return []
 
+    def _get_captured_conversations(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Build the conversation list from captured GraphQL chat responses.
+
+        Scrolls the chat list while fewer than ``limit`` chats have been
+        captured so the page issues its pagination queries.
+
+        Args:
+            limit (int): Maximum number of conversations to return
+
+        Returns:
+            List[Dict[str, Any]]: Conversations in the same shape as
+            get_conversations(), with Poe's real IDs and timestamps
+        """
+        self.capture.poll()
+        for _ in range(20):
+            if len(self.capture.conversations) >= limit:
+                break
+            before = len(self.capture.conversations)
+            if not self.waits.scroll_until_stable(max_loops=1, step_timeout=2.0):
+                break
+            self.waits.network_idle(timeout=5)
+            self.capture.poll()
+            if len(self.capture.conversations) == before:
+                break
+
+        conversations = []
+        for conv in self.capture.get_conversations()[:limit]:
+            title = conv.get('title', 'Untitled Conversation')
+            conversations.append({
+                'id': conv['id'],
+                'title': title[:100],
+                'url': f"https://poe.com/chat/{conv['id']}",
+                'bot': conv['bot'],
+                'category': self._categorize_conversation(title, conv['bot']),
+                'method': 'network_capture',
+                'extracted_at': datetime.now().isoformat(),
+                'created_at': conv.get('created_at'),
+                'updated_at': conv.get('updated_at'),
+                'messages': []
+            })
+        return conversations
+
     def _extract_conversation_id(self, url: str) -> str:
         """
         Extract conversation ID from Poe.com URL with better error handling.
@@ -839,18 +960,16 @@ class PoeApiClient:
                 '[class*="model"]'
             ]
 
-            for selector in bot_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elements:
-                        text = elem.text.strip()
-                        if text and 3 <= len(text) <= 50:
-                            return text
-                except:
-                    continue
+            page = self.extractor.page(
+                message_selectors=[],
+                bot_selectors=bot_selectors,
+                bot_name_length=(3, 50)
+            )
+            if page['bot']:
+                return page['bot']
 
             # Fallback: extract from page title
-            title = self.driver.title
+            title = page['pageTitle']
             bot_name = self._extract_bot_name(title)
             return bot_name if bot_name != "Assistant" else "Assistant"
 
@@ -858,12 +977,13 @@ class PoeApiClient:
             logger.debug(f"Error extracting bot name: {e}")
             return "Assistant"
 
-    def _determine_message_role(self, element, index: int, strategy: str) -> str:
+    def _determine_message_role(self, element: Dict[str, Any], index: int, strategy: str) -> str:
         """
         Determine if a message is from user or assistant using multiple heuristics.
 
         Args:
-            element: Selenium WebElement containing the message
+            element (dict): Message record from DomExtractor.page(); ``hint``
+                            holds the class/markup role indicator found in-page
             index (int): Position of message in conversation
             strategy (str): Detection strategy used to find messages
 
@@ -871,24 +991,12 @@ class PoeApiClient:
             str: 'user' or 'assistant'
         """
         try:
-            # Method 1: Class-based detection
-            elem_class = element.get_attribute('class') or ""
-            elem_html = element.get_attribute('outerHTML') or ""
-
-            user_indicators = ["user", "human", "you", "me", "question"]
-            assistant_indicators = ["bot", "assistant", "ai", "response", "answer"]
-
-            # Check for explicit role indicators
-            for indicator in user_indicators:
-                if indicator in elem_class.lower() or indicator in elem_html.lower():
-                    return "user"
-
-            for indicator in assistant_indicators:
-                if indicator in elem_class.lower() or indicator in elem_html.lower():
-                    return "assistant"
+            # Method 1: Class-based detection (evaluated in-page)
+            if element.get('hint'):
+                return element['hint']
 
             # Method 2: Content analysis
-            text = element.text.strip()
+            text = element.get('text', '').strip()
 
             # Short questions are likely from users
             if "?" in text and len(text) < 200:
@@ -924,51 +1032,10 @@ class PoeApiClient:
         if not text:
             return "General"
 
-        text_lower = text.lower()
-
-        # Technical/Programming categories
-        technical_keywords = [
-            'code', 'programming', 'python', 'javascript', 'html', 'css',
-            'api', 'database', 'sql', 'git', 'github', 'debug', 'error',
-            'function', 'algorithm', 'data structure', 'software',
-            'development'
-        ]
-
-        # Creative categories
-        creative_keywords = [
-            'write', 'story', 'poem', 'creative', 'art', 'design', 'music',
-            'drawing', 'painting', 'novel', 'character', 'plot', 'narrative'
-        ]
-
-        # Educational categories
-        educational_keywords = [
-            'learn', 'study', 'explain', 'teach', 'lesson', 'homework',
-            'assignment', 'research', 'analysis', 'definition', 'concept'
-        ]
-
-        # Business categories
-        business_keywords = [
-            'business', 'marketing', 'sales', 'strategy', 'management',
-            'finance', 'budget', 'proposal', 'meeting', 'presentation'
-        ]
-
-        # Science categories
-        science_keywords = [
-            'science', 'physics', 'chemistry', 'biology', 'math', 'formula',
-            'experiment', 'hypothesis', 'theory', 'research', 'data'
-        ]
-
-        # Check for category matches
-        if any(keyword in text_lower for keyword in technical_keywords):
-            return "Technical"
-        elif any(keyword in text_lower for keyword in creative_keywords):
-            return "Creative"
-        elif any(keyword in text_lower for keyword in educational_keywords):
-            return "Educational"
-        elif any(keyword in text_lower for keyword in business_keywords):
-            return "Business"
-        elif any(keyword in text_lower for keyword in science_keywords):
-            return "Science"
+        # One pass over the text for all keyword lists, first category wins
+        category = _CATEGORY_MATCHER.first(text)
+        if category:
+            return category
 
         # Bot-based categorization as fallback
         if bot_name:
@@ -990,7 +1057,7 @@ class PoeApiClient:
         # Navigate to chats if not already there
         if "chats" not in self.driver.current_url:
             self.driver.get("https://poe.com/chats")
-            time.sleep(5)
+            self.waits.page_loaded(["a[href*='/chat/']"], timeout=15)
 
         # Print page source length
         page_source = self.driver.page_source
@@ -1060,6 +1127,9 @@ class PoeApiClient:
                 logger.warning(f"⚠️  Error closing driver: {e}")
             finally:
                 self.driver = None
+                self.waits = None
+                self.extractor = None
+                self.capture = None
                 self.authenticated = False
 
     def __enter__(self):
@@ -0,0 +1,251 @@
+"""
+Single-pass DOM extraction for the Selenium scrapers.
+
+Reading a WebElement's ``text`` or any attribute is a separate WebDriver
+HTTP round trip, so walking a page element by element costs several round
+trips per element and per selector. The scripts here run inside the page
+and return everything the scrapers need as structured JSON in a single
+``execute_script`` call. Post-processing (filtering, dedupe) happens in
+Python on plain dicts, using sets rather than list scans.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# arguments: selectors, containerLinkSelector (or null), maxPerSelector (or null)
+#
+# Returns one record per matched element, in selector order:
+#   {s: selector index, href, text, title, aria, link}
+# ``link`` is the href of the first descendant matching containerLinkSelector.
+ELEMENTS_JS = """
+var selectors = arguments[0] || [];
+var linkSelector = arguments[1];
+var maxPer = arguments[2];
+var out = [];
+for (var s = 0; s < selectors.length; s++) {
+    var nodes;
+    try { nodes = document.querySelectorAll(selectors[s]); } catch (e) { continue; }
+    var n = maxPer ? Math.min(nodes.length, maxPer) : nodes.length;
+    for (var i = 0; i < n; i++) {
+        var el = nodes[i];
+        var link = null;
+        if (linkSelector) {
+            var a = el.querySelector(linkSelector);
+            link = a ? a.href : null;
+        }
+        out.push({
+            s: s,
+            href: (typeof el.href === 'string' && el.href) ? el.href : null,
+            text: (el.innerText || '').trim(),
+            title: el.getAttribute('title') || '',
+            aria: el.getAttribute('aria-label') || '',
+            link: link
+        });
+    }
+}
+return out;
+"""
+
+# arguments: messageSelectors, userIndicators, botIndicators, minLength,
+#            titleSelectors, botSelectors, botNameMin, botNameMax
+#
+# Picks the first message selector with at least one element whose text is
+# longer than minLength and returns those messages together with title and
+# bot-name candidates and document.title.
+PAGE_JS = """
+var msgSelectors = arguments[0] || [];
+var userInd = arguments[1] || [];
+var botInd = arguments[2] || [];
+var minLen = arguments[3] || 0;
+var titleSelectors = arguments[4] || [];
+var botSelectors = arguments[5] || [];
+var botMin = arguments[6], botMax = arguments[7];
+
+function roleHint(el) {
+    var hay = ((el.getAttribute('class') || '') + ' ' + el.outerHTML).toLowerCase();
+    for (var i = 0; i < userInd.length; i++) {
+        if (hay.indexOf(userInd[i]) !== -1) { return 'user'; }
+    }
+    for (var j = 0; j < botInd.length; j++) {
+        if (hay.indexOf(botInd[j]) !== -1) { return 'assistant'; }
+    }
+    return null;
+}
+function query(sel) {
+    try { return Array.prototype.slice.call(document.querySelectorAll(sel)); }
+    catch (e) { return []; }
+}
+
+var result = {selector: null, messages: [], titles: [], bot: null, pageTitle: document.title || ''};
+for (var s = 0; s < msgSelectors.length; s++) {
+    var els = query(msgSelectors[s]).filter(function (el) {
+        return (el.innerText || '').trim().length > minLen;
+    });
+    if (els.length) {
+        result.selector = msgSelectors[s];
+        result.messages = els.map(function (el) {
+            return {text: (el.innerText || '').trim(), hint: roleHint(el)};
+        });
+        break;
+    }
+}
+titleSelectors.forEach(function (sel) {
+    var el = query(sel)[0];
+    result.titles.push(el ? (el.innerText || el.textContent || '').trim() : '');
+});
+for (var b = 0; b < botSelectors.length && result.bot === null; b++) {
+    var candidates = query(botSelectors[b]);
+    for (var c = 0; c < candidates.length; c++) {
+        var txt = (candidates[c].innerText || '').trim();
+        if (txt.length >= botMin && txt.length <= botMax) { result.bot = txt; break; }
+    }
+}
+return result;
+"""
+
+USER_INDICATORS = ("user", "human", "you", "me", "question")
+ASSISTANT_INDICATORS = ("bot", "assistant", "ai", "response", "answer")
+
+
+class DomExtractor:
+    """Extracts page data with one ``execute_script`` round trip per call."""
+
+    def __init__(self, driver, timings=None):
+        """Initialize the extractor.
+
+        Args:
+            driver: Selenium WebDriver instance
+            timings: Optional StepTimings to record extraction time in
+        """
+        self.driver = driver
+        self.timings = timings
+
+    def _run(self, step: str, script: str, *args: Any) -> Any:
+        if self.timings is None:
+            return self.driver.execute_script(script, *args)
+        with self.timings.step(step):
+            return self.driver.execute_script(script, *args)
+
+    def elements(
+        self,
+        selectors: Sequence[str],
+        container_link: Optional[str] = None,
+        max_per_selector: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Snapshot text and link attributes of all elements matching selectors.
+
+        Args:
+            selectors: CSS selectors, in priority order
+            container_link: If set, also report the href of the first
+                descendant matching this selector as ``link``
+            max_per_selector: Cap on elements read per selector
+
+        Returns:
+            Element records ``{s, href, text, title, aria, link}`` where ``s``
+            is the index of the selector that matched
+        """
+        records = self._run(
+            "extract_elements",
+            ELEMENTS_JS,
+            list(selectors),
+            container_link,
+            max_per_selector,
+        )
+        return records or []
+
+    def page(
+        self,
+        message_selectors: Sequence[str],
+        title_selectors: Sequence[str] = (),
+        bot_selectors: Sequence[str] = (),
+        min_length: int = 5,
+        bot_name_length: Tuple[int, int] = (3, 50),
+        user_indicators: Sequence[str] = USER_INDICATORS,
+        assistant_indicators: Sequence[str] = ASSISTANT_INDICATORS,
+    ) -> Dict[str, Any]:
+        """Extract messages, title and bot-name candidates of a conversation page.
+
+        Args:
+            message_selectors: Message selectors; the first yielding messages wins
+            title_selectors: Title selectors; first match text per selector
+            bot_selectors: Selectors searched for a bot name
+            min_length: Messages must be longer than this many characters
+            bot_name_length: Inclusive (min, max) length of a bot name
+            user_indicators: Class/markup substrings marking user messages
+            assistant_indicators: Class/markup substrings marking bot messages
+
+        Returns:
+            Dict with ``selector``, ``messages`` (``{text, hint}``),
+            ``titles``, ``bot`` and ``pageTitle``
+        """
+        result = self._run(
+            "extract_page",
+            PAGE_JS,
+            list(message_selectors),
+            list(user_indicators),
+            list(assistant_indicators),
+            min_length,
+            list(title_selectors),
+            list(bot_selectors),
+            bot_name_length[0],
+            bot_name_length[1],
+        ) or {}
+        result.setdefault("selector", None)
+        result.setdefault("messages", [])
+        result.setdefault("titles", [])
+        result.setdefault("bot", None)
+        result.setdefault("pageTitle", "")
+        return result
+
+
+def dedupe_by(records: Iterable[Dict[str, Any]], key: str) -> List[Dict[str, Any]]:
+    """Drop records whose ``key`` value has already been seen, keeping order.
+
+    Args:
+        records: Records to dedupe
+        key: Field to dedupe on
+
+    Returns:
+        Records with first occurrence of each key value
+    """
+    seen: Set[Any] = set()
+    unique = []
+    for record in records:
+        value = record.get(key)
+        if value in seen:
+            continue
+        seen.add(value)
+        unique.append(record)
+    return unique
+
+
+def chat_urls_from_source(
+    page_source: str,
+    patterns: Sequence[str],
+    seen: Optional[Set[str]] = None,
+    base_url: str = "https://poe.com",
+) -> List[Tuple[str, str]]:
+    """Find chat URLs in raw page source.
+
+    Args:
+        page_source: HTML source
+        patterns: Regex patterns whose first group is a URL or path
+        seen: URLs already collected; updated in place
+        base_url: Prefix for relative matches
+
+    Returns:
+        New ``(url, pattern)`` pairs, in discovery order
+    """
+    seen = set() if seen is None else seen
+    found = []
+    for pattern in patterns:
+        for match in re.findall(pattern, page_source):
+            url = match if match.startswith("http") else f"{base_url}{match}"
+            if url in seen:
+                continue
+            seen.add(url)
+            found.append((url, pattern))
+    return found
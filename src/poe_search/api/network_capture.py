@@ -0,0 +1,285 @@
+"""
+Network-level capture of Poe GraphQL responses.
+
+The Poe web app loads chats and messages through ``gql_POST`` requests.
+With Chrome DevTools Protocol network logging enabled, the browser clients
+can read those JSON responses directly instead of scraping rendered text,
+which yields Poe's real chat codes, message IDs and creation times.
+
+:class:`GraphQLCapture` consumes CDP events (from the driver's performance
+log, or forwarded by :class:`~poe_search.api.waits.WaitStrategy` once
+attached, so that the log has a single reader), fetches
+matching response bodies with ``Network.getResponseBody`` and merges every
+chat and message object found in the payloads.
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+GQL_URL_MARKER = "gql_POST"
+
+
+def poe_time_to_iso(value: Any) -> Optional[str]:
+    """Convert a Poe timestamp to an ISO 8601 string.
+
+    Poe reports ``creationTime``/``lastInteractionTime`` as integer
+    microseconds since the epoch; seconds and milliseconds are detected by
+    magnitude, and strings are passed through.
+
+    Args:
+        value: Raw timestamp
+
+    Returns:
+        ISO timestamp in UTC, or None if the value is unusable
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        if not value.isdigit():
+            return value
+        value = int(value)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if number > 1e17:      # nanoseconds
+        number /= 1e9
+    elif number > 1e14:    # microseconds
+        number /= 1e6
+    elif number > 1e11:    # milliseconds
+        number /= 1e3
+    return datetime.fromtimestamp(number, tz=timezone.utc).isoformat()
+
+
+def _bot_name(node: Dict[str, Any]) -> Optional[str]:
+    bot = node.get("defaultBotObject") or node.get("bot") or {}
+    if isinstance(bot, dict):
+        return bot.get("displayName") or bot.get("handle") or bot.get("nickname")
+    return bot or None
+
+
+class GraphQLCapture:
+    """Collects conversations and messages from captured ``gql_POST`` responses."""
+
+    def __init__(self, driver, url_marker: str = GQL_URL_MARKER):
+        """Initialize the capture.
+
+        Args:
+            driver: Selenium Chrome driver with performance logging enabled
+            url_marker: Substring identifying GraphQL response URLs
+        """
+        self.driver = driver
+        self.url_marker = url_marker
+        self.conversations: Dict[str, Dict[str, Any]] = {}
+        self._messages: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._pending: set = set()
+        self._waits = None
+        self.responses_seen = 0
+
+    def enable(self) -> bool:
+        """Enable CDP network domain events on the driver.
+
+        Returns:
+            True if the driver accepted the command
+        """
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            return True
+        except Exception as e:
+            logger.warning(f"Network capture unavailable: {e}")
+            return False
+
+    def attach(self, waits) -> None:
+        """Receive CDP events drained by a WaitStrategy.
+
+        From then on :meth:`poll` reads the log through the wait strategy,
+        so its network-idle tracking sees every event too.
+
+        Args:
+            waits: WaitStrategy whose network-idle polling reads the same log
+        """
+        self._waits = waits
+        if self.handle_event not in waits.cdp_listeners:
+            waits.cdp_listeners.append(self.handle_event)
+
+    def poll(self) -> int:
+        """Drain the driver's performance log and process pending events.
+
+        Returns:
+            Number of log entries processed
+        """
+        if self._waits is not None:
+            return self._waits.drain_cdp_events()
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"Could not read performance log: {e}")
+            return 0
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.handle_event(message)
+        return len(entries)
+
+    def handle_event(self, message: Dict[str, Any]) -> None:
+        """Process one CDP event.
+
+        Args:
+            message: CDP event with ``method`` and ``params``
+        """
+        method = message.get("method")
+        params = message.get("params", {})
+        request_id = params.get("requestId")
+        if method == "Network.responseReceived":
+            url = params.get("response", {}).get("url", "")
+            if self.url_marker in url:
+                self._pending.add(request_id)
+        elif method == "Network.loadingFinished" and request_id in self._pending:
+            self._pending.discard(request_id)
+            self._fetch_body(request_id)
+        elif method == "Network.loadingFailed":
+            self._pending.discard(request_id)
+
+    def _fetch_body(self, request_id: str) -> None:
+        try:
+            result = self.driver.execute_cdp_cmd(
+                "Network.getResponseBody", {"requestId": request_id}
+            )
+        except Exception as e:
+            logger.debug(f"Response body for {request_id} unavailable: {e}")
+            return
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8", errors="replace")
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            logger.debug(f"Ignoring non-JSON GraphQL response {request_id}")
+            return
+        self.ingest(payload)
+
+    def ingest(self, payload: Any) -> None:
+        """Merge chats and messages found anywhere in a GraphQL payload.
+
+        A chat is any object with a ``chatCode``; a message is any object
+        with ``messageId`` and ``text``. Messages are attributed to the
+        innermost enclosing chat.
+
+        Args:
+            payload: Decoded JSON response (or list of responses)
+        """
+        self.responses_seen += 1
+        self._ingest_node(payload, None)
+
+    def _ingest_node(self, node: Any, chat_code: Optional[str]) -> None:
+        if isinstance(node, list):
+            for item in node:
+                self._ingest_node(item, chat_code)
+            return
+        if not isinstance(node, dict):
+            return
+        if node.get("chatCode"):
+            chat_code = node["chatCode"]
+            self._merge_chat(node)
+        if "messageId" in node and "text" in node and chat_code:
+            self._merge_message(chat_code, node)
+            return
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                self._ingest_node(value, chat_code)
+
+    def _merge_chat(self, node: Dict[str, Any]) -> None:
+        code = node["chatCode"]
+        conv = self.conversations.setdefault(code, {"id": code, "messages": []})
+        if node.get("chatId") is not None:
+            conv["chat_id"] = node["chatId"]
+        if node.get("title"):
+            conv["title"] = node["title"]
+        bot = _bot_name(node)
+        if bot:
+            conv["bot"] = bot
+        updated = poe_time_to_iso(node.get("lastInteractionTime"))
+        if updated:
+            conv["updated_at"] = updated
+        created = poe_time_to_iso(node.get("creationTime"))
+        if created:
+            conv["created_at"] = created
+
+    def _merge_message(self, chat_code: str, node: Dict[str, Any]) -> None:
+        conv = self.conversations.setdefault(chat_code, {"id": chat_code, "messages": []})
+        messages = self._messages.setdefault(chat_code, {})
+        message_id = str(node["messageId"])
+        author = node.get("author") or ""
+        role = "user" if author in ("human", "user") else "bot"
+        messages[message_id] = {
+            "id": message_id,
+            "role": role,
+            "content": node.get("text") or "",
+            "timestamp": poe_time_to_iso(node.get("creationTime")),
+            "bot": None if role == "user" else (conv.get("bot") or author),
+        }
+
+    def get_messages(self, chat_code: str) -> List[Dict[str, Any]]:
+        """Get captured messages of a conversation in chronological order.
+
+        Args:
+            chat_code: Conversation ID as used in ``/chat/<code>`` URLs
+
+        Returns:
+            Messages in database format
+        """
+        messages = list(self._messages.get(chat_code, {}).values())
+        messages.sort(key=lambda m: (m["timestamp"] or "", m["id"]))
+        return messages
+
+    def get_conversation(self, chat_code: str) -> Optional[Dict[str, Any]]:
+        """Get a captured conversation with its messages.
+
+        Missing timestamps are filled from the message range.
+
+        Args:
+            chat_code: Conversation ID
+
+        Returns:
+            Conversation in database format, or None if nothing was captured
+        """
+        conv = self.conversations.get(chat_code)
+        if conv is None:
+            return None
+        result = dict(conv)
+        messages = self.get_messages(chat_code)
+        stamps = [m["timestamp"] for m in messages if m["timestamp"]]
+        result["messages"] = messages
+        result["message_count"] = len(messages)
+        result.setdefault("title", "Untitled Conversation")
+        result.setdefault("bot", "Assistant")
+        if stamps:
+            result.setdefault("created_at", stamps[0])
+            result.setdefault("updated_at", stamps[-1])
+        for message in messages:
+            if message["role"] == "bot" and not message["bot"]:
+                message["bot"] = result["bot"]
+        return result
+
+    def get_conversations(self) -> List[Dict[str, Any]]:
+        """Get all captured conversations, most recently active first.
+
+        Returns:
+            Conversations in database format
+        """
+        conversations = [self.get_conversation(code) for code in self.conversations]
+        conversations.sort(key=lambda c: c.get("updated_at") or "", reverse=True)
+        return conversations
+
+    def clear(self) -> None:
+        """Forget captured data."""
+        self.conversations.clear()
+        self._messages.clear()
+        self._pending.clear()
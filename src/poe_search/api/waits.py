@@ -0,0 +1,415 @@
+"""
+Event-driven wait strategies for the Selenium scrapers.
+
+Instead of sleeping for a fixed number of seconds after every navigation,
+the browser clients wait on observable page conditions:
+
+- document ready state
+- network idle (Chrome DevTools Protocol performance log, with a
+  Resource Timing fallback for drivers without CDP logging)
+- "content stable" signals from an injected MutationObserver
+- scroll-height stabilization for lazily loaded lists
+
+Every wait is recorded in a :class:`StepTimings` instance so the time spent
+per scrape step can be logged and inspected.
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Installs (once per document) a MutationObserver that stamps the time of the
+# last DOM mutation on ``window.__poeSearchLastMutation``.
+_MUTATION_OBSERVER_JS = """
+if (!window.__poeSearchObserver) {
+    window.__poeSearchLastMutation = Date.now();
+    window.__poeSearchObserver = new MutationObserver(function () {
+        window.__poeSearchLastMutation = Date.now();
+    });
+    window.__poeSearchObserver.observe(document.documentElement || document, {
+        childList: true, subtree: true, characterData: true
+    });
+}
+return Date.now() - window.__poeSearchLastMutation;
+"""
+
+_QUIET_MS_JS = "return Date.now() - (window.__poeSearchLastMutation || 0);"
+
+_RESOURCE_COUNT_JS = (
+    "return (window.performance && performance.getEntriesByType)"
+    " ? performance.getEntriesByType('resource').length : 0;"
+)
+
+_SCROLL_HEIGHT_JS = "return document.body ? document.body.scrollHeight : 0;"
+
+_SCROLL_TO_BOTTOM_JS = "window.scrollTo(0, document.body.scrollHeight);"
+
+_ANY_SELECTOR_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    if (document.querySelector(selectors[i])) { return selectors[i]; }
+}
+return null;
+"""
+
+
+class StepTimings:
+    """Per-step timing instrumentation for a scrape."""
+
+    def __init__(self):
+        """Initialize an empty timing record."""
+        self.steps: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Time a named step.
+
+        Args:
+            name: Step name
+
+        Yields:
+            Mutable record for the step; callers may add extra fields
+        """
+        record: Dict[str, Any] = {"step": name}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self.steps.append(record)
+            logger.debug(f"⏱️  {name}: {record['seconds']:.3f}s")
+
+    def total(self) -> float:
+        """Get total time spent in all recorded steps.
+
+        Returns:
+            Total seconds
+        """
+        return sum(step["seconds"] for step in self.steps)
+
+    def summary(self) -> Dict[str, float]:
+        """Get accumulated seconds per step name.
+
+        Returns:
+            Mapping of step name to total seconds
+        """
+        totals: Dict[str, float] = {}
+        for step in self.steps:
+            totals[step["step"]] = totals.get(step["step"], 0.0) + step["seconds"]
+        return totals
+
+    def reset(self) -> None:
+        """Discard recorded steps."""
+        self.steps.clear()
+
+
+def poll_until(
+    condition: Callable[[], Any],
+    timeout: float,
+    poll_interval: float = 0.1,
+) -> Any:
+    """Poll a condition until it returns a truthy value or the timeout expires.
+
+    Exceptions raised by the condition are treated as "not yet".
+
+    Args:
+        condition: Zero-argument callable
+        timeout: Maximum seconds to wait
+        poll_interval: Seconds between polls
+
+    Returns:
+        The first truthy value, or None on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            result = condition()
+            if result:
+                return result
+        except Exception as e:
+            logger.debug(f"Wait condition raised: {e}")
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(poll_interval)
+
+
+class WaitStrategy:
+    """Waits on DOM and network conditions of a Selenium driver."""
+
+    def __init__(
+        self,
+        driver,
+        timeout: float = 20.0,
+        poll_interval: float = 0.1,
+        quiet_period: float = 0.5,
+        timings: Optional[StepTimings] = None,
+    ):
+        """Initialize the wait strategy.
+
+        Args:
+            driver: Selenium WebDriver instance
+            timeout: Default maximum seconds for a single wait
+            poll_interval: Seconds between condition polls
+            quiet_period: Seconds without DOM or network activity that count as settled
+            timings: Timing record to append to (a new one is created if None)
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.quiet_period = quiet_period
+        self.timings = timings or StepTimings()
+        self._cdp_available: Optional[bool] = None
+        self._inflight: set = set()
+        self._cdp_events_seen = 0
+        # Called with every CDP event drained from the performance log, so
+        # other consumers (e.g. GraphQLCapture) still see events read here
+        self.cdp_listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+    def _poll(self, condition: Callable[[], Any], timeout: Optional[float]) -> Any:
+        return poll_until(
+            condition,
+            self.timeout if timeout is None else timeout,
+            self.poll_interval,
+        )
+
+    def document_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until ``document.readyState`` is ``complete``.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the document finished loading in time
+        """
+        with self.timings.step("document_ready") as record:
+            ok = bool(self._poll(
+                lambda: self.driver.execute_script("return document.readyState") == "complete",
+                timeout,
+            ))
+            record["ok"] = ok
+            return ok
+
+    def any_selector(
+        self,
+        selectors: Iterable[str],
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """Wait until any of the CSS selectors matches an element.
+
+        All selectors are checked in a single script round trip per poll.
+
+        Args:
+            selectors: CSS selectors to check, in priority order
+            timeout: Maximum seconds to wait
+
+        Returns:
+            The first matching selector, or None on timeout
+        """
+        selectors = list(selectors)
+        with self.timings.step("any_selector") as record:
+            matched = self._poll(
+                lambda: self.driver.execute_script(_ANY_SELECTOR_JS, selectors),
+                timeout,
+            )
+            record["selector"] = matched
+            return matched
+
+    def content_stable(
+        self,
+        quiet_period: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Wait until the DOM has not mutated for ``quiet_period`` seconds.
+
+        A MutationObserver is injected on first use in each document.
+
+        Args:
+            quiet_period: Seconds without mutations required
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the DOM settled in time
+        """
+        quiet_ms = (self.quiet_period if quiet_period is None else quiet_period) * 1000
+        with self.timings.step("content_stable") as record:
+            try:
+                self.driver.execute_script(_MUTATION_OBSERVER_JS)
+            except Exception as e:
+                logger.debug(f"Could not install MutationObserver: {e}")
+                record["ok"] = False
+                return False
+
+            def quiet() -> bool:
+                elapsed = self.driver.execute_script(_QUIET_MS_JS)
+                return elapsed is not None and elapsed >= quiet_ms
+
+            ok = bool(self._poll(quiet, timeout))
+            record["ok"] = ok
+            return ok
+
+    def network_idle(
+        self,
+        quiet_period: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Wait until no network requests are in flight for ``quiet_period`` seconds.
+
+        Uses the Chrome DevTools Protocol performance log when the driver
+        was started with ``goog:loggingPrefs`` performance logging, otherwise
+        falls back to watching the Resource Timing entry count.
+
+        Args:
+            quiet_period: Seconds of network silence required
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the network went idle in time
+        """
+        quiet = self.quiet_period if quiet_period is None else quiet_period
+        with self.timings.step("network_idle") as record:
+            if self._cdp_logging_available():
+                record["source"] = "cdp"
+                probe = self._drain_cdp_events
+            else:
+                record["source"] = "resource_timing"
+                probe = self._resource_count
+
+            state = {"last_value": probe(), "last_change": time.monotonic()}
+
+            def idle() -> bool:
+                value = probe()
+                now = time.monotonic()
+                if value != state["last_value"]:
+                    state["last_value"] = value
+                    state["last_change"] = now
+                    return False
+                if record["source"] == "cdp" and self._inflight:
+                    return False
+                return now - state["last_change"] >= quiet
+
+            ok = bool(self._poll(idle, timeout))
+            record["ok"] = ok
+            return ok
+
+    def scroll_until_stable(
+        self,
+        max_loops: int = 20,
+        step_timeout: float = 2.0,
+    ) -> int:
+        """Scroll to the bottom until the page height stops growing.
+
+        After each scroll the height is polled for growth instead of
+        sleeping a fixed pause; the loop ends as soon as a scroll produces
+        no new content within ``step_timeout``.
+
+        Args:
+            max_loops: Maximum number of scrolls
+            step_timeout: Seconds to wait for new content after each scroll
+
+        Returns:
+            Number of scrolls that loaded new content
+        """
+        grown = 0
+        with self.timings.step("scroll_until_stable") as record:
+            last_height = self.driver.execute_script(_SCROLL_HEIGHT_JS)
+            for _ in range(max_loops):
+                self.driver.execute_script(_SCROLL_TO_BOTTOM_JS)
+                new_height = self._poll(
+                    lambda: self._grown_height(last_height),
+                    step_timeout,
+                )
+                if not new_height:
+                    break
+                last_height = new_height
+                grown += 1
+            record["loops"] = grown
+        return grown
+
+    def page_loaded(
+        self,
+        selectors: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[str]:
+        """Wait for a navigation to settle.
+
+        Combines document ready, an optional selector wait and a content
+        stability wait. This is the drop-in replacement for the fixed
+        ``time.sleep`` after ``driver.get``.
+
+        Args:
+            selectors: CSS selectors of which at least one must appear
+            timeout: Maximum seconds for each sub-wait
+
+        Returns:
+            The matched selector (or "" when no selectors were given),
+            or None if none of the selectors appeared
+        """
+        # Requests of the previous page that never reported back would
+        # keep network_idle() waiting; this page's events are still unread
+        self._inflight.clear()
+        self.document_ready(timeout)
+        matched: Optional[str] = ""
+        if selectors:
+            matched = self.any_selector(selectors, timeout)
+        self.content_stable(timeout=timeout)
+        return matched
+
+    def _grown_height(self, last_height: int) -> Optional[int]:
+        height = self.driver.execute_script(_SCROLL_HEIGHT_JS)
+        return height if height and height != last_height else None
+
+    def _resource_count(self) -> int:
+        try:
+            return int(self.driver.execute_script(_RESOURCE_COUNT_JS) or 0)
+        except Exception:
+            return 0
+
+    def _cdp_logging_available(self) -> bool:
+        if self._cdp_available is None:
+            try:
+                self._cdp_available = "performance" in (self.driver.log_types or [])
+            except Exception:
+                self._cdp_available = False
+        return self._cdp_available
+
+    def drain_cdp_events(self) -> int:
+        """Consume pending CDP events from the driver's performance log.
+
+        Reading the log empties it, so this is its only reader: every event
+        is tracked for :meth:`network_idle` and forwarded to
+        :attr:`cdp_listeners`.
+
+        Returns:
+            Number of log entries read
+        """
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return 0
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            for listener in self.cdp_listeners:
+                try:
+                    listener(message)
+                except Exception as e:
+                    logger.debug(f"CDP listener failed: {e}")
+            method = message.get("method", "")
+            request_id = message.get("params", {}).get("requestId")
+            if method == "Network.requestWillBeSent":
+                self._inflight.add(request_id)
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                self._inflight.discard(request_id)
+        self._cdp_events_seen += len(entries)
+        return len(entries)
+
+    def _drain_cdp_events(self) -> int:
+        """Consume pending CDP network events and return the running total seen."""
+        self.drain_cdp_events()
+        return self._cdp_events_seen
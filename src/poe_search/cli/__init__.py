@@ -155,27 +155,176 @@ def search(ctx: click.Context, query: str, bot: Optional[str], limit: int, outpu
 
 @main.command()
 @click.option("--days", default=7, help="Number of days to sync")
+@click.option("--limit", default=50, help="Maximum number of conversations to sync")
+@click.option("--resume", is_flag=True, help="Resume the last interrupted sync from its checkpoint")
+@click.option("--job-id", type=int, help="Sync job to resume (default: most recent unfinished)")
 @click.pass_context
-def sync(ctx: click.Context, days: int):
+def sync(ctx: click.Context, days: int, limit: int, resume: bool, job_id: Optional[int]):
     """Sync conversations from Poe."""
     client = ctx.obj["client"]
     
-    with Progress(
+    from poe_search.sync.daemon import SyncLock, SyncLockError
+    
+    lock = SyncLock(client.database.db_path)
+    try:
+        lock.acquire()
+    except SyncLockError as e:
+        console.print(f"❌ {e}", style="red")
+        console.print("If the sync daemon is running, use 'poe-search daemon trigger' instead")
+        return
+    
+    with lock, Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        task = progress.add_task(f"Syncing last {days} days...", total=None)
+        description = "Resuming sync..." if resume else f"Syncing last {days} days..."
+        task = progress.add_task(description, total=None)
+        
+        def on_progress(message: str, percent: int):
+            progress.update(task, description=message)
         
         try:
-            stats = client.sync(days=days)
+            if resume:
+                stats = client.resume_sync(job_id=job_id, progress_callback=on_progress)
+            else:
+                stats = client.sync(days=days, limit=limit, progress_callback=on_progress)
             progress.update(task, completed=True)
         except Exception as e:
             console.print(f"❌ Sync failed: {e}", style="red")
+            console.print("Run 'poe-search sync --resume' to continue from the last checkpoint")
             return
     
-    console.print("✅ Sync completed!", style="green")
-    console.print(f"📊 New: {stats['new']}, Updated: {stats['updated']}, Total: {stats['total']}")
+    if stats is None:
+        console.print("No interrupted sync to resume.", style="yellow")
+        return
+    
+    if stats["status"] == "completed":
+        console.print("✅ Sync completed!", style="green")
+    else:
+        console.print(f"⚠️  Sync {stats['status']} (job {stats['job_id']})", style="yellow")
+    console.print(
+        f"📊 New: {stats['new']}, Updated: {stats['updated']}, "
+        f"Skipped: {stats['skipped']}, Failed: {stats['failed']}, Total: {stats['total']}"
+    )
+    if stats["status"] != "completed":
+        console.print("Run 'poe-search sync --resume' to retry the remaining conversations")
+
+
+@main.group(invoke_without_command=True)
+@click.option("--interval", type=int, help="Seconds between syncs (default: sync.sync_interval)")
+@click.option("--days", type=int, help="Number of days each sync covers (default: sync.sync_days_back)")
+@click.option("--limit", type=int, help="Maximum conversations per sync (default: sync.sync_batch_size)")
+@click.option("--socket", "socket_path", type=click.Path(), help="Status endpoint Unix socket path")
+@click.option("--no-initial-sync", is_flag=True, help="Wait one interval before the first sync")
+@click.pass_context
+def daemon(
+    ctx: click.Context,
+    interval: Optional[int],
+    days: Optional[int],
+    limit: Optional[int],
+    socket_path: Optional[str],
+    no_initial_sync: bool,
+):
+    """Run periodic background syncs without the GUI."""
+    ctx.obj["socket_path"] = socket_path
+    if ctx.invoked_subcommand is not None:
+        return
+    
+    import signal
+    
+    from poe_search.sync.daemon import DEFAULT_SOCKET_PATH, SyncDaemon, SyncLockError
+    
+    settings = ctx.obj["config"].sync
+    sync_daemon = SyncDaemon(
+        ctx.obj["client"],
+        interval=interval or settings.sync_interval,
+        days=days or settings.sync_days_back,
+        limit=limit or settings.sync_batch_size,
+        run_on_start=not no_initial_sync,
+        socket_path=socket_path or DEFAULT_SOCKET_PATH,
+    )
+    signal.signal(signal.SIGTERM, lambda signum, frame: sync_daemon.stop())
+    
+    console.print(
+        f"🔄 Sync daemon running every {sync_daemon.interval}s "
+        f"(status: {sync_daemon.socket_path})"
+    )
+    try:
+        sync_daemon.run()
+    except SyncLockError as e:
+        console.print(f"❌ {e}", style="red")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        sync_daemon.stop()
+    console.print("Sync daemon stopped")
+
+
+def _query_daemon(ctx: click.Context, command: str) -> Optional[dict]:
+    """Send a command to the running daemon, reporting connection errors."""
+    from poe_search.sync.daemon import query_daemon
+    
+    try:
+        return query_daemon(command, ctx.obj.get("socket_path"))
+    except OSError as e:
+        console.print(f"❌ Sync daemon not reachable: {e}", style="red")
+        return None
+
+
+@daemon.command("status")
+@click.option("--json", "as_json", is_flag=True, help="Print the raw status JSON")
+@click.pass_context
+def daemon_status(ctx: click.Context, as_json: bool):
+    """Show sync daemon progress and throughput."""
+    response = _query_daemon(ctx, "status")
+    if response is None:
+        return
+    
+    status = response["status"]
+    if as_json:
+        import json
+        console.print(json.dumps(status, indent=2))
+        return
+    
+    table = Table(title="Sync Daemon")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="magenta")
+    table.add_row("State", status["state"])
+    table.add_row("PID", str(status["pid"]))
+    table.add_row("Runs", f"{status['runs']} ({status['failed_runs']} failed)")
+    table.add_row("Triggers", f"{status['triggers']} ({status['coalesced_triggers']} coalesced)")
+    table.add_row("Conversations synced", str(status["conversations_synced"]))
+    table.add_row("Throughput", f"{status.get('throughput', 0):.2f} conversations/s")
+    if status["progress"]:
+        table.add_row("Progress", f"{status['progress']['message']} ({status['progress']['percent']}%)")
+    if status["next_run_at"]:
+        from datetime import datetime
+        table.add_row("Next run", datetime.fromtimestamp(status["next_run_at"]).isoformat(timespec="seconds"))
+    if status["last_run"]:
+        last = status["last_run"]
+        table.add_row("Last run", f"{last['duration']:.1f}s, {last['error'] or last['stats']}")
+    console.print(table)
+
+
+@daemon.command("trigger")
+@click.pass_context
+def daemon_trigger(ctx: click.Context):
+    """Ask the sync daemon to sync now."""
+    response = _query_daemon(ctx, "sync")
+    if response is None:
+        return
+    if response["queued"]:
+        console.print("✅ Sync queued", style="green")
+    else:
+        console.print("A sync is already queued; request coalesced", style="yellow")
+
+
+@daemon.command("stop")
+@click.pass_context
+def daemon_stop(ctx: click.Context):
+    """Stop the sync daemon."""
+    if _query_daemon(ctx, "stop") is not None:
+        console.print("✅ Sync daemon stopping", style="green")
 
 
 @main.group()
@@ -218,11 +367,19 @@ def list_bots(ctx: click.Context):
 
 
 @main.command()
-@click.option("--format", "output_format", default="json", type=click.Choice(["json", "csv", "markdown"]))
-@click.option("--output", "-o", help="Output file path")
+@click.option("--format", "output_format", default="json",
+              type=click.Choice(["json", "ndjson", "csv", "markdown", "parquet", "feather"]))
+@click.option("--output", "-o", help="Output file path (a directory for parquet/feather)")
 @click.option("--bot", help="Filter by specific bot")
 @click.option("--days", type=int, help="Filter by number of days")
 @click.option("--conversation-id", help="Export specific conversation")
+@click.option("--compress", "compression", type=click.Choice(["gzip", "zstd", "xz"]),
+              help="Compress the export (text formats)")
+@click.option("--max-part-size", type=int, help="Split the export into parts of at most N MB")
+@click.option("--shard-by", type=click.Choice(["conversation", "bot", "category", "month"]),
+              help="Write one file per shard into the output directory")
+@click.option("--workers", type=int, help="Parallel writers for sharded exports")
+@click.option("--force", is_flag=True, help="Rewrite unchanged shards")
 @click.pass_context
 def export(
     ctx: click.Context,
@@ -231,13 +388,21 @@ def export(
     bot: Optional[str],
     days: Optional[int],
     conversation_id: Optional[str],
+    compression: Optional[str],
+    max_part_size: Optional[int],
+    shard_by: Optional[str],
+    workers: Optional[int],
+    force: bool,
 ):
     """Export conversations to file."""
     client = ctx.obj["client"]
     
     # Generate default output filename if not provided
     if not output:
-        output = f"poe_conversations.{output_format}"
+        if output_format in ("parquet", "feather") or shard_by:
+            output = f"poe_conversations_{output_format}"
+        else:
+            output = f"poe_conversations.{output_format}"
     
     filters = {}
     if bot:
@@ -247,6 +412,40 @@ def export(
     if conversation_id:
         filters["conversation_id"] = conversation_id
     
+    if shard_by:
+        if output_format in ("parquet", "feather"):
+            console.print("❌ Sharded exports support json, ndjson, csv and markdown", style="red")
+            return
+        with Progress(console=console) as progress:
+            task = progress.add_task("Writing shards...", total=None)
+            
+            def on_progress(done: int, total: int):
+                progress.update(task, completed=done, total=total)
+            
+            try:
+                stats = client.export_sharded(
+                    output,
+                    format=output_format,
+                    shard_by=shard_by,
+                    workers=workers,
+                    compression=compression,
+                    force=force,
+                    progress_callback=on_progress,
+                    **filters,
+                )
+            except Exception as e:
+                console.print(f"❌ Export failed: {e}", style="red")
+                return
+        
+        console.print(
+            f"✅ {stats['conversations']} conversations in {stats['shards']} files under {output}: "
+            f"{stats['written']} written, {stats['skipped']} unchanged, {stats['removed']} removed",
+            style="green",
+        )
+        if stats["failed"]:
+            console.print(f"⚠️ {stats['failed']} files failed to write", style="yellow")
+        return
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -258,6 +457,8 @@ def export(
             client.export_conversations(
                 output_path=output,
                 format=output_format,
+                compression=compression,
+                max_part_size=max_part_size * 1024 * 1024 if max_part_size else None,
                 **filters,
             )
             progress.update(task, completed=True)
@@ -265,7 +466,62 @@ def export(
             console.print(f"❌ Export failed: {e}", style="red")
             return
     
-    console.print(f"✅ Conversations exported to {output}", style="green")
+    paths = [] if output_format in ("parquet", "feather") else client.exporter.output_paths
+    if len(paths) > 1:
+        console.print(f"✅ Conversations exported to {len(paths)} parts:", style="green")
+        for path in paths:
+            console.print(f"  {path}")
+    else:
+        console.print(f"✅ Conversations exported to {paths[0] if paths else output}", style="green")
+
+
+@main.command(name="import")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--format", "input_format",
+              type=click.Choice(["json", "ndjson", "parquet", "feather"]),
+              help="Export format (detected from the file name by default)")
+@click.option("--on-conflict", default="replace", type=click.Choice(["replace", "skip", "newer"]),
+              help="How to treat conversations that are already in the database")
+@click.option("--batch-size", default=500, type=int, help="Conversations per insert batch")
+@click.pass_context
+def import_(
+    ctx: click.Context,
+    paths: tuple,
+    input_format: Optional[str],
+    on_conflict: str,
+    batch_size: int,
+):
+    """Import exported conversations into the database."""
+    client = ctx.obj["client"]
+    
+    with Progress(console=console) as progress:
+        task = progress.add_task("Importing conversations...", total=None)
+        
+        def on_progress(read: int, bytes_read: int, total_bytes: int):
+            progress.update(
+                task,
+                description=f"Importing conversations ({read:,} read)...",
+                completed=bytes_read,
+                total=total_bytes or None,
+            )
+        
+        try:
+            stats = client.import_conversations(
+                list(paths),
+                format=input_format,
+                on_conflict=on_conflict,
+                progress_callback=on_progress,
+                batch_size=batch_size,
+            )
+        except Exception as e:
+            console.print(f"❌ Import failed: {e}", style="red")
+            return
+    
+    console.print(
+        f"✅ Imported {stats['imported']:,} conversations ({stats['messages']:,} messages read, "
+        f"{stats['skipped']:,} skipped)",
+        style="green",
+    )
 
 
 @main.command()
@@ -288,5 +544,101 @@ def analytics(ctx: click.Context, period: str):
     console.print(f"Average conversation length: {data.get('avg_conversation_length', 0):.1f}")
 
 
+@main.command()
+@click.option("--all", "recategorize", is_flag=True,
+              help="Also recategorize conversations whose category was set by hand or by sync")
+@click.option("--full", is_flag=True,
+              help="Re-score conversations even if they and the rules are unchanged")
+@click.option("--conversation-id", "conversation_ids", multiple=True,
+              help="Categorize specific conversations (repeatable)")
+@click.option("--classifier", is_flag=True, help="Use the trained classifier instead of keyword rules")
+@click.option("--status", is_flag=True, help="Only show how many conversations need categorizing")
+@click.option("--workers", type=int, help="Scoring processes (default: CPU count)")
+@click.option("--chunk-size", default=500, type=int, help="Conversations per chunk")
+@click.pass_context
+def categorize(
+    ctx: click.Context,
+    recategorize: bool,
+    full: bool,
+    conversation_ids: tuple,
+    classifier: bool,
+    status: bool,
+    workers: Optional[int],
+    chunk_size: int,
+):
+    """Categorize stored conversations by keyword rules."""
+    client = ctx.obj["client"]
+    
+    if status:
+        stale = client.count_stale_categorizations(recategorize=recategorize)
+        console.print(f"{stale:,} conversations are new or changed since they were last categorized")
+        return
+    
+    with Progress(console=console) as progress:
+        task = progress.add_task("Categorizing conversations...", total=100)
+        
+        def on_progress(message: str, percent: int):
+            progress.update(task, description=message, completed=percent)
+        
+        try:
+            stats = client.categorize_conversations(
+                conversation_ids=list(conversation_ids) or None,
+                recategorize=recategorize,
+                full=full,
+                workers=workers,
+                chunk_size=chunk_size,
+                progress_callback=on_progress,
+                classifier=classifier,
+            )
+        except Exception as e:
+            console.print(f"❌ Categorization failed: {e}", style="red")
+            return
+    
+    console.print(
+        f"✅ Categorized {stats['categorized']:,} of {stats['total']:,} conversations "
+        f"({stats['unchanged']:,} unchanged, {stats['skipped']:,} skipped, {stats['failed']:,} failed)",
+        style="green",
+    )
+
+
+@main.command(name="train-classifier")
+@click.option("--full", is_flag=True, help="Retrain from scratch instead of updating the model")
+@click.pass_context
+def train_classifier(ctx: click.Context, full: bool):
+    """Train the category classifier from categorized conversations."""
+    client = ctx.obj["client"]
+    
+    with console.status("Training classifier..."):
+        try:
+            stats = client.train_classifier(full=full)
+        except Exception as e:
+            console.print(f"❌ Training failed: {e}", style="red")
+            return
+    
+    if stats["mode"] == "unchanged":
+        console.print(f"Classifier is up to date ({stats['examples']:,} examples)", style="yellow")
+        return
+    console.print(
+        f"✅ Classifier trained ({stats['mode']}) on {stats['new']:,} of {stats['examples']:,} examples "
+        f"in {stats['seconds']:.1f}s; {len(stats['categories'])} categories, saved to {stats['path']}",
+        style="green",
+    )
+
+
+@main.command(name="rebuild-rollups")
+@click.pass_context
+def rebuild_rollups(ctx: click.Context):
+    """Recompute the analytics rollup tables."""
+    client = ctx.obj["client"]
+    
+    try:
+        rows = client.rebuild_rollups()
+    except Exception as e:
+        console.print(f"❌ Failed to rebuild rollups: {e}", style="red")
+        return
+    
+    console.print(f"✅ Rebuilt analytics rollups ({rows:,} day/bot/category rows)", style="green")
+
+
 if __name__ == "__main__":
     main()
@@ -1,17 +1,36 @@
 """Main client for Poe Search functionality."""
 
 import logging
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from poe_search.api.client import PoeAPIClient  # This is the main API client
+from poe_search.export.columnar import COLUMNAR_FORMATS, ColumnarExporter
 from poe_search.export.exporter import ConversationExporter
+from poe_search.export.importer import ConversationImporter
+from poe_search.export.sharded import ShardedExporter
+from poe_search.search.categorizer import BatchCategorizer
+from poe_search.search.classifier import TextClassifier, default_model_path
 from poe_search.search.engine import SearchEngine
+from poe_search.storage.analytics import ConversationAnalytics
 from poe_search.storage.database import Database
+from poe_search.sync.jobs import RetryPolicy, SyncJobRunner
+
+if TYPE_CHECKING:
+    from poe_search.api.client import PoeAPIClient
 
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name):
+    # The API client imports Selenium; it is resolved on first use so that
+    # local commands (search, export, analytics) do not pay for it.
+    if name == "PoeAPIClient":
+        from poe_search.api.client import PoeAPIClient
+        return PoeAPIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class PoeSearchClient:
     """Main client for Poe Search functionality."""
 
@@ -42,9 +61,11 @@ class PoeSearchClient:
         self._exporter = None
     
     @property
-    def api_client(self) -> PoeAPIClient:
+    def api_client(self) -> "PoeAPIClient":
         """Get the Poe API client."""
         if self._api_client is None:
+            # Looked up in the module namespace first, where tests patch it
+            PoeAPIClient = globals().get("PoeAPIClient") or __getattr__("PoeAPIClient")
             if self.config and hasattr(self.config, 'get_poe_tokens'):
                 tokens = self.config.get_poe_tokens()
                 p_b_token = tokens.get('p-b') if isinstance(tokens, dict) else tokens
@@ -251,21 +272,8 @@ class PoeSearchClient:
             Number of conversations synced
         """
         try:
-            conversations = self.get_conversation_history(days=days)
-            
-            synced_count = 0
-            for conv in conversations:
-                try:
-                    self.database.save_conversation(conv)
-                    synced_count += 1
-                except Exception as e:
-                    logger.warning(
-                        "Failed to store conversation %s: %s",
-                        conv.get('id', 'unknown'),
-                        e,
-                    )
-                    continue
-            
+            stats = self.sync(days=days)
+            synced_count = stats["new"] + stats["updated"]
             logger.info(f"Synced {synced_count} conversations")
             return synced_count
             
@@ -273,34 +281,111 @@ class PoeSearchClient:
             logger.error(f"Failed to sync conversations: {e}")
             return 0
     
-    def sync(self, days: int = 7) -> Dict[str, int]:
+    def sync(
+        self,
+        days: int = 7,
+        limit: int = 50,
+        progress_callback: Optional[Any] = None,
+        **runner_options: Any,
+    ) -> Dict[str, Any]:
         """Sync conversations from Poe.
         
+        The discovered conversation list is checkpointed in a sync job
+        before anything is fetched, so an interrupted sync can be continued
+        with :meth:`resume_sync`.
+        
         Args:
             days: Number of days to sync
+            limit: Maximum number of conversations to discover
+            progress_callback: Called with a status message and percentage
+            **runner_options: Further SyncJobRunner options (on_synced, should_stop)
             
         Returns:
             Statistics about synced data
         """
         logger.info(f"Syncing conversations from last {days} days")
         
-        # Get recent conversations from API
-        conversations = self.api_client.get_recent_conversations(days=days)
+        conversations = self.api_client.get_conversation_list(limit=limit)
         
-        # Store in database
-        stats = {"new": 0, "updated": 0, "total": len(conversations)}
-        
-        for conversation in conversations:
-            if self.database.conversation_exists(conversation["id"]):
-                self.database.update_conversation(conversation)
-                stats["updated"] += 1
-            else:
-                self.database.save_conversation(conversation)
-                stats["new"] += 1
+        # Listings that report activity times can be narrowed down to the period
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        conversations = [
+            conv for conv in conversations
+            if not conv.get("updated_at") or conv["updated_at"] >= cutoff
+        ]
         
+        stats = self._sync_runner(progress_callback, **runner_options).start(
+            conversations, params={"days": days, "limit": limit}
+        )
         logger.info(f"Sync complete: {stats}")
         return stats
     
+    def resume_sync(
+        self,
+        job_id: Optional[int] = None,
+        progress_callback: Optional[Any] = None,
+        **runner_options: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """Resume an interrupted sync from its checkpoint.
+        
+        Conversations stored before the interruption are skipped and failed
+        ones are retried with backoff.
+        
+        Args:
+            job_id: Sync job to resume, or None for the most recent unfinished one
+            progress_callback: Called with a status message and percentage
+            **runner_options: Further SyncJobRunner options (on_synced, should_stop)
+            
+        Returns:
+            Statistics about synced data, or None if there is nothing to resume
+        """
+        stats = self._sync_runner(progress_callback, **runner_options).resume(job_id)
+        if stats is not None:
+            logger.info(f"Resumed sync complete: {stats}")
+        return stats
+    
+    def _sync_runner(
+        self,
+        progress_callback: Optional[Any] = None,
+        **runner_options: Any,
+    ) -> SyncJobRunner:
+        """Create a sync job runner using the configured retry settings."""
+        if self.config and hasattr(self.config, "sync"):
+            retry_policy = RetryPolicy.from_settings(self.config.sync)
+        else:
+            retry_policy = RetryPolicy()
+        
+        return SyncJobRunner(
+            self.database,
+            fetch=self._fetch_conversation,
+            retry_policy=retry_policy,
+            progress_callback=progress_callback,
+            **runner_options,
+        )
+    
+    def _fetch_conversation(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fetch one sync job item and convert it to database format."""
+        url = item.get("url") or f"https://poe.com/chat/{item['conversation_id']}"
+        conversation = self.api_client.get_conversation_details(url)
+        if conversation is None:
+            return None
+        
+        data = conversation.to_dict() if hasattr(conversation, "to_dict") else dict(conversation)
+        data["id"] = item["conversation_id"]
+        data["updated_at"] = data.get("updated_at") or data["created_at"]
+        data["messages"] = [
+            {
+                "id": msg.get("message_id") or msg.get("id") or f"{data['id']}_{i}",
+                "role": "user" if msg.get("role") == "user" else "bot",
+                "content": msg.get("content", ""),
+                "timestamp": msg.get("timestamp") or data["created_at"],
+                "bot": msg.get("bot_name") or msg.get("bot") or data.get("bot"),
+            }
+            for i, msg in enumerate(data.get("messages", []))
+        ]
+        data["message_count"] = len(data["messages"])
+        return data
+    
     def get_conversations(
         self,
         bot: Optional[str] = None,
@@ -327,26 +412,117 @@ class PoeSearchClient:
         self,
         output_path: str,
         format: str = "json",
+        compression: Optional[str] = None,
+        max_part_size: Optional[int] = None,
         **filters: Any,
-    ) -> None:
+    ) -> int:
         """Export conversations to file.
         
+        Conversations are streamed from the database in chunks, so the
+        archive is never held in memory as a whole.
+        
         Args:
             output_path: Output file path
-            format: Export format (json, csv, markdown)
+            format: Export format (json, ndjson, csv, markdown, or the
+                columnar parquet and feather, written as a directory with
+                conversations and messages tables)
+            compression: Compress text formats (gzip, zstd, xz); defaults to
+                the configured format when ``export.compress_exports`` is set
+            max_part_size: Split text formats into parts of roughly this many
+                bytes; defaults to ``export.max_export_part_mb``
             **filters: Filters for conversations to export
+            
+        Returns:
+            Number of conversations exported
         """
-        conversations = self.database.get_conversations(**filters)
-        self.exporter.export(
-            conversations=conversations,
-            output_path=output_path,
-            format=format,
-        )
+        if format.lower() in COLUMNAR_FORMATS:
+            stats = ColumnarExporter(self.database).export(
+                output_path=output_path,
+                format=format,
+                **filters,
+            )
+            count = stats["conversations"]
+        else:
+            export_settings = getattr(self.config, "export", None)
+            if export_settings is not None:
+                if compression is None and export_settings.compress_exports:
+                    compression = export_settings.compression_format
+                if max_part_size is None and export_settings.max_export_part_mb:
+                    max_part_size = export_settings.max_export_part_mb * 1024 * 1024
+            count = self.exporter.export_from_database(
+                output_path=output_path,
+                format=format,
+                compression=compression,
+                max_part_size=max_part_size,
+                **filters,
+            )
         logger.info(
             "Exported %d conversations to %s",
-            len(conversations),
+            count,
             output_path,
         )
+        return count
+    
+    def export_sharded(
+        self,
+        output_dir: str,
+        format: str = "markdown",
+        shard_by: str = "conversation",
+        **options: Any,
+    ) -> Dict[str, int]:
+        """Export conversations to a directory, one file per shard.
+        
+        Shards are written in parallel and only shards whose content changed
+        since the last export into the same directory are rewritten.
+        
+        Args:
+            output_dir: Output directory
+            format: Export format of each file (json, ndjson, csv, markdown)
+            shard_by: conversation, bot, category or month
+            **options: Further ShardedExporter options and conversation filters
+            
+        Returns:
+            Statistics about written, skipped and removed shards
+        """
+        export_settings = getattr(self.config, "export", None)
+        if export_settings is not None and export_settings.compress_exports:
+            options.setdefault("compression", export_settings.compression_format)
+        stats = ShardedExporter(self.database).export(
+            output_dir, format=format, shard_by=shard_by, **options
+        )
+        logger.info(f"Sharded export to {output_dir}: {stats}")
+        return stats
+    
+    def import_conversations(
+        self,
+        paths: List[Union[str, Path]],
+        format: Optional[str] = None,
+        on_conflict: str = "replace",
+        progress_callback: Optional[Any] = None,
+        batch_size: int = 500,
+    ) -> Dict[str, int]:
+        """Import exported archives into the database.
+        
+        Args:
+            paths: Export files or directories (json, ndjson, parquet, feather,
+                sharded; compressed and split exports are supported)
+            format: Export format, detected from each path if None
+            on_conflict: replace, skip or newer for conversations already stored
+            progress_callback: Called with (conversations read, bytes read, total bytes)
+            batch_size: Conversations inserted per executemany batch
+            
+        Returns:
+            Statistics: conversations read, imported and skipped, messages read
+        """
+        stats = ConversationImporter(self.database).import_paths(
+            paths,
+            format=format,
+            on_conflict=on_conflict,
+            batch_size=batch_size,
+            progress_callback=progress_callback,
+        )
+        logger.info(f"Import complete: {stats}")
+        return stats
     
     def get_bots(self) -> List[Dict[str, Any]]:
         """Get list of bots from database.
@@ -366,3 +542,107 @@ class PoeSearchClient:
             Analytics data
         """
         return self.database.get_analytics(period=period)
+    
+    def get_dashboard_analytics(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """Get the analytics dashboard summary, aggregated in the database.
+        
+        Args:
+            days: Only count conversations created in the last N days (None = all time)
+            
+        Returns:
+            Dict with overview, bots, categories and timeline entries
+        """
+        return ConversationAnalytics(self.database).dashboard(days=days)
+    
+    def categorize_conversations(
+        self,
+        conversation_ids: Optional[List[str]] = None,
+        recategorize: bool = False,
+        full: bool = False,
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+        progress_callback: Optional[Any] = None,
+        classifier: bool = False,
+    ) -> Dict[str, int]:
+        """Categorize stored conversations with the default rules.
+        
+        Conversation text is scored in parallel chunks and the categories
+        of each chunk are stored in one transaction. Only conversations
+        that changed since they were last scored are read, unless ``full``.
+        
+        Args:
+            conversation_ids: Only these conversations (all if None)
+            recategorize: Also score conversations whose category was set
+                by hand or by the sync
+            full: Re-score conversations even if they and the rules are unchanged
+            workers: Scoring processes (CPU count if None)
+            chunk_size: Conversations per chunk
+            progress_callback: Called with a status message and percentage
+            classifier: Use the trained classifier (see :meth:`train_classifier`)
+                instead of the keyword rules
+            
+        Returns:
+            Statistics: total, categorized, unchanged, skipped, failed, interrupted
+        """
+        stats = BatchCategorizer(
+            self.database,
+            workers=workers,
+            chunk_size=chunk_size,
+            progress_callback=progress_callback,
+            categorizer=self.load_classifier() if classifier else None,
+        ).run(
+            conversation_ids,
+            uncategorized_only=not (recategorize or conversation_ids),
+            incremental=not full,
+        )
+        logger.info(f"Categorization complete: {stats}")
+        return stats
+    
+    def load_classifier(self) -> TextClassifier:
+        """Load the trained category classifier of this database.
+        
+        Raises:
+            FileNotFoundError: If no classifier was trained yet
+        """
+        path = default_model_path(self.database)
+        if not path.exists():
+            raise FileNotFoundError(f"No trained classifier at {path}; run train-classifier first")
+        return TextClassifier.load(path)
+    
+    def train_classifier(self, full: bool = False) -> Dict[str, Any]:
+        """Train the category classifier from the categorized conversations.
+        
+        The saved classifier is updated with the conversations categorized
+        since it was last trained, or retrained from scratch when needed.
+        
+        Args:
+            full: Retrain from scratch
+            
+        Returns:
+            Training statistics (see :meth:`TextClassifier.train`) and the model path
+        """
+        path = default_model_path(self.database)
+        classifier = TextClassifier.load(path) if path.exists() and not full else TextClassifier()
+        stats = classifier.train(self.database, full=full)
+        if stats["mode"] != "unchanged":
+            classifier.save(path)
+        stats["path"] = str(path)
+        logger.info(f"Classifier training complete: {stats}")
+        return stats
+    
+    def count_stale_categorizations(self, recategorize: bool = False) -> int:
+        """Count conversations the next categorization run would read.
+        
+        Args:
+            recategorize: Include conversations whose category was set by
+                hand or by the sync
+        """
+        return BatchCategorizer(self.database).stale_count(uncategorized_only=not recategorize)
+    
+    def rebuild_rollups(self) -> int:
+        """Recompute the analytics rollups from the stored conversations.
+        
+        Returns:
+            Number of rollup rows
+        """
+        return self.database.rebuild_rollups()
@@ -164,12 +164,17 @@ class ExportOptions:
     max_conversations: Optional[int] = None
     date_range: Optional[tuple] = None
     categories: Optional[List[str]] = None
+    compression: Optional[str] = None  # 'gzip', 'zstd', 'xz'
+    max_part_size: Optional[int] = None  # bytes per part
 
     def __post_init__(self):
         """Validate export options."""
         valid_formats = ['json', 'txt', 'csv', 'markdown']
         if self.format not in valid_formats:
             raise ValueError(f"Invalid format. Must be one of: {valid_formats}")
+        valid_compressions = [None, 'gzip', 'zstd', 'xz']
+        if self.compression not in valid_compressions:
+            raise ValueError(f"Invalid compression. Must be one of: {valid_compressions}")
 
 
 @dataclass
@@ -1,5 +1,17 @@
 """Export module initialization."""
 
+from poe_search.export.columnar import ColumnarExporter, ColumnarImporter
+from poe_search.export.compression import COMPRESSION_FORMATS, open_export_file
 from poe_search.export.exporter import ConversationExporter
+from poe_search.export.importer import ConversationImporter
+from poe_search.export.sharded import ShardedExporter
 
-__all__ = ["ConversationExporter"]
+__all__ = [
+    "COMPRESSION_FORMATS",
+    "ColumnarExporter",
+    "ColumnarImporter",
+    "ConversationExporter",
+    "ConversationImporter",
+    "ShardedExporter",
+    "open_export_file",
+]
@@ -0,0 +1,403 @@
+"""Columnar Parquet/Arrow export and import.
+
+Conversations and messages are written as two tables, ``conversations``
+and ``messages``, instead of one flat CSV row per message, so conversation
+metadata is stored once. Low-cardinality columns (bot, category, role) are
+dictionary encoded, and rows are streamed from a database cursor into
+fixed-size row groups (Parquet) or record batches (Arrow IPC/Feather).
+
+Load an export with pandas::
+
+    conversations = pd.read_parquet("export/conversations.parquet")
+    messages = pd.read_parquet("export/messages.parquet")
+
+Requires the optional ``pyarrow`` dependency, which is imported on first
+use so that importing this module stays cheap.
+"""
+
+import importlib
+import importlib.util
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from poe_search.utils.timestamps import from_epoch_ms, to_epoch_ms
+
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Bound by _require_pyarrow()
+pa: Any = None
+ipc: Any = None
+pq: Any = None
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_FORMATS = ("parquet", "feather")
+
+# Conversation fields stored as columns; everything else goes to ``metadata``
+_CONVERSATION_COLUMNS = ("id", "bot", "title", "created_at", "updated_at", "message_count", "category")
+
+
+def _require_pyarrow() -> None:
+    global pa, ipc, pq
+    if pa is not None:
+        return
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "Parquet/Arrow export requires pyarrow. Install it with: pip install pyarrow"
+        )
+    pa = importlib.import_module("pyarrow")
+    ipc = importlib.import_module("pyarrow.ipc")
+    pq = importlib.import_module("pyarrow.parquet")
+
+
+def conversation_schema() -> "pa.Schema":
+    """Arrow schema of the conversations table."""
+    _require_pyarrow()
+    return pa.schema([
+        ("id", pa.string()),
+        ("bot", pa.dictionary(pa.int32(), pa.string())),
+        ("category", pa.dictionary(pa.int32(), pa.string())),
+        ("title", pa.string()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+        ("message_count", pa.int32()),
+        ("metadata", pa.string()),  # JSON of the remaining fields
+    ])
+
+
+def message_schema() -> "pa.Schema":
+    """Arrow schema of the messages table."""
+    _require_pyarrow()
+    return pa.schema([
+        ("conversation_id", pa.string()),
+        ("id", pa.string()),
+        ("position", pa.int32()),
+        ("role", pa.dictionary(pa.int8(), pa.string())),
+        ("bot", pa.dictionary(pa.int32(), pa.string())),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("content", pa.string()),
+    ])
+
+
+def _format_time(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+class _TableWriter:
+    """Buffers rows column-wise and flushes them as row groups.
+
+    Dictionary columns are encoded against one growing dictionary per
+    column, so later batches only append to it. Arrow IPC files need this
+    (they allow dictionary deltas but not replacements).
+    """
+
+    def __init__(self, path: Path, schema: "pa.Schema", format: str, row_group_size: int):
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+        self.rows = 0
+        self._buffered = 0
+        self._dictionaries: Dict[str, Dict[str, int]] = {
+            field.name: {} for field in schema if pa.types.is_dictionary(field.type)
+        }
+        if format == "parquet":
+            self._writer = pq.ParquetWriter(
+                str(path), schema, compression="zstd", use_dictionary=list(self._dictionaries)
+            )
+        else:
+            self._sink = pa.OSFile(str(path), "wb")
+            self._writer = ipc.new_file(
+                self._sink,
+                schema,
+                options=ipc.IpcWriteOptions(compression="zstd", emit_dictionary_deltas=True),
+            )
+
+    def append(self, row: Dict[str, Any]) -> None:
+        for name, values in self.columns.items():
+            value = row.get(name)
+            dictionary = self._dictionaries.get(name)
+            if dictionary is not None and value is not None:
+                value = dictionary.setdefault(value, len(dictionary))
+            values.append(value)
+        self._buffered += 1
+        if self._buffered >= self.row_group_size:
+            self.flush()
+
+    def _array(self, field: "pa.Field") -> "pa.Array":
+        values = self.columns[field.name]
+        dictionary = self._dictionaries.get(field.name)
+        if dictionary is None:
+            return pa.array(values, type=field.type)
+        return pa.DictionaryArray.from_arrays(
+            pa.array(values, type=field.type.index_type),
+            pa.array(list(dictionary), type=field.type.value_type),
+        )
+
+    def flush(self) -> None:
+        if not self._buffered:
+            return
+        batch = pa.RecordBatch.from_arrays(
+            [self._array(field) for field in self.schema], schema=self.schema
+        )
+        if isinstance(self._writer, pq.ParquetWriter):
+            self._writer.write_batch(batch, row_group_size=self.row_group_size)
+        else:
+            self._writer.write_batch(batch)
+        self.rows += self._buffered
+        self._buffered = 0
+        for values in self.columns.values():
+            values.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+        if hasattr(self, "_sink"):
+            self._sink.close()
+
+
+class ColumnarExporter:
+    """Export conversations as Parquet or Arrow IPC (Feather) tables."""
+
+    def __init__(self, database):
+        """Initialize the exporter.
+
+        Args:
+            database: Database instance
+        """
+        _require_pyarrow()
+        self.database = database
+
+    def export(
+        self,
+        output_path: str,
+        format: str = "parquet",
+        row_group_size: int = 10000,
+        chunk_size: int = 500,
+        **filters: Any,
+    ) -> Dict[str, int]:
+        """Stream conversations from the database into columnar tables.
+
+        Args:
+            output_path: Output directory; receives ``conversations.<ext>``
+                and ``messages.<ext>``
+            format: ``parquet`` or ``feather``
+            row_group_size: Rows per Parquet row group / Arrow record batch
+            chunk_size: Rows fetched per database round trip
+            **filters: Conversation filters (bot, days, limit, conversation_id)
+
+        Returns:
+            Number of conversations and messages written
+        """
+        conversations = self.database.iter_conversations(chunk_size=chunk_size, **filters)
+        return self.export_conversations(conversations, output_path, format, row_group_size)
+
+    def export_conversations(
+        self,
+        conversations: Iterable[Dict[str, Any]],
+        output_path: str,
+        format: str = "parquet",
+        row_group_size: int = 10000,
+    ) -> Dict[str, int]:
+        """Write conversations from any iterable into columnar tables.
+
+        Args:
+            conversations: Conversations in database format
+            output_path: Output directory
+            format: ``parquet`` or ``feather``
+            row_group_size: Rows per row group / record batch
+
+        Returns:
+            Number of conversations and messages written
+        """
+        format = format.lower()
+        if format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format: {format}")
+
+        output_dir = Path(output_path)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        conversation_writer = _TableWriter(
+            output_dir / f"conversations.{format}", conversation_schema(), format, row_group_size
+        )
+        message_writer = _TableWriter(
+            output_dir / f"messages.{format}", message_schema(), format, row_group_size
+        )
+
+        try:
+            for conversation in conversations:
+                metadata = {
+                    key: value for key, value in conversation.items()
+                    if key not in _CONVERSATION_COLUMNS and key != "messages"
+                }
+                conversation_writer.append({
+                    "id": conversation["id"],
+                    "bot": conversation.get("bot"),
+                    "category": conversation.get("category"),
+                    "title": conversation.get("title"),
+                    "created_at": from_epoch_ms(to_epoch_ms(conversation.get("created_at"))),
+                    "updated_at": from_epoch_ms(to_epoch_ms(conversation.get("updated_at"))),
+                    "message_count": conversation.get("message_count", 0),
+                    "metadata": json.dumps(metadata, ensure_ascii=False) if metadata else None,
+                })
+                for position, message in enumerate(conversation.get("messages") or []):
+                    message_writer.append({
+                        "conversation_id": conversation["id"],
+                        "id": message.get("id"),
+                        "position": position,
+                        "role": message.get("role"),
+                        "bot": message.get("bot"),
+                        "timestamp": from_epoch_ms(to_epoch_ms(message.get("timestamp"))),
+                        "content": message.get("content", ""),
+                    })
+        finally:
+            conversation_writer.close()
+            message_writer.close()
+
+        stats = {"conversations": conversation_writer.rows, "messages": message_writer.rows}
+        logger.info(f"Exported {stats} to {output_dir} as {format}")
+        return stats
+
+
+class ColumnarImporter:
+    """Import Parquet or Arrow IPC exports into the database."""
+
+    def __init__(self, database):
+        """Initialize the importer.
+
+        Args:
+            database: Database instance
+        """
+        _require_pyarrow()
+        self.database = database
+
+    def import_path(
+        self,
+        input_path: str,
+        batch_size: int = 500,
+        on_conflict: str = "replace",
+    ) -> Dict[str, int]:
+        """Import an export directory written by :class:`ColumnarExporter`.
+
+        Args:
+            input_path: Export directory
+            batch_size: Conversations inserted per executemany batch
+            on_conflict: replace, skip or newer (see
+                :meth:`Database.save_conversations_bulk`)
+
+        Returns:
+            Number of conversations and messages imported
+        """
+        conversations = self.iter_directory(input_path)
+        stats = {"conversations": 0, "messages": 0}
+
+        def counted(items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for conversation in items:
+                stats["messages"] += len(conversation["messages"])
+                yield conversation
+
+        stats["conversations"] = self.database.save_conversations_bulk(
+            counted(conversations), batch_size=batch_size, on_conflict=on_conflict
+        )
+        logger.info(f"Imported {stats} from {input_path}")
+        return stats
+
+    def iter_directory(self, input_path: str) -> Iterator[Dict[str, Any]]:
+        """Stream the conversations of an export directory.
+
+        Args:
+            input_path: Export directory
+
+        Returns:
+            Iterator of conversations with their messages
+
+        Raises:
+            FileNotFoundError: If the directory holds no conversations table
+        """
+        input_dir = Path(input_path)
+        for format in COLUMNAR_FORMATS:
+            conversations_file = input_dir / f"conversations.{format}"
+            if conversations_file.exists():
+                break
+        else:
+            raise FileNotFoundError(f"No conversations table found in {input_dir}")
+
+        messages_file = input_dir / f"messages.{format}"
+        return self.iter_conversations(
+            conversations_file,
+            messages_file if messages_file.exists() else None,
+            format,
+        )
+
+    def iter_conversations(
+        self,
+        conversations_file: Path,
+        messages_file: Optional[Path] = None,
+        format: str = "parquet",
+    ) -> Iterator[Dict[str, Any]]:
+        """Reassemble conversations in database format from the two tables.
+
+        The messages table must follow conversation order, as written by
+        :class:`ColumnarExporter`; both tables are then read batch by batch
+        in lockstep without loading either into memory.
+
+        Args:
+            conversations_file: Conversations table
+            messages_file: Messages table, if any
+            format: ``parquet`` or ``feather``
+
+        Yields:
+            Conversations with their messages
+        """
+        messages = self._iter_rows(messages_file, format) if messages_file else iter(())
+        pending = next(messages, None)
+
+        for row in self._iter_rows(conversations_file, format):
+            conversation_messages = []
+            while pending is not None and pending["conversation_id"] == row["id"]:
+                conversation_messages.append(pending)
+                pending = next(messages, None)
+            yield self._to_conversation(row, conversation_messages)
+
+        if pending is not None:
+            skipped = 1 + sum(1 for _ in messages)
+            logger.warning(
+                f"Skipped {skipped} messages that do not follow conversation order"
+            )
+
+    def _to_conversation(self, row: Dict[str, Any], messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        conversation = json.loads(row["metadata"]) if row.get("metadata") else {}
+        created_at = _format_time(row["created_at"]) or datetime.now(timezone.utc).isoformat()
+        conversation.update({
+            "id": row["id"],
+            "bot": row["bot"] or "unknown",
+            "title": row["title"] or "",
+            "created_at": created_at,
+            "updated_at": _format_time(row["updated_at"]) or created_at,
+            "message_count": row["message_count"] or len(messages),
+        })
+        if row.get("category") is not None:
+            conversation["category"] = row["category"]
+        messages.sort(key=lambda m: m["position"])
+        conversation["messages"] = [
+            {
+                "id": m["id"] or f"{row['id']}_{m['position']}",
+                "role": m["role"],
+                "content": m["content"] or "",
+                "timestamp": _format_time(m["timestamp"]) or created_at,
+                "bot": m["bot"],
+            }
+            for m in messages
+        ]
+        return conversation
+
+    @staticmethod
+    def _iter_rows(path: Path, format: str) -> Iterator[Dict[str, Any]]:
+        if format == "parquet":
+            batches = pq.ParquetFile(str(path)).iter_batches()
+        else:
+            reader = ipc.open_file(pa.memory_map(str(path), "r"))
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        for batch in batches:
+            yield from batch.to_pylist()
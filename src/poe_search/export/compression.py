@@ -0,0 +1,334 @@
+"""Streaming compression and size-bounded parts for export files.
+
+:func:`open_export_file` returns a text stream that the exporters write to
+as if it were a plain file. Bytes are compressed on the fly (gzip, zstd or
+xz), so an archive never exists uncompressed on disk or in memory.
+
+With ``max_part_size`` the output is split into numbered parts
+(``export.part001.json.gz``, ``export.part002.json.gz``, ...). Every part
+is a complete compressed stream, and concatenating the decompressed parts
+in order reproduces the export, so ``cat export.part*.json.gz | gunzip``
+works. A part is closed once its compressed size reaches the limit, so a
+part can overshoot by what the compressor still held in its buffers.
+
+:class:`ExportReader` is the inverse: it decompresses one or more parts
+into a single byte stream for the importers.
+"""
+
+import gzip
+import io
+import logging
+import lzma
+import os
+import re
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Sequence, TextIO, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_FORMATS = ("gzip", "zstd", "xz")
+
+COMPRESSION_SUFFIXES = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+    "xz": ".xz",
+}
+
+DEFAULT_LEVELS = {
+    "gzip": 6,
+    "zstd": 3,
+    "xz": 6,
+}
+
+WRITE_BUFFER_SIZE = 256 * 1024
+PART_SLICE_SIZE = 16 * 1024
+
+_PART_PATTERN = re.compile(r"^(?P<stem>.*)\.part\d{3}(?P<suffix>(\.[^.]*)*)$")
+
+
+def compressed_path(path: Union[str, Path], compression: Optional[str]) -> Path:
+    """Return ``path`` with the compression suffix appended if missing.
+
+    Args:
+        path: Export file path
+        compression: Compression format, or None
+
+    Returns:
+        Output path, e.g. ``export.json.gz`` for ``export.json`` and gzip
+    """
+    path = Path(path)
+    if compression is None:
+        return path
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}")
+    suffix = COMPRESSION_SUFFIXES[compression]
+    if path.suffix == suffix:
+        return path
+    return path.with_name(path.name + suffix)
+
+
+def part_path(path: Path, compression: Optional[str], number: int) -> Path:
+    """Return the path of part ``number`` of a split export.
+
+    The part number goes before the format suffix so that tools that
+    dispatch on the extension still recognize each part.
+    """
+    name = path.name
+    suffix = COMPRESSION_SUFFIXES[compression] if compression else ""
+    if suffix:
+        name = name[: -len(suffix)]
+    stem, dot, extension = name.rpartition(".")
+    if not dot:
+        stem, extension = name, ""
+    part = f"{stem}.part{number:03d}"
+    return path.with_name(f"{part}.{extension}{suffix}" if extension else f"{part}{suffix}")
+
+
+class CompressedWriter(io.RawIOBase):
+    """Binary writer that compresses into one or more part files."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+        threads: Optional[int] = None,
+        max_part_size: Optional[int] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            path: Output path (already carrying the compression suffix)
+            compression: gzip, zstd, xz, or None for uncompressed output
+            level: Compression level (format default if None)
+            threads: zstd worker threads; None uses all CPUs, 0 disables
+            max_part_size: Split into parts of roughly this many bytes
+        """
+        super().__init__()
+        if compression is not None and compression not in COMPRESSION_FORMATS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise RuntimeError(
+                "zstd compression requires the zstandard package: pip install zstandard"
+            )
+        if max_part_size is not None and max_part_size <= 0:
+            raise ValueError("max_part_size must be positive")
+
+        self.path = Path(path)
+        self.compression = compression
+        self.level = DEFAULT_LEVELS.get(compression) if level is None else level
+        self.threads = (os.cpu_count() or 1) if threads is None else threads
+        self.max_part_size = max_part_size
+        self.paths: List[Path] = []
+
+        self._raw: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        if not self.max_part_size:
+            if self._stream is None:
+                self._open_part()
+            self._stream.write(data)
+            return len(data)
+
+        # Feed in slices so parts are cut close to the size limit
+        view = memoryview(data)
+        while view:
+            if self._stream is None:
+                self._open_part()
+            size = PART_SLICE_SIZE
+            if self._stream is self._raw:
+                size = min(size, self.max_part_size - self._raw.tell())
+            self._stream.write(view[:size])
+            view = view[size:]
+            if self._raw.tell() >= self.max_part_size:
+                self._close_part()
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._stream is None and not self.paths:
+                # Empty export: still produce a (valid, empty) output file
+                self._open_part()
+            self._close_part()
+        finally:
+            super().close()
+
+    def _open_part(self) -> None:
+        if self.max_part_size:
+            path = part_path(self.path, self.compression, len(self.paths) + 1)
+        else:
+            path = self.path
+        self._raw = open(path, "wb")
+        self.paths.append(path)
+
+        if self.compression == "gzip":
+            self._stream = gzip.GzipFile(
+                filename="", mode="wb", fileobj=self._raw, compresslevel=self.level
+            )
+        elif self.compression == "xz":
+            self._stream = lzma.LZMAFile(self._raw, mode="wb", preset=self.level)
+        elif self.compression == "zstd":
+            compressor = zstandard.ZstdCompressor(
+                level=self.level, threads=self.threads, write_content_size=False
+            )
+            self._stream = compressor.stream_writer(self._raw, closefd=False)
+        else:
+            self._stream = self._raw
+
+    def _close_part(self) -> None:
+        if self._stream is None:
+            return
+        try:
+            if self._stream is not self._raw:
+                self._stream.close()
+        finally:
+            self._raw.close()
+            logger.debug(f"Closed export part {self.paths[-1]}")
+            self._stream = None
+            self._raw = None
+
+
+def open_export_file(
+    path: Union[str, Path],
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+    threads: Optional[int] = None,
+    max_part_size: Optional[int] = None,
+    newline: Optional[str] = None,
+) -> TextIO:
+    """Open a UTF-8 text stream for an export file.
+
+    The returned stream's ``buffer.raw`` is the :class:`CompressedWriter`;
+    its ``paths`` attribute lists the files written once the stream is
+    closed.
+
+    Args:
+        path: Output path (already carrying the compression suffix)
+        compression: gzip, zstd, xz, or None for uncompressed output
+        level: Compression level (format default if None)
+        threads: zstd worker threads; None uses all CPUs, 0 disables
+        max_part_size: Split into parts of roughly this many bytes
+        newline: Newline translation, as for :func:`open`
+
+    Returns:
+        Writable text stream
+    """
+    writer = CompressedWriter(path, compression, level, threads, max_part_size)
+    buffered = io.BufferedWriter(writer, buffer_size=WRITE_BUFFER_SIZE)
+    return io.TextIOWrapper(buffered, encoding="utf-8", newline=newline)
+
+
+def detect_compression(path: Union[str, Path]) -> Optional[str]:
+    """Guess the compression format of a file from its suffix."""
+    suffix = Path(path).suffix
+    for compression, compression_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == compression_suffix:
+            return compression
+    return None
+
+
+def expand_parts(path: Union[str, Path]) -> List[Path]:
+    """Return all parts of a split export, given any one of them.
+
+    Args:
+        path: An export file, possibly one part of a split export
+
+    Returns:
+        The sorted sibling parts, or just ``path`` if it is not a part
+    """
+    path = Path(path)
+    match = _PART_PATTERN.match(path.name)
+    if not match:
+        return [path]
+    pattern = f"{match.group('stem')}.part[0-9][0-9][0-9]{match.group('suffix')}"
+    return sorted(path.parent.glob(pattern))
+
+
+class ExportReader(io.RawIOBase):
+    """Binary reader over the decompressed content of one or more parts."""
+
+    def __init__(self, paths: Sequence[Union[str, Path]]):
+        """Initialize the reader.
+
+        Args:
+            paths: Files to read in order; each is decompressed according
+                to its suffix
+        """
+        super().__init__()
+        self.paths = [Path(path) for path in paths]
+        self.total_bytes = sum(path.stat().st_size for path in self.paths)
+        self._done_bytes = 0
+        self._index = -1
+        self._raw: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+
+    @property
+    def bytes_read(self) -> int:
+        """Bytes consumed from the (compressed) input files so far."""
+        if self._raw is None or self._raw.closed:
+            return self._done_bytes
+        return self._done_bytes + self._raw.tell()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while True:
+            if self._stream is None and not self._next_part():
+                return 0
+            read = self._stream.readinto(buffer)
+            if read:
+                return read
+            self._close_part()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._close_part()
+        super().close()
+
+    def _next_part(self) -> bool:
+        self._index += 1
+        if self._index >= len(self.paths):
+            return False
+        path = self.paths[self._index]
+        compression = detect_compression(path)
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise RuntimeError(
+                "zstd compression requires the zstandard package: pip install zstandard"
+            )
+        self._raw = open(path, "rb")
+        if compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode="rb")
+        elif compression == "xz":
+            self._stream = lzma.LZMAFile(self._raw, mode="rb")
+        elif compression == "zstd":
+            self._stream = zstandard.ZstdDecompressor().stream_reader(
+                self._raw, read_across_frames=True, closefd=False
+            )
+        else:
+            self._stream = self._raw
+        return True
+
+    def _close_part(self) -> None:
+        if self._stream is None:
+            return
+        self._done_bytes += self.paths[self._index].stat().st_size
+        if self._stream is not self._raw:
+            self._stream.close()
+        self._raw.close()
+        self._stream = None
+        self._raw = None
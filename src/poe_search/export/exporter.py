@@ -1,14 +1,38 @@
-"""Export conversations to various formats."""
+"""Export conversations to various formats.
+
+All formats are written incrementally from an iterable of conversations.
+:meth:`ConversationExporter.export_from_database` feeds them straight from
+a database cursor, so memory use stays flat no matter how many
+conversations are exported. Output can be compressed on the fly and split
+into size-bounded parts (see :mod:`poe_search.export.compression`).
+"""
 
 import json
 import csv
 import logging
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 from datetime import datetime
 
+from poe_search.export.compression import compressed_path, open_export_file
+
 logger = logging.getLogger(__name__)
 
+SUPPORTED_FORMATS = ("json", "ndjson", "csv", "markdown")
+
+CSV_HEADER = [
+    "conversation_id",
+    "bot",
+    "title",
+    "created_at",
+    "updated_at",
+    "message_count",
+    "message_id",
+    "role",
+    "content",
+    "timestamp",
+]
+
 
 class ConversationExporter:
     """Export conversations to various formats."""
@@ -20,157 +44,289 @@ class ConversationExporter:
             database: Database instance
         """
         self.database = database
+        self.output_paths: List[Path] = []
     
     def export(
         self,
-        conversations: List[Dict[str, Any]],
+        conversations: Iterable[Dict[str, Any]],
         output_path: str,
         format: str = "json",
-    ) -> None:
+        count: Optional[int] = None,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        max_part_size: Optional[int] = None,
+    ) -> int:
         """Export conversations to the specified format.
         
+        The files written are recorded in :attr:`output_paths`.
+        
         Args:
-            conversations: List of conversations to export
+            conversations: Conversations to export; any iterable, consumed once
             output_path: Output file path
-            format: Export format (json, csv, markdown)
+            format: Export format (json, ndjson, csv, markdown)
+            count: Number of conversations, if known up front (used in headers)
+            compression: Compress the output (gzip, zstd, xz); the suffix is
+                appended to the output path if missing
+            compression_level: Compression level (format default if None)
+            max_part_size: Split the output into parts of roughly this many bytes
+            
+        Returns:
+            Number of conversations written
         """
-        output_file = Path(output_path)
+        format = format.lower()
+        if format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+        
+        if count is None and hasattr(conversations, "__len__"):
+            count = len(conversations)
+        
+        output_file = compressed_path(output_path, compression)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"Exporting {len(conversations)} conversations to {output_path} as {format}")
+        logger.info(
+            f"Exporting {count if count is not None else 'streamed'} conversations "
+            f"to {output_file} as {format}"
+            + (f" ({compression})" if compression else "")
+        )
         
-        if format.lower() == "json":
-            self._export_json(conversations, output_file)
-        elif format.lower() == "csv":
-            self._export_csv(conversations, output_file)
-        elif format.lower() == "markdown":
-            self._export_markdown(conversations, output_file)
-        else:
-            raise ValueError(f"Unsupported export format: {format}")
+        newline = "" if format == "csv" else None
+        f = open_export_file(
+            output_file,
+            compression=compression,
+            level=compression_level,
+            max_part_size=max_part_size,
+            newline=newline,
+        )
+        try:
+            if format == "json":
+                written = self._export_json(conversations, f, count)
+            elif format == "ndjson":
+                written = self._export_ndjson(conversations, f)
+            elif format == "csv":
+                written = self._export_csv(conversations, f)
+            else:
+                written = self._export_markdown(conversations, f, count)
+        finally:
+            f.close()
+            self.output_paths = f.buffer.raw.paths
+        
+        if len(self.output_paths) > 1:
+            logger.info(f"Export split into {len(self.output_paths)} parts")
+        return written
     
-    def _export_json(self, conversations: List[Dict[str, Any]], output_file: Path) -> None:
-        """Export conversations as JSON.
+    def export_from_database(
+        self,
+        output_path: str,
+        format: str = "json",
+        chunk_size: int = 500,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        max_part_size: Optional[int] = None,
+        **filters: Any,
+    ) -> int:
+        """Stream conversations from the database into an export file.
         
         Args:
-            conversations: List of conversations
-            output_file: Output file path
+            output_path: Output file path
+            format: Export format (json, ndjson, csv, markdown)
+            chunk_size: Rows fetched per database round trip
+            compression: Compress the output (gzip, zstd, xz)
+            compression_level: Compression level (format default if None)
+            max_part_size: Split the output into parts of roughly this many bytes
+            **filters: Conversation filters (bot, days, limit, conversation_id)
+            
+        Returns:
+            Number of conversations written
         """
-        export_data = {
-            "exported_at": datetime.now().isoformat(),
-            "conversation_count": len(conversations),
-            "conversations": conversations,
-        }
+        count = self.database.count_conversations(**filters)
+        conversations = self.database.iter_conversations(chunk_size=chunk_size, **filters)
+        return self.export(
+            conversations,
+            output_path,
+            format,
+            count=count,
+            compression=compression,
+            compression_level=compression_level,
+            max_part_size=max_part_size,
+        )
+    
+    def _export_json(
+        self,
+        conversations: Iterable[Dict[str, Any]],
+        f: TextIO,
+        count: Optional[int] = None,
+    ) -> int:
+        """Export conversations as a JSON document, one conversation at a time.
         
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        The output matches ``json.dump(..., indent=2)`` of the whole export
+        dict. When the count is not known up front it is written after the
+        conversation array.
+        
+        Args:
+            conversations: Conversations to export
+            f: Output file
+            count: Number of conversations, if known
+            
+        Returns:
+            Number of conversations written
+        """
+        f.write("{\n")
+        f.write(f'  "exported_at": {json.dumps(datetime.now().isoformat())},\n')
+        if count is not None:
+            f.write(f'  "conversation_count": {count},\n')
+        f.write('  "conversations": [')
+        
+        written = 0
+        for conversation in conversations:
+            text = json.dumps(conversation, indent=2, ensure_ascii=False)
+            f.write(",\n    " if written else "\n    ")
+            f.write(text.replace("\n", "\n    "))
+            written += 1
+        
+        f.write("\n  ]" if written else "]")
+        if count is None:
+            f.write(f',\n  "conversation_count": {written}')
+        f.write("\n}")
+        return written
     
-    def _export_csv(self, conversations: List[Dict[str, Any]], output_file: Path) -> None:
-        """Export conversations as CSV.
+    def _export_ndjson(self, conversations: Iterable[Dict[str, Any]], f: TextIO) -> int:
+        """Export conversations as newline-delimited JSON.
         
         Args:
-            conversations: List of conversations
-            output_file: Output file path
+            conversations: Conversations to export
+            f: Output file
+            
+        Returns:
+            Number of conversations written
         """
-        with open(output_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
+        written = 0
+        for conversation in conversations:
+            f.write(json.dumps(conversation, ensure_ascii=False))
+            f.write("\n")
+            written += 1
+        return written
+    
+    def _export_csv(self, conversations: Iterable[Dict[str, Any]], f: TextIO) -> int:
+        """Export conversations as CSV, one row per message.
+        
+        Args:
+            conversations: Conversations to export
+            f: Output file
             
-            # Write header
-            writer.writerow([
-                "conversation_id",
-                "bot",
-                "title",
-                "created_at",
-                "updated_at",
-                "message_count",
-                "message_id",
-                "role",
-                "content",
-                "timestamp",
-            ])
+        Returns:
+            Number of conversations written
+        """
+        writer = csv.writer(f)
+        
+        # Write header
+        writer.writerow(CSV_HEADER)
+        
+        # Write data
+        written = 0
+        for conversation in conversations:
+            base_row = [
+                conversation.get("id", ""),
+                conversation.get("bot", ""),
+                conversation.get("title", ""),
+                conversation.get("created_at", ""),
+                conversation.get("updated_at", ""),
+                conversation.get("message_count", 0),
+            ]
             
-            # Write data
-            for conversation in conversations:
-                base_row = [
-                    conversation.get("id", ""),
-                    conversation.get("bot", ""),
-                    conversation.get("title", ""),
-                    conversation.get("created_at", ""),
-                    conversation.get("updated_at", ""),
-                    conversation.get("message_count", 0),
-                ]
-                
-                # If conversation has messages, write each message as a row
-                messages = conversation.get("messages", [])
-                if messages:
-                    for message in messages:
-                        message_row = base_row + [
-                            message.get("id", ""),
-                            message.get("role", ""),
-                            message.get("content", ""),
-                            message.get("timestamp", ""),
-                        ]
-                        writer.writerow(message_row)
-                else:
-                    # Write conversation without messages
-                    writer.writerow(base_row + ["", "", "", ""])
+            # If conversation has messages, write each message as a row
+            messages = conversation.get("messages", [])
+            if messages:
+                writer.writerows(
+                    base_row + [
+                        message.get("id", ""),
+                        message.get("role", ""),
+                        message.get("content", ""),
+                        message.get("timestamp", ""),
+                    ]
+                    for message in messages
+                )
+            else:
+                # Write conversation without messages
+                writer.writerow(base_row + ["", "", "", ""])
+            written += 1
+        return written
     
-    def _export_markdown(self, conversations: List[Dict[str, Any]], output_file: Path) -> None:
+    def _export_markdown(
+        self,
+        conversations: Iterable[Dict[str, Any]],
+        f: TextIO,
+        count: Optional[int] = None,
+    ) -> int:
         """Export conversations as Markdown.
         
         Args:
-            conversations: List of conversations
-            output_file: Output file path
+            conversations: Conversations to export
+            f: Output file
+            count: Number of conversations, if known (otherwise written at the end)
+            
+        Returns:
+            Number of conversations written
         """
-        with open(output_file, "w", encoding="utf-8") as f:
-            # Write header
-            f.write("# Poe Conversations Export\n\n")
-            f.write(f"Exported on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total conversations: {len(conversations)}\n\n")
-            f.write("---\n\n")
+        # Write header
+        f.write("# Poe Conversations Export\n\n")
+        f.write(f"Exported on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        if count is not None:
+            f.write(f"Total conversations: {count}\n")
+        f.write("\n---\n\n")
+        
+        # Write each conversation
+        written = 0
+        for i, conversation in enumerate(conversations, 1):
+            self._write_markdown_conversation(f, i, conversation)
+            written = i
+        
+        if count is None:
+            f.write(f"Total conversations: {written}\n")
+        return written
+    
+    def _write_markdown_conversation(self, f: TextIO, index: int, conversation: Dict[str, Any]) -> None:
+        """Write one conversation section of a Markdown export."""
+        f.write(f"## Conversation {index}: {conversation.get('title', 'Untitled')}\n\n")
+        
+        # Conversation metadata
+        f.write(f"- **Bot**: {conversation.get('bot', 'Unknown')}\n")
+        f.write(f"- **Created**: {conversation.get('created_at', 'Unknown')}\n")
+        f.write(f"- **Updated**: {conversation.get('updated_at', 'Unknown')}\n")
+        f.write(f"- **Messages**: {conversation.get('message_count', 0)}\n")
+        f.write(f"- **ID**: `{conversation.get('id', 'Unknown')}`\n\n")
+        
+        # Write messages
+        messages = conversation.get("messages", [])
+        if messages:
+            f.write("### Messages\n\n")
             
-            # Write each conversation
-            for i, conversation in enumerate(conversations, 1):
-                f.write(f"## Conversation {i}: {conversation.get('title', 'Untitled')}\n\n")
-                
-                # Conversation metadata
-                f.write(f"- **Bot**: {conversation.get('bot', 'Unknown')}\n")
-                f.write(f"- **Created**: {conversation.get('created_at', 'Unknown')}\n")
-                f.write(f"- **Updated**: {conversation.get('updated_at', 'Unknown')}\n")
-                f.write(f"- **Messages**: {conversation.get('message_count', 0)}\n")
-                f.write(f"- **ID**: `{conversation.get('id', 'Unknown')}`\n\n")
+            for message in messages:
+                role = message.get("role", "unknown")
+                content = message.get("content", "")
+                timestamp = message.get("timestamp", "")
                 
-                # Write messages
-                messages = conversation.get("messages", [])
-                if messages:
-                    f.write("### Messages\n\n")
-                    
-                    for message in messages:
-                        role = message.get("role", "unknown")
-                        content = message.get("content", "")
-                        timestamp = message.get("timestamp", "")
-                        
-                        # Format role
-                        if role == "user":
-                            role_emoji = "👤"
-                            role_text = "User"
-                        elif role == "bot":
-                            role_emoji = "🤖"
-                            role_text = conversation.get("bot", "Bot")
-                        else:
-                            role_emoji = "❓"
-                            role_text = role.title()
-                        
-                        f.write(f"#### {role_emoji} {role_text}\n")
-                        if timestamp:
-                            f.write(f"*{timestamp}*\n\n")
-                        
-                        # Format content (escape markdown special characters)
-                        escaped_content = content.replace("*", "\\*").replace("_", "\\_").replace("`", "\\`")
-                        f.write(f"{escaped_content}\n\n")
+                # Format role
+                if role == "user":
+                    role_emoji = "👤"
+                    role_text = "User"
+                elif role == "bot":
+                    role_emoji = "🤖"
+                    role_text = conversation.get("bot", "Bot")
                 else:
-                    f.write("*No messages in this conversation*\n\n")
+                    role_emoji = "❓"
+                    role_text = role.title()
                 
-                f.write("---\n\n")
+                f.write(f"#### {role_emoji} {role_text}\n")
+                if timestamp:
+                    f.write(f"*{timestamp}*\n\n")
+                
+                # Format content (escape markdown special characters)
+                escaped_content = content.replace("*", "\\*").replace("_", "\\_").replace("`", "\\`")
+                f.write(f"{escaped_content}\n\n")
+        else:
+            f.write("*No messages in this conversation*\n\n")
+        
+        f.write("---\n\n")
     
     def export_search_results(
         self,
@@ -0,0 +1,367 @@
+"""Import exported archives back into the database.
+
+:class:`ConversationImporter` is the inverse of the exporters. It reads
+
+* JSON exports (the ``{"conversations": [...]}`` document written by
+  :class:`ConversationExporter`, or a bare array of conversations),
+* NDJSON exports, one conversation per line,
+* Parquet/Feather export directories written by :class:`ColumnarExporter`,
+* sharded export directories written by :class:`ShardedExporter`,
+
+optionally compressed and split into parts. Files are parsed incrementally
+and conversations are handed to :meth:`Database.save_conversations_bulk`
+as a stream, so a large export never has to fit in memory. ``ijson`` is
+used for JSON documents when it is installed; otherwise a stdlib parser
+decodes one conversation at a time.
+"""
+
+import io
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Union
+
+from poe_search.export.columnar import COLUMNAR_FORMATS, ColumnarImporter
+from poe_search.export.compression import ExportReader, detect_compression, expand_parts
+from poe_search.export.sharded import MANIFEST_NAME
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("json", "ndjson") + COLUMNAR_FORMATS
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Progress is reported after every this many conversations
+PROGRESS_INTERVAL = 500
+
+_NON_WHITESPACE = re.compile(r"\S")
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """Guess the format of an export file or directory.
+
+    Args:
+        path: Export file or directory
+
+    Returns:
+        One of :data:`IMPORT_FORMATS`, or ``sharded`` for a sharded export
+    """
+    path = Path(path)
+    if path.is_dir():
+        if (path / MANIFEST_NAME).exists():
+            return "sharded"
+        for format in COLUMNAR_FORMATS:
+            if (path / f"conversations.{format}").exists():
+                return format
+        raise ValueError(f"Not an export directory: {path}")
+
+    suffixes = path.suffixes
+    if suffixes and detect_compression(path):
+        suffixes = suffixes[:-1]
+    suffix = suffixes[-1] if suffixes else ""
+    if suffix == ".json":
+        return "json"
+    if suffix in (".ndjson", ".jsonl"):
+        return "ndjson"
+    raise ValueError(f"Cannot tell the export format of {path}; pass format explicitly")
+
+
+class _JSONStream:
+    """Decodes JSON values one at a time from a text stream."""
+
+    def __init__(self, f: TextIO, chunk_size: int = READ_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        # Read at least as much as is buffered, so that a large value is
+        # re-scanned a logarithmic number of times, not linearly
+        data = self.f.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.buffer[self.pos]
+            self.pos = len(self.buffer)
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid JSON export: expected {char!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof or not self._fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if (
+                isinstance(value, (int, float))
+                and end == len(self.buffer)
+                and not self.eof
+                and self._fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        """Decode the elements of the array at the current position."""
+        self.expect("[")
+        while True:
+            char = self.peek()
+            if char == "]":
+                self.pos += 1
+                return
+            if char == ",":
+                self.pos += 1
+                continue
+            yield self.decode()
+
+
+def iter_json_conversations(f: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Stream the conversations of a JSON export with the stdlib decoder.
+
+    Args:
+        f: Text stream positioned at the start of the document
+        chunk_size: Characters read per refill
+
+    Returns:
+        Iterator of conversations
+    """
+    stream = _JSONStream(f, chunk_size)
+    if stream.peek() == "[":
+        yield from stream.iter_array()
+        return
+
+    stream.expect("{")
+    while True:
+        char = stream.peek()
+        if char == "}" or not char:
+            return
+        if char == ",":
+            stream.pos += 1
+            continue
+        key = stream.decode()
+        stream.expect(":")
+        if key == "conversations" and stream.peek() == "[":
+            yield from stream.iter_array()
+        else:
+            stream.decode()  # Export metadata
+
+
+def _iter_json_conversations_ijson(f: io.RawIOBase) -> Iterator[Dict[str, Any]]:
+    """Stream the conversations of a JSON export with ijson."""
+    reader = io.BufferedReader(f, buffer_size=READ_CHUNK_SIZE)
+    first = reader.peek(64).lstrip()[:1]
+    prefix = "item" if first == b"[" else "conversations.item"
+    return ijson.items(reader, prefix, use_float=True)
+
+
+def iter_ndjson_conversations(f: TextIO) -> Iterator[Dict[str, Any]]:
+    """Stream the conversations of an NDJSON export.
+
+    Args:
+        f: Text stream
+
+    Returns:
+        Iterator of conversations
+    """
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid NDJSON export at line {line_number}: {e}") from e
+
+
+class ConversationImporter:
+    """Import exports into the database through the bulk insert path."""
+
+    def __init__(self, database):
+        """Initialize the importer.
+
+        Args:
+            database: Database instance
+        """
+        self.database = database
+
+    def import_paths(
+        self,
+        paths: Iterable[Union[str, Path]],
+        format: Optional[str] = None,
+        on_conflict: str = "replace",
+        batch_size: int = 500,
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    ) -> Dict[str, int]:
+        """Import one or more exports.
+
+        Args:
+            paths: Export files or directories; any part of a split export
+                brings in all of its parts
+            format: Export format (detected from each path if None)
+            on_conflict: replace, skip or newer (see
+                :meth:`Database.save_conversations_bulk`)
+            batch_size: Conversations inserted per executemany batch
+            progress_callback: Called with (conversations read, bytes read,
+                total bytes); byte counts are 0 for columnar exports
+
+        Returns:
+            Statistics: conversations read, imported and skipped, messages read
+        """
+        stats = {"read": 0, "imported": 0, "skipped": 0, "messages": 0}
+        for path in self._expand(paths):
+            logger.info(f"Importing {path}")
+            file_stats = self.import_path(
+                path,
+                format=format,
+                on_conflict=on_conflict,
+                batch_size=batch_size,
+                progress_callback=progress_callback,
+            )
+            for key in stats:
+                stats[key] += file_stats[key]
+        return stats
+
+    def import_path(
+        self,
+        path: Union[str, Path, List[Path]],
+        format: Optional[str] = None,
+        on_conflict: str = "replace",
+        batch_size: int = 500,
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    ) -> Dict[str, int]:
+        """Import a single export (all parts of it, if given a list).
+
+        See :meth:`import_paths` for the arguments.
+        """
+        parts = path if isinstance(path, list) else [Path(path)]
+        format = format or detect_format(parts[0])
+        if format == "sharded":
+            return self.import_paths(
+                self._sharded_files(parts[0]),
+                on_conflict=on_conflict,
+                batch_size=batch_size,
+                progress_callback=progress_callback,
+            )
+        if format not in IMPORT_FORMATS:
+            raise ValueError(f"Unsupported import format: {format}")
+
+        stats = {"read": 0, "imported": 0, "skipped": 0, "messages": 0}
+        reader = None
+        if format in COLUMNAR_FORMATS:
+            conversations = ColumnarImporter(self.database).iter_directory(str(parts[0]))
+        else:
+            reader = ExportReader(parts)
+            conversations = self.iter_conversations(reader, format)
+
+        def counted(items: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            for conversation in items:
+                if not isinstance(conversation, dict) or "id" not in conversation:
+                    raise ValueError(f"Not a conversation: {str(conversation)[:80]}")
+                stats["read"] += 1
+                stats["messages"] += len(conversation.get("messages") or [])
+                if progress_callback and stats["read"] % PROGRESS_INTERVAL == 0:
+                    self._report(progress_callback, stats, reader)
+                yield conversation
+
+        try:
+            stats["imported"] = self.database.save_conversations_bulk(
+                counted(conversations), batch_size=batch_size, on_conflict=on_conflict
+            )
+        finally:
+            if reader is not None:
+                reader.close()
+        stats["skipped"] = stats["read"] - stats["imported"]
+        if progress_callback:
+            self._report(progress_callback, stats, reader)
+        logger.info(f"Imported {stats['imported']} of {stats['read']} conversations from {parts[0]}")
+        return stats
+
+    def iter_conversations(self, reader: io.RawIOBase, format: str) -> Iterator[Dict[str, Any]]:
+        """Stream the conversations of a JSON or NDJSON export.
+
+        Args:
+            reader: Binary stream of the decompressed export
+            format: json or ndjson
+
+        Returns:
+            Iterator of conversations
+        """
+        if format == "json" and IJSON_AVAILABLE:
+            return _iter_json_conversations_ijson(reader)
+        text = io.TextIOWrapper(
+            io.BufferedReader(reader, buffer_size=READ_CHUNK_SIZE), encoding="utf-8-sig"
+        )
+        if format == "json":
+            return iter_json_conversations(text)
+        return iter_ndjson_conversations(text)
+
+    @staticmethod
+    def _report(
+        progress_callback: Callable[[int, int, int], None],
+        stats: Dict[str, int],
+        reader: Optional[ExportReader],
+    ) -> None:
+        if reader is None:
+            progress_callback(stats["read"], 0, 0)
+        else:
+            progress_callback(stats["read"], reader.bytes_read, reader.total_bytes)
+
+    @staticmethod
+    def _expand(paths: Iterable[Union[str, Path]]) -> List[Union[Path, List[Path]]]:
+        """Group the given paths into exports, collecting split parts once."""
+        exports: List[Union[Path, List[Path]]] = []
+        seen = set()
+        for path in map(Path, paths):
+            if not path.exists():
+                raise FileNotFoundError(f"Export not found: {path}")
+            if path.is_dir():
+                exports.append(path)
+                continue
+            parts = expand_parts(path)
+            if parts[0] in seen:
+                continue
+            seen.add(parts[0])
+            exports.append(parts if len(parts) > 1 else path)
+        return exports
+
+    @staticmethod
+    def _sharded_files(directory: Path) -> List[Path]:
+        with open(directory / MANIFEST_NAME, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") not in IMPORT_FORMATS:
+            raise ValueError(
+                f"Sharded {manifest.get('format')} exports cannot be imported; "
+                "export as json or ndjson"
+            )
+        return [directory / file_name for file_name in manifest.get("shards", {})]
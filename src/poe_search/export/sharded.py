@@ -0,0 +1,269 @@
+"""Multi-file exports, one file per conversation, bot, category or month.
+
+:class:`ShardedExporter` writes a directory of export files in parallel:
+
+* conversations are grouped into shards (``conversation``, ``bot``,
+  ``category`` or ``month``) whose file names are derived deterministically
+  with :func:`poe_search.utils.common.sanitize_filename`,
+* shards are written by a thread or process pool, each worker streaming its
+  conversations from the database through :class:`ConversationExporter`,
+* ``index.json`` lists every conversation with the file it was written to
+  and a content hash per shard; a re-export only rewrites shards whose
+  content changed and removes shards that no longer exist.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from poe_search.export.compression import compressed_path
+from poe_search.export.exporter import SUPPORTED_FORMATS, ConversationExporter
+from poe_search.utils.common import sanitize_filename
+from poe_search.utils.timestamps import format_epoch_ms, to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+SHARD_KEYS = ("conversation", "bot", "category", "month")
+
+MANIFEST_NAME = "index.json"
+
+FILE_EXTENSIONS = {
+    "json": ".json",
+    "ndjson": ".ndjson",
+    "csv": ".csv",
+    "markdown": ".md",
+}
+
+# Leaves room for the conversation id, extension and compression suffix
+MAX_TITLE_LENGTH = 80
+
+
+def conversation_hash(conversation: Dict[str, Any]) -> str:
+    """Stable content hash of a conversation."""
+    data = json.dumps(conversation, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def shard_name(conversation: Dict[str, Any], shard_by: str) -> str:
+    """File name (without extension) of the shard a conversation belongs to.
+
+    Args:
+        conversation: Conversation data
+        shard_by: conversation, bot, category or month
+
+    Returns:
+        Filesystem-safe shard name
+    """
+    if shard_by == "conversation":
+        title = sanitize_filename(conversation.get("title") or "untitled", MAX_TITLE_LENGTH)
+        return f"{title}_{sanitize_filename(str(conversation.get('id', '')))}"
+    if shard_by == "bot":
+        return sanitize_filename(conversation.get("bot") or "unknown")
+    if shard_by == "category":
+        return sanitize_filename(conversation.get("category") or "Uncategorized")
+    if shard_by == "month":
+        # UTC month of the stored created_ts, or of created_at in any form
+        created_ts = conversation.get("created_ts")
+        if created_ts is None:
+            created_ts = to_epoch_ms(conversation.get("created_at"))
+        return format_epoch_ms(created_ts, "%Y-%m", default="unknown")
+    raise ValueError(f"Unsupported shard key: {shard_by}")
+
+
+def _write_shard(
+    database: Any,
+    conversation_ids: List[str],
+    path: str,
+    format: str,
+    compression: Optional[str],
+) -> int:
+    """Write one shard file; runs in a pool worker."""
+    exporter = ConversationExporter(database)
+    conversations = (
+        conversation
+        for conversation in map(database.get_conversation, conversation_ids)
+        if conversation is not None
+    )
+    return exporter.export(
+        conversations,
+        path,
+        format,
+        count=len(conversation_ids),
+        compression=compression,
+    )
+
+
+class ShardedExporter:
+    """Export conversations to a directory of per-shard files."""
+
+    def __init__(self, database):
+        """Initialize the exporter.
+
+        Args:
+            database: Database instance
+        """
+        self.database = database
+
+    def export(
+        self,
+        output_dir: str,
+        format: str = "markdown",
+        shard_by: str = "conversation",
+        workers: Optional[int] = None,
+        use_processes: bool = False,
+        compression: Optional[str] = None,
+        force: bool = False,
+        chunk_size: int = 500,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        **filters: Any,
+    ) -> Dict[str, int]:
+        """Export conversations, one file per shard.
+
+        Args:
+            output_dir: Output directory (created if missing)
+            format: Export format of each file (json, ndjson, csv, markdown)
+            shard_by: conversation, bot, category or month
+            workers: Pool size (executor default if None)
+            use_processes: Use a process pool instead of a thread pool
+            compression: Compress each file (gzip, zstd, xz)
+            force: Rewrite every shard even if its content is unchanged
+            chunk_size: Rows fetched per database round trip while indexing
+            progress_callback: Called with (shards done, shards to write)
+            **filters: Conversation filters (bot, days, limit, conversation_id)
+
+        Returns:
+            Statistics: conversations, shards, written, skipped, removed, failed
+        """
+        format = format.lower()
+        if format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported export format: {format}")
+        if shard_by not in SHARD_KEYS:
+            raise ValueError(f"Unsupported shard key: {shard_by}")
+
+        directory = Path(output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        previous = self._load_manifest(directory)
+
+        # Pass 1: hash every conversation and assign it to a shard
+        entries: List[Dict[str, Any]] = []
+        shards: Dict[str, Dict[str, Any]] = {}
+        for conversation in self.database.iter_conversations(chunk_size=chunk_size, **filters):
+            file_name = compressed_path(
+                shard_name(conversation, shard_by) + FILE_EXTENSIONS[format], compression
+            ).name
+            content_hash = conversation_hash(conversation)
+            shard = shards.setdefault(file_name, {"ids": [], "hash": hashlib.sha256()})
+            shard["ids"].append(conversation["id"])
+            shard["hash"].update(content_hash.encode("ascii"))
+            entries.append({
+                "id": conversation["id"],
+                "title": conversation.get("title"),
+                "bot": conversation.get("bot"),
+                "category": conversation.get("category"),
+                "created_at": conversation.get("created_at"),
+                "updated_at": conversation.get("updated_at"),
+                "file": file_name,
+                "hash": content_hash,
+            })
+
+        for shard in shards.values():
+            shard["hash"].update(f"{format}:{compression}".encode("ascii"))
+            shard["hash"] = shard["hash"].hexdigest()
+
+        # Pass 2: write changed shards in parallel
+        old_shards = previous.get("shards", {})
+        pending = [
+            file_name
+            for file_name, shard in shards.items()
+            if force
+            or old_shards.get(file_name, {}).get("hash") != shard["hash"]
+            or not (directory / file_name).exists()
+        ]
+        logger.info(
+            f"Exporting {len(entries)} conversations into {len(shards)} {shard_by} shards "
+            f"({len(pending)} changed)"
+        )
+
+        failed = set()
+        if pending:
+            executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            with executor_class(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        _write_shard,
+                        self.database,
+                        shards[file_name]["ids"],
+                        str(directory / file_name),
+                        format,
+                        compression,
+                    ): file_name
+                    for file_name in pending
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    file_name = futures[future]
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to write shard {file_name}: {e}")
+                        failed.add(file_name)
+                    if progress_callback:
+                        progress_callback(done, len(pending))
+
+        # Remove shards that no longer have any conversations
+        removed = 0
+        for file_name in old_shards:
+            if file_name not in shards:
+                try:
+                    (directory / file_name).unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+
+        self._save_manifest(directory, {
+            "exported_at": datetime.now().isoformat(),
+            "format": format,
+            "shard_by": shard_by,
+            "compression": compression,
+            "conversation_count": len(entries),
+            # Failed shards are left out so the next export retries them
+            "shards": {
+                file_name: {"hash": shard["hash"], "conversation_count": len(shard["ids"])}
+                for file_name, shard in sorted(shards.items())
+                if file_name not in failed
+            },
+            "conversations": entries,
+        })
+
+        return {
+            "conversations": len(entries),
+            "shards": len(shards),
+            "written": len(pending) - len(failed),
+            "skipped": len(shards) - len(pending),
+            "removed": removed,
+            "failed": len(failed),
+        }
+
+    @staticmethod
+    def _load_manifest(directory: Path) -> Dict[str, Any]:
+        path = directory / MANIFEST_NAME
+        if not path.exists():
+            return {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable export manifest {path}: {e}")
+            return {}
+
+    @staticmethod
+    def _save_manifest(directory: Path, manifest: Dict[str, Any]) -> None:
+        path = directory / MANIFEST_NAME
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, path)
@@ -6,6 +6,7 @@ This module provides the primary entry point for the PyQt6 GUI application.
 
 import sys
 import os
+import importlib.util
 import logging
 from pathlib import Path
 from typing import Optional
@@ -106,10 +107,9 @@ def check_dependencies() -> list:
         ('webdriver_manager', 'webdriver-manager')
     ]
     
+    # Located, not imported: Selenium is only needed once a sync starts
     for package_name, install_name in required_packages:
-        try:
-            __import__(package_name)
-        except ImportError:
+        if importlib.util.find_spec(package_name) is None:
             missing.append(install_name)
     
     return missing
@@ -167,6 +167,9 @@ def handle_exception(exc_type, exc_value, exc_traceback):
 def main() -> int:
     """Main entry point for the Poe Search GUI application"""
     try:
+        from poe_search.gui.startup import StartupTimeline
+        timeline = StartupTimeline("Poe Search GUI")
+        
         # Set up global exception handling
         sys.excepthook = handle_exception
         
@@ -194,12 +197,15 @@ def main() -> int:
         # Set up application
         app = setup_application()
         logger.info("✅ QApplication created")
+        timeline.mark("application")
         
         # Create and show main window
         try:
             window = MainWindow()
             logger.info("✅ Main window created")
+            timeline.mark("window")
             
+            timeline.watch(window)
             window.show()
             logger.info("✅ Main window displayed")
             
@@ -9,6 +9,8 @@ from PyQt6.QtGui import QFont, QIcon
 from PyQt6.QtWidgets import QApplication, QMessageBox
 
 from poe_search.gui.main_window import MainWindow
+from poe_search.gui.resources.styles import DARK_THEME
+from poe_search.gui.startup import StartupTimeline, warm_up_database
 from poe_search.utils.config import load_config
 
 logger = logging.getLogger(__name__)
@@ -23,8 +25,10 @@ class PoeSearchApp:
         Args:
             config_path: Optional path to configuration file
         """
+        self.timeline = StartupTimeline("Poe Search")
         self.config_path = config_path
         self.config = load_config(config_path)
+        self.timeline.mark("config")
         self.app = None
         self.main_window = None
     
@@ -126,256 +130,7 @@ class PoeSearchApp:
     
     def apply_custom_dark_theme(self, app: QApplication) -> None:
         """Apply a custom dark theme if other options fail."""
-        style = """
-        QMainWindow {
-            background-color: #1e1e1e;
-            color: #ffffff;
-        }
-        
-        QWidget {
-            background-color: #1e1e1e;
-            color: #ffffff;
-            selection-background-color: #0078d4;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #444444;
-            background-color: #2b2b2b;
-        }
-        
-        QTabBar::tab {
-            background-color: #2b2b2b;
-            color: #ffffff;
-            padding: 8px 16px;
-            margin-right: 2px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: #0078d4;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #404040;
-        }
-        
-        QLineEdit {
-            background-color: #3b3b3b;
-            border: 1px solid #555555;
-            padding: 8px;
-            border-radius: 4px;
-            color: #ffffff;
-        }
-        
-        QLineEdit:focus {
-            border-color: #0078d4;
-        }
-        
-        QTableWidget {
-            background-color: #2b2b2b;
-            alternate-background-color: #353535;
-            gridline-color: #555555;
-            color: #ffffff;
-        }
-        
-        QTableWidget::item {
-            padding: 8px;
-        }
-        
-        QTableWidget::item:selected {
-            background-color: #0078d4;
-        }
-        
-        QHeaderView::section {
-            background-color: #404040;
-            color: #ffffff;
-            padding: 8px;
-            border: none;
-        }
-        
-        QScrollBar:vertical {
-            background-color: #2b2b2b;
-            width: 12px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #555555;
-            border-radius: 6px;
-            min-height: 20px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #666666;
-        }
-        
-        QMenuBar {
-            background-color: #2b2b2b;
-            color: #ffffff;
-        }
-        
-        QMenuBar::item {
-            background-color: transparent;
-            padding: 4px 8px;
-        }
-        
-        QMenuBar::item:selected {
-            background-color: #404040;
-        }
-        
-        QMenu {
-            background-color: #2b2b2b;
-            color: #ffffff;
-            border: 1px solid #555555;
-        }
-        
-        QMenu::item {
-            padding: 6px 16px;
-        }
-        
-        QMenu::item:selected {
-            background-color: #0078d4;
-        }
-        
-        QStatusBar {
-            background-color: #2b2b2b;
-            color: #ffffff;
-            border-top: 1px solid #555555;
-        }
-        
-        QToolBar {
-            background-color: #2b2b2b;
-            border: none;
-            spacing: 4px;
-            padding: 4px;
-        }
-        
-        QPushButton {
-            background-color: #0078d4;
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 4px;
-            font-weight: 500;
-        }
-        
-        QPushButton:hover {
-            background-color: #106ebe;
-        }
-        
-        QPushButton:pressed {
-            background-color: #005a9e;
-        }
-        
-        QPushButton:disabled {
-            background-color: #404040;
-            color: #888888;
-        }
-        
-        QComboBox {
-            background-color: #3b3b3b;
-            border: 1px solid #555555;
-            padding: 6px;
-            border-radius: 4px;
-            color: #ffffff;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 20px;
-        }
-        
-        QComboBox::down-arrow {
-            image: none;
-            border-left: 5px solid transparent;
-            border-right: 5px solid transparent;
-            border-top: 5px solid #ffffff;
-        }
-        
-        QComboBox QAbstractItemView {
-            background-color: #2b2b2b;
-            border: 1px solid #555555;
-            selection-background-color: #0078d4;
-            color: #ffffff;
-        }
-        
-        QCheckBox {
-            color: #ffffff;
-        }
-        
-        QCheckBox::indicator {
-            width: 16px;
-            height: 16px;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            background-color: #3b3b3b;
-        }
-        
-        QCheckBox::indicator:checked {
-            background-color: #0078d4;
-            border-color: #0078d4;
-        }
-        
-        QProgressBar {
-            background-color: #3b3b3b;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            text-align: center;
-            color: #ffffff;
-        }
-        
-        QProgressBar::chunk {
-            background-color: #0078d4;
-            border-radius: 3px;
-        }
-        
-        QGroupBox {
-            color: #ffffff;
-            border: 1px solid #555555;
-            border-radius: 4px;
-            margin: 8px 0px;
-            padding-top: 8px;
-        }
-        
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 8px;
-            padding: 0 4px 0 4px;
-        }
-        
-        QTextEdit {
-            background-color: #2b2b2b;
-            color: #ffffff;
-            border: 1px solid #555555;
-            border-radius: 4px;
-        }
-        
-        QListWidget {
-            background-color: #2b2b2b;
-            color: #ffffff;
-            border: 1px solid #555555;
-            border-radius: 4px;
-        }
-        
-        QListWidget::item {
-            padding: 4px;
-            border-bottom: 1px solid #444444;
-        }
-        
-        QListWidget::item:selected {
-            background-color: #0078d4;
-        }
-        
-        QSpinBox, QDateEdit {
-            background-color: #3b3b3b;
-            border: 1px solid #555555;
-            padding: 6px;
-            border-radius: 4px;
-            color: #ffffff;
-        }
-        """
-        
-        app.setStyleSheet(style)
+        app.setStyleSheet(DARK_THEME)
     
     def set_application_font(self, app: QApplication) -> None:
         """Set the application font to match Windows 11."""
@@ -391,11 +146,14 @@ class PoeSearchApp:
         try:
             # Create QApplication
             self.app = self.create_app()
+            self.timeline.mark("application")
             
             # Create main window
             self.main_window = MainWindow(self.config)
+            self.timeline.mark("window")
             
-            # Show main window
+            # Show main window; the rest waits until it is interactive
+            self.timeline.watch(self.main_window, on_interactive=self.finish_startup)
             self.main_window.show()
             
             # Run event loop
@@ -411,6 +169,17 @@ class PoeSearchApp:
                 )
             return 1
 
+    def finish_startup(self) -> None:
+        """Warm up the database once the window is interactive.
+
+        The warm-up only migrates the schema and fills the SQLite page
+        cache; the windows open their own connections.
+        """
+        def database_ready(database, counts):
+            self.timeline.mark("database_ready")
+        
+        warm_up_database(self.config.database_url, on_ready=database_ready)
+
 
 def main():
     """Main entry point for the GUI application."""
@@ -0,0 +1,529 @@
+"""Shared in-memory catalog of conversations for the GUI.
+
+The widgets used to keep their own full list of conversation dicts and
+copy it on every filter. :class:`ConversationCatalog` holds the loaded
+conversations once, column by column: bot and category are dictionary
+encoded into integer arrays (:class:`StringPool`), timestamps and message
+counts are integer arrays, and the conversations themselves are kept by
+reference for row access. Rows are indexed by ID, bot, category and
+creation day, and the indexes are maintained as conversations are added,
+changed or recategorized, so lookups and bulk operations do not scan the
+catalog. Filtering and sorting return arrays of row numbers, which
+widgets show through :class:`CatalogView` without copying any dicts.
+
+Widgets subscribe to the catalog and refresh when it changes, so loading
+conversations into the :func:`shared_catalog` updates every view of it.
+"""
+
+import logging
+import weakref
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+from poe_search.storage.database import DAY_MS
+from poe_search.utils.timestamps import to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+# Stored in an integer column for a missing value
+MISSING = -(2 ** 63)
+
+# Integer columns, by the conversation key they are read from
+INT_COLUMNS = ("created_ts", "updated_ts", "message_count")
+# Dictionary-encoded string columns
+STRING_COLUMNS = ("bot", "category")
+
+# Category values counted as no category
+UNCATEGORIZED = (None, "", "Uncategorized")
+
+
+def _field(conversation: Any, key: str) -> Any:
+    # The launcher still passes conversation objects as well as dicts
+    if isinstance(conversation, dict):
+        return conversation.get(key)
+    return getattr(conversation, key, None)
+
+
+def _int_or_missing(value: Any) -> int:
+    return MISSING if value is None else int(value)
+
+
+class StringPool:
+    """Dictionary encoding of a string column: each value is stored once.
+
+    Code 0 is reserved for a missing value.
+    """
+
+    def __init__(self):
+        self.values: List[Optional[str]] = [None]
+        self._codes: Dict[Optional[str], int] = {None: 0}
+
+    def encode(self, value: Optional[str]) -> int:
+        """The code of a value, added to the pool if new."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes[value] = code
+        return code
+
+    def code(self, value: Optional[str]) -> Optional[int]:
+        """The code of a value, or None if it is not in the pool."""
+        return self._codes.get(value)
+
+    def decode(self, code: int) -> Optional[str]:
+        """The value of a code."""
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class CatalogChange(NamedTuple):
+    """A change to the catalog, as passed to listeners.
+
+    ``kind`` is ``"reset"`` (everything was replaced), ``"update"``
+    (conversations were added or changed) or ``"remove"``; ``ids`` are the
+    conversations concerned (empty for a reset).
+    """
+
+    kind: str
+    ids: tuple
+
+
+class CatalogView(Sequence):
+    """Read-only sequence of catalog conversations given by row numbers.
+
+    Indexing returns the conversations the catalog was loaded with (not
+    copies). Views are snapshots: they are not updated when the catalog
+    changes.
+    """
+
+    def __init__(self, catalog: "ConversationCatalog", rows: Optional[Sequence[int]] = None):
+        self.catalog = catalog
+        self.rows = array("I", range(len(catalog)) if rows is None else rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return CatalogView(self.catalog, self.rows[index])
+        return self.catalog.conversation(self.rows[index])
+
+    def ids(self) -> List[str]:
+        """IDs of the conversations in the view, in order."""
+        return [self.catalog.conversation_id(row) for row in self.rows]
+
+
+class ConversationCatalog:
+    """Column-oriented store of the conversations loaded into the GUI.
+
+    Conversations are identified by ``id``; adding one with a known ID
+    replaces it. Missing values: ``created_ts`` falls back to the ``ts``
+    of a search result and then to ``created_at``, ``updated_ts`` to
+    ``updated_at``, and ``message_count`` to the length of ``messages``.
+    """
+
+    def __init__(
+        self,
+        conversations: Optional[Iterable[Any]] = None,
+        defaults: Optional[Dict[str, str]] = None,
+    ):
+        """Initialize the catalog.
+
+        Args:
+            conversations: Conversations to load
+            defaults: Values stored for a missing bot or category
+        """
+        self.defaults = dict(defaults or {})
+        self._listeners: List[Callable[[], Optional[Callable[[CatalogChange], None]]]] = []
+        self._clear()
+        if conversations is not None:
+            self._put_all(conversations)
+
+    # Loading
+
+    def load(self, conversations: Iterable[Any]) -> None:
+        """Replace the contents of the catalog."""
+        self._clear()
+        self._put_all(conversations)
+        self._notify("reset", ())
+
+    def upsert(self, conversations: Iterable[Any]) -> None:
+        """Add conversations, replacing those already in the catalog."""
+        ids = self._put_all(conversations)
+        if ids:
+            self._notify("update", ids)
+
+    def set_category(self, conversation_ids: Iterable[str], category: Optional[str]) -> None:
+        """Change the category of conversations (the dicts are updated too)."""
+        code = self._strings["category"].encode(self._default("category", category))
+        ids = []
+        for conversation_id in conversation_ids:
+            row = self._rows_by_id.get(conversation_id)
+            if row is None:
+                continue
+            self._set_code("category", row, code)
+            conversation = self._items[row]
+            if isinstance(conversation, dict):
+                conversation["category"] = category
+            ids.append(conversation_id)
+        if ids:
+            self._notify("update", tuple(ids))
+
+    def remove(self, conversation_ids: Iterable[str]) -> None:
+        """Remove conversations from the catalog."""
+        doomed = {self._rows_by_id[i] for i in conversation_ids if i in self._rows_by_id}
+        if not doomed:
+            return
+        ids = tuple(self._ids[row] for row in sorted(doomed))
+        kept = [row for row in range(len(self)) if row not in doomed]
+
+        self._ids = [self._ids[row] for row in kept]
+        self._items = [self._items[row] for row in kept]
+        for name in STRING_COLUMNS:
+            column = self._codes[name]
+            self._codes[name] = array("I", (column[row] for row in kept))
+        for name in INT_COLUMNS:
+            column = self._ints[name]
+            self._ints[name] = array("q", (column[row] for row in kept))
+        self._reindex()
+        self._notify("remove", ids)
+
+    def _clear(self) -> None:
+        self._ids: List[str] = []
+        self._items: List[Any] = []
+        self._rows_by_id: Dict[str, int] = {}
+        self._strings = {name: StringPool() for name in STRING_COLUMNS}
+        self._codes = {name: array("I") for name in STRING_COLUMNS}
+        self._ints = {name: array("q") for name in INT_COLUMNS}
+        # Rows by string code, and by day of creation (days since the epoch)
+        self._index: Dict[str, Dict[int, Set[int]]] = {name: {} for name in STRING_COLUMNS}
+        self._days: Dict[int, Set[int]] = {}
+
+    def _reindex(self) -> None:
+        self._rows_by_id = {conversation_id: row for row, conversation_id in enumerate(self._ids)}
+        for name in STRING_COLUMNS:
+            index: Dict[int, Set[int]] = {}
+            for row, code in enumerate(self._codes[name]):
+                index.setdefault(code, set()).add(row)
+            self._index[name] = index
+        self._days = {}
+        for row, created in enumerate(self._ints["created_ts"]):
+            if created != MISSING:
+                self._days.setdefault(created // DAY_MS, set()).add(row)
+
+    def _set_code(self, name: str, row: int, code: int) -> None:
+        index = self._index[name]
+        old = index.get(self._codes[name][row])
+        if old is not None:
+            old.discard(row)
+        self._codes[name][row] = code
+        index.setdefault(code, set()).add(row)
+
+    def _set_created(self, row: int, created: int) -> None:
+        old = self._ints["created_ts"][row]
+        if old != MISSING:
+            self._days[old // DAY_MS].discard(row)
+        self._ints["created_ts"][row] = created
+        if created != MISSING:
+            self._days.setdefault(created // DAY_MS, set()).add(row)
+
+    def _put_all(self, conversations: Iterable[Any]) -> tuple:
+        ids = []
+        for conversation in conversations:
+            conversation_id = _field(conversation, "id")
+            row = self._rows_by_id.get(conversation_id)
+            if row is None:
+                self._append(conversation)
+            else:
+                self._store(row, conversation)
+            ids.append(conversation_id)
+        return tuple(ids)
+
+    def _append(self, conversation: Any) -> None:
+        conversation_id = _field(conversation, "id")
+        self._rows_by_id[conversation_id] = len(self._ids)
+        self._ids.append(conversation_id)
+        self._items.append(conversation)
+        for name in STRING_COLUMNS:
+            self._codes[name].append(0)
+            self._index[name].setdefault(0, set()).add(len(self._ids) - 1)
+        for name in INT_COLUMNS:
+            self._ints[name].append(MISSING)
+        self._store(len(self._ids) - 1, conversation)
+
+    def _store(self, row: int, conversation: Any) -> None:
+        self._items[row] = conversation
+        for name in STRING_COLUMNS:
+            value = self._default(name, _field(conversation, name))
+            self._set_code(name, row, self._strings[name].encode(value))
+
+        created = _field(conversation, "created_ts")
+        if created is None:
+            created = _field(conversation, "ts")
+        if created is None:
+            created = to_epoch_ms(_field(conversation, "created_at"))
+        updated = _field(conversation, "updated_ts")
+        if updated is None:
+            updated = to_epoch_ms(_field(conversation, "updated_at"))
+        message_count = _field(conversation, "message_count")
+        if message_count is None:
+            message_count = len(_field(conversation, "messages") or ())
+
+        self._set_created(row, _int_or_missing(created))
+        self._ints["updated_ts"][row] = _int_or_missing(updated)
+        self._ints["message_count"][row] = int(message_count)
+
+    def _default(self, name: str, value: Optional[str]) -> Optional[str]:
+        return self.defaults.get(name, value) if value in (None, "") else value
+
+    # Change notifications
+
+    def subscribe(self, listener: Callable[[CatalogChange], None]) -> None:
+        """Call ``listener(change)`` after every change.
+
+        Bound methods are held weakly, so a widget subscribing its own
+        method does not outlive its window.
+        """
+        if hasattr(listener, "__func__"):
+            self._listeners.append(weakref.WeakMethod(listener))
+        else:
+            self._listeners.append(lambda: listener)
+
+    def unsubscribe(self, listener: Callable[[CatalogChange], None]) -> None:
+        """Stop calling a listener."""
+        self._listeners = [ref for ref in self._listeners if ref() not in (None, listener)]
+
+    def _notify(self, kind: str, ids: tuple) -> None:
+        change = CatalogChange(kind, ids)
+        alive = []
+        for ref in self._listeners:
+            listener = ref()
+            if listener is None:
+                continue
+            alive.append(ref)
+            try:
+                listener(change)
+            except Exception as e:
+                logger.error(f"Error in catalog listener {listener}: {e}")
+        self._listeners = alive
+
+    # Row access
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, conversation_id: object) -> bool:
+        return conversation_id in self._rows_by_id
+
+    def row_of(self, conversation_id: str) -> Optional[int]:
+        """The row of a conversation, or None."""
+        return self._rows_by_id.get(conversation_id)
+
+    def get(self, conversation_id: str) -> Optional[Any]:
+        """A conversation by ID."""
+        row = self._rows_by_id.get(conversation_id)
+        return None if row is None else self._items[row]
+
+    def get_many(self, conversation_ids: Iterable[str]) -> List[Any]:
+        """The conversations with some IDs, in that order (unknown IDs are skipped)."""
+        rows_by_id, items = self._rows_by_id, self._items
+        return [items[rows_by_id[i]] for i in conversation_ids if i in rows_by_id]
+
+    def conversation(self, row: int) -> Any:
+        """The conversation in a row."""
+        return self._items[row]
+
+    def conversation_id(self, row: int) -> str:
+        """The ID of the conversation in a row."""
+        return self._ids[row]
+
+    def value(self, row: int, key: str) -> Any:
+        """A column value of a row (None if missing)."""
+        if key in STRING_COLUMNS:
+            return self._strings[key].decode(self._codes[key][row])
+        if key in INT_COLUMNS:
+            value = self._ints[key][row]
+            return None if value == MISSING else value
+        if key == "id":
+            return self._ids[row]
+        return _field(self._items[row], key)
+
+    def view(self, rows: Optional[Sequence[int]] = None) -> CatalogView:
+        """A sequence of the conversations in some rows (all by default)."""
+        return CatalogView(self, rows)
+
+    # Queries
+
+    def select(
+        self,
+        bot: Optional[str] = None,
+        category: Optional[str] = None,
+        days: Optional[int] = None,
+        start: Any = None,
+        end: Any = None,
+        title: Optional[str] = None,
+        rows: Optional[Sequence[int]] = None,
+    ) -> array:
+        """Rows matching filters, in catalog order (or the order of ``rows``).
+
+        Without ``rows``, the bot, category and day indexes give the
+        candidates, so the cost follows the number of matches rather than
+        the size of the catalog.
+
+        Args:
+            bot: Only this bot
+            category: Only this category ("Uncategorized" also matches none)
+            days: Only conversations created in the last N days
+            start: Only conversations created at or after this timestamp
+            end: Only conversations created at or before this timestamp
+            title: Only titles containing this text (case-insensitive)
+            rows: Rows to select from (all by default)
+
+        Returns:
+            Array of row numbers
+        """
+        bot_codes = category_codes = None
+        if bot:
+            bot_codes = {self._strings["bot"].code(bot)} - {None}
+        if category:
+            pool = self._strings["category"]
+            values = UNCATEGORIZED if category == "Uncategorized" else (category,)
+            category_codes = {pool.code(value) for value in values} - {None}
+
+        start_ms, end_ms = to_epoch_ms(start), to_epoch_ms(end)
+        if days:
+            cutoff = to_epoch_ms(datetime.now(timezone.utc)) - days * DAY_MS
+            start_ms = cutoff if start_ms is None else max(start_ms, cutoff)
+        dated = start_ms is not None or end_ms is not None
+        low = start_ms if start_ms is not None else MISSING + 1
+        high = end_ms if end_ms is not None else 2 ** 63 - 1
+
+        if rows is None:
+            selected: Iterable[int] = self._candidates(bot_codes, category_codes, low, high, dated)
+        else:
+            selected = rows
+            if bot_codes is not None:
+                column = self._codes["bot"]
+                selected = [row for row in selected if column[row] in bot_codes]
+            if category_codes is not None:
+                column = self._codes["category"]
+                selected = [row for row in selected if column[row] in category_codes]
+
+        if dated:
+            # Day buckets only narrow the candidates down to whole days
+            column = self._ints["created_ts"]
+            selected = [row for row in selected if low <= column[row] <= high]
+
+        if title:
+            needle = title.lower()
+            items = self._items
+            selected = [
+                row for row in selected
+                if needle in (_field(items[row], "title") or "").lower()
+            ]
+
+        return array("I", selected)
+
+    def _candidates(
+        self,
+        bot_codes: Optional[Set[int]],
+        category_codes: Optional[Set[int]],
+        low: int,
+        high: int,
+        dated: bool,
+    ) -> Iterable[int]:
+        """Rows in the bot, category and day postings, in catalog order."""
+        postings: List[Set[int]] = []
+        for name, codes in (("bot", bot_codes), ("category", category_codes)):
+            if codes is None:
+                continue
+            index = self._index[name]
+            sets = [index[code] for code in codes if code in index]
+            postings.append(sets[0] if len(sets) == 1 else set().union(*sets))
+        if dated:
+            first, last = low // DAY_MS, high // DAY_MS
+            if last - first < len(self._days):
+                days = (self._days.get(day) for day in range(first, last + 1))
+            else:
+                days = (rows for day, rows in self._days.items() if first <= day <= last)
+            postings.append(set().union(*(rows for rows in days if rows)))
+
+        if not postings:
+            return range(len(self))
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
+
+    def sort(
+        self,
+        rows: Sequence[int],
+        key: Union[str, Callable[[Any], Any]],
+        descending: bool = False,
+    ) -> array:
+        """Sort rows by a column, a conversation key or a function.
+
+        Missing values go last when descending (first when ascending), as
+        in SQL; ties keep the order of ``rows``.
+        """
+        if callable(key):
+            items = self._items
+            ordered = sorted(rows, key=lambda row: key(items[row]), reverse=descending)
+            return array("I", ordered)
+
+        if key in INT_COLUMNS:
+            column = self._ints[key]
+
+            def sort_key(row):
+                value = column[row]
+                return (value != MISSING, value)
+        elif key in STRING_COLUMNS:
+            # Sort the distinct values once, then compare their ranks
+            pool = self._strings[key]
+            present = sorted(range(1, len(pool)), key=pool.decode)
+            rank = {code: position for position, code in enumerate(present)}
+            rank[0] = -1
+            column = self._codes[key]
+
+            def sort_key(row):
+                return rank[column[row]]
+        else:
+            def sort_key(row):
+                value = self.value(row, key)
+                return (value is not None, value if value is not None else 0)
+
+        return array("I", sorted(rows, key=sort_key, reverse=descending))
+
+    def counts(self, key: str, rows: Optional[Sequence[int]] = None) -> Dict[Optional[str], int]:
+        """Conversations per bot or category."""
+        if key not in STRING_COLUMNS:
+            raise ValueError(f"Unsupported column: {key}")
+        column = self._codes[key]
+        codes = Counter(column if rows is None else (column[row] for row in rows))
+        pool = self._strings[key]
+        return {pool.decode(code): count for code, count in codes.items()}
+
+
+_shared_catalog: Optional[ConversationCatalog] = None
+
+
+def shared_catalog() -> ConversationCatalog:
+    """The catalog shared by all widgets of the application."""
+    global _shared_catalog
+    if _shared_catalog is None:
+        _shared_catalog = ConversationCatalog()
+    return _shared_catalog
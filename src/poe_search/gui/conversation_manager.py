@@ -1,50 +1,47 @@
 """Conversation management for GUI."""
 
 from typing import List, Dict, Any, Optional
-from datetime import datetime
+
+from poe_search.gui.catalog import CatalogView, ConversationCatalog, shared_catalog
 
 class ConversationManager:
-    """Manages conversation data for the GUI."""
-    
-    def __init__(self):
-        self.conversations = []
-        self.filtered_conversations = []
-    
+    """Manages conversation data for the GUI.
+
+    Conversations live in a :class:`ConversationCatalog` (the shared one by
+    default); filtering selects rows of it instead of copying the list.
+    """
+
+    def __init__(self, catalog: Optional[ConversationCatalog] = None):
+        self.catalog = catalog if catalog is not None else shared_catalog()
+        self.filtered_conversations = self.catalog.view()
+
+    @property
+    def conversations(self) -> CatalogView:
+        """All conversations."""
+        return self.catalog.view()
+
     def set_conversations(self, conversations: List[Dict[str, Any]]):
         """Set the conversation list."""
-        self.conversations = conversations
-        self.filtered_conversations = conversations.copy()
-    
-    def get_conversations(self) -> List[Dict[str, Any]]:
+        self.catalog.load(conversations)
+        self.filtered_conversations = self.catalog.view()
+
+    def get_conversations(self) -> CatalogView:
         """Get filtered conversations."""
         return self.filtered_conversations
-    
-    def filter_conversations(self, search_text: str = "", bot_filter: str = "All Bots", 
-                           date_filter: str = "All Time") -> List[Dict[str, Any]]:
+
+    def filter_conversations(self, search_text: str = "", bot_filter: str = "All Bots",
+                           date_filter: str = "All Time") -> CatalogView:
         """Filter conversations based on criteria."""
-        filtered = self.conversations.copy()
-        
-        # Text search
-        if search_text:
-            filtered = [
-                conv for conv in filtered 
-                if search_text.lower() in conv.get('title', '').lower()
-            ]
-        
-        # Bot filter
-        if bot_filter != "All Bots":
-            bot_name = bot_filter.replace("🤖 ", "")
-            filtered = [
-                conv for conv in filtered 
-                if conv.get('bot', 'Assistant') == bot_name
-            ]
-        
-        self.filtered_conversations = filtered
-        return filtered
-    
+        bot_name = None if bot_filter == "All Bots" else bot_filter.replace("🤖 ", "")
+        rows = self.catalog.select(bot=bot_name, title=search_text or None)
+
+        self.filtered_conversations = self.catalog.view(rows)
+        return self.filtered_conversations
+
     def get_conversation_by_id(self, conv_id: str) -> Optional[Dict[str, Any]]:
         """Get conversation by ID."""
-        for conv in self.conversations:
-            if conv.get('id') == conv_id:
-                return conv
-        return None
\ No newline at end of file
+        return self.catalog.get(conv_id)
+
+    def get_conversations_by_ids(self, conv_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get conversations by ID (unknown IDs are skipped)."""
+        return self.catalog.get_many(conv_ids)
@@ -0,0 +1,16 @@
+"""Qt item models for GUI views."""
+
+from .conversation_model import (
+    Column,
+    ConversationSortFilterProxyModel,
+    ConversationTableModel,
+)
+from .message_model import MessageListModel, MessageRole
+
+__all__ = [
+    "Column",
+    "ConversationTableModel",
+    "ConversationSortFilterProxyModel",
+    "MessageListModel",
+    "MessageRole",
+]
@@ -0,0 +1,399 @@
+"""Table models for conversation lists.
+
+Views show conversation summaries through :class:`ConversationTableModel`,
+which pages rows in from the database as the view scrolls (``canFetchMore``
+/ ``fetchMore``) instead of creating an item per row up front. Sorting and
+filtering re-run the keyset-paged summary query, so only the visible pages
+are ever loaded, formatted or kept in memory. Queries run on the shared
+:class:`~poe_search.gui.workers.data_loader.DataLoader`, never on the UI
+thread; rows are inserted when a page arrives. Conversations already in
+memory are shown from a :class:`~poe_search.gui.catalog.ConversationCatalog`
+through an index view, and follow its changes.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    pyqtSignal,
+)
+
+from poe_search.gui.catalog import CatalogChange, ConversationCatalog
+from poe_search.gui.workers.data_loader import CancellationToken, shared_loader
+from poe_search.storage.database import SUMMARY_SORT_KEYS
+from poe_search.utils.timestamps import format_epoch_ms, to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+
+class Column(NamedTuple):
+    """A model column: header, the summary field it shows, and its text."""
+
+    header: str
+    key: str
+    display: Callable[[Dict[str, Any]], str]
+    sortable: bool = True
+
+
+def _text(key: str, default: str) -> Callable[[Dict[str, Any]], str]:
+    return lambda conversation: conversation.get(key) or default
+
+
+def _timestamp(key: str, text_key: str, format_str: str) -> Callable[[Dict[str, Any]], str]:
+    def display(conversation: Dict[str, Any]) -> str:
+        value = conversation.get(key)
+        if value is None:
+            value = to_epoch_ms(conversation.get(text_key))
+        return format_epoch_ms(value, format_str, default=conversation.get(text_key) or "Unknown")
+    return display
+
+
+TITLE = Column("Title", "title", _text("title", "Untitled"))
+BOT = Column("Bot", "bot", _text("bot", "Unknown"))
+CATEGORY = Column("Category", "category", _text("category", "Uncategorized"))
+MESSAGES = Column("Messages", "message_count", lambda c: str(c.get("message_count") or 0))
+UPDATED = Column("Last Updated", "updated_ts", _timestamp("updated_ts", "updated_at", "%Y-%m-%d %H:%M"))
+CREATED = Column("Created", "created_ts", _timestamp("created_ts", "created_at", "%Y-%m-%d"))
+
+# Filters understood by both the database and the catalog
+FILTER_KEYS = ("bot", "category", "days", "start", "end")
+
+
+class ConversationTableModel(QAbstractTableModel):
+    """Conversation summaries, paged in from the database on demand.
+
+    With a database set, rows come from
+    :meth:`Database.get_conversation_summaries` one page at a time as the
+    view asks for more. Rows can instead come from a catalog with
+    :meth:`set_catalog`, or from a list with :meth:`set_conversations`
+    (e.g. text search results); sorting and filtering then select rows of
+    the catalog. A list keeps its order (e.g. search relevance) until a
+    column is sorted.
+    """
+
+    # Signals
+    total_changed = pyqtSignal(int)  # Rows matching the current filters
+    loading_changed = pyqtSignal(bool)  # A page is being fetched
+
+    def __init__(
+        self,
+        columns: List[Column],
+        page_size: int = 200,
+        checkable: bool = False,
+        parent=None,
+    ):
+        """Initialize the model.
+
+        Args:
+            columns: Columns to show
+            page_size: Rows fetched from the database per page
+            checkable: Give the first column a check box
+            parent: Parent object
+        """
+        super().__init__(parent)
+
+        self.columns = list(columns)
+        self.page_size = page_size
+        self.checkable = checkable
+
+        self.database = None
+        self.loader = None
+        self.filters: Dict[str, Any] = {}
+        self.sort_key = "updated_ts"
+        self.descending = True
+        # Show a given list in its own order until a column is sorted
+        self._given_order = False
+
+        self._rows: Sequence[Dict[str, Any]] = []
+        self.catalog: Optional[ConversationCatalog] = None
+        self._exhausted = True
+        self._display: Dict[int, List[str]] = {}
+        self._checked: Set[str] = set()
+        self._total = 0
+        # Page request in flight; results of superseded requests are dropped
+        self._request: Optional[CancellationToken] = None
+
+    # Loading
+
+    def set_database(self, database, **filters: Any) -> None:
+        """Page rows in from a database (replaces any given list).
+
+        Args:
+            database: Database instance
+            **filters: Filters to query with (see :meth:`set_filters`)
+        """
+        self.database = database
+        self.loader = shared_loader(database) if database is not None else None
+        self._set_catalog(None)
+        self.set_filters(**filters)
+
+    def set_catalog(self, catalog: ConversationCatalog, **filters: Any) -> None:
+        """Show the conversations of a catalog instead of paging from the database.
+
+        The model refreshes whenever the catalog changes.
+
+        Args:
+            catalog: Catalog to show
+            **filters: Filters to select rows with (see :meth:`set_filters`)
+        """
+        self._set_catalog(catalog)
+        self._given_order = False
+        self.set_filters(**filters)
+
+    def set_conversations(self, conversations: Iterable[Dict[str, Any]], **filters: Any) -> None:
+        """Show a list of conversations in their own catalog.
+
+        The rows keep the given order until :meth:`sort` is called.
+
+        Args:
+            conversations: Conversations to show
+            **filters: Filters to apply to them (see :meth:`set_filters`)
+        """
+        self._set_catalog(ConversationCatalog(conversations))
+        self._given_order = True
+        self.set_filters(**filters)
+
+    def _set_catalog(self, catalog: Optional[ConversationCatalog]) -> None:
+        if self.catalog is not None:
+            self.catalog.unsubscribe(self._on_catalog_changed)
+        self.catalog = catalog
+        if catalog is not None:
+            catalog.subscribe(self._on_catalog_changed)
+
+    def _on_catalog_changed(self, change: CatalogChange) -> None:
+        self.refresh()
+
+    def set_filters(self, **filters: Any) -> None:
+        """Replace the filters (see ``FILTER_KEYS``) and reload."""
+        unknown = set(filters) - set(FILTER_KEYS)
+        if unknown:
+            raise ValueError(f"Unsupported filters: {', '.join(sorted(unknown))}")
+        self.filters = {key: value for key, value in filters.items() if value is not None}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Reload from the start with the current source, filters and sort."""
+        self._cancel_request()
+        self.beginResetModel()
+        self._display.clear()
+        if self.catalog is not None:
+            rows = self.catalog.select(**self.filters)
+            if self.sort_key and not self._given_order:
+                rows = self.catalog.sort(rows, self.sort_key, self.descending)
+            self._rows = self.catalog.view(rows)
+            self._exhausted = True
+            self._total = len(rows)
+        else:
+            self._rows = []
+            self._exhausted = self.loader is None
+            self._total = 0
+        self.endResetModel()
+
+        if self._exhausted:
+            self.total_changed.emit(self._total)
+            return
+
+        # The first page comes with the count of matching rows
+        filters = dict(self.filters)
+        self._request_page(
+            lambda db, page: (db.count_conversations(**filters), page(db)),
+            self._on_first_page,
+        )
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not parent.isValid() and not self._exhausted and self._request is None
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        if not self.canFetchMore(parent):
+            return
+        self._request_page(lambda db, page: page(db), self._on_page)
+
+    def is_loading(self) -> bool:
+        """Whether a page is being fetched."""
+        return self._request is not None
+
+    def _request_page(self, job, on_result) -> None:
+        """Fetch the page after the last loaded row on the data loader."""
+        after = None
+        if self._rows:
+            last = self._rows[-1]
+            after = (last.get(self.sort_key), last["id"])
+        query = dict(
+            sort=self.sort_key,
+            descending=self.descending,
+            limit=self.page_size,
+            after=after,
+            **self.filters,
+        )
+
+        def page(db):
+            return db.get_conversation_summaries(**query)
+
+        self._request = self.loader.submit(
+            lambda db: job(db, page), on_result=on_result, on_error=self._on_error
+        )
+        self.loading_changed.emit(True)
+
+    def _cancel_request(self) -> None:
+        if self._request is not None:
+            self._request.cancel()
+            self._request = None
+            self.loading_changed.emit(False)
+
+    def _on_first_page(self, result) -> None:
+        self._total, page = result
+        self._on_page(page)
+        self.total_changed.emit(self._total)
+
+    def _on_page(self, page: List[Dict[str, Any]]) -> None:
+        self._request = None
+        self._exhausted = len(page) < self.page_size
+        if page:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+            self._rows.extend(page)
+            self.endInsertRows()
+        self.loading_changed.emit(False)
+
+    def _on_error(self, message: str) -> None:
+        logger.error(f"Error fetching conversations: {message}")
+        self._request = None
+        self._exhausted = True
+        self.loading_changed.emit(False)
+        self.total_changed.emit(len(self._rows))
+
+    # Qt model interface
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        conversation = self._rows[row]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Formatted once per row, not on every repaint
+            texts = self._display.get(row)
+            if texts is None:
+                texts = [column.display(conversation) for column in self.columns]
+                self._display[row] = texts
+            return texts[index.column()]
+        if role == Qt.ItemDataRole.UserRole:
+            return conversation.get("id")
+        if role == Qt.ItemDataRole.CheckStateRole and self.checkable and index.column() == 0:
+            checked = conversation.get("id") in self._checked
+            return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not (index.isValid() and self.checkable and index.column() == 0
+                and role == Qt.ItemDataRole.CheckStateRole):
+            return False
+        conversation_id = self._rows[index.row()].get("id")
+        if Qt.CheckState(value) == Qt.CheckState.Checked:
+            self._checked.add(conversation_id)
+        else:
+            self._checked.discard(conversation_id)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if self.checkable and index.isValid() and index.column() == 0:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.columns[section].header
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Sort by a column, in SQL when paging from the database."""
+        spec = self.columns[column]
+        if not spec.sortable:
+            return
+        if self.catalog is None and spec.key not in SUMMARY_SORT_KEYS:
+            return
+        self.sort_key = spec.key
+        self.descending = order == Qt.SortOrder.DescendingOrder
+        self._given_order = False
+        self.refresh()
+
+    # Row access
+
+    def total_count(self) -> int:
+        """Rows matching the current filters, loaded or not."""
+        return self._total
+
+    def conversation(self, row: int) -> Optional[Dict[str, Any]]:
+        """The conversation shown in a row."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def conversation_id(self, row: int) -> Optional[str]:
+        """The ID of the conversation shown in a row."""
+        conversation = self.conversation(row)
+        return conversation.get("id") if conversation else None
+
+    def loaded_conversations(self) -> List[Dict[str, Any]]:
+        """The rows loaded so far."""
+        return list(self._rows)
+
+    def checked_ids(self) -> List[str]:
+        """IDs of the checked conversations, in row order."""
+        return [c["id"] for c in self._rows if c.get("id") in self._checked]
+
+    def set_all_checked(self, checked: bool) -> None:
+        """Check or uncheck every loaded row."""
+        if checked:
+            self._checked.update(c.get("id") for c in self._rows)
+        else:
+            self._checked.clear()
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, 0),
+                [Qt.ItemDataRole.CheckStateRole],
+            )
+
+
+class ConversationSortFilterProxyModel(QSortFilterProxyModel):
+    """Proxy that hands sorting and filtering to the source model.
+
+    Views sort through the proxy as usual, but instead of sorting loaded
+    rows in memory the request is passed to
+    :meth:`ConversationTableModel.sort`, which re-queries in SQL.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setDynamicSortFilter(False)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        source = self.sourceModel()
+        if source is not None and column >= 0:
+            source.sort(column, order)
+
+    def set_filters(self, **filters: Any) -> None:
+        """Filter the source model (in SQL when it pages from the database)."""
+        self.sourceModel().set_filters(**filters)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        # The source model only holds rows that match its filters
+        return True
+
+    def conversation_id(self, row: int) -> Optional[str]:
+        """The ID of the conversation shown in a proxy row."""
+        source_index = self.mapToSource(self.index(row, 0))
+        return self.sourceModel().conversation_id(source_index.row())
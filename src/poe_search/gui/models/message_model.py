@@ -0,0 +1,158 @@
+"""List model for the messages of a conversation.
+
+:class:`MessageListModel` holds one page of messages at a time from the
+database, newest page first, and prepends older pages as the view is
+scrolled up (see :meth:`MessageListModel.fetch_older`). Pages are read on
+the shared data loader, off the UI thread. Views draw rows with a
+delegate, so no widget is created per message.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt, pyqtSignal
+
+from poe_search.gui.workers.data_loader import CancellationToken, shared_loader
+
+logger = logging.getLogger(__name__)
+
+# The message dict of a row
+MessageRole = Qt.ItemDataRole.UserRole
+
+
+class MessageListModel(QAbstractListModel):
+    """Messages of one conversation, oldest first.
+
+    With :meth:`load`, messages are paged from
+    :meth:`Database.get_messages` starting at the newest page. A list of
+    messages can instead be shown as is with :meth:`set_messages`.
+    """
+
+    # Signals
+    loaded = pyqtSignal()  # The newest page of a stored conversation arrived
+
+    def __init__(self, page_size: int = 100, parent=None):
+        """Initialize the model.
+
+        Args:
+            page_size: Messages fetched from the database per page
+            parent: Parent object
+        """
+        super().__init__(parent)
+
+        self.page_size = page_size
+        self.database = None
+        self.loader = None
+        self.conversation_id: Optional[str] = None
+
+        self._messages: List[Dict[str, Any]] = []
+        self._total = 0
+        self._request: Optional[CancellationToken] = None
+
+    def load(self, database, conversation_id: str) -> None:
+        """Show a stored conversation, starting with its newest messages.
+
+        The model is emptied at once; :attr:`loaded` is emitted when the
+        first page has been read.
+        """
+        self._reset(database, conversation_id, [])
+        page_size = self.page_size
+
+        def first_page(db):
+            return db.count_messages(conversation_id), db.get_messages(conversation_id, limit=page_size)
+
+        self._request = self.loader.submit(first_page, on_result=self._on_first_page, on_error=self._on_error)
+
+    def set_messages(self, messages: List[Dict[str, Any]]) -> None:
+        """Show a list of messages (nothing is fetched from the database)."""
+        self._reset(None, None, list(messages))
+
+    def clear(self) -> None:
+        """Remove all messages."""
+        self.set_messages([])
+
+    def is_loading(self) -> bool:
+        """Whether a page is being read."""
+        return self._request is not None
+
+    def can_fetch_older(self) -> bool:
+        """Whether older messages are still in the database."""
+        return (self.loader is not None and self._request is None
+                and bool(self._messages) and len(self._messages) < self._total)
+
+    def fetch_older(self) -> None:
+        """Request the page of messages before the oldest one shown.
+
+        The page is prepended when it arrives.
+        """
+        if not self.can_fetch_older():
+            return
+
+        conversation_id, page_size = self.conversation_id, self.page_size
+        before = self._messages[0].get("seq")
+        self._request = self.loader.submit(
+            lambda db: db.get_messages(conversation_id, limit=page_size, before=before),
+            on_result=self._on_older_page,
+            on_error=self._on_error,
+        )
+
+    def _reset(self, database, conversation_id: Optional[str], messages: List[Dict[str, Any]]) -> None:
+        if self._request is not None:
+            self._request.cancel()
+            self._request = None
+        self.beginResetModel()
+        self.database = database
+        self.loader = shared_loader(database) if database is not None else None
+        self.conversation_id = conversation_id
+        self._messages = messages
+        self._total = len(messages)
+        self.endResetModel()
+
+    def _on_first_page(self, result) -> None:
+        self._request = None
+        total, page = result
+        self.beginResetModel()
+        self._total = total
+        self._messages = page
+        self.endResetModel()
+        self.loaded.emit()
+
+    def _on_older_page(self, page: List[Dict[str, Any]]) -> None:
+        self._request = None
+        if not page:
+            # Nothing older after all (e.g. deleted since counting)
+            self._total = len(self._messages)
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(page) - 1)
+        self._messages[:0] = page
+        self.endInsertRows()
+
+    def _on_error(self, message: str) -> None:
+        logger.error(f"Error loading messages for {self.conversation_id}: {message}")
+        self._request = None
+        self._total = len(self._messages)
+        if not self._messages:
+            self.loaded.emit()
+
+    def total_count(self) -> int:
+        """Messages in the conversation, loaded or not."""
+        return self._total
+
+    def message(self, row: int) -> Optional[Dict[str, Any]]:
+        """The message shown in a row."""
+        if 0 <= row < len(self._messages):
+            return self._messages[row]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._messages)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        message = self._messages[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return message.get("content", "")
+        if role == MessageRole:
+            return message
+        return None
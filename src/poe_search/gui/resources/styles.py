@@ -0,0 +1,508 @@
+"""Stylesheets of the GUI.
+
+The sheets live in a module, as Qt's resource compiler would emit them,
+so a launch loads them from bytecode without reading or building any
+text. Each is applied once, to the application or the main window,
+before the widgets it styles are created, so Qt polishes every widget
+a single time.
+"""
+
+# Windows 11-style dark theme of the application
+DARK_THEME = """
+QMainWindow {
+    background-color: #1e1e1e;
+    color: #ffffff;
+}
+
+QWidget {
+    background-color: #1e1e1e;
+    color: #ffffff;
+    selection-background-color: #0078d4;
+}
+
+QTabWidget::pane {
+    border: 1px solid #444444;
+    background-color: #2b2b2b;
+}
+
+QTabBar::tab {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    padding: 8px 16px;
+    margin-right: 2px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+
+QTabBar::tab:selected {
+    background-color: #0078d4;
+}
+
+QTabBar::tab:hover {
+    background-color: #404040;
+}
+
+QLineEdit {
+    background-color: #3b3b3b;
+    border: 1px solid #555555;
+    padding: 8px;
+    border-radius: 4px;
+    color: #ffffff;
+}
+
+QLineEdit:focus {
+    border-color: #0078d4;
+}
+
+QTableWidget {
+    background-color: #2b2b2b;
+    alternate-background-color: #353535;
+    gridline-color: #555555;
+    color: #ffffff;
+}
+
+QTableWidget::item {
+    padding: 8px;
+}
+
+QTableWidget::item:selected {
+    background-color: #0078d4;
+}
+
+QHeaderView::section {
+    background-color: #404040;
+    color: #ffffff;
+    padding: 8px;
+    border: none;
+}
+
+QScrollBar:vertical {
+    background-color: #2b2b2b;
+    width: 12px;
+}
+
+QScrollBar::handle:vertical {
+    background-color: #555555;
+    border-radius: 6px;
+    min-height: 20px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background-color: #666666;
+}
+
+QMenuBar {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+
+QMenuBar::item {
+    background-color: transparent;
+    padding: 4px 8px;
+}
+
+QMenuBar::item:selected {
+    background-color: #404040;
+}
+
+QMenu {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    border: 1px solid #555555;
+}
+
+QMenu::item {
+    padding: 6px 16px;
+}
+
+QMenu::item:selected {
+    background-color: #0078d4;
+}
+
+QStatusBar {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    border-top: 1px solid #555555;
+}
+
+QToolBar {
+    background-color: #2b2b2b;
+    border: none;
+    spacing: 4px;
+    padding: 4px;
+}
+
+QPushButton {
+    background-color: #0078d4;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: 500;
+}
+
+QPushButton:hover {
+    background-color: #106ebe;
+}
+
+QPushButton:pressed {
+    background-color: #005a9e;
+}
+
+QPushButton:disabled {
+    background-color: #404040;
+    color: #888888;
+}
+
+QComboBox {
+    background-color: #3b3b3b;
+    border: 1px solid #555555;
+    padding: 6px;
+    border-radius: 4px;
+    color: #ffffff;
+}
+
+QComboBox::drop-down {
+    border: none;
+    width: 20px;
+}
+
+QComboBox::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 5px solid #ffffff;
+}
+
+QComboBox QAbstractItemView {
+    background-color: #2b2b2b;
+    border: 1px solid #555555;
+    selection-background-color: #0078d4;
+    color: #ffffff;
+}
+
+QCheckBox {
+    color: #ffffff;
+}
+
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    background-color: #3b3b3b;
+}
+
+QCheckBox::indicator:checked {
+    background-color: #0078d4;
+    border-color: #0078d4;
+}
+
+QProgressBar {
+    background-color: #3b3b3b;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    text-align: center;
+    color: #ffffff;
+}
+
+QProgressBar::chunk {
+    background-color: #0078d4;
+    border-radius: 3px;
+}
+
+QGroupBox {
+    color: #ffffff;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    margin: 8px 0px;
+    padding-top: 8px;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 8px;
+    padding: 0 4px 0 4px;
+}
+
+QTextEdit {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    border: 1px solid #555555;
+    border-radius: 4px;
+}
+
+QListWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    border: 1px solid #555555;
+    border-radius: 4px;
+}
+
+QListWidget::item {
+    padding: 4px;
+    border-bottom: 1px solid #444444;
+}
+
+QListWidget::item:selected {
+    background-color: #0078d4;
+}
+
+QSpinBox, QDateEdit {
+    background-color: #3b3b3b;
+    border: 1px solid #555555;
+    padding: 6px;
+    border-radius: 4px;
+    color: #ffffff;
+}
+"""
+
+# Main window of the launcher, with fixed, non-overlapping layouts
+FIXED_LAYOUT = """
+/* Main Window */
+QMainWindow {
+    background-color: #1e1e1e;
+    color: #ffffff;
+    font-family: 'Segoe UI', sans-serif;
+}
+
+QWidget {
+    background-color: #1e1e1e;
+    color: #ffffff;
+    font-family: 'Segoe UI', sans-serif;
+    font-size: 12px;
+}
+
+/* Tabs */
+QTabWidget::pane {
+    border: 1px solid #404040;
+    background-color: #2b2b2b;
+    border-radius: 6px;
+}
+
+QTabBar::tab {
+    background-color: #3c3c3c;
+    color: #ffffff;
+    padding: 12px 20px;
+    margin-right: 2px;
+    border-top-left-radius: 6px;
+    border-top-right-radius: 6px;
+    font-weight: bold;
+    min-width: 100px;
+}
+
+QTabBar::tab:selected {
+    background-color: #0078d4;
+    color: white;
+}
+
+QTabBar::tab:hover {
+    background-color: #4a4a4a;
+}
+
+/* Group Boxes */
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #404040;
+    border-radius: 6px;
+    margin-top: 0.5ex;
+    padding-top: 15px;
+    background-color: #2a2a2a;
+    font-size: 13px;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 8px 0 8px;
+    color: #0078d4;
+    font-weight: bold;
+    background-color: #2a2a2a;
+}
+
+/* Input Fields */
+QLineEdit {
+    background-color: #3c3c3c;
+    color: #ffffff;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    padding: 6px 10px;
+    font-size: 12px;
+}
+
+QLineEdit:focus {
+    border-color: #0078d4;
+    background-color: #404040;
+}
+
+QSpinBox {
+    background-color: #3c3c3c;
+    color: #ffffff;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    padding: 6px;
+    font-size: 12px;
+}
+
+QSpinBox:focus {
+    border-color: #0078d4;
+}
+
+/* Buttons */
+QPushButton {
+    background-color: #0078d4;
+    color: white;
+    border: none;
+    border-radius: 4px;
+    padding: 8px 16px;
+    font-weight: bold;
+    font-size: 12px;
+    min-width: 60px;
+}
+
+QPushButton:hover {
+    background-color: #106ebe;
+}
+
+QPushButton:pressed {
+    background-color: #005a9e;
+}
+
+QPushButton:disabled {
+    background-color: #404040;
+    color: #888888;
+}
+
+/* List Widget */
+QListWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    border: 1px solid #404040;
+    border-radius: 4px;
+    font-size: 12px;
+    alternate-background-color: #323232;
+}
+
+QListWidget::item {
+    padding: 10px;
+    border-bottom: 1px solid #3a3a3a;
+    margin: 1px;
+}
+
+QListWidget::item:selected {
+    background-color: #0078d4;
+    color: white;
+}
+
+QListWidget::item:hover {
+    background-color: #404040;
+}
+
+/* Text Browser */
+QTextBrowser {
+    background-color: #1e1e1e;
+    color: #ffffff;
+    border: 1px solid #404040;
+    border-radius: 4px;
+    padding: 15px;
+    font-size: 13px;
+    line-height: 1.5;
+}
+
+/* Progress Bar */
+QProgressBar {
+    border: 1px solid #404040;
+    border-radius: 4px;
+    text-align: center;
+    font-weight: bold;
+    background-color: #2a2a2a;
+    color: #ffffff;
+    font-size: 11px;
+}
+
+QProgressBar::chunk {
+    background-color: #0078d4;
+    border-radius: 3px;
+}
+
+/* Status Bar */
+QStatusBar {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    border-top: 1px solid #404040;
+    font-size: 11px;
+}
+
+/* Menu Bar */
+QMenuBar {
+    background-color: #2a2a2a;
+    color: #ffffff;
+    border-bottom: 1px solid #404040;
+    font-size: 12px;
+}
+
+QMenuBar::item {
+    background-color: transparent;
+    padding: 8px 12px;
+    border-radius: 3px;
+}
+
+QMenuBar::item:selected {
+    background-color: #0078d4;
+}
+
+/* Checkboxes */
+QCheckBox {
+    spacing: 8px;
+    font-size: 12px;
+}
+
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    background-color: #3c3c3c;
+}
+
+QCheckBox::indicator:checked {
+    background-color: #0078d4;
+    border-color: #0078d4;
+}
+
+/* Splitter */
+QSplitter::handle {
+    background-color: #404040;
+    border-radius: 2px;
+}
+
+QSplitter::handle:horizontal {
+    width: 3px;
+}
+
+QSplitter::handle:hover {
+    background-color: #0078d4;
+}
+
+/* Scroll Area */
+QScrollArea {
+    border: none;
+    background-color: transparent;
+}
+
+QScrollBar:vertical {
+    background-color: #2a2a2a;
+    width: 10px;
+    border-radius: 5px;
+}
+
+QScrollBar::handle:vertical {
+    background-color: #555555;
+    border-radius: 5px;
+    min-height: 20px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background-color: #0078d4;
+}
+"""
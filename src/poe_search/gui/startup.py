@@ -0,0 +1,239 @@
+"""Cold start of the GUI: show the window first, do the rest once it is up.
+
+* :class:`StartupTimeline` records the time of each startup phase and logs
+  time-to-first-paint and time-to-interactive on every launch,
+* :class:`DeferredTabs` builds a tab's widgets the first time it is shown,
+  or one tab per event loop turn once the window is interactive, so only
+  the first tab is built before the window appears,
+* :func:`warm_up_database` opens the database (which may migrate the
+  schema or rebuild the rollups) and reads its indexes on a background
+  thread, delivering the counts back on the UI thread.
+
+Qt is imported where it is used, so the timeline works without PyQt6.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+FIRST_PAINT = "first_paint"
+INTERACTIVE = "interactive"
+
+# Signals of warm-ups, kept alive until their result is delivered
+_pending_warm_ups: Set[Any] = set()
+
+
+class StartupTimeline:
+    """Seconds from the start of a launch to each startup phase."""
+
+    def __init__(self, name: str = "GUI", clock: Callable[[], float] = time.perf_counter):
+        """Start the timeline.
+
+        Args:
+            name: Entry point, for the log
+            clock: Monotonic clock in seconds
+        """
+        self.name = name
+        self._clock = clock
+        self.started = clock()
+        self.marks: Dict[str, float] = {}
+        self._watcher: Any = None
+
+    def mark(self, phase: str) -> float:
+        """Record that a phase is reached; the first time counts.
+
+        Phases reached after the window became interactive are logged
+        as they come.
+
+        Returns:
+            Seconds since the start
+        """
+        if phase not in self.marks:
+            self.marks[phase] = self._clock() - self.started
+            if INTERACTIVE in self.marks and phase != INTERACTIVE:
+                logger.info(f"{self.name} startup: {phase} at {self.marks[phase]:.3f} s")
+        return self.marks[phase]
+
+    @property
+    def time_to_first_paint(self) -> Optional[float]:
+        return self.marks.get(FIRST_PAINT)
+
+    @property
+    def time_to_interactive(self) -> Optional[float]:
+        return self.marks.get(INTERACTIVE)
+
+    def summary(self) -> str:
+        """One line with every phase reached, in order."""
+        phases = ", ".join(f"{phase} {seconds:.3f} s" for phase, seconds in self.marks.items())
+        return f"{self.name} startup: {phases or 'no phases'}"
+
+    def watch(self, window: Any, on_interactive: Optional[Callable[[], None]] = None) -> None:
+        """Mark the first paint of a window and when it becomes interactive.
+
+        The window is interactive at the first turn of the event loop after
+        it painted; the timeline is logged then and ``on_interactive`` runs,
+        which is where deferred work should start.
+
+        Args:
+            window: Top-level widget about to be shown
+            on_interactive: Called once the window is interactive
+        """
+        from PyQt6.QtCore import QEvent, QObject, QTimer
+
+        timeline = self
+
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Type.Paint and FIRST_PAINT not in timeline.marks:
+                    timeline.mark(FIRST_PAINT)
+                    obj.removeEventFilter(self)
+                    QTimer.singleShot(0, became_interactive)
+                return False
+
+        def became_interactive():
+            timeline.mark(INTERACTIVE)
+            logger.info(timeline.summary())
+            timeline._watcher = None
+            if on_interactive is not None:
+                on_interactive()
+
+        self._watcher = FirstPaintFilter()
+        window.installEventFilter(self._watcher)
+
+
+class DeferredTabs:
+    """Tabs of a ``QTabWidget`` whose content is built on first use.
+
+    Each tab gets an empty page at once; its factory runs when the tab is
+    first shown, or from :meth:`build_when_idle`, and the widget it
+    returns fills the page.
+    """
+
+    def __init__(self, tab_widget: Any):
+        self.tab_widget = tab_widget
+        # Factories of the pages not built yet
+        self._factories: Dict[Any, Callable[[], Any]] = {}
+        tab_widget.currentChanged.connect(self.build)
+
+    @property
+    def pending(self) -> int:
+        """Tabs not built yet."""
+        return len(self._factories)
+
+    def add(self, factory: Callable[[], Any], label: str) -> int:
+        """Add a tab whose content is made by ``factory`` when needed.
+
+        Returns:
+            Index of the tab
+        """
+        from PyQt6.QtWidgets import QVBoxLayout, QWidget
+
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._factories[page] = factory
+        index = self.tab_widget.addTab(page, label)
+        if index == self.tab_widget.currentIndex():
+            self.build(index)
+        return index
+
+    def build(self, index: int) -> bool:
+        """Build the content of a tab if it was not built yet.
+
+        Returns:
+            Whether the tab was built now
+        """
+        page = self.tab_widget.widget(index)
+        factory = self._factories.pop(page, None)
+        if factory is None:
+            return False
+        start = time.perf_counter()
+        page.layout().addWidget(factory())
+        logger.debug(
+            f"Built tab {self.tab_widget.tabText(index)!r} in {time.perf_counter() - start:.3f} s"
+        )
+        return True
+
+    def build_all(self) -> None:
+        """Build every tab not built yet."""
+        for index in range(self.tab_widget.count()):
+            self.build(index)
+
+    def build_when_idle(self, on_done: Optional[Callable[[], None]] = None) -> None:
+        """Build the remaining tabs one per event loop turn.
+
+        Input is handled between tabs, so the window stays responsive;
+        a tab shown before its turn is built right away.
+
+        Args:
+            on_done: Called once every tab is built
+        """
+        from PyQt6.QtCore import QTimer
+
+        def step():
+            pending = [i for i in range(self.tab_widget.count())
+                       if self.tab_widget.widget(i) in self._factories]
+            if pending:
+                self.build(pending[0])
+            if len(pending) > 1:
+                QTimer.singleShot(0, step)
+            elif on_done is not None:
+                on_done()
+
+        QTimer.singleShot(0, step)
+
+
+def warm_up_database(
+    database_url: Optional[str] = None,
+    on_ready: Optional[Callable[[Any, Dict[str, int]], None]] = None,
+    on_error: Optional[Callable[[str], None]] = None,
+) -> threading.Thread:
+    """Open and warm up the database on a background thread.
+
+    Args:
+        database_url: Database to open; the configured one by default
+        on_ready: Called on the UI thread with the database and the counts
+            of :meth:`~poe_search.storage.database.Database.warm_up`
+        on_error: Called on the UI thread with the error message
+
+    Returns:
+        The started thread
+    """
+    from PyQt6.QtCore import QObject, pyqtSignal
+
+    class WarmUpSignals(QObject):
+        ready = pyqtSignal(object, object)
+        failed = pyqtSignal(str)
+
+    # Created on the UI thread, so the signals are delivered there
+    signals = WarmUpSignals()
+    _pending_warm_ups.add(signals)
+    if on_ready is not None:
+        signals.ready.connect(on_ready)
+    if on_error is not None:
+        signals.failed.connect(on_error)
+    signals.ready.connect(lambda *_: _pending_warm_ups.discard(signals))
+    signals.failed.connect(lambda _: _pending_warm_ups.discard(signals))
+
+    def run():
+        try:
+            from poe_search.storage.database import Database
+
+            url = database_url
+            if url is None:
+                from poe_search.utils.config import load_config
+                url = load_config().database_url
+            database = Database(url)
+            counts = database.warm_up()
+        except Exception as e:
+            logger.error(f"Database warm-up error: {e}")
+            signals.failed.emit(str(e))
+            return
+        signals.ready.emit(database, counts)
+
+    thread = threading.Thread(target=run, name="database-warm-up", daemon=True)
+    thread.start()
+    return thread
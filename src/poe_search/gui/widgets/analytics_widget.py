@@ -1,8 +1,6 @@
 """Analytics widget for displaying conversation statistics and insights."""
 
 import logging
-from collections import Counter, defaultdict
-from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
@@ -24,8 +22,22 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from poe_search.gui.catalog import CatalogChange, ConversationCatalog, shared_catalog
+from poe_search.gui.workers.data_loader import shared_loader
+from poe_search.storage.analytics import ConversationAnalytics, summarize_conversations
+from poe_search.storage.database import Database
+
 logger = logging.getLogger(__name__)
 
+# Time range choices and the number of days they cover (None = all time)
+TIME_RANGE_DAYS = {
+    "Last 7 days": 7,
+    "Last 30 days": 30,
+    "Last 90 days": 90,
+    "Last year": 365,
+    "All time": None,
+}
+
 
 class StatCard(QFrame):
     """Widget for displaying a single statistic."""
@@ -114,10 +126,11 @@ class AnalyticsWidget(QWidget):
         """Initialize the analytics widget."""
         super().__init__(parent)
         
-        self.conversations = []
+        self.catalog: Optional[ConversationCatalog] = None
         self.client = None
         self.setup_ui()
         self.setup_connections()
+        self.set_catalog(shared_catalog())
         
         # Auto-refresh timer
         self.refresh_timer = QTimer()
@@ -410,62 +423,53 @@ class AnalyticsWidget(QWidget):
         self.refresh_button.clicked.connect(self.refresh_analytics)
         self.auto_refresh_checkbox.toggled.connect(self.toggle_auto_refresh)
     
-    def update_analytics(self, conversations: List[Dict[str, Any]]):
-        """Update analytics with conversation data."""
-        self.conversations = conversations
-        
-        # Filter by time range
-        filtered_conversations = self.filter_by_time_range(conversations)
-        
-        # Update overview stats
-        self.update_overview_stats(filtered_conversations)
-        
-        # Update category breakdown
-        self.update_category_breakdown(filtered_conversations)
+    def set_catalog(self, catalog: ConversationCatalog):
+        """Summarize the conversations of a catalog and follow its changes.
         
-        # Update bot breakdown
-        self.update_bot_breakdown(filtered_conversations)
+        Args:
+            catalog: Conversation catalog (the shared one by default)
+        """
+        if self.catalog is not None:
+            self.catalog.unsubscribe(self.on_catalog_changed)
+        self.catalog = catalog
+        catalog.subscribe(self.on_catalog_changed)
+    
+    def on_catalog_changed(self, change: CatalogChange):
+        """Re-summarize the catalog, unless the dashboard comes from the database."""
+        if not (self.client and hasattr(self.client, "get_dashboard_analytics")):
+            self.render_catalog_summary()
+    
+    def update_analytics(self, conversations: List[Dict[str, Any]]):
+        """Update analytics from an in-memory conversation list.
         
-        # Update timeline
-        self.update_timeline(filtered_conversations)
+        The list is loaded into the catalog, which re-renders every
+        widget following it.
+        """
+        self.catalog.load(conversations)
     
-    def filter_by_time_range(self, conversations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter conversations by selected time range."""
-        time_range = self.time_range_combo.currentText()
-        
-        if time_range == "All time":
-            return conversations
-        
-        # Calculate date threshold
-        now = datetime.now()
-        if time_range == "Last 7 days":
-            threshold = now - timedelta(days=7)
-        elif time_range == "Last 30 days":
-            threshold = now - timedelta(days=30)
-        elif time_range == "Last 90 days":
-            threshold = now - timedelta(days=90)
-        elif time_range == "Last year":
-            threshold = now - timedelta(days=365)
-        else:
-            return conversations
-        
-        # Filter conversations
-        filtered = []
-        for conv in conversations:
-            created_at = conv.get("created_at", "")
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    if dt >= threshold:
-                        filtered.append(conv)
-                except:
-                    continue
-        
-        return filtered
+    def render_catalog_summary(self):
+        """Show the summary of the conversations in the catalog."""
+        self.render_summary(summarize_conversations(self.catalog.view(), days=self.selected_days()))
+    
+    def selected_days(self) -> Optional[int]:
+        """Number of days covered by the selected time range (None = all time)."""
+        return TIME_RANGE_DAYS.get(self.time_range_combo.currentText())
+    
+    def render_summary(self, summary: Dict[str, Any]):
+        """Show a dashboard summary.
+        
+        Args:
+            summary: Result of ``ConversationAnalytics.dashboard`` or
+                ``summarize_conversations``
+        """
+        self.update_overview_stats(summary["overview"])
+        self.update_category_breakdown(summary["categories"])
+        self.update_bot_breakdown(summary["bots"])
+        self.update_timeline(summary["timeline"])
     
-    def update_overview_stats(self, conversations: List[Dict[str, Any]]):
+    def update_overview_stats(self, overview: Dict[str, Any]):
         """Update overview statistics cards."""
-        if not conversations:
+        if not overview["total_conversations"]:
             self.total_conversations_card.update_value("0")
             self.total_messages_card.update_value("0")
             self.avg_messages_card.update_value("0")
@@ -474,106 +478,48 @@ class AnalyticsWidget(QWidget):
             self.largest_conversation_card.update_value("0", "messages")
             return
         
-        total_conversations = len(conversations)
-        total_messages = sum(conv.get("message_count", 0) for conv in conversations)
-        avg_messages = total_messages / total_conversations if total_conversations > 0 else 0
-        
-        # Most used bot
-        bot_counts = Counter(conv.get("bot", "Unknown") for conv in conversations)
-        most_used_bot = bot_counts.most_common(1)[0][0] if bot_counts else "None"
-        
-        # Recent activity (last 7 days)
-        week_ago = datetime.now() - timedelta(days=7)
-        recent_conversations = 0
-        for conv in conversations:
-            created_at = conv.get("created_at", "")
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    if dt >= week_ago:
-                        recent_conversations += 1
-                except:
-                    continue
-        
-        # Largest conversation
-        largest_conversation = max(conversations, key=lambda x: x.get("message_count", 0))
-        largest_count = largest_conversation.get("message_count", 0)
-        
         # Update cards
-        self.total_conversations_card.update_value(f"{total_conversations:,}")
-        self.total_messages_card.update_value(f"{total_messages:,}")
-        self.avg_messages_card.update_value(f"{avg_messages:.1f}")
-        self.most_used_bot_card.update_value(most_used_bot)
-        self.recent_activity_card.update_value(str(recent_conversations), "conversations this week")
-        self.largest_conversation_card.update_value(str(largest_count), "messages")
+        self.total_conversations_card.update_value(f"{overview['total_conversations']:,}")
+        self.total_messages_card.update_value(f"{overview['total_messages']:,}")
+        self.avg_messages_card.update_value(f"{overview['avg_messages']:.1f}")
+        self.most_used_bot_card.update_value(overview["most_used_bot"] or "None")
+        self.recent_activity_card.update_value(
+            str(overview["recent_conversations"]), "conversations this week"
+        )
+        self.largest_conversation_card.update_value(str(overview["largest_conversation"]), "messages")
     
-    def update_category_breakdown(self, conversations: List[Dict[str, Any]]):
+    def update_category_breakdown(self, categories: List[Dict[str, Any]]):
         """Update category breakdown table."""
-        category_counts = Counter(conv.get("category", "Uncategorized") for conv in conversations)
-        total = len(conversations)
-        
-        self.category_table.setRowCount(len(category_counts))
-        
-        for row, (category, count) in enumerate(category_counts.most_common()):
-            percentage = (count / total * 100) if total > 0 else 0
-            
-            self.category_table.setItem(row, 0, QTableWidgetItem(category))
-            self.category_table.setItem(row, 1, QTableWidgetItem(str(count)))
-            self.category_table.setItem(row, 2, QTableWidgetItem(f"{percentage:.1f}%"))
+        self._fill_breakdown(self.category_table, categories)
     
-    def update_bot_breakdown(self, conversations: List[Dict[str, Any]]):
+    def update_bot_breakdown(self, bots: List[Dict[str, Any]]):
         """Update bot breakdown table."""
-        bot_counts = Counter(conv.get("bot", "Unknown") for conv in conversations)
-        total = len(conversations)
-        
-        self.bot_table.setRowCount(len(bot_counts))
+        self._fill_breakdown(self.bot_table, bots)
+    
+    def _fill_breakdown(self, table: QTableWidget, rows: List[Dict[str, Any]]):
+        table.setRowCount(len(rows))
         
-        for row, (bot, count) in enumerate(bot_counts.most_common()):
-            percentage = (count / total * 100) if total > 0 else 0
-            
-            self.bot_table.setItem(row, 0, QTableWidgetItem(bot))
-            self.bot_table.setItem(row, 1, QTableWidgetItem(str(count)))
-            self.bot_table.setItem(row, 2, QTableWidgetItem(f"{percentage:.1f}%"))
+        for row, entry in enumerate(rows):
+            table.setItem(row, 0, QTableWidgetItem(entry["name"]))
+            table.setItem(row, 1, QTableWidgetItem(str(entry["conversations"])))
+            table.setItem(row, 2, QTableWidgetItem(f"{entry['percentage']:.1f}%"))
     
-    def update_timeline(self, conversations: List[Dict[str, Any]]):
-        """Update activity timeline table."""
-        # Group conversations by date
-        daily_activity = defaultdict(lambda: {"conversations": 0, "messages": 0, "bots": []})
-        
-        for conv in conversations:
-            created_at = conv.get("created_at", "")
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    date_key = dt.strftime("%Y-%m-%d")
-                    
-                    daily_activity[date_key]["conversations"] += 1
-                    daily_activity[date_key]["messages"] += conv.get("message_count", 0)
-                    daily_activity[date_key]["bots"].append(conv.get("bot", "Unknown"))
-                except:
-                    continue
-        
-        # Sort by date (most recent first)
-        sorted_dates = sorted(daily_activity.keys(), reverse=True)[:30]  # Last 30 days
-        
-        self.timeline_table.setRowCount(len(sorted_dates))
-        
-        for row, date in enumerate(sorted_dates):
-            activity = daily_activity[date]
-            
-            # Most active bot for the day
-            bot_counts = Counter(activity["bots"])
-            most_active_bot = bot_counts.most_common(1)[0][0] if bot_counts else "None"
-            
-            self.timeline_table.setItem(row, 0, QTableWidgetItem(date))
-            self.timeline_table.setItem(row, 1, QTableWidgetItem(str(activity["conversations"])))
-            self.timeline_table.setItem(row, 2, QTableWidgetItem(str(activity["messages"])))
-            self.timeline_table.setItem(row, 3, QTableWidgetItem(most_active_bot))
+    def update_timeline(self, timeline: List[Dict[str, Any]]):
+        """Update activity timeline table (most recent days first)."""
+        self.timeline_table.setRowCount(len(timeline))
+        
+        for row, day in enumerate(timeline):
+            self.timeline_table.setItem(row, 0, QTableWidgetItem(day["date"]))
+            self.timeline_table.setItem(row, 1, QTableWidgetItem(str(day["conversations"])))
+            self.timeline_table.setItem(row, 2, QTableWidgetItem(str(day["messages"])))
+            self.timeline_table.setItem(row, 3, QTableWidgetItem(day["top_bot"]))
     
     def on_time_range_changed(self, time_range: str):
         """Handle time range change."""
-        if self.conversations:
-            self.update_analytics(self.conversations)
+        if self.client and hasattr(self.client, "get_dashboard_analytics"):
+            self.refresh_data()
+        elif len(self.catalog):
+            self.render_catalog_summary()
     
     def refresh_analytics(self):
         """Refresh analytics data."""
@@ -600,7 +546,20 @@ class AnalyticsWidget(QWidget):
         try:
             # Don't call refresh_analytics() to avoid recursion
             # Instead, directly emit the signal or update the data
-            if self.client:
+            database = getattr(self.client, "database", None) if self.client else None
+            if isinstance(database, Database):
+                # Aggregated in SQL on the data loader, off the UI thread
+                days = self.selected_days()
+                shared_loader(database).submit(
+                    lambda db: ConversationAnalytics(db).dashboard(days=days),
+                    on_result=self.render_summary,
+                    on_error=lambda message: logger.error(f"Error loading analytics: {message}"),
+                    key=f"analytics_widget:{id(self)}",
+                )
+            elif self.client and hasattr(self.client, "get_dashboard_analytics"):
+                # Aggregated in SQL: cost does not grow with the archive
+                self.render_summary(self.client.get_dashboard_analytics(days=self.selected_days()))
+            elif self.client:
                 # Get conversations and update analytics directly
                 conversations = self.client.get_conversations()
                 self.update_analytics(conversations)
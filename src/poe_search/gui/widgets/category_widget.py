@@ -1,19 +1,31 @@
 """Category management widget for organizing conversations."""
 
 import logging
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 from collections import defaultdict, Counter
+from functools import lru_cache
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
     QTableWidget, QTableWidgetItem, QHeaderView, QComboBox,
     QPushButton, QLineEdit, QTextEdit, QMessageBox, QSplitter,
     QListWidget, QListWidgetItem, QCheckBox, QProgressBar,
-    QTabWidget, QScrollArea, QFrame
+    QTabWidget, QScrollArea, QFrame, QTableView, QAbstractItemView
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt6.QtGui import QFont, QIcon, QColor
 
+from poe_search.gui.catalog import (
+    UNCATEGORIZED,
+    CatalogChange,
+    CatalogView,
+    ConversationCatalog,
+    shared_catalog,
+)
+from poe_search.gui.models import Column, ConversationSortFilterProxyModel, ConversationTableModel
+from poe_search.gui.models.conversation_model import BOT, CATEGORY, MESSAGES, TITLE, UPDATED
+from poe_search.search.keywords import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,10 +45,28 @@ class CategoryRule:
         if not self.enabled or not self.keywords:
             return False
         
-        search_text = text if case_sensitive else text.lower()
-        search_keywords = self.keywords if case_sensitive else [k.lower() for k in self.keywords]
+        if case_sensitive:
+            return any(keyword in text for keyword in self.keywords)
         
-        return any(keyword in search_text for keyword in search_keywords)
+        return matching_rule([self], text) is not None
+
+
+@lru_cache(maxsize=16)
+def _compile_rules(signature: Tuple[Tuple[bool, Tuple[str, ...]], ...]) -> KeywordMatcher:
+    return KeywordMatcher({
+        position: keywords for position, (enabled, keywords) in enumerate(signature) if enabled
+    })
+
+
+def matching_rule(rules: List[CategoryRule], text: str) -> Optional[CategoryRule]:
+    """The first enabled rule with a keyword in the text (case-insensitive).
+    
+    All rules are matched together in one pass over the text; the compiled
+    matcher is reused while the rules stay the same.
+    """
+    matcher = _compile_rules(tuple((rule.enabled, tuple(rule.keywords)) for rule in rules))
+    position = matcher.first(text)
+    return None if position is None else rules[position]
 
 
 class CategoryWorker(QThread):
@@ -89,10 +119,8 @@ class CategoryWorker(QThread):
     
     def categorize_text(self, text: str) -> Optional[str]:
         """Categorize text using rules."""
-        for rule in self.rules:
-            if rule.matches(text):
-                return rule.category
-        return None
+        rule = matching_rule(self.rules, text)
+        return rule.category if rule else None
     
     def stop(self):
         """Stop categorization."""
@@ -110,12 +138,40 @@ class CategoryWidget(QWidget):
         """Initialize the category widget."""
         super().__init__(parent)
         
-        self.conversations = []
+        self.catalog: Optional[ConversationCatalog] = None
         self.rules = self.get_default_rules()
         self.categorization_worker = None
         
         self.setup_ui()
         self.setup_connections()
+        self.set_catalog(shared_catalog())
+    
+    @property
+    def conversations(self) -> CatalogView:
+        """The conversations of the catalog."""
+        return self.catalog.view()
+    
+    @conversations.setter
+    def conversations(self, conversations: List[Dict[str, Any]]):
+        self.catalog.load(conversations)
+    
+    def set_catalog(self, catalog: ConversationCatalog):
+        """Show the conversations of a catalog and follow its changes.
+        
+        Args:
+            catalog: Conversation catalog (the shared one by default)
+        """
+        if self.catalog is not None:
+            self.catalog.unsubscribe(self.on_catalog_changed)
+        self.catalog = catalog
+        catalog.subscribe(self.on_catalog_changed)
+        self.populate_category_table()
+        self.update_auto_categorization_list()
+        self.update_overview()
+    
+    def on_catalog_changed(self, change: CatalogChange):
+        """Update the stats when the catalog changes (the tables follow it themselves)."""
+        self.update_overview()
         
     def setup_ui(self):
         """Set up the user interface."""
@@ -183,38 +239,43 @@ class CategoryWidget(QWidget):
         table_group = QGroupBox("Conversations by Category")
         table_layout = QVBoxLayout(table_group)
         
-        self.category_table = QTableWidget()
-        self.category_table.setColumnCount(5)
-        self.category_table.setHorizontalHeaderLabels([
-            "Title", "Current Category", "Bot", "Messages", "Last Updated"
-        ])
+        self.category_model = ConversationTableModel(
+            [TITLE, CATEGORY._replace(header="Current Category"), BOT, MESSAGES, UPDATED], parent=self
+        )
+        self.category_proxy = ConversationSortFilterProxyModel(self)
+        self.category_proxy.setSourceModel(self.category_model)
+        
+        self.category_table = QTableView()
+        self.category_table.setModel(self.category_proxy)
         
         # Configure table
-        self.category_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.category_table.setSelectionMode(QTableWidget.SelectionMode.MultiSelection)
+        self.category_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.category_table.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
         self.category_table.setAlternatingRowColors(True)
-        self.category_table.setSortingEnabled(True)
+        self.category_table.verticalHeader().setVisible(False)
+        self.category_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
-        # Column sizing
+        # Column sizing (ResizeToContents would measure every row)
         header = self.category_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # Title
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Category
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Bot
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Messages
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Updated
+        for column, width in ((1, 130), (2, 140), (3, 90), (4, 140)):
+            header.resizeSection(column, width)
+        header.setSortIndicator(4, Qt.SortOrder.DescendingOrder)
+        self.category_table.setSortingEnabled(True)
         
         # Style
         self.category_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #404040;
                 font-size: 13px;
                 border-radius: 8px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4;
                 color: white;
             }
@@ -286,31 +347,47 @@ class CategoryWidget(QWidget):
         list_group = QGroupBox("Conversations to Categorize")
         list_layout = QVBoxLayout(list_group)
         
-        self.auto_categorization_table = QTableWidget()
-        self.auto_categorization_table.setColumnCount(4)
-        self.auto_categorization_table.setHorizontalHeaderLabels([
-            "Select", "Title", "Current Category", "Suggested Category"
-        ])
+        # The first column is a check box in the model, not a widget per row;
+        # suggestions are computed when a row is first shown
+        self.auto_categorization_model = ConversationTableModel(
+            [
+                Column("Select", "id", lambda conversation: "", sortable=False),
+                TITLE,
+                CATEGORY._replace(header="Current Category"),
+                Column(
+                    "Suggested Category", "suggested",
+                    lambda conversation: self.suggest_category_for_conversation(conversation) or "No suggestion",
+                    sortable=False,
+                ),
+            ],
+            checkable=True,
+            parent=self,
+        )
+        
+        self.auto_categorization_table = QTableView()
+        self.auto_categorization_table.setModel(self.auto_categorization_model)
         
         # Configure table
-        self.auto_categorization_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.auto_categorization_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.auto_categorization_table.setAlternatingRowColors(True)
+        self.auto_categorization_table.verticalHeader().setVisible(False)
+        self.auto_categorization_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
         # Column sizing
         header = self.auto_categorization_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # Select
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Title
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Current
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Suggested
+        for column, width in ((0, 60), (2, 130), (3, 150)):
+            header.resizeSection(column, width)
         
         # Style
         self.auto_categorization_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #404040;
                 font-size: 13px;
                 border-radius: 8px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
             }
@@ -523,29 +600,26 @@ class CategoryWidget(QWidget):
         ]
     
     def update_conversations(self, conversations: List[Dict[str, Any]]):
-        """Update conversations data."""
-        self.conversations = conversations
-        self.update_overview()
-        self.update_auto_categorization_list()
+        """Update conversations data (in the catalog, for every widget showing it)."""
+        self.catalog.load(conversations)
         self.update_rules_display()
     
     def update_overview(self):
         """Update the overview tab."""
-        if not self.conversations:
+        total = len(self.catalog)
+        if not total:
             return
         
         # Update stats cards
-        total = len(self.conversations)
-        categorized = sum(1 for conv in self.conversations 
-                         if conv.get("category") and conv["category"] != "Uncategorized")
-        uncategorized = total - categorized
+        uncategorized = sum(
+            count for category, count in self.catalog.counts("category").items()
+            if category in UNCATEGORIZED
+        )
+        categorized = total - uncategorized
         
         self.update_stat_card(self.total_card, str(total))
         self.update_stat_card(self.categorized_card, f"{categorized} ({categorized/total*100:.1f}%)" if total > 0 else "0 (0%)")
         self.update_stat_card(self.uncategorized_card, f"{uncategorized} ({uncategorized/total*100:.1f}%)" if total > 0 else "0 (0%)")
-        
-        # Update table
-        self.populate_category_table()
     
     def update_stat_card(self, card: QFrame, value: str):
         """Update a stat card value."""
@@ -555,109 +629,41 @@ class CategoryWidget(QWidget):
     
     def populate_category_table(self):
         """Populate the category overview table."""
-        filtered_conversations = self.get_filtered_conversations()
-        
-        self.category_table.setRowCount(len(filtered_conversations))
-        
-        for row, conversation in enumerate(filtered_conversations):
-            # Title
-            title_item = QTableWidgetItem(conversation.get("title", "Untitled"))
-            title_item.setData(Qt.ItemDataRole.UserRole, conversation.get("id"))
-            self.category_table.setItem(row, 0, title_item)
-            
-            # Category
-            category = conversation.get("category", "Uncategorized")
-            category_item = QTableWidgetItem(category)
-            self.category_table.setItem(row, 1, category_item)
-            
-            # Bot
-            bot_item = QTableWidgetItem(conversation.get("bot", "Unknown"))
-            self.category_table.setItem(row, 2, bot_item)
-            
-            # Messages
-            msg_count = conversation.get("message_count", 0)
-            msg_item = QTableWidgetItem(str(msg_count))
-            msg_item.setData(Qt.ItemDataRole.DisplayRole, msg_count)
-            self.category_table.setItem(row, 3, msg_item)
-            
-            # Last updated
-            updated_at = conversation.get("updated_at", "")
-            if updated_at:
-                try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                    updated_text = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    updated_text = updated_at
-            else:
-                updated_text = "Unknown"
-            updated_item = QTableWidgetItem(updated_text)
-            self.category_table.setItem(row, 4, updated_item)
-    
-    def get_filtered_conversations(self) -> List[Dict[str, Any]]:
+        self.category_model.set_catalog(self.catalog, **self.get_category_filter())
+    
+    def get_filtered_conversations(self) -> CatalogView:
         """Get conversations filtered by current filter."""
+        return self.catalog.view(self.catalog.select(**self.get_category_filter()))
+    
+    def get_category_filter(self) -> Dict[str, Any]:
+        """Get the category overview filter for the table model."""
         filter_category = self.filter_combo.currentText()
-        
-        if filter_category == "All Categories":
-            return self.conversations
-        
-        return [conv for conv in self.conversations 
-                if conv.get("category", "Uncategorized") == filter_category]
+        return {"category": None if filter_category == "All Categories" else filter_category}
     
     def filter_conversations(self):
         """Filter conversations based on current selection."""
-        self.populate_category_table()
+        self.category_proxy.set_filters(**self.get_category_filter())
     
     def bulk_categorize_selected(self):
         """Bulk categorize selected conversations."""
-        selected_rows = set()
-        for item in self.category_table.selectedItems():
-            selected_rows.add(item.row())
+        conversation_ids = []
+        for index in self.category_table.selectionModel().selectedRows():
+            conversation_id = index.data(Qt.ItemDataRole.UserRole)
+            if conversation_id:
+                conversation_ids.append(conversation_id)
         
-        if not selected_rows:
+        if not conversation_ids:
             QMessageBox.information(self, "No Selection", "Please select conversations to categorize.")
             return
         
-        conversation_ids = []
-        for row in selected_rows:
-            title_item = self.category_table.item(row, 0)
-            if title_item:
-                conversation_id = title_item.data(Qt.ItemDataRole.UserRole)
-                if conversation_id:
-                    conversation_ids.append(conversation_id)
-        
-        if conversation_ids:
-            self.bulk_categorization_requested.emit(conversation_ids)
+        self.bulk_categorization_requested.emit(conversation_ids)
     
     def update_auto_categorization_list(self):
         """Update the auto-categorization list."""
-        conversations = self.conversations
-        
-        if self.uncategorized_only_checkbox.isChecked():
-            conversations = [conv for conv in conversations 
-                           if not conv.get("category") or conv["category"] == "Uncategorized"]
-        
-        self.auto_categorization_table.setRowCount(len(conversations))
-        
-        for row, conversation in enumerate(conversations):
-            # Checkbox
-            checkbox = QCheckBox()
-            self.auto_categorization_table.setCellWidget(row, 0, checkbox)
-            
-            # Title
-            title_item = QTableWidgetItem(conversation.get("title", "Untitled"))
-            title_item.setData(Qt.ItemDataRole.UserRole, conversation.get("id"))
-            self.auto_categorization_table.setItem(row, 1, title_item)
-            
-            # Current category
-            current_category = conversation.get("category", "Uncategorized")
-            current_item = QTableWidgetItem(current_category)
-            self.auto_categorization_table.setItem(row, 2, current_item)
-            
-            # Suggested category (would be calculated based on rules)
-            suggested_category = self.suggest_category_for_conversation(conversation)
-            suggested_item = QTableWidgetItem(suggested_category or "No suggestion")
-            self.auto_categorization_table.setItem(row, 3, suggested_item)
+        self.auto_categorization_model.set_catalog(
+            self.catalog,
+            category="Uncategorized" if self.uncategorized_only_checkbox.isChecked() else None,
+        )
     
     def suggest_category_for_conversation(self, conversation: Dict[str, Any]) -> Optional[str]:
         """Suggest a category for a conversation based on rules."""
@@ -673,35 +679,17 @@ class CategoryWidget(QWidget):
         conversation_text = " ".join(text_parts)
         
         # Apply rules
-        for rule in self.rules:
-            if rule.matches(conversation_text):
-                return rule.category
-        
-        return None
+        rule = matching_rule(self.rules, conversation_text)
+        return rule.category if rule else None
     
     def toggle_select_all(self, checked: bool):
         """Toggle select all checkboxes."""
-        for row in range(self.auto_categorization_table.rowCount()):
-            checkbox = self.auto_categorization_table.cellWidget(row, 0)
-            if checkbox:
-                checkbox.setChecked(checked)
+        self.auto_categorization_model.set_all_checked(checked)
     
     def start_auto_categorization(self):
         """Start auto-categorization process."""
         # Get selected conversations
-        selected_conversations = []
-        for row in range(self.auto_categorization_table.rowCount()):
-            checkbox = self.auto_categorization_table.cellWidget(row, 0)
-            if checkbox and checkbox.isChecked():
-                title_item = self.auto_categorization_table.item(row, 1)
-                if title_item:
-                    conversation_id = title_item.data(Qt.ItemDataRole.UserRole)
-                    conversation = next(
-                        (conv for conv in self.conversations if conv.get("id") == conversation_id),
-                        None
-                    )
-                    if conversation:
-                        selected_conversations.append(conversation)
+        selected_conversations = self.catalog.get_many(self.auto_categorization_model.checked_ids())
         
         if not selected_conversations:
             QMessageBox.information(self, "No Selection", "Please select conversations to categorize.")
@@ -726,16 +714,19 @@ class CategoryWidget(QWidget):
         self.categorize_selected_button.setEnabled(True)
         
         # Emit updates for each categorized conversation
+        by_category = defaultdict(list)
         for conversation_id, category in categorized.items():
             self.category_updated.emit(conversation_id, category)
+            by_category[category].append(conversation_id)
+        
+        # One catalog update per category; every view follows it
+        for category, conversation_ids in by_category.items():
+            self.catalog.set_category(conversation_ids, category)
         
         QMessageBox.information(
             self, "Categorization Complete", 
             f"Successfully categorized {len(categorized)} conversations."
         )
-        
-        # Refresh displays
-        self.update_auto_categorization_list()
     
     def on_categorization_error(self, error_message: str):
         """Handle categorization error."""
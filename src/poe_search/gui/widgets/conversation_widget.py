@@ -1,121 +1,197 @@
 """Conversation viewer widget for displaying conversation details."""
 
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import math
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QColor, QFont, QTextCharFormat
+from PyQt6.QtCore import QModelIndex, QPointF, QRectF, QSize, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import (
+    QAction,
+    QColor,
+    QFont,
+    QFontMetrics,
+    QKeySequence,
+    QPainter,
+    QPen,
+    QTextCharFormat,
+    QTextLayout,
+    QTextOption,
+)
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
     QComboBox,
-    QFrame,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QMenu,
     QMessageBox,
     QPushButton,
-    QScrollArea,
     QSplitter,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+from poe_search.gui.models import MessageListModel, MessageRole
+from poe_search.gui.workers.data_loader import shared_loader
+from poe_search.utils.timestamps import format_epoch_ms, to_epoch_ms
+
 logger = logging.getLogger(__name__)
 
 
-class MessageWidget(QFrame):
-    """Widget for displaying a single message."""
+class _MessageLayout(NamedTuple):
+    """Everything needed to size and paint a message, computed once."""
     
-    def __init__(self, message: Dict[str, Any], parent=None):
-        """Initialize message widget."""
-        super().__init__(parent)
-        
-        self.message = message
-        self.setup_ui()
-        
-    def setup_ui(self):
-        """Set up the message UI."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 8, 12, 8)
-        layout.setSpacing(4)
-        
-        # Message header
-        header_layout = QHBoxLayout()
-        
-        # Sender
-        sender = self.message.get("sender", "Unknown")
-        sender_label = QLabel(sender)
-        sender_label.setStyleSheet("""
-            QLabel {
-                font-weight: 600;
-                font-size: 13px;
-                color: #0078d4;
-                padding: 2px 0;
-            }
-        """)
-        header_layout.addWidget(sender_label)
-        
-        # Timestamp
-        timestamp = self.message.get("timestamp", "")
-        if timestamp:
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                time_text = dt.strftime("%Y-%m-%d %H:%M:%S")
-            except:
-                time_text = timestamp
-        else:
-            time_text = "Unknown time"
-        
-        time_label = QLabel(time_text)
-        time_label.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                color: #888888;
-                padding: 2px 0;
-            }
-        """)
-        header_layout.addWidget(time_label)
-        header_layout.addStretch()
-        
-        layout.addLayout(header_layout)
+    sender: str
+    time_text: str
+    content: QTextLayout
+    header_height: int
+    height: int
+    from_user: bool
+
+
+class MessageDelegate(QStyledItemDelegate):
+    """Draws messages as cards in a list view.
+    
+    The wrapped text layout of each message is built once per view width
+    and kept in a bounded cache, so scrolling and repainting only draw
+    the rows in view.
+    """
+    
+    MARGIN_X = 12
+    MARGIN_Y = 8
+    SPACING = 4
+    GAP = 8  # Between cards
+    CACHE_SIZE = 1000
+    
+    def __init__(self, view: QListView):
+        """Initialize the delegate.
         
-        # Message content
-        content = self.message.get("content", "")
-        content_label = QLabel(content)
-        content_label.setWordWrap(True)
-        content_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        content_label.setStyleSheet("""
-            QLabel {
-                font-size: 13px;
-                line-height: 1.4;
-                padding: 4px 0;
-                color: #ffffff;
-            }
-        """)
-        layout.addWidget(content_label)
-        
-        # Style the frame based on sender
-        if sender.lower() in ["user", "human"]:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #2b2b2b;
-                    border: 1px solid #404040;
-                    border-radius: 8px;
-                    margin: 2px 0;
-                }
-            """)
+        Args:
+            view: List view the delegate draws for
+        """
+        super().__init__(view)
+        
+        self.view = view
+        self.sender_font = QFont()
+        self.sender_font.setPixelSize(13)
+        self.sender_font.setWeight(QFont.Weight.DemiBold)
+        self.time_font = QFont()
+        self.time_font.setPixelSize(11)
+        self.content_font = QFont()
+        self.content_font.setPixelSize(13)
+        
+        self._cache: "OrderedDict[Any, _MessageLayout]" = OrderedDict()
+    
+    def clear_cache(self):
+        """Drop all cached layouts."""
+        self._cache.clear()
+    
+    def _width(self) -> int:
+        return max(self.view.viewport().width() - 2 * self.view.spacing(), 1)
+    
+    def _text_layout(self, text: str, width: int) -> Tuple[QTextLayout, float]:
+        layout = QTextLayout(text, self.content_font)
+        option = QTextOption()
+        option.setWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+        layout.setTextOption(option)
+        
+        height = 0.0
+        layout.beginLayout()
+        while True:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(width)
+            line.setPosition(QPointF(0, height))
+            height += line.height()
+        layout.endLayout()
+        return layout, height
+    
+    def _message_layout(self, message: Dict[str, Any], width: int) -> _MessageLayout:
+        key = (message.get("id") or id(message), width)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry
+        
+        sender = message.get("sender") or message.get("role") or "Unknown"
+        timestamp = message.get("timestamp", "")
+        time_text = format_epoch_ms(
+            message.get("ts", to_epoch_ms(timestamp)),
+            "%Y-%m-%d %H:%M:%S",
+            default=timestamp or "Unknown time",
+        )
+        content, content_height = self._text_layout(
+            message.get("content", ""), max(width - 2 * self.MARGIN_X, 1)
+        )
+        header_height = max(QFontMetrics(self.sender_font).height(), QFontMetrics(self.time_font).height())
+        height = 2 * self.MARGIN_Y + header_height + self.SPACING + math.ceil(content_height) + self.GAP
+        
+        entry = _MessageLayout(
+            sender, time_text, content, header_height, height,
+            sender.lower() in ["user", "human"],
+        )
+        self._cache[key] = entry
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return entry
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        message = index.data(MessageRole)
+        if message is None:
+            return super().sizeHint(option, index)
+        width = self._width()
+        return QSize(width, self._message_layout(message, width).height)
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        message = index.data(MessageRole)
+        if message is None:
+            return super().paint(painter, option, index)
+        entry = self._message_layout(message, self._width())
+        rect = option.rect
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Card, styled by sender
+        if option.state & QStyle.StateFlag.State_Selected:
+            border = "#0078d4"
         else:
-            self.setStyleSheet("""
-                QFrame {
-                    background-color: #323232;
-                    border: 1px solid #505050;
-                    border-radius: 8px;
-                    margin: 2px 0;
-                }
-            """)
+            border = "#404040" if entry.from_user else "#505050"
+        painter.setPen(QPen(QColor(border)))
+        painter.setBrush(QColor("#2b2b2b" if entry.from_user else "#323232"))
+        card = QRectF(rect).adjusted(0.5, 0.5, -0.5, -self.GAP - 0.5)
+        painter.drawRoundedRect(card, 8, 8)
+        
+        # Header: sender and time
+        x = rect.left() + self.MARGIN_X
+        y = rect.top() + self.MARGIN_Y
+        align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        sender_width = QFontMetrics(self.sender_font).horizontalAdvance(entry.sender)
+        painter.setFont(self.sender_font)
+        painter.setPen(QColor("#0078d4"))
+        painter.drawText(QRectF(x, y, sender_width, entry.header_height), align, entry.sender)
+        painter.setFont(self.time_font)
+        painter.setPen(QColor("#888888"))
+        time_x = x + sender_width + 8
+        painter.drawText(
+            QRectF(time_x, y, max(rect.right() - self.MARGIN_X - time_x, 0), entry.header_height),
+            align, entry.time_text,
+        )
+        
+        # Content
+        painter.setPen(QColor("#ffffff"))
+        entry.content.draw(painter, QPointF(x, y + entry.header_height + self.SPACING))
+        
+        painter.restore()
 
 
 class ConversationWidget(QWidget):
@@ -132,6 +208,8 @@ class ConversationWidget(QWidget):
         self.current_conversation = None
         self.messages = []
         self.client = None
+        self.database = None
+        self._scroll_anchor = None
         
         self.setup_ui()
         self.setup_connections()
@@ -250,25 +328,45 @@ class ConversationWidget(QWidget):
         
         layout = QVBoxLayout(group)
         
-        # Messages scroll area
-        self.messages_scroll = QScrollArea()
-        self.messages_scroll.setWidgetResizable(True)
-        self.messages_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.messages_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        
-        # Messages container widget
-        self.messages_container = QWidget()
-        self.messages_layout = QVBoxLayout(self.messages_container)
-        self.messages_layout.setContentsMargins(0, 0, 0, 0)
-        self.messages_layout.setSpacing(8)
-        self.messages_layout.addStretch()  # Push messages to top
-        
-        self.messages_scroll.setWidget(self.messages_container)
-        layout.addWidget(self.messages_scroll)
-        
-        # Style the scroll area
-        self.messages_scroll.setStyleSheet("""
-            QScrollArea {
+        # Messages list: rows are drawn by the delegate, and older pages are
+        # loaded from the database when scrolled to the top
+        self.messages_model = MessageListModel(parent=self)
+        self.messages_view = QListView()
+        self.messages_view.setModel(self.messages_model)
+        self.message_delegate = MessageDelegate(self.messages_view)
+        self.messages_view.setItemDelegate(self.message_delegate)
+        self.messages_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.messages_view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.messages_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.messages_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.messages_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.messages_view.setSpacing(2)
+        layout.addWidget(self.messages_view)
+        
+        # Copy the selected message's text
+        copy_action = QAction("Copy Message", self.messages_view)
+        copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        copy_action.triggered.connect(self.copy_selected_message)
+        self.messages_view.addAction(copy_action)
+        self.messages_view.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+        
+        # Shown instead of the list when there is nothing to list
+        self.messages_placeholder = QLabel()
+        self.messages_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.messages_placeholder.setWordWrap(True)
+        self.messages_placeholder.setStyleSheet("""
+            QLabel {
+                color: #888888;
+                font-size: 14px;
+                padding: 40px;
+            }
+        """)
+        self.messages_placeholder.setVisible(False)
+        layout.addWidget(self.messages_placeholder)
+        
+        # Style the list
+        self.messages_view.setStyleSheet("""
+            QListView {
                 border: 1px solid #404040;
                 border-radius: 8px;
                 background-color: #2b2b2b;
@@ -300,6 +398,10 @@ class ConversationWidget(QWidget):
         """Set up signal connections."""
         self.category_combo.currentTextChanged.connect(self.on_category_changed)
         self.export_button.clicked.connect(self.on_export_requested)
+        self.messages_view.verticalScrollBar().valueChanged.connect(self.on_messages_scrolled)
+        self.messages_model.loaded.connect(self.show_messages)
+        self.messages_model.rowsAboutToBeInserted.connect(self.on_messages_about_to_be_inserted)
+        self.messages_model.rowsInserted.connect(self.on_messages_inserted)
     
     def show_empty_state(self):
         """Show empty state when no conversation is selected."""
@@ -316,16 +418,13 @@ class ConversationWidget(QWidget):
         self.clear_messages()
         
         # Show placeholder
-        placeholder = QLabel("Select a conversation from the search results to view its details and messages.")
-        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-size: 14px;
-                padding: 40px;
-            }
-        """)
-        self.messages_layout.addWidget(placeholder)
+        self.show_placeholder("Select a conversation from the search results to view its details and messages.")
+    
+    def show_placeholder(self, text: str):
+        """Show a message in place of the messages list."""
+        self.messages_placeholder.setText(text)
+        self.messages_placeholder.setVisible(True)
+        self.messages_view.setVisible(False)
     
     def load_conversation(self, conversation: Dict[str, Any]):
         """Load and display a conversation."""
@@ -342,26 +441,16 @@ class ConversationWidget(QWidget):
         self.message_count_label.setText(f"Messages: {message_count}")
         
         # Format dates
-        created_at = conversation.get("created_at", "")
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                created_text = dt.strftime("%Y-%m-%d %H:%M")
-            except:
-                created_text = created_at
-        else:
-            created_text = "Unknown"
+        created_text = format_epoch_ms(
+            conversation.get("created_ts", to_epoch_ms(conversation.get("created_at"))),
+            default=conversation.get("created_at") or "Unknown",
+        )
         self.created_label.setText(f"Created: {created_text}")
         
-        updated_at = conversation.get("updated_at", "")
-        if updated_at:
-            try:
-                dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                updated_text = dt.strftime("%Y-%m-%d %H:%M")
-            except:
-                updated_text = updated_at
-        else:
-            updated_text = "Unknown"
+        updated_text = format_epoch_ms(
+            conversation.get("updated_ts", to_epoch_ms(conversation.get("updated_at"))),
+            default=conversation.get("updated_at") or "Unknown",
+        )
         self.updated_label.setText(f"Updated: {updated_text}")
         
         # Set category
@@ -370,47 +459,101 @@ class ConversationWidget(QWidget):
         self.category_combo.setEnabled(True)
         self.export_button.setEnabled(True)
         
-        # Load messages
-        messages = conversation.get("messages", [])
-        self.load_messages(messages)
+        # Load messages: summaries carry none, so page them from the database
+        messages = conversation.get("messages")
+        if messages is None and self.database and conversation.get("id"):
+            self.load_stored_messages(conversation["id"])
+        else:
+            self.load_messages(messages or [])
+    
+    def open_conversation(self, conversation_id: str):
+        """Load a stored conversation without decoding all of its messages.
+        
+        The conversation is read in the background and shown when it
+        arrives; a later call supersedes an earlier one still loading.
+        
+        Args:
+            conversation_id: Conversation ID
+        """
+        if not self.database:
+            return
+        
+        def on_result(summaries):
+            if summaries:
+                self.load_conversation(summaries[0])
+        
+        shared_loader(self.database).submit(
+            lambda db: db.get_conversation_summaries(conversation_id=conversation_id, limit=1),
+            on_result=on_result,
+            key=f"conversation_widget:{id(self)}",
+        )
     
     def load_messages(self, messages: List[Dict[str, Any]]):
         """Load and display messages."""
         self.messages = messages
         self.clear_messages()
+        self.messages_model.set_messages(messages)
+        self.show_messages()
+    
+    def load_stored_messages(self, conversation_id: str):
+        """Display a stored conversation's messages, newest page first.
         
-        if not messages:
-            placeholder = QLabel("No messages in this conversation.")
-            placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            placeholder.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-size: 14px;
-                    padding: 20px;
-                }
-            """)
-            self.messages_layout.addWidget(placeholder)
+        The messages are read in the background; the list is shown when
+        the first page arrives.
+        """
+        self.messages = []
+        self.clear_messages()
+        self.show_placeholder("Loading messages...")
+        self.messages_model.load(self.database, conversation_id)
+    
+    def show_messages(self):
+        """Show the messages list, or a placeholder if it is empty."""
+        if self.messages_model.is_loading():
+            return
+        if self.messages_model.rowCount() == 0:
+            self.show_placeholder("No messages in this conversation.")
             return
         
-        # Add message widgets
-        for message in messages:
-            message_widget = MessageWidget(message)
-            self.messages_layout.addWidget(message_widget)
-        
-        # Scroll to bottom
-        QTimer.singleShot(100, self.scroll_to_bottom)
+        self.messages_placeholder.setVisible(False)
+        self.messages_view.setVisible(True)
+        # Once the view has its size after being shown
+        QTimer.singleShot(0, self.scroll_to_bottom)
     
     def clear_messages(self):
-        """Clear all message widgets."""
-        while self.messages_layout.count() > 1:  # Keep the stretch item
-            child = self.messages_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        """Clear all messages."""
+        self.messages_model.clear()
+        self.message_delegate.clear_cache()
     
     def scroll_to_bottom(self):
         """Scroll to the bottom of the messages."""
-        scrollbar = self.messages_scroll.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self.messages_view.scrollToBottom()
+    
+    def on_messages_scrolled(self, value: int):
+        """Load older messages when the list is scrolled to the top."""
+        if value <= self.messages_view.verticalScrollBar().minimum():
+            self.messages_model.fetch_older()
+    
+    def on_messages_about_to_be_inserted(self, parent, first: int, last: int):
+        """Remember the scroll position before older messages are prepended."""
+        if first == 0 and self.messages_model.rowCount() > 0:
+            scrollbar = self.messages_view.verticalScrollBar()
+            self._scroll_anchor = (scrollbar.value(), scrollbar.maximum())
+    
+    def on_messages_inserted(self, parent, first: int, last: int):
+        """Keep the same messages in view above the prepended ones."""
+        if self._scroll_anchor is None:
+            return
+        value, old_maximum = self._scroll_anchor
+        self._scroll_anchor = None
+        scrollbar = self.messages_view.verticalScrollBar()
+        self.messages_view.doItemsLayout()
+        scrollbar.setValue(value + scrollbar.maximum() - old_maximum)
+    
+    def copy_selected_message(self):
+        """Copy the selected message's text to the clipboard."""
+        index = self.messages_view.currentIndex()
+        if index.isValid():
+            QApplication.clipboard().setText(index.data(Qt.ItemDataRole.DisplayRole) or "")
     
     def on_category_changed(self, category: str):
         """Handle category change."""
@@ -439,18 +582,26 @@ class ConversationWidget(QWidget):
             client: PoeSearchClient instance
         """
         self.client = client
+        if hasattr(client, 'database'):
+            self.database = client.database
+    
+    def set_database(self, database):
+        """Set the database messages are paged from.
+        
+        Args:
+            database: Database instance
+        """
+        self.database = database
 
     def refresh_data(self):
         """Refresh the conversation data."""
         logger.debug("ConversationWidget.refresh_data() called")
         try:
-            if self.current_conversation and self.client:
+            if self.current_conversation and self.database:
                 # Reload the current conversation from the database
                 conversation_id = self.current_conversation.get("id")
                 if conversation_id:
-                    conversation = self.client.database.get_conversation(conversation_id)
-                    if conversation:
-                        self.load_conversation(conversation)
+                    self.open_conversation(conversation_id)
             logger.debug("ConversationWidget.refresh_data() completed successfully")
         except Exception as e:
             logger.error(f"Failed to refresh conversation data: {e}")
@@ -1,11 +1,12 @@
 """Search widget for finding and filtering conversations."""
 
 import logging
-from datetime import datetime
+from datetime import datetime, time
 from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import QDate, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QComboBox,
     QDateEdit,
@@ -18,13 +19,16 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QSpinBox,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+from poe_search.gui.models import ConversationSortFilterProxyModel, ConversationTableModel
+from poe_search.gui.models.conversation_model import BOT, CATEGORY, CREATED, MESSAGES, TITLE, UPDATED
+from poe_search.gui.workers.data_loader import shared_loader
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,47 +58,15 @@ class SearchWidget(QWidget):
     def set_database(self, database):
         """Set the database instance.
         
+        The database is only read on the shared data loader, so this
+        returns at once and the results arrive in the background.
+        
         Args:
             database: Database instance
         """
         self.database = database
         self.logger.info("Database set for search widget")
         
-        # DEBUG: Try to create a new database connection to ensure we get data
-        try:
-            from pathlib import Path
-
-            # Use absolute path to ensure we get the right database
-            project_root = Path(__file__).parent.parent.parent.parent.parent
-            data_db_path = project_root / "data" / "poe_search.db"
-            root_db_path = project_root / "poe_search.db" 
-            
-            self.logger.info(f"DEBUG: project_root = {project_root}")
-            self.logger.info(f"DEBUG: data_db_path = {data_db_path}, exists = {data_db_path.exists()}")
-            self.logger.info(f"DEBUG: root_db_path = {root_db_path}, exists = {root_db_path.exists()}")
-            
-            # Test both database paths
-            if data_db_path.exists():
-                from poe_search.storage.database import Database
-                test_db = Database(str(data_db_path))
-                test_convs = test_db.get_conversations()
-                self.logger.info(f"DEBUG: data database has {len(test_convs)} conversations")
-                
-                # If the passed database is empty but the data database has conversations, use the data database
-                current_convs = self.database.get_conversations() if self.database else []
-                if len(current_convs) == 0 and len(test_convs) > 0:
-                    self.logger.warning("Passed database is empty, switching to data database")
-                    self.database = test_db
-                    
-            if root_db_path.exists():
-                from poe_search.storage.database import Database
-                test_db2 = Database(str(root_db_path))
-                test_convs2 = test_db2.get_conversations()
-                self.logger.info(f"DEBUG: root database has {len(test_convs2)} conversations")
-                
-        except Exception as e:
-            self.logger.error(f"DEBUG: Database path testing failed: {e}")
-        
         # Automatically load all conversations when database is set
         if self.database:
             self.show_all_conversations()
@@ -255,8 +227,15 @@ class SearchWidget(QWidget):
         self.results_label.setStyleSheet("color: #888888; font-size: 12px;")
         layout.addWidget(self.results_label)
         
-        # Table
-        self.results_table = QTableWidget()
+        # Table: rows are paged in from the database as the view scrolls
+        self.results_model = ConversationTableModel([TITLE, BOT, CATEGORY, MESSAGES, UPDATED, CREATED], parent=self)
+        self.results_proxy = ConversationSortFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_model.total_changed.connect(self.update_results_label)
+        self.results_model.loading_changed.connect(self.show_progress)
+        
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
         self.setup_results_table()
         layout.addWidget(self.results_table)
         
@@ -264,39 +243,38 @@ class SearchWidget(QWidget):
     
     def setup_results_table(self):
         """Set up the results table."""
-        self.results_table.setColumnCount(6)
-        self.results_table.setHorizontalHeaderLabels([
-            "Title", "Bot", "Category", "Messages", "Last Updated", "Created"
-        ])
-        
         # Configure table
-        self.results_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.results_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.results_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.results_table.setAlternatingRowColors(True)
-        self.results_table.setSortingEnabled(True)
+        self.results_table.verticalHeader().setVisible(False)
+        # Fixed row heights let the view lay out rows without measuring them
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         
-        # Column sizing
+        # Column sizing (ResizeToContents would measure every loaded row)
         header = self.results_table.horizontalHeader()
         header.setStretchLastSection(False)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # Title
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # Bot
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # Category
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # Messages
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # Updated
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)  # Created
+        for column, width in ((1, 140), (2, 120), (3, 90), (4, 140), (5, 100)):
+            header.resizeSection(column, width)
+        
+        # Sorting runs in SQL; start with the model's order (last updated first)
+        header.setSortIndicator(4, Qt.SortOrder.DescendingOrder)
+        self.results_table.setSortingEnabled(True)
         
         # Style the table for Windows 11
         self.results_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #404040;
                 font-size: 13px;
                 border-radius: 8px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 8px;
                 border: none;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #0078d4;
                 color: white;
             }
@@ -330,8 +308,8 @@ class SearchWidget(QWidget):
         self.auto_refresh_checkbox.toggled.connect(self.toggle_auto_refresh)
         
         # Table selection
-        self.results_table.itemSelectionChanged.connect(self.on_selection_changed)
-        self.results_table.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.results_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.results_table.doubleClicked.connect(self.on_item_double_clicked)
     
     def get_search_params(self) -> Dict[str, Any]:
         """Get current search parameters from the widget.
@@ -379,37 +357,31 @@ class SearchWidget(QWidget):
     
     def apply_filters(self):
         """Apply current filters to the results."""
-        # For non-date filters, we can filter current results
-        # For date filters, we need to perform a new search
-        if self.database and self.conversations:
+        if self.database or self.conversations:
             self.filter_current_results()
     
+    def get_filters(self) -> Dict[str, Any]:
+        """Get the bot, category and date filters for the results model."""
+        selected_bot = self.bot_combo.currentText()
+        selected_category = self.category_combo.currentText()
+        return {
+            "bot": None if selected_bot == "All Bots" else selected_bot,
+            "category": None if selected_category == "All Categories" else selected_category,
+            "start": self.date_from.date().toPyDate(),
+            "end": datetime.combine(self.date_to.date().toPyDate(), time.max),
+        }
+    
     def filter_current_results(self):
-        """Filter the current results based on UI filters."""
-        if not self.conversations:
-            return
-            
-        filtered_conversations = []
-        
-        for conversation in self.conversations:
-            # Bot filter
-            selected_bot = self.bot_combo.currentText()
-            if selected_bot != "All Bots" and conversation.get("bot") != selected_bot:
-                continue
-                
-            # Category filter
-            selected_category = self.category_combo.currentText()
-            if selected_category != "All Categories" and conversation.get("category") != selected_category:
-                continue
-                
-            filtered_conversations.append(conversation)
-        
-        # Update the table with filtered results
-        self.populate_table(filtered_conversations)
-        
-        # Update results label
-        count = len(filtered_conversations)
-        self.results_label.setText(f"{count} conversation{'s' if count != 1 else ''} found")
+        """Filter the current results based on UI filters.
+        
+        Browsed conversations are re-queried in SQL; text search results
+        are filtered in memory.
+        """
+        filters = self.get_filters()
+        if self.conversations:
+            # Search results were already limited to the date range
+            filters = {"bot": filters["bot"], "category": filters["category"]}
+        self.results_proxy.set_filters(**filters)
     
     def clear_filters(self):
         """Clear all filters."""
@@ -448,70 +420,36 @@ class SearchWidget(QWidget):
         self.populate_table(conversations)
         self.update_bot_filter()
         self.show_progress(False)
-        
-        # Update results label
-        count = len(conversations)
+    
+    def update_results_label(self, count: int):
+        """Show the number of conversations matching the filters."""
         self.results_label.setText(f"{count} conversation{'s' if count != 1 else ''} found")
     
     def populate_table(self, conversations: List[Dict[str, Any]]):
-        """Populate the results table."""
-        self.results_table.setRowCount(len(conversations))
-        
-        for row, conversation in enumerate(conversations):
-            # Title
-            title_item = QTableWidgetItem(conversation.get("title", "Untitled"))
-            title_item.setData(Qt.ItemDataRole.UserRole, conversation.get("id"))
-            self.results_table.setItem(row, 0, title_item)
-            
-            # Bot
-            bot_item = QTableWidgetItem(conversation.get("bot", "Unknown"))
-            self.results_table.setItem(row, 1, bot_item)
-            
-            # Category
-            category = conversation.get("category", "Uncategorized")
-            category_item = QTableWidgetItem(category)
-            self.results_table.setItem(row, 2, category_item)
-            
-            # Message count
-            msg_count = conversation.get("message_count", 0)
-            msg_item = QTableWidgetItem(str(msg_count))
-            msg_item.setData(Qt.ItemDataRole.DisplayRole, msg_count)
-            self.results_table.setItem(row, 3, msg_item)
-            
-            # Last updated
-            updated_at = conversation.get("updated_at", "")
-            if updated_at:
-                try:
-                    dt = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                    updated_text = dt.strftime("%Y-%m-%d %H:%M")
-                except:
-                    updated_text = updated_at
-            else:
-                updated_text = "Unknown"
-            updated_item = QTableWidgetItem(updated_text)
-            self.results_table.setItem(row, 4, updated_item)
-            
-            # Created
-            created_at = conversation.get("created_at", "")
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    created_text = dt.strftime("%Y-%m-%d")
-                except:
-                    created_text = created_at
-            else:
-                created_text = "Unknown"
-            created_item = QTableWidgetItem(created_text)
-            self.results_table.setItem(row, 5, created_item)
+        """Show a list of conversations (e.g. text search results) in the table."""
+        self.results_model.set_conversations(conversations)
     
     def update_bot_filter(self):
         """Update the bot filter dropdown with available bots."""
-        current_bots = set(conv.get("bot", "Unknown") for conv in self.conversations)
-        
+        if self.conversations:
+            # Counted on the dictionary-encoded bot column of the results
+            bots = self.results_model.catalog.counts("bot")
+            self.set_bot_choices(set(bot or "Unknown" for bot in bots))
+        elif self.database:
+            # Browsing pages rows in, so take the bots from the rollups
+            shared_loader(self.database).submit(
+                lambda db: set(row["bot"] for row in db.get_rollups(group_by="bot")),
+                on_result=self.set_bot_choices,
+                key=f"search_widget_bots:{id(self)}",
+            )
+    
+    def set_bot_choices(self, current_bots):
+        """Fill the bot filter dropdown, keeping the selection if possible."""
         # Save current selection
         current_selection = self.bot_combo.currentText()
         
-        # Update items
+        # Update items without re-running the filters for each change
+        self.bot_combo.blockSignals(True)
         self.bot_combo.clear()
         self.bot_combo.addItem("All Bots")
         self.bot_combo.addItems(sorted(current_bots))
@@ -519,30 +457,25 @@ class SearchWidget(QWidget):
         # Restore selection if possible
         if current_selection in [self.bot_combo.itemText(i) for i in range(self.bot_combo.count())]:
             self.bot_combo.setCurrentText(current_selection)
+        self.bot_combo.blockSignals(False)
     
     def on_selection_changed(self):
         """Handle table selection changes."""
-        current_row = self.results_table.currentRow()
-        if current_row >= 0:
-            title_item = self.results_table.item(current_row, 0)
-            if title_item:
-                conversation_id = title_item.data(Qt.ItemDataRole.UserRole)
-                if conversation_id:
-                    self.conversation_selected.emit(conversation_id)
+        conversation_id = self.get_selected_conversation_id()
+        if conversation_id:
+            self.conversation_selected.emit(conversation_id)
     
-    def on_item_double_clicked(self, item):
+    def on_item_double_clicked(self, index):
         """Handle double-click on table item."""
-        conversation_id = item.data(Qt.ItemDataRole.UserRole) 
+        conversation_id = index.data(Qt.ItemDataRole.UserRole)
         if conversation_id:
             self.conversation_selected.emit(conversation_id)
     
     def get_selected_conversation_id(self) -> Optional[str]:
         """Get the currently selected conversation ID."""
-        current_row = self.results_table.currentRow()
-        if current_row >= 0:
-            title_item = self.results_table.item(current_row, 0)
-            if title_item:
-                return title_item.data(Qt.ItemDataRole.UserRole)
+        index = self.results_table.currentIndex()
+        if index.isValid():
+            return index.data(Qt.ItemDataRole.UserRole)
         return None
 
     def refresh_data(self):
@@ -562,60 +495,17 @@ class SearchWidget(QWidget):
             return
         
         try:
-            # Get all conversations from database
-            all_conversations = self.database.get_conversations()
-            logger.info(f"Raw conversations from database: {len(all_conversations)}")
-            
-            # Apply all current filters including date range
-            filtered_conversations = []
-            selected_bot = self.bot_combo.currentText()
-            selected_category = self.category_combo.currentText()
-            
-            # Use the actual selected date range from the UI
-            user_date_from = self.date_from.date().toPyDate()
-            user_date_to = self.date_to.date().toPyDate()
-            
-            logger.info(f"Filters: bot={selected_bot}, "
-                        f"category={selected_category}, "
-                        f"date_range={user_date_from} to {user_date_to}")
-            
-            for conversation in all_conversations:
-                # Apply bot filter
-                if (selected_bot != "All Bots" and
-                        conversation.get("bot") != selected_bot):
-                    continue
-                
-                # Apply category filter
-                if (selected_category != "All Categories" and
-                        conversation.get("category") != selected_category):
-                    continue
-                
-                # Apply user's selected date filter
-                conv_date = conversation.get("created_at")
-                if conv_date:
-                    try:
-                        from datetime import datetime
-                        conv_datetime = datetime.fromisoformat(
-                            conv_date.replace('Z', '+00:00'))
-                        conv_date_only = conv_datetime.date()
-                        if not (user_date_from <= conv_date_only <=
-                                user_date_to):
-                            continue
-                    except (ValueError, AttributeError):
-                        # Skip conversations with invalid dates
-                        continue
-                
-                filtered_conversations.append(conversation)
+            filters = self.get_filters()
+            logger.info(f"Filters: {filters}")
             
-            # Use existing methods to display results
-            self.populate_table(filtered_conversations)
+            # All filters run in SQL on the indexed columns, and rows are
+            # paged in as the table scrolls; conversations with unparseable
+            # dates are excluded by the date range
+            self.conversations = []
+            self.results_model.set_database(self.database, **filters)
             self.update_bot_filter()
             
-            # Update results count
-            count = len(filtered_conversations)
-            text = f"{count} conversation{'s' if count != 1 else ''} found"
-            self.results_label.setText(text)
-            logger.info(f"Showing {count} conversations after filters")
+            logger.info(f"Showing {self.results_model.total_count()} conversations after filters")
             
         except Exception as e:
             logger.error(f"Error showing all conversations: {e}")
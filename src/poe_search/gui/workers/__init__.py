@@ -3,5 +3,14 @@
 from .search_worker import SearchWorker
 from .sync_worker import SyncWorker
 from .categorization_worker import CategoryWorker, CategoryRule
+from .data_loader import CancellationToken, DataLoader, shared_loader
 
-__all__ = ["SearchWorker", "SyncWorker", "CategoryWorker", "CategoryRule"]
+__all__ = [
+    "SearchWorker",
+    "SyncWorker",
+    "CategoryWorker",
+    "CategoryRule",
+    "CancellationToken",
+    "DataLoader",
+    "shared_loader",
+]
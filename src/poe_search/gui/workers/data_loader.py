@@ -0,0 +1,179 @@
+"""Background data loading for the widgets.
+
+Widgets never query SQLite on the UI thread. They submit small jobs to a
+:class:`DataLoader`, which runs them against one shared
+:class:`~poe_search.storage.database.Database` on a ``QThreadPool`` and
+delivers the result back on the UI thread through signals. Every job has
+a :class:`CancellationToken`: a cancelled job is skipped if it has not
+started yet, and its result is dropped if it finishes anyway.
+"""
+
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from poe_search.storage.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationToken:
+    """Flag shared between a job and whoever submitted it."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the job to stop; its result will not be delivered."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job was cancelled."""
+        return self._event.is_set()
+
+
+class _JobSignals(QObject):
+    """Signals of one job (QRunnable is not a QObject)."""
+
+    finished = pyqtSignal(object)  # Result
+    failed = pyqtSignal(str)  # Error message
+
+
+class _LoadJob(QRunnable):
+    """Runs one function of the database on a pool thread."""
+
+    def __init__(self, fn: Callable[..., Any], database: Database,
+                 token: CancellationToken, signals: _JobSignals):
+        super().__init__()
+
+        self.fn = fn
+        self.database = database
+        self.token = token
+        self.signals = signals
+
+    def run(self):
+        if self.token.cancelled:
+            return
+        try:
+            result = self.fn(self.database)
+        except Exception as e:
+            logger.error(f"Data loading error: {e}")
+            if not self.token.cancelled:
+                self.signals.failed.emit(str(e))
+            return
+        if not self.token.cancelled:
+            self.signals.finished.emit(result)
+
+
+class DataLoader(QObject):
+    """Runs database reads off the UI thread for the widgets.
+
+    Jobs are functions taking the database, e.g.
+    ``loader.submit(lambda db: db.count_conversations(bot=bot), on_result=...)``.
+    Callbacks run on the thread that submitted the job (the UI thread).
+    Submitting with a ``key`` cancels the previous job with the same key,
+    so only the latest request for the same data is delivered.
+    """
+
+    def __init__(self, database: Database, max_threads: int = 2, parent=None):
+        """Initialize the loader.
+
+        Args:
+            database: Database shared by all jobs
+            max_threads: Jobs run at the same time
+            parent: Parent object
+        """
+        super().__init__(parent)
+
+        self.database = database
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+
+        self._keys: Dict[str, CancellationToken] = {}
+        # Signals of jobs whose result has not been delivered yet
+        self._pending: Dict[CancellationToken, _JobSignals] = {}
+
+    def submit(
+        self,
+        fn: Callable[[Database], Any],
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        key: Optional[str] = None,
+    ) -> CancellationToken:
+        """Run ``fn(database)`` on the thread pool.
+
+        Args:
+            fn: Function of the database to run
+            on_result: Called with the return value
+            on_error: Called with the error message if ``fn`` raises
+            key: Cancel the previous job submitted with this key
+
+        Returns:
+            Token to cancel the job with
+        """
+        if key is not None:
+            self.cancel(key)
+
+        token = CancellationToken()
+        signals = _JobSignals()
+        self._pending[token] = signals
+        if key is not None:
+            self._keys[key] = token
+
+        def deliver(result):
+            self._release(token, key)
+            if not token.cancelled and on_result is not None:
+                on_result(result)
+
+        def fail(message):
+            self._release(token, key)
+            if not token.cancelled and on_error is not None:
+                on_error(message)
+
+        signals.finished.connect(deliver)
+        signals.failed.connect(fail)
+        self.pool.start(_LoadJob(fn, self.database, token, signals))
+        return token
+
+    def cancel(self, key: str) -> None:
+        """Cancel the pending job submitted with a key, if any."""
+        token = self._keys.pop(key, None)
+        if token is not None:
+            token.cancel()
+            self._pending.pop(token, None)
+
+    def cancel_all(self) -> None:
+        """Cancel every pending job."""
+        for token in list(self._pending):
+            token.cancel()
+        self._pending.clear()
+        self._keys.clear()
+
+    def pending_count(self) -> int:
+        """Jobs submitted whose result has not been delivered."""
+        return len(self._pending)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Block until running jobs finish (for shutdown and tests)."""
+        return self.pool.waitForDone(msecs)
+
+    def _release(self, token: CancellationToken, key: Optional[str]) -> None:
+        self._pending.pop(token, None)
+        if key is not None and self._keys.get(key) is token:
+            del self._keys[key]
+
+
+_shared_loaders: "weakref.WeakKeyDictionary[Database, DataLoader]" = weakref.WeakKeyDictionary()
+
+
+def shared_loader(database: Database) -> DataLoader:
+    """The loader for a database, shared by all widgets using it."""
+    loader = _shared_loaders.get(database)
+    if loader is None:
+        loader = DataLoader(database)
+        _shared_loaders[database] = loader
+    return loader
@@ -1,13 +1,14 @@
 """Search worker for performing background searches."""
 
 import logging
-from datetime import datetime
+from datetime import date, datetime, time
 from typing import Any, Dict, List, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from poe_search.search.engine import SearchEngine
 from poe_search.storage.database import Database
+from poe_search.utils.timestamps import from_epoch_ms, to_epoch_ms
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +50,10 @@ class SearchWorker(QThread):
             use_regex = self.search_params.get("use_regex", False)
             case_sensitive = self.search_params.get("case_sensitive", False)
             
+            # A plain date as the upper bound includes that whole day
+            if isinstance(date_to, date) and not isinstance(date_to, datetime):
+                date_to = datetime.combine(date_to, time.max)
+            
             # Update progress
             self.progress.emit(10)
             
@@ -64,8 +69,13 @@ class SearchWorker(QThread):
                     case_sensitive=case_sensitive
                 )
             else:
-                # Get all conversations
-                results = self.database.get_conversations()
+                # Browse: bot, category and dates are filtered in SQL
+                results = self.database.get_conversations(
+                    bot=None if bot == "All Bots" else bot,
+                    category=None if category == "All Categories" else category,
+                    start=date_from,
+                    end=date_to,
+                )
             
             self.progress.emit(50)
             
@@ -111,46 +121,33 @@ class SearchWorker(QThread):
             filtered = [conv for conv in filtered 
                        if conv.get("category", "Uncategorized") == category_filter]
         
-        # Date filters
+        # Date filters (epoch milliseconds; text search results carry the
+        # matching message's timestamp instead of the conversation's)
         if date_from or date_to:
+            from_ms = to_epoch_ms(date_from)
+            to_ms = to_epoch_ms(date_to)
             date_filtered = []
             for conv in filtered:
-                conv_date = self.parse_date(conv.get("created_at"))
-                if conv_date:
-                    if date_from and conv_date < date_from:
-                        continue
-                    if date_to and conv_date > date_to:
-                        continue
-                    date_filtered.append(conv)
+                conv_ms = conv.get("created_ts", conv.get("ts"))
+                if conv_ms is None:
+                    continue
+                if from_ms is not None and conv_ms < from_ms:
+                    continue
+                if to_ms is not None and conv_ms > to_ms:
+                    continue
+                date_filtered.append(conv)
             filtered = date_filtered
         
         return filtered
     
     def parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
-        """Parse date string to datetime object."""
-        if not date_str:
-            return None
-        
-        try:
-            # Handle ISO format with Z timezone
-            if date_str.endswith('Z'):
-                date_str = date_str[:-1] + '+00:00'
-            return datetime.fromisoformat(date_str)
-        except ValueError:
-            try:
-                # Try other common formats
-                return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                return None
+        """Parse date string to an aware UTC datetime object."""
+        return from_epoch_ms(to_epoch_ms(date_str))
     
     def sort_results(self, conversations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Sort search results by relevance and date."""
-        # Sort by updated_at descending (most recent first)
-        def sort_key(conv):
-            updated_at = self.parse_date(conv.get("updated_at"))
-            return updated_at if updated_at else datetime.min
-        
-        return sorted(conversations, key=sort_key, reverse=True)
+        # Sort by updated_ts descending (most recent first); stable for ties
+        return sorted(conversations, key=lambda conv: conv.get("updated_ts") or 0, reverse=True)
     
     def stop(self):
         """Stop the search operation."""
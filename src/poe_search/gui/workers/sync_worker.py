@@ -8,6 +8,9 @@ from typing import List, Optional
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from poe_search.client import PoeSearchClient
+from poe_search.gui.catalog import ConversationCatalog, shared_catalog
+from poe_search.sync.daemon import SyncLock, SyncLockError
+from poe_search.sync.jobs import RetryPolicy, SyncJobRunner
 
 logger = logging.getLogger(__name__)
 
@@ -24,20 +27,32 @@ class SyncWorker(QThread):
     sync_finished = pyqtSignal()  # Sync operation finished (for compatibility)
     
     def __init__(self, client: PoeSearchClient, days: int = 7,
-                 conversation_ids: Optional[List[str]] = None):
+                 conversation_ids: Optional[List[str]] = None,
+                 resume: bool = False,
+                 catalog: Optional[ConversationCatalog] = None):
         """Initialize sync worker.
         
         Args:
             client: Poe Search client
             days: Number of days to sync (recent conversations)
             conversation_ids: Specific conversation IDs to sync, or None for recent
+            resume: Continue the last interrupted sync job instead of starting anew
+            catalog: Catalog updated with each synced conversation (the
+                shared one by default)
         """
         super().__init__()
         
         self.client = client
         self.days = days
         self.conversation_ids = conversation_ids
+        self.resume = resume
         self.should_stop = False
+        self._fetched = 0
+        
+        # Synced conversations are added to the catalog as they arrive
+        # (on the UI thread), updating its indexes incrementally
+        self.catalog = catalog if catalog is not None else shared_catalog()
+        self.conversation_synced.connect(lambda conversation: self.catalog.upsert([conversation]))
         
         # Define major bot IDs to sync from
         self.major_bots = [
@@ -58,148 +73,63 @@ class SyncWorker(QThread):
         
     def run(self):
         """Run the sync operation."""
+        # Same lock as the CLI sync and the daemon: one sync per database
+        lock = SyncLock(self.client.database.db_path)
+        try:
+            lock.acquire()
+        except SyncLockError as e:
+            logger.warning(f"Sync not started: {e}")
+            self.error_occurred.emit(f"Sync already running: {e}")
+            self.sync_error.emit(f"Sync already running: {e}")
+            self.sync_finished.emit()
+            return
+        
+        with lock:
+            self._run_sync()
+    
+    def _run_sync(self):
+        """Run the sync operation while holding the sync lock."""
         try:
             logger.info("Starting conversation sync")
             
-            stats = {
-                'new': 0,
-                'updated': 0,
-                'failed': 0,
-                'total': 0,
-                'bots_synced': 0
-            }
+            config = getattr(self.client, 'config', None)
+            runner = SyncJobRunner(
+                self.client.database,
+                fetch=self._fetch_conversation,
+                retry_policy=RetryPolicy.from_settings(config.sync) if config and hasattr(config, 'sync') else None,
+                progress_callback=lambda message, percent: self.progress_updated.emit(
+                    10 + int(percent * 0.9), message
+                ),
+                on_synced=self.conversation_synced.emit,
+                should_stop=lambda: self.should_stop,
+            )
             
-            # Get conversations to sync
-            if self.conversation_ids:
-                conversations_to_sync = self.conversation_ids
-                self.progress_updated.emit(10, "Using specified conversation IDs")
-            else:
-                # Get recent conversations from all major bots
-                self.progress_updated.emit(5, "Fetching recent conversations from all bots...")
-                conversations_to_sync = self.get_conversations_from_all_bots()
+            stats = None
+            if self.resume:
+                self.progress_updated.emit(5, "Resuming interrupted sync...")
+                stats = runner.resume()
             
-            total_conversations = len(conversations_to_sync)
-            stats['total'] = total_conversations
-            
-            logger.info(f"Found {total_conversations} conversations to sync from {stats['bots_synced']} bots")
-            
-            if total_conversations == 0:
-                self.progress_updated.emit(100, "No conversations to sync")
-                self.sync_complete.emit(stats)
-                self.sync_finished.emit()  # Signal completion
-                return
-            
-            # Sync each conversation with rate limiting
-            for i, conversation_id in enumerate(conversations_to_sync):
-                if self.should_stop:
-                    break
+            if stats is None:
+                # Get conversations to sync
+                if self.conversation_ids:
+                    conversations_to_sync = self.conversation_ids
+                    self.progress_updated.emit(10, "Using specified conversation IDs")
+                else:
+                    # Get recent conversations from all major bots
+                    self.progress_updated.emit(5, "Fetching recent conversations from all bots...")
+                    conversations_to_sync = self.get_conversations_from_all_bots()
                 
-                try:
-                    # Update progress
-                    progress = int((i / total_conversations) * 90) + 10
-                    self.progress_updated.emit(
-                        progress, 
-                        f"Syncing conversation {i+1}/{total_conversations}"
-                    )
-                    
-                    # Add delay between API calls to respect rate limits
-                    if i > 0:  # Skip delay for first conversation
-                        delay = random.uniform(1, 3)  # 1-3 seconds between calls
-                        time.sleep(delay)
-                    
-                    # Check if conversation already exists
-                    existing = None
-                    try:
-                        if hasattr(self.client.database, 'get_conversation'):
-                            existing = self.client.database.get_conversation(
-                                conversation_id
-                            )
-                    except Exception:
-                        pass  # Conversation doesn't exist or error accessing
-                    
-                    # Fetch conversation data with retry logic
-                    conversation_data = None
-                    max_retries = 3
-                    
-                    for retry in range(max_retries):
-                        try:
-                            conversation_data = (
-                                self.client.api_client.get_conversation(
-                                    conversation_id
-                                )
-                            )
-                            break  # Success, exit retry loop
-                        except Exception as e:
-                            error_msg = str(e).lower()
-                            rate_limit_keywords = [
-                                'rate limit', '429', 'too many requests'
-                            ]
-                            if any(keyword in error_msg for keyword in rate_limit_keywords):
-                                if retry < max_retries - 1:
-                                    # Exponential backoff for rate limits
-                                    delay = min(5 * (2 ** retry), 30)  # 5, 10, 20s
-                                    logger.warning(
-                                        f"Rate limit hit, waiting {delay} seconds "
-                                        f"before retry {retry + 1}"
-                                    )
-                                    time.sleep(delay)
-                                    continue
-                                else:
-                                    logger.error(
-                                        f"Rate limit exceeded for conversation "
-                                        f"{conversation_id}"
-                                    )
-                                    stats['failed'] += 1
-                                    break
-                            else:
-                                # Non-rate-limit error, don't retry
-                                logger.error(
-                                    f"Failed to fetch conversation "
-                                    f"{conversation_id}: {e}"
-                                )
-                                stats['failed'] += 1
-                                break
-                    
-                    if conversation_data:
-                        # Save to database
-                        try:
-                            if existing:
-                                if hasattr(self.client.database, 'update_conversation'):
-                                    self.client.database.update_conversation(
-                                        conversation_data
-                                    )
-                                else:
-                                    self.client.database.save_conversation(
-                                        conversation_data
-                                    )
-                                stats['updated'] += 1
-                            else:
-                                self.client.database.save_conversation(
-                                    conversation_data
-                                )
-                                stats['new'] += 1
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to save conversation {conversation_id}: {e}"
-                            )
-                            stats['failed'] += 1
-                            continue
-                        
-                        # Emit synced conversation
-                        self.conversation_synced.emit(conversation_data)
-                        
-                        logger.debug(f"Synced conversation: {conversation_id}")
-                    else:
-                        if stats['failed'] == 0:  # Only increment if not already counted
-                            stats['failed'] += 1
-                        logger.warning(
-                            f"Failed to fetch conversation: {conversation_id}"
-                        )
+                logger.info(f"Found {len(conversations_to_sync)} conversations to sync")
                 
-                except Exception as e:
-                    logger.error(f"Error syncing conversation {conversation_id}: {e}")
-                    stats['failed'] += 1
-                    continue
+                if not conversations_to_sync:
+                    stats = {'new': 0, 'updated': 0, 'failed': 0, 'total': 0}
+                    self.progress_updated.emit(100, "No conversations to sync")
+                    self.sync_complete.emit(stats)
+                    self.sync_finished.emit()  # Signal completion
+                    return
+                
+                # The ID list is checkpointed before fetching so the sync can resume
+                stats = runner.start(conversations_to_sync, params={'days': self.days})
             
             # Final progress update
             self.progress_updated.emit(100, "Sync completed")
@@ -216,6 +146,18 @@ class SyncWorker(QThread):
             self.sync_error.emit(str(e))  # For GUI compatibility
             self.sync_finished.emit()  # Signal completion even on error
     
+    def _fetch_conversation(self, item: dict) -> Optional[dict]:
+        """Fetch one conversation of the sync job.
+        
+        Failures raise and are retried by the job runner with backoff.
+        """
+        # Add delay between API calls to respect rate limits
+        if self._fetched:  # Skip delay for first conversation
+            time.sleep(random.uniform(1, 3))  # 1-3 seconds between calls
+        self._fetched += 1
+        
+        return self.client.api_client.get_conversation(item['conversation_id'])
+    
     def get_conversations_from_all_bots(self) -> List[str]:
         """Get conversation IDs from all major bots."""
         all_conversation_ids = []
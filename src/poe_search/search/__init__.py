@@ -1,5 +1,16 @@
 """Search module initialization."""
 
+from poe_search.search.categorizer import BatchCategorizer, CategoryRule, RuleCategorizer, default_rules
+from poe_search.search.classifier import TextClassifier
 from poe_search.search.engine import SearchEngine
+from poe_search.search.keywords import KeywordMatcher
 
-__all__ = ["SearchEngine"]
+__all__ = [
+    "BatchCategorizer",
+    "CategoryRule",
+    "KeywordMatcher",
+    "RuleCategorizer",
+    "SearchEngine",
+    "TextClassifier",
+    "default_rules",
+]
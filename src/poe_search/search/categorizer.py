@@ -0,0 +1,497 @@
+"""Rule-based conversation categorization, in batches over the database.
+
+:class:`RuleCategorizer` scores a text against keyword and pattern rules
+with a single :class:`KeywordMatcher` pass. :class:`BatchCategorizer` runs
+it over the stored conversations:
+
+* conversation text is streamed from the database a chunk at a time,
+* chunks are scored by a process pool (scoring is CPU-bound, so threads
+  would share one core), with a bounded number of chunks in flight,
+* the categories of a chunk are written back in a single transaction,
+* progress is reported at most every ``progress_interval`` seconds.
+
+Each scored conversation's outcome is stored with a hash of the rule set
+and of its text. Incremental runs (the default) only read conversations
+that were never scored, were scored with other rules, or changed since,
+and only re-score those whose text actually changed.
+
+Nothing here depends on Qt; the GUI worker and the ``categorize`` CLI
+command both drive :class:`BatchCategorizer`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from poe_search.search.keywords import KeywordMatcher
+from poe_search.storage.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Minimum confidence for a category to be assigned
+MIN_CONFIDENCE = 0.5
+
+# (conversation ID, current category, text), as streamed from the database
+TextChunk = Sequence[Tuple[str, Optional[str], str]]
+
+
+class CategoryRule:
+    """Represents a categorization rule."""
+
+    def __init__(self, name: str, category: str, keywords: List[str],
+                 pattern: Optional[str] = None, confidence: float = 0.7):
+        """Initialize category rule.
+
+        Args:
+            name: Rule name
+            category: Category to assign
+            keywords: Keywords to match
+            pattern: Optional regex pattern
+            confidence: Confidence threshold (0.0-1.0)
+        """
+        self.name = name
+        self.category = category
+        self.keywords = [k.lower() for k in keywords]
+        self.pattern = re.compile(pattern, re.IGNORECASE) if pattern else None
+        self.confidence = confidence
+        self.matcher = KeywordMatcher({name: self.keywords})
+
+    def matches(self, text: str) -> float:
+        """Check if rule matches text and return confidence score.
+
+        Args:
+            text: Text to check
+
+        Returns:
+            Confidence score (0.0-1.0)
+        """
+        if not text:
+            return 0.0
+
+        text_lower = text.lower()
+        matches = self.matcher.counts(text_lower, lowered=True).get(self.name, 0)
+        return self.score(text, matches, len(text_lower.split()))
+
+    def score(self, text: str, matches: int, word_count: int) -> float:
+        """Confidence score from keyword matches found beforehand.
+
+        Args:
+            text: Text checked
+            matches: Number of this rule's keywords in the text
+            word_count: Number of words in the text
+
+        Returns:
+            Confidence score (0.0-1.0)
+        """
+        # Check pattern first (higher priority)
+        if self.pattern and self.pattern.search(text):
+            return min(1.0, self.confidence + 0.2)
+
+        if matches == 0:
+            return 0.0
+
+        # Calculate confidence based on keyword density
+        keyword_density = matches / max(word_count, 1)
+
+        # Scale confidence based on matches and density
+        base_confidence = min(matches / len(self.keywords), 1.0)
+        density_bonus = min(keyword_density * 2, 0.3)
+
+        return min(base_confidence + density_bonus, 1.0)
+
+
+def default_rules() -> List[CategoryRule]:
+    """Get default categorization rules.
+
+    Returns:
+        List of default rules
+    """
+    return [
+        CategoryRule(
+            "Technical",
+            "Technical",
+            ["programming", "code", "software", "development", "python", "javascript",
+             "algorithm", "database", "api", "framework", "debug", "error", "function",
+             "variable", "class", "method", "library", "package", "git", "github"],
+            r"\b(def|class|import|from|function|var|let|const|SELECT|UPDATE|INSERT)\b"
+        ),
+        CategoryRule(
+            "Medical",
+            "Medical",
+            ["health", "medical", "doctor", "medicine", "symptom", "treatment", "therapy",
+             "diagnosis", "hospital", "clinic", "patient", "disease", "illness", "medication",
+             "prescription", "surgery", "anatomy", "physiology", "psychology"],
+            r"\b(mg|ml|dosage|prescription|diagnosis|symptoms?)\b"
+        ),
+        CategoryRule(
+            "Spiritual",
+            "Spiritual",
+            ["spiritual", "meditation", "mindfulness", "religion", "faith", "prayer",
+             "god", "divine", "soul", "enlightenment", "consciousness", "buddhism",
+             "christianity", "islam", "judaism", "hinduism", "yoga", "chakra"],
+            r"\b(meditation|prayer|enlightenment|consciousness|divine)\b"
+        ),
+        CategoryRule(
+            "Political",
+            "Political",
+            ["politics", "government", "policy", "election", "democracy", "republican",
+             "democrat", "conservative", "liberal", "vote", "legislation", "congress",
+             "senate", "president", "political", "economy", "economic", "tax"],
+            r"\b(election|congress|senate|legislation|policy|democrat|republican)\b"
+        ),
+        CategoryRule(
+            "Entertainment",
+            "Entertainment",
+            ["movie", "film", "music", "song", "game", "gaming", "book", "novel",
+             "tv", "television", "show", "series", "actor", "artist", "celebrity",
+             "entertainment", "fun", "hobby", "sport", "sports"],
+            r"\b(movie|film|music|game|book|tv show|series)\b"
+        ),
+        CategoryRule(
+            "Education",
+            "Education",
+            ["education", "learning", "study", "school", "university", "college",
+             "student", "teacher", "course", "lesson", "homework", "assignment",
+             "research", "academic", "science", "math", "history", "literature"],
+            r"\b(study|learn|education|school|university|research|academic)\b"
+        ),
+        CategoryRule(
+            "Business",
+            "Business",
+            ["business", "company", "corporate", "management", "marketing", "sales",
+             "profit", "revenue", "strategy", "investment", "finance", "money",
+             "career", "job", "work", "professional", "industry", "market"],
+            r"\b(business|company|marketing|sales|investment|finance|career)\b"
+        ),
+        CategoryRule(
+            "Creative",
+            "Creative",
+            ["creative", "art", "design", "writing", "poetry", "painting", "drawing",
+             "photography", "music", "composition", "creative writing", "artistic",
+             "inspiration", "imagination", "craft", "make", "create"],
+            r"\b(creative|art|design|writing|poetry|painting|artistic|inspiration)\b"
+        )
+    ]
+
+
+def rules_version(rules: Sequence[CategoryRule]) -> str:
+    """Hash identifying a rule set; any change to it alters the results."""
+    data = json.dumps([
+        [rule.name, rule.category, rule.keywords, rule.pattern.pattern if rule.pattern else None,
+         rule.confidence]
+        for rule in rules
+    ])
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def content_hash(text: str) -> str:
+    """Hash of a conversation's text, as scored."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class RuleCategorizer:
+    """Scores texts against a list of rules, matching all keywords in one pass.
+
+    Any object with ``version`` and :meth:`categorize_chunk` can stand in
+    for it in :class:`BatchCategorizer` (see
+    :class:`poe_search.search.classifier.TextClassifier`).
+    """
+
+    def __init__(self, rules: Optional[Sequence[CategoryRule]] = None):
+        """Initialize the categorizer.
+
+        Args:
+            rules: Categorization rules (the default rules if None)
+        """
+        self.rules = list(rules) if rules else default_rules()
+        # The keywords of all rules, matched in one pass per text
+        self.matcher = KeywordMatcher({
+            position: rule.keywords for position, rule in enumerate(self.rules)
+        })
+
+    @property
+    def version(self) -> str:
+        """Hash of the rules; stored categorizations with another are stale."""
+        return rules_version(self.rules)
+
+    def categorize(self, text: str) -> Tuple[Optional[str], float]:
+        """Categorize text using rules.
+
+        Args:
+            text: Text to categorize
+
+        Returns:
+            Tuple of (category, confidence)
+        """
+        if not text:
+            return None, 0.0
+
+        best_category = None
+        best_confidence = 0.0
+
+        text_lower = text.lower()
+        word_count = len(text_lower.split())
+        matches = self.matcher.counts(text_lower, lowered=True)
+
+        # Score all rules
+        for position, rule in enumerate(self.rules):
+            confidence = rule.score(text, matches.get(position, 0), word_count)
+
+            if confidence > best_confidence:
+                best_category = rule.category
+                best_confidence = confidence
+
+        return best_category, best_confidence
+
+    def categorize_chunk(self, chunk: TextChunk) -> List[Tuple[str, Optional[str], float]]:
+        """Categorize a chunk of (conversation ID, current category, text).
+
+        Returns:
+            (conversation ID, best category, confidence) for each item
+        """
+        return [
+            (conversation_id, *self.categorize(text))
+            for conversation_id, _category, text in chunk
+        ]
+
+
+# Categorizer of a pool worker process, unpickled once by _init_worker
+_worker_categorizer: Any = None
+
+
+def _init_worker(categorizer: Any) -> None:
+    global _worker_categorizer
+    _worker_categorizer = categorizer
+
+
+def _categorize_in_worker(chunk: TextChunk) -> List[Tuple[str, Optional[str], float]]:
+    return _worker_categorizer.categorize_chunk(chunk)
+
+
+class BatchCategorizer:
+    """Categorizes stored conversations in parallel chunks."""
+
+    def __init__(
+        self,
+        database: Database,
+        rules: Optional[Sequence[CategoryRule]] = None,
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+        min_confidence: float = MIN_CONFIDENCE,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        on_categorized: Optional[Callable[[Dict[str, str]], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        progress_interval: float = 0.25,
+        clock: Callable[[], float] = time.monotonic,
+        categorizer: Any = None,
+    ):
+        """Initialize the categorizer.
+
+        Args:
+            database: Database holding the conversations
+            rules: Categorization rules (the default rules if None)
+            workers: Scoring processes (CPU count if None); 0 or 1 scores
+                in this process
+            chunk_size: Conversations read, scored and written together
+            min_confidence: Minimum confidence for a category to be assigned
+            progress_callback: Called with a status message and percentage
+            on_categorized: Called with the categories (by conversation ID)
+                written for each chunk
+            should_stop: Polled between chunks; a true value interrupts the run
+            progress_interval: Minimum seconds between progress reports
+            clock: Monotonic clock (for tests)
+            categorizer: Scores chunks instead of ``rules``, e.g. a trained
+                :class:`~poe_search.search.classifier.TextClassifier`
+        """
+        self.database = database
+        self.categorizer = categorizer if categorizer is not None else RuleCategorizer(rules)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = chunk_size
+        self.min_confidence = min_confidence
+        self.rules_hash = hashlib.sha256(
+            f"{self.categorizer.version}:{min_confidence}".encode("utf-8")
+        ).hexdigest()
+        self.progress_callback = progress_callback
+        self.on_categorized = on_categorized
+        self.should_stop = should_stop or (lambda: False)
+        self.progress_interval = progress_interval
+        self.clock = clock
+        self._last_progress: Optional[float] = None
+
+    def stale_count(self, uncategorized_only: bool = True) -> int:
+        """Number of conversations an incremental run would read."""
+        return self.database.count_stale_categorizations(self.rules_hash, uncategorized_only)
+
+    def run(
+        self,
+        conversation_ids: Optional[List[str]] = None,
+        uncategorized_only: bool = True,
+        incremental: bool = True,
+    ) -> Dict[str, int]:
+        """Categorize conversations and store their categories.
+
+        Args:
+            conversation_ids: Only these conversations (all if None)
+            uncategorized_only: Skip conversations with a category that
+                categorization did not assign
+            incremental: Skip conversations scored with the same rules
+                since they last changed, and re-score changed ones only if
+                their text changed
+
+        Returns:
+            Statistics: total, categorized, unchanged, skipped (text and
+            rules unchanged), failed, and ``interrupted`` (1 if stopped early)
+        """
+        stale_for = self.rules_hash if incremental else None
+        if conversation_ids is not None:
+            total = len(set(conversation_ids))
+        else:
+            total = self.database.count_stale_categorizations(stale_for, uncategorized_only)
+        stats = {
+            "total": total, "categorized": 0, "unchanged": 0, "skipped": 0, "failed": 0,
+            "interrupted": 0,
+        }
+        logger.info(f"Found {total} conversations to categorize")
+
+        chunks = self.database.iter_conversation_texts(
+            conversation_ids,
+            uncategorized_only=uncategorized_only,
+            chunk_size=self.chunk_size,
+            stale_for=stale_for,
+        )
+        if self.workers > 1 and total > self.chunk_size:
+            self._run_pool(chunks, stats, incremental)
+        else:
+            for chunk in chunks:
+                if self.should_stop():
+                    break
+                batch = self._prepare(chunk, incremental)
+                self._store(batch, self.categorizer.categorize_chunk(batch["score"]), stats)
+
+        if self.should_stop():
+            stats["interrupted"] = 1
+        self._progress(
+            "Categorization interrupted" if stats["interrupted"] else "Categorization completed",
+            100, force=True,
+        )
+        logger.info(
+            f"Categorization finished: {stats['categorized']} categorized, "
+            f"{stats['unchanged']} unchanged, {stats['skipped']} skipped, {stats['failed']} failed"
+        )
+        return stats
+
+    def _run_pool(self, chunks: Iterable[TextChunk], stats: Dict[str, int], incremental: bool) -> None:
+        # A few chunks per worker in flight keeps the pool busy while
+        # bounding the texts held in memory
+        max_pending = self.workers * 2
+        pending: Dict[Future, Dict[str, Any]] = {}
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.categorizer,),
+        ) as executor:
+            try:
+                for chunk in chunks:
+                    if self.should_stop():
+                        break
+                    batch = self._prepare(chunk, incremental)
+                    pending[executor.submit(_categorize_in_worker, batch["score"])] = batch
+                    if len(pending) >= max_pending:
+                        self._collect(pending, stats, FIRST_COMPLETED)
+                self._collect(pending, stats)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _collect(
+        self, pending: Dict[Future, Dict[str, Any]], stats: Dict[str, int], return_when: str = ALL_COMPLETED
+    ) -> None:
+        done, _ = wait(list(pending), return_when=return_when)
+        for future in done:
+            batch = pending.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"Error categorizing {len(batch['chunk'])} conversations: {e}")
+                stats["failed"] += len(batch["chunk"])
+                continue
+            self._store(batch, results, stats)
+
+    def _prepare(self, chunk: TextChunk, incremental: bool) -> Dict[str, Any]:
+        """Hash a chunk's texts and pick the conversations to score.
+
+        Conversations last scored with the same rules and the same text (a
+        sync touched them without changing their messages) keep their
+        previous outcome when running incrementally.
+        """
+        hashes = {conversation_id: content_hash(text) for conversation_id, _category, text in chunk}
+        previous = self.database.get_categorization_states(list(hashes))
+        score = [
+            item for item in chunk
+            if not incremental
+            or item[0] not in previous
+            or previous[item[0]]["rules_hash"] != self.rules_hash
+            or previous[item[0]]["content_hash"] != hashes[item[0]]
+        ]
+        return {"chunk": chunk, "score": score, "hashes": hashes, "previous": previous}
+
+    def _store(
+        self,
+        batch: Dict[str, Any],
+        results: List[Tuple[str, Optional[str], float]],
+        stats: Dict[str, int],
+    ) -> None:
+        """Write the categories and states of a scored chunk in one transaction."""
+        chunk, hashes, previous = batch["chunk"], batch["hashes"], batch["previous"]
+        current = {conversation_id: category for conversation_id, category, _text in chunk}
+        categories: Dict[str, str] = {}
+        states = []
+        for conversation_id, category, confidence in results:
+            if not category or confidence < self.min_confidence:
+                category = None
+            elif current[conversation_id] != category:
+                categories[conversation_id] = category
+            # The category categorization owns: the one it found, or the one
+            # it assigned before if nothing was found now
+            state = previous.get(conversation_id)
+            if category is None and state and state["category"] == current[conversation_id]:
+                category = current[conversation_id]
+            states.append((conversation_id, self.rules_hash, hashes[conversation_id], confidence, category))
+
+        scored = {conversation_id for conversation_id, _category, _confidence in results}
+        for conversation_id in hashes.keys() - scored:
+            state = previous[conversation_id]
+            states.append((
+                conversation_id, self.rules_hash, state["content_hash"], state["confidence"], state["category"]
+            ))
+
+        try:
+            self.database.set_conversation_categories(categories, states)
+        except Exception as e:
+            logger.error(f"Error storing categories of {len(chunk)} conversations: {e}")
+            stats["failed"] += len(chunk)
+            return
+
+        stats["categorized"] += len(categories)
+        stats["unchanged"] += len(scored) - len(categories)
+        stats["skipped"] += len(chunk) - len(scored)
+        if categories and self.on_categorized:
+            self.on_categorized(categories)
+
+        done = sum(stats[key] for key in ("categorized", "unchanged", "skipped", "failed"))
+        total = max(stats["total"], done, 1)
+        self._progress(f"Categorized {done}/{total} conversations", int(done * 100 / total))
+
+    def _progress(self, message: str, percent: int, force: bool = False) -> None:
+        if not self.progress_callback:
+            return
+        now = self.clock()
+        if not force and self._last_progress is not None and now - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = now
+        self.progress_callback(message, percent)
@@ -0,0 +1,323 @@
+"""Learned conversation categorization: TF-IDF features and a linear model.
+
+:class:`TextClassifier` learns categories from the conversations whose
+category was set by hand or by the sync (not by categorization itself):
+
+* texts are turned into sparse TF-IDF features over hashed words and word
+  pairs, so there is no vocabulary to grow or store,
+* a linear model trained by stochastic gradient descent (logistic loss, so
+  predictions come with a probability) runs on the CPU,
+* a whole chunk of texts is predicted with one sparse matrix product,
+* retraining only feeds the model examples added since the last training,
+  unless a category appeared or an example was relabelled or removed.
+
+A trained classifier has the interface of
+:class:`~poe_search.search.categorizer.RuleCategorizer` and can be handed
+to :class:`~poe_search.search.categorizer.BatchCategorizer`. It requires
+scikit-learn, which is imported when a classifier is created or loaded.
+"""
+
+import importlib
+import importlib.util
+import logging
+import os
+import pickle
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from poe_search.search.categorizer import MIN_CONFIDENCE, TextChunk, content_hash
+from poe_search.storage.database import Database
+
+SKLEARN_AVAILABLE = importlib.util.find_spec("sklearn") is not None
+
+# Bound by _require_sklearn()
+np: Any = None
+sp: Any = None
+sklearn: Any = None
+
+logger = logging.getLogger(__name__)
+
+# Layout of saved models; files of another format are refused
+MODEL_FORMAT = 1
+
+MODEL_FILE_NAME = "category_classifier.pkl"
+
+
+def _require_sklearn() -> None:
+    global np, sp, sklearn
+    if sklearn is not None:
+        return
+    if not SKLEARN_AVAILABLE:
+        raise ImportError(
+            "The learned categorizer requires scikit-learn. Install it with: pip install scikit-learn"
+        )
+    np = importlib.import_module("numpy")
+    sp = importlib.import_module("scipy.sparse")
+    sklearn = importlib.import_module("sklearn")
+
+
+def default_model_path(database: Database) -> Path:
+    """Where the classifier of a database is saved by default."""
+    return Path(database.db_path).parent / MODEL_FILE_NAME
+
+
+class TextClassifier:
+    """Linear categorizer over TF-IDF features, trained from labelled conversations."""
+
+    def __init__(self, n_features: int = 2 ** 18, alpha: float = 1e-5):
+        """Initialize an untrained classifier.
+
+        Args:
+            n_features: Size of the hashed feature space
+            alpha: Regularization strength of the linear model
+        """
+        _require_sklearn()
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+        from sklearn.linear_model import SGDClassifier
+
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32,
+        )
+        self.tfidf = TfidfTransformer(sublinear_tf=True)
+        self.model = SGDClassifier(loss="log_loss", alpha=alpha, random_state=0)
+        # Changes on every full training; with revision, identifies the predictions
+        self.model_id: Optional[str] = None
+        self.revision = 0
+        self.trained_at: Optional[str] = None
+        # "category:content hash" of every training example, by conversation ID
+        self.examples: Dict[str, str] = {}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Unpickled in a worker process, where nothing imported scikit-learn yet
+        _require_sklearn()
+        self.__dict__.update(state)
+
+    @property
+    def is_trained(self) -> bool:
+        return self.model_id is not None
+
+    @property
+    def categories(self) -> List[str]:
+        """Categories the classifier can predict."""
+        return list(self.model.classes_) if self.is_trained else []
+
+    @property
+    def version(self) -> str:
+        """Identifies the model; stored categorizations with another are stale."""
+        return f"classifier:{self.model_id}:{self.revision}"
+
+    def fit(self, texts: Sequence[str], labels: Sequence[str], ids: Optional[Sequence[str]] = None) -> None:
+        """Train from scratch.
+
+        Args:
+            texts: Conversation texts
+            labels: Category of each text (at least two distinct ones)
+            ids: Conversation ID of each text, remembered for :meth:`train`
+        """
+        self._fit_counts(self.vectorizer.transform(texts), labels)
+        self.examples = {}
+        if ids is not None:
+            self.examples = {
+                conversation_id: f"{label}:{content_hash(text)}"
+                for conversation_id, label, text in zip(ids, labels, texts)
+            }
+
+    def _fit_counts(self, counts: Any, labels: Sequence[str]) -> None:
+        if len(set(labels)) < 2:
+            raise ValueError("Training needs conversations in at least two categories")
+        features = self.tfidf.fit_transform(counts)
+        self.model.fit(features, np.asarray(labels))
+        self.model_id = uuid.uuid4().hex[:12]
+        self.revision = 0
+        self.trained_at = datetime.now().isoformat()
+
+    def partial_fit(self, texts: Sequence[str], labels: Sequence[str]) -> None:
+        """Update the model with more examples of known categories.
+
+        The TF-IDF weights of the last full training are kept.
+
+        Raises:
+            ValueError: If the classifier is untrained or a label is a new category
+        """
+        if not self.is_trained:
+            raise ValueError("The classifier must be trained before it can be updated")
+        unknown = set(labels) - set(self.model.classes_)
+        if unknown:
+            raise ValueError(f"New categories need a full training: {sorted(unknown)}")
+        self._partial_fit_counts(self.vectorizer.transform(texts), labels)
+
+    def _partial_fit_counts(self, counts: Any, labels: Sequence[str]) -> None:
+        self.model.partial_fit(self.tfidf.transform(counts), np.asarray(labels))
+        self.revision += 1
+        self.trained_at = datetime.now().isoformat()
+
+    def predict(self, texts: Sequence[str]) -> List[Tuple[Optional[str], float]]:
+        """Predict the category of many texts at once.
+
+        Returns:
+            (category, probability) of each text; (None, 0.0) for empty texts
+        """
+        if not texts:
+            return []
+        if not self.is_trained:
+            raise ValueError("The classifier is not trained")
+        features = self.tfidf.transform(self.vectorizer.transform(texts))
+        probabilities = self.model.predict_proba(features)
+        best = probabilities.argmax(axis=1)
+        confidences = probabilities[np.arange(len(texts)), best]
+        classes = self.model.classes_
+        return [
+            (str(classes[index]), float(confidence)) if text else (None, 0.0)
+            for text, index, confidence in zip(texts, best, confidences)
+        ]
+
+    def categorize(self, text: str) -> Tuple[Optional[str], float]:
+        """Categorize one text.
+
+        Returns:
+            Tuple of (category, confidence)
+        """
+        return self.predict([text])[0]
+
+    def categorize_chunk(self, chunk: TextChunk) -> List[Tuple[str, Optional[str], float]]:
+        """Categorize a chunk of (conversation ID, current category, text).
+
+        Returns:
+            (conversation ID, best category, confidence) for each item
+        """
+        predictions = self.predict([text for _id, _category, text in chunk])
+        return [
+            (conversation_id, category, confidence)
+            for (conversation_id, _category, _text), (category, confidence) in zip(chunk, predictions)
+        ]
+
+    def train(self, database: Database, full: bool = False, chunk_size: int = 500) -> Dict[str, Any]:
+        """Train from the conversations labelled in a database.
+
+        Examples are the conversations whose category categorization did
+        not assign. Only new examples are fed to the model when that is
+        enough; a full training happens the first time, when ``full`` is
+        set, when a category appeared, or when an example was relabelled,
+        edited or removed (a linear model cannot unlearn them).
+
+        Args:
+            database: Database holding the conversations
+            full: Train from scratch regardless
+            chunk_size: Conversations read at a time
+
+        Returns:
+            Statistics: examples, new (examples fed to the model), mode
+            (full, incremental or unchanged), categories, seconds
+        """
+        start = time.perf_counter()
+        ids: List[str] = []
+        labels: List[str] = []
+        keys: List[str] = []
+        counts = []
+        new_rows: List[int] = []
+        for chunk in database.iter_conversation_texts(chunk_size=chunk_size, labelled_only=True):
+            # Texts are hashed into sparse counts right away, so they are
+            # not all held in memory
+            counts.append(self.vectorizer.transform([text for _id, _category, text in chunk]))
+            for conversation_id, category, text in chunk:
+                key = f"{category}:{content_hash(text)}"
+                if self.examples.get(conversation_id) != key:
+                    new_rows.append(len(ids))
+                ids.append(conversation_id)
+                labels.append(category)
+                keys.append(key)
+
+        current = dict(zip(ids, keys))
+        changed = any(current.get(conversation_id) != key for conversation_id, key in self.examples.items())
+        new_labels = {labels[row] for row in new_rows}
+        needs_full = full or not self.is_trained or changed or not new_labels <= set(self.categories)
+
+        if needs_full and ids:
+            self._fit_counts(sp.vstack(counts), labels)
+            mode, new = "full", len(ids)
+        elif new_rows:
+            self._partial_fit_counts(
+                sp.vstack(counts).tocsr()[new_rows], [labels[row] for row in new_rows]
+            )
+            mode, new = "incremental", len(new_rows)
+        else:
+            mode, new = "unchanged", 0
+        self.examples = current
+
+        stats = {
+            "examples": len(ids),
+            "new": new,
+            "mode": mode,
+            "categories": self.categories,
+            "seconds": time.perf_counter() - start,
+        }
+        logger.info(f"Classifier training ({mode}): {len(ids)} examples, {new} fed to the model")
+        return stats
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the classifier, replacing the file atomically."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(
+                {"format": MODEL_FORMAT, "sklearn": sklearn.__version__, "classifier": self},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TextClassifier":
+        """Load a saved classifier.
+
+        Raises:
+            ValueError: If the file was saved in another model format
+        """
+        _require_sklearn()
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if not isinstance(data, dict) or data.get("format") != MODEL_FORMAT:
+            raise ValueError(f"Unsupported classifier model format in {path}; retrain it")
+        if data.get("sklearn") != sklearn.__version__:
+            logger.warning(
+                f"Classifier {path} was saved with scikit-learn {data.get('sklearn')}, "
+                f"running {sklearn.__version__}"
+            )
+        return data["classifier"]
+
+
+def evaluate(
+    categorizer: Any,
+    texts: Sequence[str],
+    labels: Sequence[str],
+    min_confidence: float = MIN_CONFIDENCE,
+) -> Dict[str, float]:
+    """Measure a categorizer (rules or classifier) against known categories.
+
+    Returns:
+        accuracy (share of texts given their label), coverage (share given
+        any category at ``min_confidence``), seconds spent categorizing
+    """
+    chunk = [(str(index), None, text) for index, text in enumerate(texts)]
+    start = time.perf_counter()
+    results = categorizer.categorize_chunk(chunk)
+    seconds = time.perf_counter() - start
+
+    assigned = [
+        category if category and confidence >= min_confidence else None
+        for _id, category, confidence in results
+    ]
+    total = max(len(texts), 1)
+    return {
+        "accuracy": sum(a == label for a, label in zip(assigned, labels)) / total,
+        "coverage": sum(a is not None for a in assigned) / total,
+        "seconds": seconds,
+    }
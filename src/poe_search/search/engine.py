@@ -2,10 +2,11 @@
 
 import re
 import logging
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 
-from poe_search.storage.database import Database
+from poe_search.storage.database import DAY_MS, Database
+from poe_search.utils.timestamps import to_epoch_ms
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,7 @@ class SearchEngine:
                     "title": message["conversation_title"],
                     "preview": self._generate_preview(message["content"], query),
                     "date": message["timestamp"][:10],  # Just the date part
+                    "ts": message.get("ts"),
                     "matches": [message],
                     "score": self._calculate_relevance_score(message["content"], query),
                 }
@@ -191,6 +193,8 @@ class SearchEngine:
         end_date: datetime,
         bot: Optional[str] = None,
         limit: int = 10,
+        after: Optional[Tuple[int, str]] = None,
+        ascending: bool = False,
     ) -> List[Dict[str, Any]]:
         """Search conversations within a date range.
         
@@ -199,23 +203,49 @@ class SearchEngine:
             end_date: End date for search
             bot: Filter by specific bot
             limit: Maximum number of results
+            after: Keyset cursor: ``(created_ts, id)`` of the last result of
+                the previous page
+            ascending: Oldest first instead of newest first
             
         Returns:
             List of conversations in date range
         """
-        conversations = self.database.get_conversations(bot=bot, limit=limit * 2)
-        
-        filtered_conversations = []
+        conversations = self.database.get_conversations_by_date(
+            start=start_date,
+            end=end_date,
+            bot=bot,
+            limit=limit,
+            after=after,
+            ascending=ascending,
+        )
         
         for conv in conversations:
-            conv_date = datetime.fromisoformat(conv["created_at"].replace("Z", "+00:00"))
-            
-            if start_date <= conv_date <= end_date:
-                conv["preview"] = conv.get("title", "No title")
-                conv["date"] = conv["created_at"][:10]
-                filtered_conversations.append(conv)
+            conv["preview"] = conv.get("title", "No title")
+            conv["date"] = conv["created_at"][:10]
         
-        return filtered_conversations[:limit]
+        return conversations
+    
+    def date_histogram(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        bucket: str = "day",
+        bot: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Count conversations per time bucket, e.g. for date picker density.
+        
+        Args:
+            start_date: Start date (None for the first conversation)
+            end_date: End date (None for the last conversation)
+            bucket: hour, day, week, month or year
+            bot: Filter by specific bot
+            
+        Returns:
+            List of ``{"start_ts", "label", "count"}``, oldest first
+        """
+        return self.database.get_date_histogram(
+            start=start_date, end=end_date, bucket=bucket, bot=bot
+        )
     
     def _generate_preview(self, content: str, query: str, max_length: int = 100) -> str:
         """Generate a preview snippet highlighting the search query.
@@ -315,12 +345,11 @@ class SearchEngine:
         
         # Date range filter
         if "days" in filters:
-            cutoff_date = datetime.now() - timedelta(days=filters["days"])
-            cutoff_str = cutoff_date.isoformat()
+            cutoff_ms = to_epoch_ms(datetime.now(timezone.utc)) - filters["days"] * DAY_MS
             
             filtered_results = [
                 result for result in filtered_results
-                if result.get("date", "") >= cutoff_str[:10]
+                if (result.get("ts", result.get("created_ts")) or 0) >= cutoff_ms
             ]
         
         # Minimum score filter
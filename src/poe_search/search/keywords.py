@@ -0,0 +1,103 @@
+"""Multi-keyword matching for conversation categorization.
+
+Categorization rules test many keywords against the same text. Checking
+``keyword in text.lower()`` keyword by keyword (and lowercasing the text
+again for every rule) makes the cost grow with the number of rules.
+:class:`KeywordMatcher` compiles the keywords of every rule into a single
+regular expression, shaped like a trie so that keywords sharing a prefix
+are tried together, and finds all of them in one pass over the text.
+
+The results are the same as substring tests on the lowercased text: the
+expression reports the longest keyword starting at each position, and the
+keywords contained in it are counted through a table computed when the
+matcher is built.
+"""
+
+import re
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set
+
+
+def _trie_pattern(node: Dict[str, dict]) -> str:
+    # "" marks the end of a keyword; the optional group is greedy, so the
+    # longest keyword at a position wins
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return "(?:" + body + ")?" if "" in node else body
+
+
+class KeywordMatcher:
+    """Finds the keywords of many labelled groups in one pass over a text.
+
+    Labels are usually categories or rules; a keyword may belong to
+    several of them. Matching is case-insensitive (by ``str.lower``) and by
+    substring, like ``keyword in text.lower()``.
+    """
+
+    def __init__(self, groups: Mapping[Hashable, Iterable[str]]):
+        """Compile the keywords.
+
+        Args:
+            groups: Keywords of each label, in order of precedence
+        """
+        self.labels: List[Hashable] = list(groups)
+        # Labels of each keyword, once per listing (as counted by a loop)
+        self._keyword_labels: Dict[str, List[Hashable]] = {}
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword:
+                    self._keyword_labels.setdefault(keyword, []).append(label)
+
+        keywords = list(self._keyword_labels)
+        # Keywords found inside each keyword, which the expression does not
+        # report separately
+        self._contained: Dict[str, List[str]] = {
+            keyword: [other for other in keywords if other != keyword and other in keyword]
+            for keyword in keywords
+        }
+
+        self._regex: Optional[re.Pattern] = None
+        if keywords:
+            trie: Dict[str, dict] = {}
+            for keyword in keywords:
+                node = trie
+                for char in keyword:
+                    node = node.setdefault(char, {})
+                node[""] = {}
+            self._regex = re.compile("(?=(" + _trie_pattern(trie) + "))")
+
+    def found(self, text: str, lowered: bool = False) -> Set[str]:
+        """The keywords occurring in a text.
+
+        Args:
+            text: Text to search
+            lowered: The text is already lowercase
+        """
+        if self._regex is None or not text:
+            return set()
+        if not lowered:
+            text = text.lower()
+        found = set(self._regex.findall(text))
+        for keyword in list(found):
+            found.update(self._contained[keyword])
+        return found
+
+    def counts(self, text: str, lowered: bool = False) -> Dict[Hashable, int]:
+        """Number of keywords of each label occurring in a text.
+
+        Labels without a match are left out.
+        """
+        counts: Dict[Hashable, int] = {}
+        for keyword in self.found(text, lowered):
+            for label in self._keyword_labels[keyword]:
+                counts[label] = counts.get(label, 0) + 1
+        return counts
+
+    def first(self, text: str, lowered: bool = False) -> Optional[Hashable]:
+        """The first label, in order of precedence, with a keyword in a text."""
+        counts = self.counts(text, lowered)
+        if not counts:
+            return None
+        return next(label for label in self.labels if label in counts)
@@ -5,12 +5,13 @@ Export service for conversation data.
 import json
 import csv
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, TextIO
 from datetime import datetime
 
 from ..core.models import Conversation, ExportOptions
 from ..core.exceptions import ExportError
 from ..core.utils import sanitize_filename, ensure_directory
+from ..export.compression import compressed_path, open_export_file
 
 
 class ExportService:
@@ -50,6 +51,8 @@ class ExportService:
             if not filtered_conversations:
                 raise ExportError("No conversations match the export criteria")
 
+            output_path = compressed_path(output_path, options.compression)
+
             # Export based on format
             if options.format == 'json':
                 return self._export_json(filtered_conversations, output_path, options)
@@ -81,6 +84,15 @@ class ExportService:
 
         return filtered
 
+    def _open(self, output_path: Path, options: ExportOptions, newline: Optional[str] = None) -> TextIO:
+        """Open an export file, compressed and split as the options request."""
+        return open_export_file(
+            output_path,
+            compression=options.compression,
+            max_part_size=options.max_part_size,
+            newline=newline,
+        )
+
     def _export_json(self, conversations: List[Conversation], output_path: Path, options: ExportOptions) -> bool:
         """Export conversations as JSON."""
         try:
@@ -97,7 +109,7 @@ class ExportService:
                 'conversations': [conv.to_dict() for conv in conversations]
             }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with self._open(output_path, options) as f:
                 json.dump(export_data, f, indent=2, ensure_ascii=False)
 
             return True
@@ -107,7 +119,7 @@ class ExportService:
     def _export_txt(self, conversations: List[Conversation], output_path: Path, options: ExportOptions) -> bool:
         """Export conversations as plain text."""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with self._open(output_path, options) as f:
                 f.write(f"Poe Search Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"Total Conversations: {len(conversations)}\n")
                 f.write("=" * 80 + "\n\n")
@@ -136,7 +148,7 @@ class ExportService:
     def _export_csv(self, conversations: List[Conversation], output_path: Path, options: ExportOptions) -> bool:
         """Export conversations as CSV."""
         try:
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            with self._open(output_path, options, newline='') as f:
                 writer = csv.writer(f)
 
                 # Write header
@@ -173,7 +185,7 @@ class ExportService:
     def _export_markdown(self, conversations: List[Conversation], output_path: Path, options: ExportOptions) -> bool:
         """Export conversations as Markdown."""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with self._open(output_path, options) as f:
                 f.write("# Poe Search Export\n\n")
                 f.write(f"**Export Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n")
                 f.write(f"**Total Conversations:** {len(conversations)}  \n\n")
@@ -201,8 +213,8 @@ class ExportService:
         except Exception as e:
             raise ExportError(f"Markdown export failed: {str(e)}")
 
-    def get_export_filename(self, base_name: str, format_type: str) -> str:
+    def get_export_filename(self, base_name: str, format_type: str, compression: Optional[str] = None) -> str:
         """Generate a safe export filename."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         safe_name = sanitize_filename(base_name)
-        return f"{safe_name}_{timestamp}.{format_type}"
+        return compressed_path(f"{safe_name}_{timestamp}.{format_type}", compression).name
@@ -1,5 +1,6 @@
 """Storage module initialization."""
 
+from poe_search.storage.analytics import ConversationAnalytics
 from poe_search.storage.database import Database
 
-__all__ = ["Database"]
+__all__ = ["ConversationAnalytics", "Database"]
@@ -0,0 +1,278 @@
+"""SQL-side analytics for the dashboard.
+
+:class:`ConversationAnalytics` aggregates conversations with ``GROUP BY``
+queries over the ``created_ts``, ``bot``, ``category`` and
+``message_count`` columns, which the ``idx_conversations_created_ts``
+index covers, so a refresh returns a few dozen rows no matter how large
+the archive is. Days are UTC days derived from the epoch-millisecond
+``created_ts`` column.
+
+:func:`summarize_conversations` computes the same summary from an
+in-memory conversation list, for callers that have no database.
+"""
+
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from poe_search.storage.database import DAY_MS
+from poe_search.utils.timestamps import to_epoch_ms
+
+RECENT_DAYS = 7
+
+TIMELINE_DAYS = 30
+
+UNKNOWN_BOT = "Unknown"
+
+UNCATEGORIZED = "Uncategorized"
+
+# Pinned so the planner never prefers idx_conversations_bot plus a row lookup
+# (which reads the large JSON rows) over the covering index
+_SOURCE = "conversations INDEXED BY idx_conversations_created_ts"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _day_string(day: int) -> str:
+    """Format a day number (days since the epoch) as YYYY-MM-DD."""
+    return datetime.fromtimestamp(day * 86400, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+class ConversationAnalytics:
+    """Dashboard aggregations computed in SQLite."""
+
+    def __init__(self, database):
+        """Initialize the analytics layer.
+
+        Args:
+            database: Database instance
+        """
+        self.database = database
+
+    def dashboard(
+        self,
+        days: Optional[int] = None,
+        timeline_days: int = TIMELINE_DAYS,
+        now_ms: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Everything the analytics dashboard shows, in one round trip.
+
+        Args:
+            days: Only count conversations created in the last N days
+                (None for all time)
+            timeline_days: Number of most recent active days in the timeline
+            now_ms: Current time in epoch milliseconds (defaults to now)
+
+        Returns:
+            Dict with ``overview``, ``bots``, ``categories`` and ``timeline``
+        """
+        now_ms = _now_ms() if now_ms is None else now_ms
+        since_ms = now_ms - days * DAY_MS if days else None
+        with self.database._get_connection() as conn:
+            return {
+                "overview": self._overview(conn, since_ms, now_ms),
+                "bots": self._breakdown(conn, "bot", UNKNOWN_BOT, since_ms),
+                "categories": self._breakdown(conn, "category", UNCATEGORIZED, since_ms),
+                "timeline": self._timeline(conn, since_ms, timeline_days),
+            }
+
+    def overview(self, days: Optional[int] = None, now_ms: Optional[int] = None) -> Dict[str, Any]:
+        """Overview statistics (see :meth:`dashboard`)."""
+        now_ms = _now_ms() if now_ms is None else now_ms
+        since_ms = now_ms - days * DAY_MS if days else None
+        with self.database._get_connection() as conn:
+            return self._overview(conn, since_ms, now_ms)
+
+    def bot_breakdown(self, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Conversation and message counts per bot, largest first."""
+        since_ms = _now_ms() - days * DAY_MS if days else None
+        with self.database._get_connection() as conn:
+            return self._breakdown(conn, "bot", UNKNOWN_BOT, since_ms)
+
+    def category_breakdown(self, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Conversation and message counts per category, largest first."""
+        since_ms = _now_ms() - days * DAY_MS if days else None
+        with self.database._get_connection() as conn:
+            return self._breakdown(conn, "category", UNCATEGORIZED, since_ms)
+
+    def daily_timeline(self, days: Optional[int] = None, limit: int = TIMELINE_DAYS) -> List[Dict[str, Any]]:
+        """Per-day activity for the most recent active days, newest first."""
+        since_ms = _now_ms() - days * DAY_MS if days else None
+        with self.database._get_connection() as conn:
+            return self._timeline(conn, since_ms, limit)
+
+    @staticmethod
+    def _where(since_ms: Optional[int]) -> Tuple[str, List[Any]]:
+        if since_ms is None:
+            return "", []
+        return " WHERE created_ts >= ?", [since_ms]
+
+    def _overview(self, conn, since_ms: Optional[int], now_ms: int) -> Dict[str, Any]:
+        where, params = self._where(since_ms)
+        row = conn.execute(
+            f"""
+            SELECT COUNT(*), COALESCE(SUM(message_count), 0), COALESCE(MAX(message_count), 0),
+                   COALESCE(SUM(created_ts >= ?), 0)
+            FROM {_SOURCE}{where}
+            """,
+            [now_ms - RECENT_DAYS * DAY_MS] + params,
+        ).fetchone()
+        total_conversations, total_messages, largest, recent = row
+        top = conn.execute(
+            f"""
+            SELECT COALESCE(NULLIF(bot, ''), ?) AS name FROM {_SOURCE}{where}
+            GROUP BY name ORDER BY COUNT(*) DESC, name LIMIT 1
+            """,
+            [UNKNOWN_BOT] + params,
+        ).fetchone()
+        return {
+            "total_conversations": total_conversations,
+            "total_messages": total_messages,
+            "avg_messages": total_messages / total_conversations if total_conversations else 0.0,
+            "most_used_bot": top[0] if top else None,
+            "recent_conversations": recent,
+            "largest_conversation": largest,
+        }
+
+    def _breakdown(self, conn, column: str, missing: str, since_ms: Optional[int]) -> List[Dict[str, Any]]:
+        where, params = self._where(since_ms)
+        rows = conn.execute(
+            f"""
+            SELECT COALESCE(NULLIF({column}, ''), ?) AS name, COUNT(*), COALESCE(SUM(message_count), 0)
+            FROM {_SOURCE}{where}
+            GROUP BY name ORDER BY COUNT(*) DESC, name
+            """,
+            [missing] + params,
+        ).fetchall()
+        return _with_percentages(
+            {"name": name, "conversations": conversations, "messages": messages}
+            for name, conversations, messages in rows
+        )
+
+    def _timeline(self, conn, since_ms: Optional[int], limit: int) -> List[Dict[str, Any]]:
+        where, params = self._where(since_ms)
+        where = (where + " AND" if where else " WHERE") + " created_ts IS NOT NULL"
+        # Per (day, bot) counts; the day totals and busiest bot are derived
+        # with window functions so a single scan of the index suffices
+        rows = conn.execute(
+            f"""
+            WITH per_bot AS (
+                SELECT created_ts / {DAY_MS} AS day, COALESCE(NULLIF(bot, ''), ?) AS bot,
+                       COUNT(*) AS conversations, SUM(message_count) AS messages
+                FROM {_SOURCE}{where}
+                GROUP BY day, 2
+            ), ranked AS (
+                SELECT day, bot,
+                       SUM(conversations) OVER (PARTITION BY day) AS day_conversations,
+                       SUM(messages) OVER (PARTITION BY day) AS day_messages,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY day ORDER BY conversations DESC, bot
+                       ) AS rank
+                FROM per_bot
+            )
+            SELECT day, day_conversations, day_messages, bot
+            FROM ranked WHERE rank = 1
+            ORDER BY day DESC LIMIT ?
+            """,
+            [UNKNOWN_BOT] + params + [limit],
+        ).fetchall()
+        return [
+            {
+                "date": _day_string(day),
+                "conversations": conversations,
+                "messages": messages or 0,
+                "top_bot": top_bot,
+            }
+            for day, conversations, messages, top_bot in rows
+        ]
+
+
+def _with_percentages(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    rows = list(rows)
+    total = sum(row["conversations"] for row in rows)
+    for row in rows:
+        row["percentage"] = row["conversations"] / total * 100 if total else 0.0
+    return rows
+
+
+def summarize_conversations(
+    conversations: Iterable[Dict[str, Any]],
+    days: Optional[int] = None,
+    timeline_days: int = TIMELINE_DAYS,
+    now_ms: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Compute the :meth:`ConversationAnalytics.dashboard` summary in Python.
+
+    Each ``created_at`` is parsed once.
+
+    Args:
+        conversations: Conversation dicts
+        days: Only count conversations created in the last N days
+        timeline_days: Number of most recent active days in the timeline
+        now_ms: Current time in epoch milliseconds (defaults to now)
+
+    Returns:
+        Same structure as :meth:`ConversationAnalytics.dashboard`
+    """
+    now_ms = _now_ms() if now_ms is None else now_ms
+    since_ms = now_ms - days * DAY_MS if days else None
+    recent_ms = now_ms - RECENT_DAYS * DAY_MS
+
+    total = messages_total = largest = recent = 0
+    bots: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    categories: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+    per_day: Dict[int, Counter] = defaultdict(Counter)
+    day_messages: Dict[int, int] = defaultdict(int)
+
+    for conversation in conversations:
+        created_ms = to_epoch_ms(conversation.get("created_at"))
+        if since_ms is not None and (created_ms is None or created_ms < since_ms):
+            continue
+        bot = conversation.get("bot") or UNKNOWN_BOT
+        category = conversation.get("category") or UNCATEGORIZED
+        message_count = conversation.get("message_count") or 0
+
+        total += 1
+        messages_total += message_count
+        largest = max(largest, message_count)
+        bots[bot][0] += 1
+        bots[bot][1] += message_count
+        categories[category][0] += 1
+        categories[category][1] += message_count
+        if created_ms is not None:
+            recent += created_ms >= recent_ms
+            day = created_ms // DAY_MS
+            per_day[day][bot] += 1
+            day_messages[day] += message_count
+
+    def breakdown(counts: Dict[str, List[int]]) -> List[Dict[str, Any]]:
+        ordered = sorted(counts.items(), key=lambda item: (-item[1][0], item[0]))
+        return _with_percentages(
+            {"name": name, "conversations": c, "messages": m} for name, (c, m) in ordered
+        )
+
+    bot_rows = breakdown(bots)
+    return {
+        "overview": {
+            "total_conversations": total,
+            "total_messages": messages_total,
+            "avg_messages": messages_total / total if total else 0.0,
+            "most_used_bot": bot_rows[0]["name"] if bot_rows else None,
+            "recent_conversations": recent,
+            "largest_conversation": largest,
+        },
+        "bots": bot_rows,
+        "categories": breakdown(categories),
+        "timeline": [
+            {
+                "date": _day_string(day),
+                "conversations": sum(per_day[day].values()),
+                "messages": day_messages[day],
+                "top_bot": min(per_day[day].items(), key=lambda item: (-item[1], item[0]))[0],
+            }
+            for day in sorted(per_day, reverse=True)[:timeline_days]
+        ],
+    }
@@ -3,12 +3,77 @@
 import json
 import logging
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from poe_search.utils.timestamps import to_epoch_ms
 
 logger = logging.getLogger(__name__)
 
+# How bulk saves treat conversations that are already stored
+CONFLICT_POLICIES = ("replace", "skip", "newer")
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+# Days covered by each get_analytics period
+PERIOD_DAYS = {"day": 1, "week": 7, "month": 30, "year": 365}
+
+# Buckets get_rollups can group by
+ROLLUP_GROUPS = ("day", "week", "month", "year", "bot", "category")
+
+_ROLLUP_BUCKETS = {
+    "day": "day",
+    # Weeks start on Monday; day 0 (1970-01-01) was a Thursday
+    "week": "day - (day + 3) % 7",
+    "month": "strftime('%Y-%m', day * 86400, 'unixepoch')",
+    "year": "strftime('%Y', day * 86400, 'unixepoch')",
+    "bot": "bot",
+    "category": "category",
+}
+
+# Bucket start (epoch milliseconds) of created_ts for each histogram bucket,
+# and how the bucket is labelled
+_HISTOGRAM_BUCKETS = {
+    "hour": ("created_ts / 3600000 * 3600000", "%Y-%m-%d %H:00"),
+    "day": (f"created_ts / {DAY_MS} * {DAY_MS}", "%Y-%m-%d"),
+    "week": (f"(created_ts / {DAY_MS} - (created_ts / {DAY_MS} + 3) % 7) * {DAY_MS}", "%Y-%m-%d"),
+    "month": (
+        "CAST(strftime('%s', created_ts / 1000, 'unixepoch', 'start of month') AS INTEGER) * 1000",
+        "%Y-%m",
+    ),
+    "year": (
+        "CAST(strftime('%s', created_ts / 1000, 'unixepoch', 'start of year') AS INTEGER) * 1000",
+        "%Y",
+    ),
+}
+
+HISTOGRAM_BUCKETS = tuple(_HISTOGRAM_BUCKETS)
+
+# Columns get_conversation_summaries returns, and those it can sort by
+SUMMARY_COLUMNS = (
+    "id", "title", "bot", "category", "message_count",
+    "created_at", "updated_at", "created_ts", "updated_ts",
+)
+SUMMARY_SORT_KEYS = ("title", "bot", "category", "message_count", "created_ts", "updated_ts")
+
+
+def _is_newer(incoming: Optional[int], stored: Optional[int]) -> bool:
+    """Whether an incoming ``updated_ts`` is later than the stored one."""
+    if stored is None:
+        return True
+    if incoming is None:
+        return False
+    return incoming > stored
+
+
+def _category_of(data: Optional[str]) -> Optional[str]:
+    """Category stored in a conversation's JSON data."""
+    try:
+        return json.loads(data).get("category") if data else None
+    except (ValueError, AttributeError):
+        return None
+
 
 class Database:
     """SQLite database for storing conversation data."""
@@ -49,9 +114,13 @@ class Database:
                     updated_at TEXT NOT NULL,
                     message_count INTEGER DEFAULT 0,
                     data TEXT,  -- JSON data
+                    created_ts INTEGER,  -- created_at in epoch milliseconds
+                    category TEXT,
+                    updated_ts INTEGER,  -- updated_at in epoch milliseconds
                     UNIQUE(id)
                 )
             """)
+            self._migrate_conversation_columns(conn)
             
             # Messages table
             conn.execute("""
@@ -63,10 +132,12 @@ class Database:
                     timestamp TEXT NOT NULL,
                     bot TEXT,
                     data TEXT,  -- JSON data
+                    ts INTEGER,  -- timestamp in epoch milliseconds
                     FOREIGN KEY (conversation_id) REFERENCES conversations (id),
                     UNIQUE(id)
                 )
             """)
+            self._migrate_message_columns(conn)
             
             # Bots table
             conn.execute("""
@@ -93,15 +164,211 @@ class Database:
                 )
             """)
             
+            # Sync jobs: one row per sync run, with the discovered conversation
+            # list checkpointed in sync_job_items so a run can be resumed
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    status TEXT NOT NULL,  -- 'running', 'interrupted', 'completed', 'failed'
+                                           -- ('failed': finished with failed items)
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    finished_at TEXT,
+                    params TEXT,  -- JSON data
+                    error TEXT
+                )
+            """)
+            
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_job_items (
+                    job_id INTEGER NOT NULL,
+                    conversation_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    url TEXT,
+                    title TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',  -- 'pending', 'done', 'failed'
+                    attempts INTEGER DEFAULT 0,
+                    last_error TEXT,
+                    next_attempt_at REAL DEFAULT 0,  -- epoch seconds
+                    updated_at TEXT,
+                    PRIMARY KEY (job_id, conversation_id),
+                    FOREIGN KEY (job_id) REFERENCES sync_jobs (id)
+                )
+            """)
+            
+            # Per (UTC day, bot, category) totals, kept in step with every write
+            # so period analytics never scan conversations or messages.
+            # category is '' for uncategorized conversations (it is part of the key)
+            rollups_exist = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_rollups'"
+            ).fetchone()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_rollups (
+                    day INTEGER NOT NULL,  -- days since the epoch (created_ts / DAY_MS)
+                    bot TEXT NOT NULL,
+                    category TEXT NOT NULL DEFAULT '',
+                    conversations INTEGER NOT NULL DEFAULT 0,
+                    nonempty INTEGER NOT NULL DEFAULT 0,  -- conversations with messages
+                    messages INTEGER NOT NULL DEFAULT 0,  -- sum of message_count
+                    user_messages INTEGER NOT NULL DEFAULT 0,
+                    characters INTEGER NOT NULL DEFAULT 0,  -- message content length
+                    PRIMARY KEY (day, bot, category)
+                ) WITHOUT ROWID
+            """)
+            rollup_columns = {row[1] for row in conn.execute("PRAGMA table_info(daily_rollups)")}
+            if "nonempty" not in rollup_columns:
+                conn.execute("ALTER TABLE daily_rollups ADD COLUMN nonempty INTEGER NOT NULL DEFAULT 0")
+                rollups_exist = None
+            if not rollups_exist:
+                self._rebuild_rollups(conn)
+            
+            # Outcome of the last categorization of each conversation, so runs
+            # only re-score conversations whose content or rules changed.
+            # updated_ts and message_count are the conversation's values when
+            # it was scored; category is the one categorization assigned
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS categorization_state (
+                    conversation_id TEXT PRIMARY KEY,
+                    rules_hash TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    confidence REAL NOT NULL,
+                    category TEXT,
+                    updated_ts INTEGER,
+                    message_count INTEGER,
+                    scored_at TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+            
             # Create indexes
             conn.execute("CREATE INDEX IF NOT EXISTS idx_conversations_bot ON conversations(bot)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_conversations_created_at ON conversations(created_at)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_conversation_id ON messages(conversation_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_ts ON messages(ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_conversations_updated_ts ON conversations(updated_ts)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_bot ON messages(bot)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sync_jobs_status ON sync_jobs(status)")
+            # Covers the analytics aggregations, which never touch the JSON data
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_conversations_created_ts
+                ON conversations(created_ts, bot, category, message_count)
+            """)
             
             conn.commit()
     
+    def _migrate_conversation_columns(self, conn: sqlite3.Connection) -> None:
+        """Add and backfill the derived columns of databases created before them."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(conversations)")}
+        missing = [
+            (name, type)
+            for name, type in (("created_ts", "INTEGER"), ("category", "TEXT"), ("updated_ts", "INTEGER"))
+            if name not in columns
+        ]
+        if not missing:
+            return
+        
+        logger.info(
+            "Migrating conversations table: adding "
+            + ", ".join(name for name, _ in missing) + " columns"
+        )
+        for name, type in missing:
+            conn.execute(f"ALTER TABLE conversations ADD COLUMN {name} {type}")
+        
+        rows = conn.execute("SELECT id, created_at, updated_at, data FROM conversations").fetchall()
+        conn.executemany(
+            "UPDATE conversations SET created_ts = ?, updated_ts = ?, category = ? WHERE id = ?",
+            [
+                (to_epoch_ms(created_at), to_epoch_ms(updated_at), _category_of(data), conversation_id)
+                for conversation_id, created_at, updated_at, data in rows
+            ],
+        )
+    
+    def _migrate_message_columns(self, conn: sqlite3.Connection) -> None:
+        """Add and backfill the messages ``ts`` column of older databases."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(messages)")}
+        if "ts" in columns:
+            return
+        
+        logger.info("Migrating messages table: adding ts column")
+        conn.execute("ALTER TABLE messages ADD COLUMN ts INTEGER")
+        rows = conn.execute("SELECT id, timestamp FROM messages").fetchall()
+        conn.executemany(
+            "UPDATE messages SET ts = ? WHERE id = ?",
+            [(to_epoch_ms(timestamp), message_id) for message_id, timestamp in rows],
+        )
+    
+    def _apply_rollups(self, conn: sqlite3.Connection, conversation_ids: List[str], sign: int) -> None:
+        """Add (sign 1) or subtract (sign -1) conversations' current rows to the rollups.
+        
+        Writers subtract the rows they are about to change and add them back
+        afterwards, so the rollups follow inserts, replacements and moves
+        between days, bots and categories without a rescan. Conversations
+        without a parseable ``created_at`` are not rolled up.
+        """
+        if not conversation_ids:
+            return
+        placeholders = ", ".join("?" for _ in conversation_ids)
+        conn.execute(f"""
+            INSERT INTO daily_rollups
+            (day, bot, category, conversations, nonempty, messages, user_messages, characters)
+            SELECT c.created_ts / {DAY_MS}, c.bot, COALESCE(c.category, ''),
+                   ? * COUNT(*), ? * SUM(c.message_count > 0), ? * COALESCE(SUM(c.message_count), 0),
+                   ? * COALESCE(SUM(m.user_messages), 0), ? * COALESCE(SUM(m.characters), 0)
+            FROM conversations c
+            LEFT JOIN (
+                SELECT conversation_id, SUM(role = 'user') AS user_messages,
+                       SUM(LENGTH(content)) AS characters
+                FROM messages WHERE conversation_id IN ({placeholders})
+                GROUP BY conversation_id
+            ) m ON m.conversation_id = c.id
+            WHERE c.id IN ({placeholders}) AND c.created_ts IS NOT NULL
+            GROUP BY 1, 2, 3
+            ON CONFLICT (day, bot, category) DO UPDATE SET
+                conversations = conversations + excluded.conversations,
+                nonempty = nonempty + excluded.nonempty,
+                messages = messages + excluded.messages,
+                user_messages = user_messages + excluded.user_messages,
+                characters = characters + excluded.characters
+        """, [sign] * 5 + list(conversation_ids) * 2)
+        if sign > 0:
+            # Buckets emptied by the subtraction (a conversation moved or shrank)
+            conn.execute("DELETE FROM daily_rollups WHERE conversations <= 0")
+    
+    def _rebuild_rollups(self, conn: sqlite3.Connection) -> int:
+        """Recompute the rollups from scratch; returns the number of rollup rows."""
+        conn.execute("DELETE FROM daily_rollups")
+        conn.execute(f"""
+            INSERT INTO daily_rollups
+            (day, bot, category, conversations, nonempty, messages, user_messages, characters)
+            SELECT c.created_ts / {DAY_MS}, c.bot, COALESCE(c.category, ''),
+                   COUNT(*), SUM(c.message_count > 0), COALESCE(SUM(c.message_count), 0),
+                   COALESCE(SUM(m.user_messages), 0), COALESCE(SUM(m.characters), 0)
+            FROM conversations c
+            LEFT JOIN (
+                SELECT conversation_id, SUM(role = 'user') AS user_messages,
+                       SUM(LENGTH(content)) AS characters
+                FROM messages GROUP BY conversation_id
+            ) m ON m.conversation_id = c.id
+            WHERE c.created_ts IS NOT NULL
+            GROUP BY 1, 2, 3
+        """)
+        return conn.execute("SELECT COUNT(*) FROM daily_rollups").fetchone()[0]
+    
+    def rebuild_rollups(self) -> int:
+        """Recompute the analytics rollups from the conversations and messages.
+        
+        The rollups are maintained on every save, so this is only needed
+        after the tables were modified outside this class.
+        
+        Returns:
+            Number of rollup rows (day, bot, category combinations)
+        """
+        with self._get_connection() as conn:
+            rows = self._rebuild_rollups(conn)
+            conn.commit()
+        logger.info(f"Rebuilt analytics rollups: {rows} rows")
+        return rows
+    
     def conversation_exists(self, conversation_id: str) -> bool:
         """Check if conversation exists in database.
         
@@ -171,11 +438,13 @@ class Database:
         conversation = self._normalize_api_data(conversation)
         
         with self._get_connection() as conn:
+            self._apply_rollups(conn, [conversation["id"]], -1)
+            
             # Insert/update conversation
             conn.execute("""
                 INSERT OR REPLACE INTO conversations 
-                (id, bot, title, created_at, updated_at, message_count, data)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                (id, bot, title, created_at, updated_at, message_count, data, created_ts, category, updated_ts)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 conversation["id"],
                 conversation["bot"],
@@ -184,6 +453,9 @@ class Database:
                 conversation["updated_at"],
                 conversation.get("message_count", 0),
                 json.dumps(conversation),
+                to_epoch_ms(conversation["created_at"]),
+                conversation.get("category"),
+                to_epoch_ms(conversation["updated_at"]),
             ))
             
             # Save messages
@@ -194,6 +466,7 @@ class Database:
             # Update bot information
             self._update_bot_info(conversation["bot"], conn)
             
+            self._apply_rollups(conn, [conversation["id"]], 1)
             conn.commit()
     
     def save_message(
@@ -214,11 +487,14 @@ class Database:
             conn = self._get_connection()
         
         try:
+            if close_conn:
+                self._apply_rollups(conn, [conversation_id], -1)
+            
             # Insert/update message
             conn.execute("""
                 INSERT OR REPLACE INTO messages 
-                (id, conversation_id, role, content, timestamp, bot, data)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                (id, conversation_id, role, content, timestamp, bot, data, ts)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 message["id"],
                 conversation_id,
@@ -227,6 +503,7 @@ class Database:
                 message["timestamp"],
                 message.get("bot"),
                 json.dumps(message),
+                to_epoch_ms(message["timestamp"]),
             ))
             
             # Update FTS index
@@ -242,12 +519,164 @@ class Database:
             ))
             
             if close_conn:
+                self._apply_rollups(conn, [conversation_id], 1)
                 conn.commit()
                 
         finally:
             if close_conn:
                 conn.close()
     
+    def save_conversations_bulk(
+        self,
+        conversations: Iterable[Dict[str, Any]],
+        batch_size: int = 500,
+        on_conflict: str = "replace",
+    ) -> int:
+        """Save many conversations in a single transaction.
+        
+        Rows are written with ``executemany`` in batches and bot statistics
+        are refreshed once at the end, instead of per conversation as in
+        :meth:`save_conversation`.
+        
+        Args:
+            conversations: Conversations to save; any iterable, consumed once
+            batch_size: Conversations per executemany batch
+            on_conflict: What to do with conversations that already exist:
+                ``replace`` them together with their messages, ``skip`` them,
+                or replace them only if the new copy is ``newer``
+            
+        Returns:
+            Number of conversations saved
+        """
+        if on_conflict not in CONFLICT_POLICIES:
+            raise ValueError(f"Unknown conflict policy: {on_conflict}")
+        
+        saved = 0
+        bots = set()
+        
+        with self._get_connection() as conn:
+            batch: List[Dict[str, Any]] = []
+            for conversation in conversations:
+                batch.append(self._normalize_api_data(conversation))
+                if len(batch) >= batch_size:
+                    written = self._insert_conversation_batch(batch, conn, on_conflict)
+                    saved += len(written)
+                    bots.update(c["bot"] for c in written)
+                    batch = []
+            if batch:
+                written = self._insert_conversation_batch(batch, conn, on_conflict)
+                saved += len(written)
+                bots.update(c["bot"] for c in written)
+            
+            for bot in sorted(bots):
+                self._update_bot_info(bot, conn)
+            conn.executemany("""
+                UPDATE bots
+                SET conversation_count = (SELECT COUNT(*) FROM conversations WHERE bot = ?),
+                    message_count = (SELECT COUNT(*) FROM messages WHERE bot = ?)
+                WHERE id = ?
+            """, [(bot, bot, bot) for bot in bots])
+            
+            conn.commit()
+        
+        return saved
+    
+    def _insert_conversation_batch(
+        self,
+        conversations: List[Dict[str, Any]],
+        conn: sqlite3.Connection,
+        on_conflict: str = "replace",
+    ) -> List[Dict[str, Any]]:
+        """Insert a batch of normalized conversations and their messages.
+        
+        Args:
+            conversations: Normalized conversations
+            conn: Database connection (caller commits)
+            on_conflict: Conflict policy (see :meth:`save_conversations_bulk`)
+            
+        Returns:
+            The conversations actually written
+        """
+        # Later copies of the same conversation win within a batch too
+        conversations = list({c["id"]: c for c in conversations}.values())
+        ids = [c["id"] for c in conversations]
+        placeholders = ", ".join("?" for _ in ids)
+        stored = dict(
+            conn.execute(
+                f"SELECT id, updated_ts FROM conversations WHERE id IN ({placeholders})", ids
+            ).fetchall()
+        )
+        if on_conflict == "skip":
+            conversations = [c for c in conversations if c["id"] not in stored]
+        elif on_conflict == "newer":
+            conversations = [
+                c for c in conversations
+                if c["id"] not in stored
+                or _is_newer(to_epoch_ms(c["updated_at"]), stored[c["id"]])
+            ]
+        if not conversations:
+            return []
+        existing = [c["id"] for c in conversations if c["id"] in stored]
+        self._apply_rollups(conn, existing, -1)
+        if existing:
+            # Replace, don't merge: drop the old messages and their index entries
+            placeholders = ", ".join("?" for _ in existing)
+            conn.execute(f"DELETE FROM messages WHERE conversation_id IN ({placeholders})", existing)
+            conn.execute(f"DELETE FROM messages_fts WHERE conversation_id IN ({placeholders})", existing)
+        
+        conn.executemany("""
+            INSERT OR REPLACE INTO conversations 
+            (id, bot, title, created_at, updated_at, message_count, data, created_ts, category, updated_ts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                c["id"],
+                c["bot"],
+                c.get("title", ""),
+                c["created_at"],
+                c["updated_at"],
+                c.get("message_count", 0),
+                json.dumps(c),
+                to_epoch_ms(c["created_at"]),
+                c.get("category"),
+                to_epoch_ms(c["updated_at"]),
+            )
+            for c in conversations
+        ])
+        
+        messages = [
+            (c["id"], message)
+            for c in conversations
+            for message in c.get("messages", [])
+        ]
+        conn.executemany("""
+            INSERT OR REPLACE INTO messages 
+            (id, conversation_id, role, content, timestamp, bot, data, ts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                message["id"],
+                conversation_id,
+                message["role"],
+                message["content"],
+                message["timestamp"],
+                message.get("bot"),
+                json.dumps(message),
+                to_epoch_ms(message["timestamp"]),
+            )
+            for conversation_id, message in messages
+        ])
+        conn.executemany("""
+            INSERT INTO messages_fts 
+            (message_id, content, conversation_id, bot)
+            VALUES (?, ?, ?, ?)
+        """, [
+            (message["id"], message["content"], conversation_id, message.get("bot", ""))
+            for conversation_id, message in messages
+        ])
+        self._apply_rollups(conn, [c["id"] for c in conversations], 1)
+        return conversations
+    
     def update_conversation(self, conversation: Dict[str, Any]) -> None:
         """Update existing conversation in database.
         
@@ -259,11 +688,90 @@ class Database:
         
         self.save_conversation(conversation)
     
+    def _conversation_filters(
+        self,
+        bot: Optional[str] = None,
+        days: Optional[int] = None,
+        conversation_id: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        category: Optional[str] = None,
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause shared by the conversation queries.
+        
+        Dates are compared as epoch milliseconds on the indexed
+        ``created_ts`` column.
+        
+        Args:
+            bot: Filter by bot
+            days: Filter by days (from now)
+            conversation_id: Filter by conversation ID
+            start: Created at or after this (ISO timestamp, datetime, date
+                or epoch milliseconds)
+            end: Created at or before this
+            category: Filter by category ("Uncategorized" matches none,
+                empty and "Uncategorized")
+            
+        Returns:
+            WHERE clause and its parameters
+        """
+        where = " WHERE 1=1"
+        params: List[Any] = []
+        
+        if bot:
+            where += " AND bot = ?"
+            params.append(bot)
+        
+        if days:
+            where += " AND created_ts >= ?"
+            params.append(to_epoch_ms(datetime.now(timezone.utc)) - days * DAY_MS)
+        
+        for bound, operator in ((start, ">="), (end, "<=")):
+            if bound is None:
+                continue
+            bound_ms = to_epoch_ms(bound)
+            if bound_ms is None:
+                raise ValueError(f"Invalid date: {bound}")
+            where += f" AND created_ts {operator} ?"
+            params.append(bound_ms)
+        
+        if category == "Uncategorized":
+            where += " AND (category IS NULL OR category IN ('', 'Uncategorized'))"
+        elif category:
+            where += " AND category = ?"
+            params.append(category)
+        
+        if conversation_id:
+            where += " AND id = ?"
+            params.append(conversation_id)
+        
+        return where, params
+    
+    @staticmethod
+    def _row_to_conversation(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a conversations row to conversation data."""
+        conv_data = json.loads(row["data"]) if row["data"] else {}
+        conv_data.update({
+            "id": row["id"],
+            "bot": row["bot"],
+            "title": row["title"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "message_count": row["message_count"],
+            "created_ts": row["created_ts"],
+            "updated_ts": row["updated_ts"],
+        })
+        return conv_data
+    
     def get_conversations(
         self,
         bot: Optional[str] = None,
         days: Optional[int] = None,
         limit: Optional[int] = None,
+        conversation_id: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        category: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """Get conversations from database.
         
@@ -271,46 +779,272 @@ class Database:
             bot: Filter by bot
             days: Filter by days (from now)
             limit: Limit number of results
+            conversation_id: Filter by conversation ID
+            start: Created at or after this (see :meth:`_conversation_filters`)
+            end: Created at or before this
+            category: Filter by category
             
         Returns:
             List of conversations
         """
-        query = "SELECT * FROM conversations WHERE 1=1"
-        params = []
+        where, params = self._conversation_filters(bot, days, conversation_id, start, end, category)
+        query = "SELECT * FROM conversations" + where + " ORDER BY updated_ts DESC"
         
-        if bot:
-            query += " AND bot = ?"
-            params.append(bot)
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
         
-        if days:
-            cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
-            query += " AND created_at >= ?"
-            params.append(cutoff_date)
+        with self._get_connection() as conn:
+            cursor = conn.execute(query, params)
+            return [self._row_to_conversation(row) for row in cursor.fetchall()]
+    
+    def iter_conversations(
+        self,
+        bot: Optional[str] = None,
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        conversation_id: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        category: Optional[str] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream conversations from a database cursor.
+        
+        Rows are fetched ``chunk_size`` at a time and decoded one by one, so
+        memory use does not grow with the number of conversations.
         
-        query += " ORDER BY updated_at DESC"
+        Args:
+            bot: Filter by bot
+            days: Filter by days (from now)
+            limit: Limit number of results
+            conversation_id: Filter by conversation ID
+            start: Created at or after this (see :meth:`_conversation_filters`)
+            end: Created at or before this
+            category: Filter by category
+            chunk_size: Rows fetched per cursor round trip
+            
+        Yields:
+            Conversations, most recently updated first
+        """
+        where, params = self._conversation_filters(bot, days, conversation_id, start, end, category)
+        query = "SELECT * FROM conversations" + where + " ORDER BY updated_ts DESC"
         
         if limit:
             query += " LIMIT ?"
             params.append(limit)
         
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_conversation(row)
+        finally:
+            conn.close()
+    
+    def count_conversations(
+        self,
+        bot: Optional[str] = None,
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        conversation_id: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        category: Optional[str] = None,
+    ) -> int:
+        """Count conversations matching the given filters.
+        
+        Args:
+            bot: Filter by bot
+            days: Filter by days (from now)
+            limit: Upper bound on the count
+            conversation_id: Filter by conversation ID
+            start: Created at or after this (see :meth:`_conversation_filters`)
+            end: Created at or before this
+            category: Filter by category
+            
+        Returns:
+            Number of matching conversations
+        """
+        where, params = self._conversation_filters(bot, days, conversation_id, start, end, category)
+        
+        with self._get_connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM conversations" + where, params).fetchone()[0]
+        
+        return min(count, limit) if limit else count
+    
+    def get_conversations_by_date(
+        self,
+        start: Any = None,
+        end: Any = None,
+        bot: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 50,
+        after: Optional[Tuple[int, str]] = None,
+        ascending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Get one page of conversations ordered by creation time.
+        
+        The range is read from the ``created_ts`` index and pages are
+        continued with a keyset cursor, so every page costs the same no
+        matter how far back the range or how deep the page is.
+        Conversations without a parseable creation time are not returned.
+        
+        Args:
+            start: Created at or after this (see :meth:`_conversation_filters`)
+            end: Created at or before this
+            bot: Filter by bot
+            category: Filter by category
+            limit: Page size
+            after: ``(created_ts, id)`` of the last conversation of the
+                previous page
+            ascending: Oldest first instead of newest first
+            
+        Returns:
+            Conversations, each with ``created_ts``; pass the last one's
+            ``(created_ts, id)`` as ``after`` to get the next page
+        """
+        where, params = self._conversation_filters(
+            bot=bot, start=start, end=end, category=category
+        )
+        where += " AND created_ts IS NOT NULL"
+        order = "ASC" if ascending else "DESC"
+        if after is not None:
+            where += f" AND (created_ts, id) {'>' if ascending else '<'} (?, ?)"
+            params.extend(after)
+        query = (
+            "SELECT * FROM conversations" + where
+            + f" ORDER BY created_ts {order}, id {order} LIMIT ?"
+        )
+        params.append(limit)
+        
         with self._get_connection() as conn:
             cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
+            return [self._row_to_conversation(row) for row in cursor.fetchall()]
+    
+    def get_date_histogram(
+        self,
+        start: Any = None,
+        end: Any = None,
+        bucket: str = "day",
+        bot: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Count conversations per time bucket of their creation time.
+        
+        Computed from the covering ``created_ts`` index alone, without
+        reading any conversation rows. Only non-empty buckets are returned.
+        
+        Args:
+            start: Created at or after this (see :meth:`_conversation_filters`)
+            end: Created at or before this
+            bucket: hour, day, week (starting Monday), month or year (UTC)
+            bot: Filter by bot
+            category: Filter by category
             
-            conversations = []
-            for row in rows:
-                conv_data = json.loads(row["data"]) if row["data"] else {}
-                conv_data.update({
-                    "id": row["id"],
-                    "bot": row["bot"],
-                    "title": row["title"],
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                    "message_count": row["message_count"],
-                })
-                conversations.append(conv_data)
+        Returns:
+            List of ``{"start_ts", "label", "count"}`` in chronological order
+        """
+        if bucket not in _HISTOGRAM_BUCKETS:
+            raise ValueError(f"Unsupported histogram bucket: {bucket}")
+        expression, label_format = _HISTOGRAM_BUCKETS[bucket]
+        where, params = self._conversation_filters(
+            bot=bot, start=start, end=end, category=category
+        )
+        
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {expression} AS bucket_ts, COUNT(*)
+                FROM conversations INDEXED BY idx_conversations_created_ts
+                {where} AND created_ts IS NOT NULL
+                GROUP BY bucket_ts ORDER BY bucket_ts
+                """,
+                params,
+            ).fetchall()
+        
+        return [
+            {
+                "start_ts": bucket_ts,
+                "label": datetime.fromtimestamp(bucket_ts / 1000, tz=timezone.utc).strftime(label_format),
+                "count": count,
+            }
+            for bucket_ts, count in rows
+        ]
+    
+    def get_conversation_summaries(
+        self,
+        sort: str = "updated_ts",
+        descending: bool = True,
+        limit: int = 200,
+        after: Optional[Tuple[Any, str]] = None,
+        bot: Optional[str] = None,
+        days: Optional[int] = None,
+        start: Any = None,
+        end: Any = None,
+        category: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get one page of conversation summaries for list views.
+        
+        Only the columns in ``SUMMARY_COLUMNS`` are read; the JSON data is
+        neither loaded nor decoded. Pages are continued with a keyset cursor
+        on ``(sort, id)``, so scrolling deep into a large result set costs
+        the same as the first page. Missing sort values (NULL) come last
+        when descending and first when ascending.
+        
+        Args:
+            sort: Column to order by, one of ``SUMMARY_SORT_KEYS``
+            descending: Largest first
+            limit: Page size
+            after: ``(sort value, id)`` of the last summary of the previous page
+            bot: Filter by bot
+            days: Filter by days (from now)
+            start: Created at or after this (see :meth:`_conversation_filters`)
+            end: Created at or before this
+            category: Filter by category
+            conversation_id: Filter by conversation ID
             
-            return conversations
+        Returns:
+            Summaries as dicts; pass the last one's ``(summary[sort], id)``
+            as ``after`` to get the next page
+        """
+        if sort not in SUMMARY_SORT_KEYS:
+            raise ValueError(f"Unsupported sort key: {sort}")
+        where, params = self._conversation_filters(
+            bot=bot, days=days, conversation_id=conversation_id, start=start, end=end, category=category
+        )
+        
+        if after is not None:
+            value, last_id = after
+            # Row values compare to NULL as unknown, so the NULL run at the
+            # end (descending) or start (ascending) is continued separately
+            if descending and value is None:
+                where += f" AND {sort} IS NULL AND id < ?"
+                params.append(last_id)
+            elif descending:
+                where += f" AND (({sort}, id) < (?, ?) OR {sort} IS NULL)"
+                params.extend((value, last_id))
+            elif value is None:
+                where += f" AND (({sort} IS NULL AND id > ?) OR {sort} IS NOT NULL)"
+                params.append(last_id)
+            else:
+                where += f" AND ({sort}, id) > (?, ?)"
+                params.extend((value, last_id))
+        
+        order = "DESC" if descending else "ASC"
+        query = (
+            f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM conversations" + where
+            + f" ORDER BY {sort} {order}, id {order} LIMIT ?"
+        )
+        params.append(limit)
+        
+        with self._get_connection() as conn:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
     
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get a single conversation by ID.
@@ -328,20 +1062,271 @@ class Database:
             )
             row = cursor.fetchone()
             
-            if row:
-                conv_data = json.loads(row["data"]) if row["data"] else {}
-                conv_data.update({
-                    "id": row["id"],
-                    "bot": row["bot"],
-                    "title": row["title"],
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                    "message_count": row["message_count"],
-                })
-                return conv_data
+            return self._row_to_conversation(row) if row else None
+    
+    def get_messages(
+        self,
+        conversation_id: str,
+        limit: Optional[int] = None,
+        before: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get messages of a conversation, paging back from the newest.
+        
+        Messages keep the order they were saved in. Each carries ``seq``, its
+        position in that order; pass the first message's ``seq`` as
+        ``before`` to get the page preceding it. Pages are read from the
+        ``conversation_id`` index, so only the requested rows are decoded.
+        
+        Args:
+            conversation_id: Conversation ID
+            limit: Page size (all messages if None)
+            before: Only messages saved before the one with this ``seq``
             
-            return None
+        Returns:
+            The latest ``limit`` matching messages, oldest first
+        """
+        query = "SELECT rowid AS seq, * FROM messages WHERE conversation_id = ?"
+        params: List[Any] = [conversation_id]
+        if before is not None:
+            query += " AND rowid < ?"
+            params.append(before)
+        query += " ORDER BY rowid DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        with self._get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        
+        messages = []
+        for row in reversed(rows):
+            message = json.loads(row["data"]) if row["data"] else {}
+            message.update({
+                "seq": row["seq"],
+                "id": row["id"],
+                "conversation_id": row["conversation_id"],
+                "role": row["role"],
+                "content": row["content"],
+                "timestamp": row["timestamp"],
+                "bot": row["bot"],
+                "ts": row["ts"],
+            })
+            messages.append(message)
+        return messages
     
+    def count_messages(self, conversation_id: str) -> int:
+        """Count the messages stored for a conversation."""
+        with self._get_connection() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE conversation_id = ?", (conversation_id,)
+            ).fetchone()[0]
+
+    @staticmethod
+    def _categorization_filters(
+        uncategorized_only: bool, stale_for: Optional[str], labelled_only: bool = False
+    ) -> Tuple[str, List[Any]]:
+        """WHERE clause over conversations ``c`` joined with their categorization state ``s``."""
+        where = " WHERE 1=1"
+        params: List[Any] = []
+        if labelled_only:
+            # Categories set by hand or by the sync, not by categorization
+            where += """ AND c.category IS NOT NULL AND c.category NOT IN ('', 'Uncategorized')
+                AND c.category IS NOT s.category"""
+        if uncategorized_only:
+            # A category categorization assigned may be replaced; one set
+            # by hand or by the sync may not
+            where += """ AND (c.category IS NULL OR c.category IN ('', 'Uncategorized')
+                OR c.category = s.category)"""
+        if stale_for is not None:
+            where += """ AND (
+                s.conversation_id IS NULL OR s.rules_hash != ?
+                OR s.updated_ts IS NOT c.updated_ts OR s.message_count IS NOT c.message_count
+            )"""
+            params.append(stale_for)
+        return where, params
+
+    def iter_conversation_texts(
+        self,
+        conversation_ids: Optional[List[str]] = None,
+        uncategorized_only: bool = False,
+        chunk_size: int = 500,
+        stale_for: Optional[str] = None,
+        labelled_only: bool = False,
+    ) -> Iterator[List[Tuple[str, Optional[str], str]]]:
+        """Stream the text of conversations in chunks, for categorization.
+
+        A conversation's text is its title followed by its messages in the
+        order they were saved. Chunks are read by id with a fresh query
+        each, so no read transaction stays open between chunks and the
+        caller may write to the database while iterating.
+
+        Args:
+            conversation_ids: Only these conversations (all if None)
+            uncategorized_only: Only conversations without a category, or
+                with the category categorization assigned them
+            chunk_size: Conversations per chunk
+            stale_for: Only conversations not scored with this rules hash
+                since they last changed (see :meth:`count_stale_categorizations`)
+            labelled_only: Only conversations with a category that
+                categorization did not assign (training examples)
+
+        Yields:
+            Lists of (conversation ID, current category, text)
+        """
+        where, where_params = self._categorization_filters(uncategorized_only, stale_for, labelled_only)
+
+        if conversation_ids is not None:
+            ids = sorted(set(conversation_ids))
+            pages = (ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size))
+        else:
+            pages = None
+
+        last_id = None
+        while True:
+            query = """
+                SELECT c.id, c.title, c.category FROM conversations c
+                LEFT JOIN categorization_state s ON s.conversation_id = c.id
+            """ + where
+            params = list(where_params)
+            if pages is not None:
+                page = next(pages, None)
+                if page is None:
+                    break
+                query += f" AND c.id IN ({', '.join('?' for _ in page)})"
+                params.extend(page)
+            elif last_id is not None:
+                query += " AND c.id > ?"
+                params.append(last_id)
+            query += " ORDER BY c.id LIMIT ?"
+            params.append(chunk_size)
+
+            with self._get_connection() as conn:
+                rows = conn.execute(query, params).fetchall()
+                if not rows:
+                    if pages is None:
+                        break
+                    continue
+                placeholders = ", ".join("?" for _ in rows)
+                contents = dict(conn.execute(f"""
+                    SELECT conversation_id, GROUP_CONCAT(content, ' ')
+                    FROM (
+                        SELECT conversation_id, content FROM messages
+                        WHERE conversation_id IN ({placeholders})
+                        ORDER BY rowid
+                    )
+                    GROUP BY conversation_id
+                """, [row["id"] for row in rows]).fetchall())
+
+            yield [
+                (
+                    row["id"],
+                    row["category"],
+                    " ".join(part for part in (row["title"], contents.get(row["id"])) if part),
+                )
+                for row in rows
+            ]
+            last_id = rows[-1]["id"]
+
+    def count_stale_categorizations(
+        self, rules_hash: Optional[str], uncategorized_only: bool = True
+    ) -> int:
+        """Count conversations that need categorizing with a rule set.
+
+        A conversation is stale if it was never scored, was scored with
+        other rules, or changed (``updated_ts`` or ``message_count``) since.
+        The count is a single query over the state table, with no text read.
+
+        Args:
+            rules_hash: Version of the rule set (None counts every
+                conversation, stale or not)
+            uncategorized_only: Leave out conversations with a category
+                that categorization did not assign
+        """
+        where, params = self._categorization_filters(uncategorized_only, rules_hash)
+        with self._get_connection() as conn:
+            return conn.execute("""
+                SELECT COUNT(*) FROM conversations c
+                LEFT JOIN categorization_state s ON s.conversation_id = c.id
+            """ + where, params).fetchone()[0]
+
+    def get_categorization_states(self, conversation_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the last categorization of conversations.
+
+        Returns:
+            State (rules_hash, content_hash, confidence, category,
+            updated_ts, message_count, scored_at) by conversation ID;
+            conversations never scored are left out
+        """
+        if not conversation_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in conversation_ids)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM categorization_state WHERE conversation_id IN ({placeholders})",
+                list(conversation_ids),
+            ).fetchall()
+        return {row["conversation_id"]: dict(row) for row in rows}
+
+    def set_conversation_categories(
+        self,
+        categories: Dict[str, Optional[str]],
+        states: Optional[List[Tuple[str, str, str, float, Optional[str]]]] = None,
+    ) -> int:
+        """Set the category of many conversations in one transaction.
+
+        The ``category`` column, the category in the conversation's JSON
+        data and the analytics rollups are updated together, along with
+        the categorization state of the scored conversations.
+
+        Args:
+            categories: Category of each conversation ID (None clears it)
+            states: (conversation ID, rules hash, content hash, confidence,
+                assigned category) of each scored conversation; the
+                conversation's current ``updated_ts`` and ``message_count``
+                are recorded with it
+
+        Returns:
+            Number of conversations updated
+        """
+        if not categories and not states:
+            return 0
+        ids = list(categories)
+        with self._get_connection() as conn:
+            self._apply_rollups(conn, ids, -1)
+            cursor = conn.executemany("""
+                UPDATE conversations
+                SET category = ?, data = json_set(COALESCE(data, '{}'), '$.category', ?)
+                WHERE id = ?
+            """, [(category, category, conversation_id) for conversation_id, category in categories.items()])
+            updated = cursor.rowcount if categories else 0
+            self._apply_rollups(conn, ids, 1)
+            if states:
+                scored_at = datetime.now().isoformat()
+                conn.executemany("""
+                    INSERT OR REPLACE INTO categorization_state
+                    (conversation_id, rules_hash, content_hash, confidence, category,
+                     updated_ts, message_count, scored_at)
+                    SELECT id, ?, ?, ?, ?, updated_ts, message_count, ?
+                    FROM conversations WHERE id = ?
+                """, [
+                    (rules_hash, content_hash, confidence, category, scored_at, conversation_id)
+                    for conversation_id, rules_hash, content_hash, confidence, category in states
+                ])
+            conn.commit()
+        return updated
+
+    def update_conversation_category(self, conversation_id: str, category: Optional[str]) -> bool:
+        """Set the category of a conversation.
+
+        Args:
+            conversation_id: Conversation ID
+            category: New category (None clears it)
+
+        Returns:
+            Whether the conversation exists
+        """
+        return self.set_conversation_categories({conversation_id: category}) > 0
+
     def search_messages(
         self,
         query: str,
@@ -392,6 +1377,7 @@ class Database:
                     "role": row["role"],
                     "content": row["content"],
                     "timestamp": row["timestamp"],
+                    "ts": row["ts"],
                     "bot": row["bot"],
                     "conversation_title": row["conversation_title"],
                     "conversation_bot": row["conversation_bot"],
@@ -429,68 +1415,137 @@ class Database:
             
             return bots
     
+    def get_rollups(
+        self,
+        start: Any = None,
+        end: Any = None,
+        group_by: Optional[str] = None,
+        bot: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> Any:
+        """Conversation totals for a date range, read from the daily rollups.
+        
+        The cost depends on the number of (day, bot, category) combinations
+        in the range, not on the number of conversations or messages.
+        
+        Args:
+            start: First day (ISO date/timestamp or datetime, inclusive, UTC)
+            end: Last day (inclusive, UTC)
+            group_by: None for one total, or day, week, month, year, bot or
+                category for one row per bucket
+            bot: Only count this bot
+            category: Only count this category ('' for uncategorized)
+            
+        Returns:
+            Dict with conversations, messages, user_messages, characters and
+            bots (distinct bots); with ``group_by``, a list of such dicts
+            ordered by bucket, each with the bucket under the ``group_by`` key
+        """
+        if group_by is not None and group_by not in ROLLUP_GROUPS:
+            raise ValueError(f"Unsupported rollup grouping: {group_by}")
+        
+        conditions = []
+        params: List[Any] = []
+        for bound, operator in ((start, ">="), (end, "<=")):
+            if bound is None:
+                continue
+            bound_ms = to_epoch_ms(bound)
+            if bound_ms is None:
+                raise ValueError(f"Invalid date: {bound}")
+            conditions.append(f"day {operator} ?")
+            params.append(bound_ms // DAY_MS)
+        if bot is not None:
+            conditions.append("bot = ?")
+            params.append(bot)
+        if category is not None:
+            conditions.append("category = ?")
+            params.append(category)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        totals = """
+            COALESCE(SUM(conversations), 0) AS conversations,
+            COALESCE(SUM(messages), 0) AS messages,
+            COALESCE(SUM(user_messages), 0) AS user_messages,
+            COALESCE(SUM(characters), 0) AS characters,
+            COUNT(DISTINCT bot) AS bots
+        """
+        with self._get_connection() as conn:
+            if group_by is None:
+                row = conn.execute(f"SELECT {totals} FROM daily_rollups{where}", params).fetchone()
+                return dict(row)
+            
+            rows = conn.execute(
+                f"""
+                SELECT {_ROLLUP_BUCKETS[group_by]} AS bucket, {totals}
+                FROM daily_rollups{where}
+                GROUP BY bucket ORDER BY bucket
+                """,
+                params,
+            ).fetchall()
+        
+        results = []
+        for row in rows:
+            result = dict(row)
+            bucket = result.pop("bucket")
+            if group_by in ("day", "week"):
+                bucket = datetime.fromtimestamp(bucket * 86400, tz=timezone.utc).strftime("%Y-%m-%d")
+            elif group_by == "category":
+                bucket = bucket or None
+            result[group_by] = bucket
+            results.append(result)
+        return results
+    
     def get_analytics(self, period: str = "month") -> Dict[str, Any]:
         """Get usage analytics.
         
+        Whole UTC days of the period are read from the daily rollups, and
+        the part of the first day after the start from the covering
+        ``created_ts`` index, so the period is exact. ``messages_sent``
+        counts user messages by their own timestamp, and the average
+        length is over conversations with messages.
+        
         Args:
             period: Analysis period (day, week, month, year)
             
         Returns:
             Analytics data
         """
-        # Calculate date range
-        now = datetime.now()
-        if period == "day":
-            start_date = now - timedelta(days=1)
-        elif period == "week":
-            start_date = now - timedelta(weeks=1)
-        elif period == "month":
-            start_date = now - timedelta(days=30)
-        elif period == "year":
-            start_date = now - timedelta(days=365)
-        else:
-            start_date = now - timedelta(days=30)  # Default to month
-        
-        start_date_str = start_date.isoformat()
+        days = PERIOD_DAYS.get(period, PERIOD_DAYS["month"])  # Default to month
+        start_date = datetime.now(timezone.utc) - timedelta(days=days)
+        start_ms = to_epoch_ms(start_date)
+        first_day = -(-start_ms // DAY_MS)  # First whole day
         
         with self._get_connection() as conn:
-            # Total conversations
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM conversations WHERE created_at >= ?",
-                (start_date_str,)
-            )
-            total_conversations = cursor.fetchone()[0]
-            
-            # Active bots
-            cursor = conn.execute(
-                "SELECT COUNT(DISTINCT bot) FROM conversations WHERE created_at >= ?",
-                (start_date_str,)
-            )
-            active_bots = cursor.fetchone()[0]
-            
-            # Messages sent (user messages)
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM messages WHERE role = 'user' AND timestamp >= ?",
-                (start_date_str,)
-            )
-            messages_sent = cursor.fetchone()[0]
-            
-            # Average conversation length
-            cursor = conn.execute("""
-                SELECT AVG(message_count) FROM conversations 
-                WHERE created_at >= ? AND message_count > 0
-            """, (start_date_str,))
-            avg_length_result = cursor.fetchone()[0]
-            avg_conversation_length = avg_length_result if avg_length_result else 0
-            
-            return {
-                "period": period,
-                "start_date": start_date_str,
-                "total_conversations": total_conversations,
-                "active_bots": active_bots,
-                "messages_sent": messages_sent,
-                "avg_conversation_length": avg_conversation_length,
-            }
+            row = conn.execute(f"""
+                WITH period AS (
+                    SELECT bot, conversations, nonempty, messages, characters
+                    FROM daily_rollups WHERE day >= ?
+                    UNION ALL
+                    SELECT c.bot, 1, c.message_count > 0, COALESCE(c.message_count, 0),
+                           (SELECT COALESCE(SUM(LENGTH(m.content)), 0) FROM messages m
+                            WHERE m.conversation_id = c.id)
+                    FROM conversations c WHERE c.created_ts >= ? AND c.created_ts < ?
+                )
+                SELECT COALESCE(SUM(conversations), 0), COUNT(DISTINCT bot),
+                       COALESCE(SUM(nonempty), 0), COALESCE(SUM(messages), 0),
+                       COALESCE(SUM(characters), 0)
+                FROM period
+            """, [first_day, start_ms, first_day * DAY_MS]).fetchone()
+            messages_sent = conn.execute(
+                "SELECT COUNT(*) FROM messages WHERE role = 'user' AND ts >= ?", [start_ms]
+            ).fetchone()[0]
+        
+        conversations, active_bots, nonempty, messages, characters = row
+        return {
+            "period": period,
+            "start_date": start_date.isoformat(),
+            "total_conversations": conversations,
+            "active_bots": active_bots,
+            "messages_sent": messages_sent,
+            "total_messages": messages,
+            "characters": characters,
+            "avg_conversation_length": messages / nonempty if nonempty else 0,
+        }
     
     def _update_bot_info(self, bot_id: str, conn: sqlite3.Connection) -> None:
         """Update bot information in database.
@@ -533,6 +1588,184 @@ class Database:
                 json.dumps({"created": now}),
             ))
     
+    def create_sync_job(
+        self,
+        conversations: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Create a sync job checkpointing the discovered conversation list.
+        
+        Args:
+            conversations: Discovered conversations with ``id`` and optional
+                ``url`` and ``title``, in sync order
+            params: Parameters the job was started with
+            
+        Returns:
+            New job ID
+        """
+        now = datetime.now().isoformat()
+        
+        with self._get_connection() as conn:
+            cursor = conn.execute("""
+                INSERT INTO sync_jobs (status, created_at, updated_at, params)
+                VALUES ('running', ?, ?, ?)
+            """, (now, now, json.dumps(params or {})))
+            job_id = cursor.lastrowid
+            
+            conn.executemany("""
+                INSERT OR IGNORE INTO sync_job_items
+                (job_id, conversation_id, position, url, title, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, [
+                (job_id, conv["id"], position, conv.get("url"), conv.get("title"), now)
+                for position, conv in enumerate(conversations)
+            ])
+            
+            conn.commit()
+            return job_id
+    
+    def get_sync_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Get a sync job with its item counts by status.
+        
+        Args:
+            job_id: Job ID
+            
+        Returns:
+            Job data or None if not found
+        """
+        with self._get_connection() as conn:
+            row = conn.execute("SELECT * FROM sync_jobs WHERE id = ?", (job_id,)).fetchone()
+            if not row:
+                return None
+            
+            job = dict(row)
+            job["params"] = json.loads(row["params"]) if row["params"] else {}
+            
+            cursor = conn.execute("""
+                SELECT status, COUNT(*) FROM sync_job_items
+                WHERE job_id = ? GROUP BY status
+            """, (job_id,))
+            job["counts"] = {status: count for status, count in cursor.fetchall()}
+            job["total"] = sum(job["counts"].values())
+            return job
+    
+    def get_resumable_sync_job(self) -> Optional[Dict[str, Any]]:
+        """Get the most recent sync job that did not run to completion.
+        
+        Jobs that finished with failed conversations count as unfinished.
+        
+        Returns:
+            Job data or None if every job has finished
+        """
+        with self._get_connection() as conn:
+            row = conn.execute("""
+                SELECT id FROM sync_jobs
+                WHERE status IN ('running', 'interrupted', 'failed')
+                ORDER BY id DESC LIMIT 1
+            """).fetchone()
+        
+        return self.get_sync_job(row["id"]) if row else None
+    
+    def get_sync_job_items(
+        self,
+        job_id: int,
+        statuses: Optional[List[str]] = None,
+        max_attempts: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the checkpointed items of a sync job in sync order.
+        
+        Args:
+            job_id: Job ID
+            statuses: Only items with one of these statuses
+            max_attempts: Only items attempted fewer times than this
+            
+        Returns:
+            List of job items
+        """
+        query = "SELECT * FROM sync_job_items WHERE job_id = ?"
+        params: List[Any] = [job_id]
+        
+        if statuses:
+            query += f" AND status IN ({', '.join('?' for _ in statuses)})"
+            params.extend(statuses)
+        
+        if max_attempts is not None:
+            query += " AND attempts < ?"
+            params.append(max_attempts)
+        
+        query += " ORDER BY position"
+        
+        with self._get_connection() as conn:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+    
+    def update_sync_job_item(
+        self,
+        job_id: int,
+        conversation_id: str,
+        status: str,
+        error: Optional[str] = None,
+        next_attempt_at: float = 0,
+    ) -> None:
+        """Record the outcome of one sync attempt.
+        
+        Args:
+            job_id: Job ID
+            conversation_id: Conversation ID
+            status: New item status ('done' or 'failed')
+            error: Error message of a failed attempt
+            next_attempt_at: Epoch seconds before which a failed item is not retried
+        """
+        now = datetime.now().isoformat()
+        
+        with self._get_connection() as conn:
+            conn.execute("""
+                UPDATE sync_job_items
+                SET status = ?, attempts = attempts + 1, last_error = ?,
+                    next_attempt_at = ?, updated_at = ?
+                WHERE job_id = ? AND conversation_id = ?
+            """, (status, error, next_attempt_at, now, job_id, conversation_id))
+            conn.execute(
+                "UPDATE sync_jobs SET updated_at = ? WHERE id = ?",
+                (now, job_id)
+            )
+            conn.commit()
+    
+    def reset_sync_job_attempts(self, job_id: int) -> None:
+        """Give failed items of a job a fresh set of retry attempts.
+        
+        Args:
+            job_id: Job ID
+        """
+        with self._get_connection() as conn:
+            conn.execute("""
+                UPDATE sync_job_items SET attempts = 0, next_attempt_at = 0
+                WHERE job_id = ? AND status = 'failed'
+            """, (job_id,))
+            conn.commit()
+    
+    def set_sync_job_status(
+        self,
+        job_id: int,
+        status: str,
+        error: Optional[str] = None,
+    ) -> None:
+        """Update the status of a sync job.
+        
+        Args:
+            job_id: Job ID
+            status: 'running', 'interrupted', 'completed' or 'failed'
+            error: Error message for a failed job
+        """
+        now = datetime.now().isoformat()
+        finished_at = now if status in ("completed", "failed") else None
+        
+        with self._get_connection() as conn:
+            conn.execute("""
+                UPDATE sync_jobs SET status = ?, error = ?, updated_at = ?, finished_at = ?
+                WHERE id = ?
+            """, (status, error, now, finished_at, job_id))
+            conn.commit()
+    
     def get_conversation_count(self) -> int:
         """Get total number of conversations in database.
         
@@ -542,7 +1775,27 @@ class Database:
         with self._get_connection() as conn:
             cursor = conn.execute("SELECT COUNT(*) FROM conversations")
             return cursor.fetchone()[0]
-    
+
+    def warm_up(self) -> Dict[str, int]:
+        """Read the pages the first screens need, e.g. on a thread at startup.
+
+        Opening the database already created or migrated the schema; this
+        walks the conversation indexes and the rollups once, so they are in
+        the OS cache before the first query of the GUI.
+
+        Returns:
+            Dict with conversations, messages and bots
+        """
+        with self._get_connection() as conn:
+            conversations, bots = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT bot) FROM conversations"
+            ).fetchone()
+            conn.execute("SELECT MAX(updated_ts) FROM conversations").fetchone()
+            messages = conn.execute(
+                "SELECT COALESCE(SUM(messages), 0) FROM daily_rollups"
+            ).fetchone()[0]
+        return {"conversations": conversations, "messages": messages, "bots": bots}
+
     def populate_sample_data(self) -> None:
         """Populate database with sample conversations for testing."""
         sample_conversations = [
@@ -0,0 +1,13 @@
+"""Sync module initialization."""
+
+from poe_search.sync.daemon import SyncDaemon, SyncLock, SyncLockError, query_daemon
+from poe_search.sync.jobs import RetryPolicy, SyncJobRunner
+
+__all__ = [
+    "RetryPolicy",
+    "SyncDaemon",
+    "SyncJobRunner",
+    "SyncLock",
+    "SyncLockError",
+    "query_daemon",
+]
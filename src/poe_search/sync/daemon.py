@@ -0,0 +1,399 @@
+"""Headless background sync daemon.
+
+:class:`SyncDaemon` runs periodic incremental syncs without the GUI:
+
+* the scheduler loop runs a sync every ``interval`` seconds and on demand;
+  triggers that arrive while a sync is queued or running are coalesced into
+  a single follow-up run instead of piling up,
+* an exclusive :class:`SyncLock` on the database file keeps a second daemon
+  or a manual ``poe-search sync`` from writing the same SQLite DB,
+* a local Unix-socket endpoint answers ``status``, ``sync`` and ``stop``
+  commands with one JSON line (see :func:`query_daemon`).
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = Path.home() / ".poe-search" / "daemon.sock"
+
+
+class SyncLockError(RuntimeError):
+    """Raised when another process holds the sync lock."""
+
+
+class SyncLock:
+    """Exclusive, non-blocking lock on a database file.
+
+    The lock is an ``flock`` on ``<database>.lock`` and is released
+    automatically by the OS if the holding process dies.
+    """
+
+    def __init__(self, database_path: Union[str, Path]):
+        """Initialize the lock.
+
+        Args:
+            database_path: SQLite database file the lock protects
+        """
+        self.path = Path(f"{database_path}.lock")
+        self._file = None
+
+    def acquire(self) -> None:
+        """Acquire the lock.
+
+        Raises:
+            SyncLockError: If another process holds the lock
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a+")
+        if FCNTL_AVAILABLE:
+            try:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                self._file.seek(0)
+                holder = self._file.read().strip() or "unknown"
+                self._file.close()
+                self._file = None
+                raise SyncLockError(
+                    f"Database is locked by another sync process (pid {holder}): {self.path}"
+                )
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.write(str(os.getpid()))
+        self._file.flush()
+
+    def release(self) -> None:
+        """Release the lock."""
+        if self._file is None:
+            return
+        if FCNTL_AVAILABLE:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+    @property
+    def locked(self) -> bool:
+        """Whether this instance holds the lock."""
+        return self._file is not None
+
+    def __enter__(self):
+        if not self.locked:
+            self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class _StatusHandler(socketserver.StreamRequestHandler):
+    """Answers one JSON line per command line."""
+
+    def handle(self):
+        for line in self.rfile:
+            command = line.decode("utf-8", errors="replace").strip()
+            if not command:
+                continue
+            response = self.server.daemon_ref.handle_command(command)
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class _StatusServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class SyncDaemon:
+    """Schedules background syncs and reports their progress."""
+
+    def __init__(
+        self,
+        client: Any,
+        interval: float = 3600,
+        days: int = 7,
+        limit: int = 100,
+        run_on_start: bool = True,
+        socket_path: Optional[Union[str, Path]] = None,
+        lock: Optional[SyncLock] = None,
+        max_failed_resumes: int = 3,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            client: PoeSearchClient used for syncing
+            interval: Seconds between scheduled syncs
+            days: Number of days each sync covers
+            limit: Maximum number of conversations per sync
+            run_on_start: Sync immediately instead of after the first interval
+            socket_path: Unix socket for the status endpoint, or None to disable
+            lock: Database lock (defaults to one on the client's database)
+            max_failed_resumes: Scheduled runs that retry a job which finished
+                with failed conversations, before it is left to a manual resume
+        """
+        self.client = client
+        self.interval = interval
+        self.days = days
+        self.limit = limit
+        self.run_on_start = run_on_start
+        self.socket_path = Path(socket_path) if socket_path else None
+        self.lock = lock or SyncLock(client.database.db_path)
+        self.max_failed_resumes = max_failed_resumes
+        # Scheduled retries of failed jobs, by job ID
+        self._failed_resumes: Dict[int, int] = {}
+
+        self._trigger = threading.Event()
+        self._stop = threading.Event()
+        self._state_lock = threading.Lock()
+        self._server: Optional[_StatusServer] = None
+        self._server_thread: Optional[threading.Thread] = None
+
+        self.status: Dict[str, Any] = {
+            "pid": os.getpid(),
+            "state": "starting",
+            "started_at": None,
+            "interval": interval,
+            "next_run_at": None,
+            "runs": 0,
+            "failed_runs": 0,
+            "triggers": 0,
+            "coalesced_triggers": 0,
+            "conversations_synced": 0,
+            "sync_seconds": 0.0,
+            "progress": None,
+            "current": None,
+            "last_run": None,
+        }
+
+    # -- control -----------------------------------------------------------
+
+    def trigger(self, reason: str = "manual") -> bool:
+        """Request a sync as soon as possible.
+
+        Returns:
+            False if the request was coalesced into an already queued sync
+        """
+        with self._state_lock:
+            self.status["triggers"] += 1
+            if self._trigger.is_set():
+                self.status["coalesced_triggers"] += 1
+                logger.debug(f"Sync trigger ({reason}) coalesced")
+                return False
+            self._trigger.set()
+        logger.info(f"Sync triggered ({reason})")
+        return True
+
+    def stop(self) -> None:
+        """Stop the daemon after the current conversation."""
+        self._stop.set()
+        self._trigger.set()
+
+    def handle_command(self, command: str) -> Dict[str, Any]:
+        """Execute a status endpoint command.
+
+        Args:
+            command: ``status``, ``sync`` or ``stop``
+
+        Returns:
+            JSON-serializable response
+        """
+        if command == "status":
+            return {"ok": True, "status": self.get_status()}
+        if command == "sync":
+            return {"ok": True, "queued": self.trigger("socket")}
+        if command == "stop":
+            self.stop()
+            return {"ok": True}
+        return {"ok": False, "error": f"unknown command: {command}"}
+
+    def get_status(self) -> Dict[str, Any]:
+        """Snapshot of the daemon status with throughput metrics."""
+        with self._state_lock:
+            status = json.loads(json.dumps(self.status, default=str))
+        if status["sync_seconds"]:
+            status["throughput"] = round(
+                status["conversations_synced"] / status["sync_seconds"], 3
+            )
+        current = status["current"]
+        if current and current["elapsed"]:
+            current["throughput"] = round(current["synced"] / current["elapsed"], 3)
+        return status
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def run(self) -> None:
+        """Run the scheduler until :meth:`stop` is called.
+
+        Raises:
+            SyncLockError: If another process is syncing the same database
+        """
+        self.lock.acquire()
+        try:
+            self._start_server()
+            self._set(state="idle", started_at=time.time())
+            if self.run_on_start:
+                self.trigger("startup")
+            logger.info(f"Sync daemon started (interval {self.interval}s)")
+
+            while not self._stop.is_set():
+                next_run = time.time() + self.interval
+                self._set(next_run_at=None if self._trigger.is_set() else next_run)
+                self._trigger.wait(timeout=max(next_run - time.time(), 0))
+                if self._stop.is_set():
+                    break
+                # Everything triggered up to this point is served by this run
+                self._trigger.clear()
+                self._run_sync()
+        finally:
+            self._set(state="stopped")
+            self._stop_server()
+            self.lock.release()
+            logger.info("Sync daemon stopped")
+
+    def _run_sync(self) -> None:
+        started = time.time()
+        current = {"started_at": started, "elapsed": 0.0, "synced": 0, "job_id": None}
+        self._set(state="syncing", current=current, progress=None)
+
+        def on_progress(message: str, percent: int):
+            self._set(progress={"message": message, "percent": percent})
+
+        def on_synced(conversation: Dict[str, Any]):
+            with self._state_lock:
+                current["synced"] += 1
+                current["elapsed"] = time.time() - started
+
+        options = {
+            "progress_callback": on_progress,
+            "on_synced": on_synced,
+            "should_stop": self._stop.is_set,
+        }
+        stats = None
+        resumed = None
+        error = None
+        try:
+            # Finish an unfinished job first, then look for new conversations
+            job = self._job_to_resume()
+            if job is not None:
+                resumed = self.client.resume_sync(job_id=job["id"], **options)
+            if not self._stop.is_set():
+                stats = self.client.sync(days=self.days, limit=self.limit, **options)
+        except Exception as e:
+            logger.error(f"Scheduled sync failed: {e}")
+            error = str(e)
+
+        duration = time.time() - started
+        with self._state_lock:
+            self.status["runs"] += 1
+            if error or any(run and run["status"] == "failed" for run in (stats, resumed)):
+                self.status["failed_runs"] += 1
+            self.status["conversations_synced"] += current["synced"]
+            self.status["sync_seconds"] += duration
+            self.status["last_run"] = {
+                "started_at": started,
+                "finished_at": time.time(),
+                "duration": round(duration, 3),
+                "stats": stats,
+                "resumed": resumed,
+                "error": error,
+                "throughput": round(current["synced"] / duration, 3) if duration else 0.0,
+            }
+            self.status["current"] = None
+            self.status["state"] = "idle"
+
+    def _job_to_resume(self) -> Optional[Dict[str, Any]]:
+        """The unfinished job a scheduled run should resume, if any.
+
+        Interrupted jobs are always resumed. A job that finished with failed
+        conversations is retried by at most ``max_failed_resumes`` runs, so a
+        conversation that always fails does not hold up later syncs.
+        """
+        job = self.client.database.get_resumable_sync_job()
+        if job is None:
+            return None
+        if job["status"] == "failed":
+            attempts = self._failed_resumes.get(job["id"], 0)
+            if attempts >= self.max_failed_resumes:
+                return None
+            self._failed_resumes[job["id"]] = attempts + 1
+        return job
+
+    def _set(self, **values: Any) -> None:
+        with self._state_lock:
+            self.status.update(values)
+
+    def _start_server(self) -> None:
+        if self.socket_path is None:
+            return
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            try:
+                query_daemon("status", self.socket_path, timeout=1.0)
+            except OSError:
+                # Stale socket left behind by a daemon that died
+                self.socket_path.unlink()
+            else:
+                raise SyncLockError(f"Another daemon is listening on {self.socket_path}")
+        self._server = _StatusServer(str(self.socket_path), _StatusHandler)
+        self._server.daemon_ref = self
+        os.chmod(self.socket_path, 0o600)
+        self._server_thread = threading.Thread(
+            target=self._server.serve_forever, name="poe-search-status", daemon=True
+        )
+        self._server_thread.start()
+        logger.info(f"Status endpoint listening on {self.socket_path}")
+
+    def _stop_server(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def query_daemon(
+    command: str = "status",
+    socket_path: Optional[Union[str, Path]] = None,
+    timeout: float = 5.0,
+) -> Dict[str, Any]:
+    """Send a command to a running daemon's status endpoint.
+
+    Args:
+        command: ``status``, ``sync`` or ``stop``
+        socket_path: Daemon socket (defaults to ``~/.poe-search/daemon.sock``)
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        OSError: If no daemon is listening
+    """
+    path = str(socket_path or DEFAULT_SOCKET_PATH)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(f"{command}\n".encode("utf-8"))
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return json.loads(data.decode("utf-8"))
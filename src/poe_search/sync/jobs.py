@@ -0,0 +1,240 @@
+"""Resumable, checkpointed conversation sync jobs.
+
+A sync job persists the list of discovered conversations before fetching
+any of them, then records the outcome of every fetch. If the process dies
+midway (driver crash, network drop), :meth:`SyncJobRunner.resume` picks the
+job up from its checkpoint: finished conversations are skipped and failed
+ones are retried with exponential backoff.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from poe_search.storage.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Item states that still need work
+OPEN_STATUSES = ["pending", "failed"]
+
+
+@dataclass
+class RetryPolicy:
+    """Retry limits and backoff for failed conversation fetches."""
+    max_attempts: int = 3
+    base_delay: float = 5.0  # seconds
+    max_delay: float = 300.0  # seconds
+
+    def delay(self, attempts: int) -> float:
+        """Backoff before the next attempt after ``attempts`` failures."""
+        return min(self.base_delay * (2 ** max(attempts - 1, 0)), self.max_delay)
+
+    @classmethod
+    def from_settings(cls, sync_settings: Any) -> "RetryPolicy":
+        """Create a policy from a :class:`~poe_search.utils.config.SyncSettings`."""
+        if not getattr(sync_settings, "retry_failed_syncs", True):
+            return cls(max_attempts=1)
+        return cls(
+            max_attempts=getattr(sync_settings, "max_retry_attempts", cls.max_attempts),
+            base_delay=getattr(sync_settings, "retry_backoff_seconds", cls.base_delay),
+        )
+
+
+class SyncJobRunner:
+    """Runs sync jobs checkpointed in the database."""
+
+    def __init__(
+        self,
+        database: Database,
+        fetch: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+        retry_policy: Optional[RetryPolicy] = None,
+        progress_callback: Optional[Callable[[str, int], None]] = None,
+        on_synced: Optional[Callable[[Dict[str, Any]], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the runner.
+
+        Args:
+            database: Database holding conversations and sync jobs
+            fetch: Fetches one job item (``conversation_id``, ``url``,
+                ``title``) and returns the conversation in database format
+            retry_policy: Retry limits and backoff
+            progress_callback: Called with a status message and percentage
+            on_synced: Called with each stored conversation
+            should_stop: Polled between items; a true value interrupts the job
+            sleep: Sleep function (for tests)
+            clock: Epoch-seconds clock (for tests)
+        """
+        self.database = database
+        self.fetch = fetch
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.progress_callback = progress_callback
+        self.on_synced = on_synced
+        self.should_stop = should_stop or (lambda: False)
+        self.sleep = sleep
+        self.clock = clock
+
+    def start(
+        self,
+        conversations: Iterable[Union[str, Dict[str, Any]]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Checkpoint a discovered conversation list and sync it.
+
+        Args:
+            conversations: Conversation IDs, or dicts with ``id`` and
+                optional ``url`` and ``title``
+            params: Parameters to record with the job
+
+        Returns:
+            Sync statistics
+        """
+        items: List[Dict[str, Any]] = []
+        seen = set()
+        for conv in conversations:
+            conv = {"id": conv} if isinstance(conv, str) else conv
+            if conv.get("id") and conv["id"] not in seen:
+                seen.add(conv["id"])
+                items.append(conv)
+
+        job_id = self.database.create_sync_job(items, params)
+        logger.info(f"Created sync job {job_id} with {len(items)} conversations")
+        return self.run(job_id)
+
+    def resume(self, job_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Resume an unfinished sync job from its checkpoint.
+
+        Conversations that were already stored are skipped; failed ones get
+        a fresh set of retry attempts.
+
+        Args:
+            job_id: Job to resume, or None for the most recent unfinished job
+
+        Returns:
+            Sync statistics, or None if there is nothing to resume
+        """
+        if job_id is None:
+            job = self.database.get_resumable_sync_job()
+        else:
+            job = self.database.get_sync_job(job_id)
+
+        if not job:
+            logger.info("No sync job to resume")
+            return None
+
+        logger.info(f"Resuming sync job {job['id']} ({job['counts']})")
+        self.database.reset_sync_job_attempts(job["id"])
+        return self.run(job["id"])
+
+    def run(self, job_id: int) -> Dict[str, Any]:
+        """Sync the open items of a job until all are done or out of retries.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Sync statistics
+        """
+        job = self.database.get_sync_job(job_id)
+        stats = {
+            "job_id": job_id,
+            "new": 0,
+            "updated": 0,
+            "failed": 0,
+            "skipped": job["counts"].get("done", 0),
+            "total": job["total"],
+            "status": "running",
+        }
+        self.database.set_sync_job_status(job_id, "running")
+
+        try:
+            while True:
+                items = self.database.get_sync_job_items(
+                    job_id, OPEN_STATUSES, self.retry_policy.max_attempts
+                )
+                if not items:
+                    break
+
+                now = self.clock()
+                due = [item for item in items if item["next_attempt_at"] <= now]
+                if not due:
+                    wait = min(item["next_attempt_at"] for item in items) - now
+                    logger.info(f"Waiting {wait:.1f}s before retrying {len(items)} conversations")
+                    if not self._wait(wait):
+                        break
+                    continue
+
+                for item in due:
+                    if self.should_stop():
+                        break
+                    self._sync_item(job_id, item, stats)
+
+                if self.should_stop():
+                    break
+        except BaseException as e:
+            # Leave the checkpoint resumable on crashes and Ctrl+C
+            self.database.set_sync_job_status(job_id, "interrupted", str(e))
+            raise
+
+        counts = self.database.get_sync_job(job_id)["counts"]
+        stats["failed"] = counts.get("failed", 0)
+
+        if self.should_stop():
+            stats["status"] = "interrupted"
+        elif counts.get("pending", 0) or stats["failed"]:
+            stats["status"] = "failed"
+        else:
+            stats["status"] = "completed"
+
+        self.database.set_sync_job_status(job_id, stats["status"])
+        self._progress(f"Sync {stats['status']}", 100)
+        logger.info(f"Sync job {job_id} {stats['status']}: {stats}")
+        return stats
+
+    def _sync_item(self, job_id: int, item: Dict[str, Any], stats: Dict[str, Any]) -> None:
+        conversation_id = item["conversation_id"]
+        done = stats["skipped"] + stats["new"] + stats["updated"]
+        self._progress(
+            f"Syncing conversation {done + 1}/{stats['total']}",
+            int(done / max(stats["total"], 1) * 100),
+        )
+
+        try:
+            conversation = self.fetch(item)
+            if not conversation:
+                raise ValueError("no conversation data returned")
+            existed = self.database.conversation_exists(conversation["id"])
+            self.database.save_conversation(conversation)
+        except Exception as e:
+            attempts = item["attempts"] + 1
+            delay = self.retry_policy.delay(attempts)
+            logger.warning(
+                f"Failed to sync conversation {conversation_id} "
+                f"(attempt {attempts}/{self.retry_policy.max_attempts}): {e}"
+            )
+            self.database.update_sync_job_item(
+                job_id, conversation_id, "failed", str(e), self.clock() + delay
+            )
+            return
+
+        self.database.update_sync_job_item(job_id, conversation_id, "done")
+        stats["updated" if existed else "new"] += 1
+        if self.on_synced:
+            self.on_synced(conversation)
+
+    def _wait(self, seconds: float) -> bool:
+        """Sleep in short slices so a stop request is honored promptly."""
+        deadline = self.clock() + seconds
+        while self.clock() < deadline:
+            if self.should_stop():
+                return False
+            self.sleep(min(1.0, deadline - self.clock()))
+        return True
+
+    def _progress(self, message: str, percent: int) -> None:
+        if self.progress_callback:
+            self.progress_callback(message, percent)
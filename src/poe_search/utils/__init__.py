@@ -1,6 +1,5 @@
 """Utilities module initialization."""
 
-from poe_search.utils.config import load_config, save_config
 from poe_search.utils.helpers import (
     clean_text,
     extract_keywords,
@@ -26,3 +25,12 @@ __all__ = [
     "parse_size",
     "format_size",
 ]
+
+
+def __getattr__(name):
+    # Resolved lazily so that the plain helpers can be imported without the
+    # configuration layer's keyring and dotenv dependencies.
+    if name in ("load_config", "save_config"):
+        from poe_search.utils import config
+        return getattr(config, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -51,6 +51,7 @@ class SyncSettings:
     sync_batch_size: int = 100
     retry_failed_syncs: bool = True
     max_retry_attempts: int = 3
+    retry_backoff_seconds: float = 5.0
 
 
 @dataclass
@@ -61,6 +62,8 @@ class ExportSettings:
     include_metadata: bool = True
     include_messages: bool = True
     compress_exports: bool = False
+    compression_format: str = "gzip"  # gzip, zstd or xz
+    max_export_part_mb: int = 0  # 0 = single file
     export_filename_template: str = "poe_conversations_{date}_{time}"
 
 
@@ -0,0 +1,102 @@
+"""Canonical timestamp parsing.
+
+Conversations arrive with timestamps in several shapes: ISO 8601 with a
+``Z`` suffix or an offset, naive ISO strings, ``YYYY-MM-DD HH:MM:SS``, and
+epoch seconds or milliseconds. :func:`to_epoch_ms` turns all of them into
+integer epoch milliseconds. The database stores the result next to the
+original text (``created_ts``, ``updated_ts``, messages ``ts``) so that
+filtering and sorting compare integers, and display code formats those
+integers with :func:`format_epoch_ms` instead of re-parsing strings.
+"""
+
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional
+
+# Numbers above this are taken as milliseconds, below as seconds
+# (1e11 seconds is in the year 5138; 1e11 milliseconds is in 1973)
+_MS_THRESHOLD = 10 ** 11
+
+_FALLBACK_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y/%m/%d %H:%M:%S", "%Y/%m/%d")
+
+
+def _datetime_ms(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+
+def _number_ms(value: float) -> int:
+    return int(value if abs(value) >= _MS_THRESHOLD else value * 1000)
+
+
+@lru_cache(maxsize=65536)
+def _parse_ms(text: str) -> Optional[int]:
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return _datetime_ms(datetime.fromisoformat(text.replace("Z", "+00:00")))
+    except ValueError:
+        pass
+    for format in _FALLBACK_FORMATS:
+        try:
+            return _datetime_ms(datetime.strptime(text, format))
+        except ValueError:
+            continue
+    try:
+        return _number_ms(float(text))
+    except ValueError:
+        return None
+
+
+def to_epoch_ms(value: Any) -> Optional[int]:
+    """Convert a timestamp to epoch milliseconds.
+
+    Naive timestamps are taken as UTC, so the UTC day of the result is the
+    calendar day written in the text. Parsed strings are cached, since the
+    same timestamps are converted again on every refresh.
+
+    Args:
+        value: ISO timestamp (a trailing ``Z`` is accepted), datetime, date,
+            or epoch seconds/milliseconds
+
+    Returns:
+        Milliseconds since the epoch, or None if the value cannot be parsed
+    """
+    if isinstance(value, str):
+        return _parse_ms(value)
+    if isinstance(value, datetime):
+        return _datetime_ms(value)
+    if isinstance(value, date):
+        return _datetime_ms(datetime(value.year, value.month, value.day))
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _number_ms(value)
+    return None
+
+
+def from_epoch_ms(value: Optional[int]) -> Optional[datetime]:
+    """Convert epoch milliseconds to an aware UTC datetime (None passes through)."""
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+
+
+def format_epoch_ms(
+    value: Optional[int],
+    format_str: str = "%Y-%m-%d %H:%M",
+    default: str = "Unknown",
+) -> str:
+    """Format epoch milliseconds for display.
+
+    Args:
+        value: Milliseconds since the epoch, or None
+        format_str: strftime format
+        default: Text for a missing timestamp
+
+    Returns:
+        Formatted UTC timestamp
+    """
+    if value is None:
+        return default
+    return from_epoch_ms(value).strftime(format_str)
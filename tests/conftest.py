@@ -2,13 +2,71 @@
 
 import pytest
 import tempfile
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Optional, Union
 from unittest.mock import Mock
 
 from poe_search.storage.database import Database
 from poe_search.api.client import PoeAPIClient
 
 
+def make_conversation(
+    index: Union[int, str],
+    created_at: Any = "2024-01-01T10:00:00",
+    updated_at: Any = None,
+    bot: str = "Claude",
+    title: Optional[str] = None,
+    messages: Any = 0,
+    width: int = 0,
+    **fields: Any,
+) -> dict:
+    """Build a conversation in database format.
+    
+    Args:
+        index: Conversation number; the ID is ``conv_<index>`` zero padded
+            to ``width`` digits (a string is used as the ID as is)
+        created_at: Creation time, ISO string or datetime
+        updated_at: Last update (``created_at`` if None)
+        bot: Bot name
+        title: Title ("Conversation <index>" if None)
+        messages: Number of alternating user/bot messages, or a list of
+            ``(role, content)`` pairs or message dicts; message IDs,
+            timestamps and the bot of bot messages are filled in
+        **fields: Further fields (category, url, message_count, ...),
+            overriding the defaults
+    """
+    conversation_id = index if isinstance(index, str) else f"conv_{index:0{width}d}"
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    if isinstance(updated_at, datetime):
+        updated_at = updated_at.isoformat()
+    if isinstance(messages, int):
+        messages = [("user" if m % 2 == 0 else "bot", f"Message {m}") for m in range(messages)]
+    
+    filled = []
+    for position, message in enumerate(messages):
+        if isinstance(message, tuple):
+            role, content = message
+            message = {"role": role, "content": content}
+        defaults = {"id": f"{conversation_id}_{position}", "timestamp": created_at}
+        if message.get("role") == "bot":
+            defaults["bot"] = bot
+        filled.append({**defaults, **message})
+    
+    conversation = {
+        "id": conversation_id,
+        "bot": bot,
+        "title": f"Conversation {index}" if title is None else title,
+        "created_at": created_at,
+        "updated_at": updated_at or created_at,
+        "message_count": len(filled),
+        "messages": filled,
+    }
+    conversation.update(fields)
+    return conversation
+
+
 @pytest.fixture
 def temp_db():
     """Create a temporary database for testing."""
@@ -0,0 +1,135 @@
+"""Tests for loading widget data off the UI thread."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from PyQt6.QtCore import QEventLoop, QTimer
+
+from poe_search.gui.workers.data_loader import DataLoader, shared_loader
+from poe_search.gui.widgets.search_widget import SearchWidget
+from tests.conftest import make_conversation
+
+BASE = datetime.now(timezone.utc)
+
+
+def recent_conversation(index):
+    return make_conversation(
+        index, BASE - timedelta(minutes=index), bot="GPT-4" if index % 3 == 0 else "Claude", width=6
+    )
+
+
+def wait_for(signal, timeout=10000):
+    """Run the event loop until a signal is emitted; return its arguments."""
+    loop = QEventLoop()
+    received = []
+
+    def on_signal(*args):
+        received.append(args)
+        loop.quit()
+
+    signal.connect(on_signal)
+    QTimer.singleShot(timeout, loop.quit)
+    loop.exec()
+    signal.disconnect(on_signal)
+    assert received, "signal was not emitted"
+    return received[0]
+
+
+class TestDataLoader:
+    """Test result delivery and cancellation."""
+
+    def test_result_delivered_on_ui_thread(self, qapp, temp_db):
+        temp_db.save_conversations_bulk([recent_conversation(i) for i in range(5)])
+        loader = DataLoader(temp_db)
+        threads, results = [], []
+
+        def count(db):
+            threads.append(threading.current_thread())
+            return db.count_conversations()
+
+        loader.submit(count, on_result=results.append)
+        loader.wait_for_done()
+        qapp.processEvents()
+
+        assert results == [5]
+        assert threads[0] is not threading.main_thread()
+        assert loader.pending_count() == 0
+
+    def test_error_delivered(self, qapp, temp_db):
+        loader = DataLoader(temp_db)
+        errors = []
+
+        def fail(db):
+            raise RuntimeError("boom")
+
+        loader.submit(fail, on_error=errors.append)
+        loader.wait_for_done()
+        qapp.processEvents()
+
+        assert errors == ["boom"]
+
+    def test_same_key_cancels_previous(self, qapp, temp_db):
+        loader = DataLoader(temp_db, max_threads=1)
+        started, results = threading.Event(), []
+
+        def slow(db):
+            started.set()
+            time.sleep(0.1)
+            return "first"
+
+        first = loader.submit(slow, on_result=results.append, key="page")
+        started.wait(5)
+        second = loader.submit(lambda db: "second", on_result=results.append, key="page")
+        loader.wait_for_done()
+        qapp.processEvents()
+
+        assert first.cancelled and not second.cancelled
+        assert results == ["second"]
+
+    def test_cancelled_result_dropped(self, qapp, temp_db):
+        loader = DataLoader(temp_db)
+        results = []
+
+        token = loader.submit(lambda db: "result", on_result=results.append)
+        token.cancel()
+        loader.wait_for_done()
+        qapp.processEvents()
+
+        assert token.cancelled
+        assert results == []
+
+    def test_cancel_all(self, qapp, temp_db):
+        loader = DataLoader(temp_db)
+        tokens = [loader.submit(lambda db: None, key=f"job{i}") for i in range(3)]
+        loader.cancel_all()
+        loader.wait_for_done()
+        qapp.processEvents()
+
+        assert all(token.cancelled for token in tokens)
+        assert loader.pending_count() == 0
+
+    def test_shared_per_database(self, temp_db):
+        assert shared_loader(temp_db) is shared_loader(temp_db)
+
+
+class TestStartup:
+    """Benchmark attaching a large archive to the search widget."""
+
+    def test_set_database_does_not_block(self, qapp, temp_db):
+        temp_db.save_conversations_bulk([recent_conversation(i) for i in range(20000)])
+        widget = SearchWidget()
+
+        start = time.perf_counter()
+        widget.set_database(temp_db)
+        ui_time = time.perf_counter() - start
+
+        (total,) = wait_for(widget.results_model.total_changed)
+        total_time = time.perf_counter() - start
+        print(f"\nset_database: {ui_time * 1000:.1f} ms on the UI thread, "
+              f"{total_time * 1000:.1f} ms until the first page")
+
+        assert total == 20000
+        assert widget.results_model.rowCount() == widget.results_model.page_size
+        # No query ran on the UI thread
+        assert ui_time < 0.1
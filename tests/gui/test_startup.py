@@ -0,0 +1,76 @@
+"""Tests for deferred tab construction and first-paint timing."""
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QLabel, QMainWindow, QTabWidget
+
+from poe_search.gui.startup import FIRST_PAINT, INTERACTIVE, DeferredTabs, StartupTimeline
+
+
+def run_until(condition, timeout=5000):
+    """Run the event loop until a condition holds."""
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.timeout.connect(lambda: condition() and loop.quit())
+    timer.start(10)
+    QTimer.singleShot(timeout, loop.quit)
+    loop.exec()
+    timer.stop()
+    assert condition(), "condition not reached"
+
+
+class TestDeferredTabs:
+    """Test that tab content is built on first use."""
+
+    def make_tabs(self, built):
+        tab_widget = QTabWidget()
+        tabs = DeferredTabs(tab_widget)
+
+        def factory(name):
+            def build():
+                built.append(name)
+                return QLabel(name)
+            return build
+
+        for name in ("Search", "Analytics", "Settings"):
+            tabs.add(factory(name), name)
+        return tab_widget, tabs
+
+    def test_current_tab_is_built_at_once(self, qapp):
+        built = []
+        tab_widget, tabs = self.make_tabs(built)
+        assert built == ["Search"]
+        assert tabs.pending == 2
+        assert tab_widget.widget(0).findChild(QLabel).text() == "Search"
+
+    def test_tab_is_built_when_shown(self, qapp):
+        built = []
+        tab_widget, tabs = self.make_tabs(built)
+        tab_widget.setCurrentIndex(2)
+        tab_widget.setCurrentIndex(0)
+        tab_widget.setCurrentIndex(2)
+        assert built == ["Search", "Settings"]
+        assert not tabs.build(2)
+
+    def test_build_when_idle(self, qapp):
+        built = []
+        done = []
+        tab_widget, tabs = self.make_tabs(built)
+        tabs.build_when_idle(on_done=lambda: done.append(True))
+        assert built == ["Search"]  # Nothing is built before the event loop runs
+
+        run_until(lambda: done)
+        assert built == ["Search", "Analytics", "Settings"]
+        assert tabs.pending == 0
+
+
+def test_watch_marks_first_paint_and_interactive(qapp):
+    timeline = StartupTimeline()
+    interactive = []
+    window = QMainWindow()
+    timeline.watch(window, on_interactive=lambda: interactive.append(True))
+    window.show()
+
+    run_until(lambda: interactive)
+    assert timeline.time_to_first_paint <= timeline.time_to_interactive
+    assert list(timeline.marks) == [FIRST_PAINT, INTERACTIVE]
+    window.close()
@@ -0,0 +1,50 @@
+"""Tests for the GUI sync worker."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from poe_search.gui.catalog import ConversationCatalog
+from poe_search.gui.workers.sync_worker import SyncWorker
+from poe_search.sync.daemon import SyncLock
+from tests.conftest import make_conversation
+
+
+@pytest.fixture
+def client(temp_db):
+    client = Mock(spec=["database", "api_client"])
+    client.database = temp_db
+    client.api_client.get_conversation.side_effect = lambda conversation_id: make_conversation(
+        conversation_id, messages=2
+    )
+    return client
+
+
+def run_worker(client):
+    worker = SyncWorker(client, conversation_ids=["conv_1"], catalog=ConversationCatalog())
+    errors, completed, finished = [], [], []
+    worker.sync_error.connect(errors.append)
+    worker.sync_complete.connect(completed.append)
+    worker.sync_finished.connect(lambda: finished.append(True))
+    worker.run()
+    return errors, completed, finished
+
+
+class TestSyncLock:
+    """Test that the worker shares the CLI and daemon sync lock."""
+
+    def test_refuses_while_locked(self, qapp, client):
+        with SyncLock(client.database.db_path):
+            errors, completed, finished = run_worker(client)
+
+        assert len(errors) == 1 and errors[0].startswith("Sync already running")
+        assert completed == [] and finished == [True]
+        client.api_client.get_conversation.assert_not_called()
+
+    def test_releases_after_sync(self, qapp, client):
+        errors, completed, finished = run_worker(client)
+
+        assert errors == [] and finished == [True]
+        assert client.database.get_conversation("conv_1") is not None
+        with SyncLock(client.database.db_path) as lock:
+            assert lock.locked
@@ -0,0 +1,408 @@
+"""
+Tests and benchmark for single-pass DOM extraction.
+
+Recorded Poe HTML pages in ``fixtures/`` are loaded into a tiny in-process
+DOM. ``FixtureDriver`` answers the extraction scripts from that DOM and
+counts WebDriver round trips, optionally simulating per-call latency, so
+the legacy per-element approach can be compared against one
+``execute_script`` call without a browser.
+"""
+
+import re
+import time
+from html.parser import HTMLParser
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from poe_search.api.extraction import (
+    ELEMENTS_JS,
+    PAGE_JS,
+    DomExtractor,
+    chat_urls_from_source,
+    dedupe_by,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class Node:
+    """Element node of the fixture DOM."""
+
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs)
+        self.parent = parent
+        self.children = []
+
+    @property
+    def inner_text(self):
+        parts = []
+        for child in self.children:
+            parts.append(child if isinstance(child, str) else child.inner_text)
+        return " ".join(p.strip() for p in parts if p.strip()).strip()
+
+    def descendants(self):
+        for child in self.children:
+            if isinstance(child, Node):
+                yield child
+                yield from child.descendants()
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+
+class _Builder(HTMLParser):
+    VOID = {"meta", "link", "br", "img", "input", "hr"}
+
+    def __init__(self):
+        super().__init__()
+        self.root = Node("#document", {})
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, attrs, self.current)
+        self.current.children.append(node)
+        if tag not in self.VOID:
+            self.current = node
+
+    def handle_endtag(self, tag):
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        if self.current.tag not in ("script", "style"):
+            self.current.children.append(data)
+
+
+_SIMPLE = re.compile(r"^(?P<tag>[a-z0-9]+)?(?P<attrs>(\[[^\]]+\])*)$")
+_ATTR = re.compile(r"\[([\w-]+)(?:(\*?=)['\"]?([^'\"\]]*)['\"]?)?\]")
+
+
+def _matches_simple(node, simple):
+    m = _SIMPLE.match(simple)
+    if not m:
+        raise ValueError(f"Unsupported selector: {simple}")
+    if m.group("tag") and node.tag != m.group("tag"):
+        return False
+    for name, op, value in _ATTR.findall(m.group("attrs")):
+        actual = node.attrs.get(name)
+        if actual is None:
+            return False
+        if op == "=" and actual != value:
+            return False
+        if op == "*=" and value not in actual:
+            return False
+    return True
+
+
+def _matches(node, selector):
+    parts = selector.split()
+    if not _matches_simple(node, parts[-1]):
+        return False
+    remaining = parts[:-1]
+    for ancestor in node.ancestors():
+        if not remaining:
+            break
+        if _matches_simple(ancestor, remaining[-1]):
+            remaining.pop()
+    return not remaining
+
+
+class FixtureDom:
+    """Parsed fixture page supporting the selector subset the scrapers use."""
+
+    def __init__(self, html):
+        builder = _Builder()
+        builder.feed(html)
+        self.source = html
+        self.root = builder.root
+        self.title = next((n.inner_text for n in self.root.descendants() if n.tag == "title"), "")
+
+    def query_all(self, selector, root=None):
+        groups = [g.strip() for g in selector.split(",")]
+        base = root or self.root
+        return [n for n in base.descendants() if any(_matches(n, g) for g in groups)]
+
+
+class FakeWebElement:
+    """WebElement whose every property read costs a driver round trip."""
+
+    def __init__(self, driver, node):
+        self._driver = driver
+        self._node = node
+
+    @property
+    def text(self):
+        self._driver._round_trip()
+        return self._node.inner_text
+
+    def get_attribute(self, name):
+        self._driver._round_trip()
+        if name == "outerHTML":
+            return f"<{self._node.tag} class=\"{self._node.attrs.get('class', '')}\">"
+        return self._node.attrs.get(name)
+
+
+class FixtureDriver:
+    """Fake WebDriver backed by a recorded HTML page."""
+
+    def __init__(self, html, latency=0.0):
+        self.dom = FixtureDom(html)
+        self.latency = latency
+        self.round_trips = 0
+        self.current_url = "https://poe.com/chats"
+        self.title = self.dom.title
+
+    def get(self, url):
+        self._round_trip()
+        self.current_url = url
+
+    def _round_trip(self):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    @property
+    def page_source(self):
+        self._round_trip()
+        return self.dom.source
+
+    def find_elements(self, by, selector):
+        self._round_trip()
+        return [FakeWebElement(self, n) for n in self.dom.query_all(selector)]
+
+    def execute_script(self, script, *args):
+        self._round_trip()
+        if script == ELEMENTS_JS:
+            return self._elements(*args)
+        if script == PAGE_JS:
+            return self._page(*args)
+        if "readyState" in script:
+            return "complete"
+        return 1000  # scroll height / quiet time
+
+    def _elements(self, selectors, link_selector, max_per):
+        out = []
+        for s, selector in enumerate(selectors):
+            nodes = self.dom.query_all(selector)
+            for node in nodes[:max_per] if max_per else nodes:
+                link = None
+                if link_selector:
+                    found = self.dom.query_all(link_selector, root=node)
+                    link = found[0].attrs.get("href") if found else None
+                out.append({
+                    "s": s,
+                    "href": node.attrs.get("href") if node.tag == "a" else None,
+                    "text": node.inner_text,
+                    "title": node.attrs.get("title", ""),
+                    "aria": node.attrs.get("aria-label", ""),
+                    "link": link,
+                })
+        return out
+
+    def _page(self, msg_selectors, user_ind, bot_ind, min_len, title_selectors,
+              bot_selectors, bot_min, bot_max):
+        def hint(node):
+            hay = node.attrs.get("class", "").lower() + " " + node.inner_text.lower()
+            if any(i in hay for i in user_ind):
+                return "user"
+            if any(i in hay for i in bot_ind):
+                return "assistant"
+            return None
+
+        result = {"selector": None, "messages": [], "titles": [], "bot": None,
+                  "pageTitle": self.dom.title}
+        for selector in msg_selectors:
+            nodes = [n for n in self.dom.query_all(selector) if len(n.inner_text) > min_len]
+            if nodes:
+                result["selector"] = selector
+                result["messages"] = [{"text": n.inner_text, "hint": hint(n)} for n in nodes]
+                break
+        for selector in title_selectors:
+            nodes = self.dom.query_all(selector)
+            result["titles"].append(nodes[0].inner_text if nodes else "")
+        for selector in bot_selectors:
+            for node in self.dom.query_all(selector):
+                if bot_min <= len(node.inner_text) <= bot_max:
+                    result["bot"] = node.inner_text
+                    break
+            if result["bot"]:
+                break
+        return result
+
+
+@pytest.fixture
+def chats_html():
+    return (FIXTURES / "chats_page.html").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def conversation_html():
+    return (FIXTURES / "conversation_page.html").read_text(encoding="utf-8")
+
+
+CHAT_SELECTORS = [
+    "a[href*='/chat/']",
+    "a[href*='/conversation/']",
+    "[data-testid*='chat'] a",
+    "[data-testid*='conversation'] a",
+]
+
+
+def legacy_conversation_links(driver):
+    """Per-element extraction as the scrapers did it before single-pass."""
+    conversations = []
+    for selector in CHAT_SELECTORS:
+        for elem in driver.find_elements("css selector", selector):
+            href = elem.get_attribute("href")
+            if not href or "/chat/" not in href:
+                continue
+            title = elem.text.strip() or elem.get_attribute("title") or "Untitled"
+            if not any(c["url"] == href for c in conversations):
+                conversations.append({"url": href, "title": title[:100]})
+    return conversations
+
+
+def single_pass_conversation_links(driver):
+    records = DomExtractor(driver).elements(CHAT_SELECTORS)
+    links = [
+        {"url": r["href"], "title": (r["text"] or r["title"] or "Untitled")[:100]}
+        for r in records
+        if r["href"] and "/chat/" in r["href"]
+    ]
+    return dedupe_by(links, "url")
+
+
+class TestDomExtractor:
+    """Test single-pass extraction against recorded pages."""
+
+    def test_elements_single_round_trip(self, chats_html):
+        driver = FixtureDriver(chats_html)
+        links = single_pass_conversation_links(driver)
+
+        assert driver.round_trips == 1
+        assert len(links) == 60
+        assert links[0] == {"url": "https://poe.com/chat/conv0000",
+                            "title": "Python question 0 with Claude-3-Opus"}
+
+    def test_single_pass_matches_legacy_output(self, chats_html):
+        assert single_pass_conversation_links(FixtureDriver(chats_html)) == \
+            legacy_conversation_links(FixtureDriver(chats_html))
+
+    def test_container_link_resolution(self, chats_html):
+        records = DomExtractor(FixtureDriver(chats_html)).elements(
+            ["[data-testid*='chat']"], container_link="a[href*='/chat/']"
+        )
+        assert len(records) == 60
+        assert records[5]["link"] == "https://poe.com/chat/conv0005"
+
+    def test_page_extraction(self, conversation_html):
+        driver = FixtureDriver(conversation_html)
+        page = DomExtractor(driver).page(
+            message_selectors=["[data-testid*='missing']", "[data-testid*='message']"],
+            title_selectors=["h1", "title"],
+            bot_selectors=["[class*='bot']"],
+            user_indicators=["human"],
+            assistant_indicators=["bot"],
+        )
+
+        assert driver.round_trips == 1
+        assert page["selector"] == "[data-testid*='message']"
+        assert len(page["messages"]) == 40
+        assert page["messages"][0]["hint"] == "user"
+        assert page["messages"][1]["hint"] == "assistant"
+        assert page["titles"] == ["Sorting lists", "Sorting lists - Poe"]
+        assert page["bot"] == "Claude-3-Opus"
+
+    def test_extraction_timed_when_timings_given(self, chats_html):
+        from poe_search.api.waits import StepTimings
+
+        timings = StepTimings()
+        DomExtractor(FixtureDriver(chats_html), timings=timings).elements(CHAT_SELECTORS)
+        assert "extract_elements" in timings.summary()
+
+
+class TestHelpers:
+    """Test set-based post-processing helpers."""
+
+    def test_dedupe_by_keeps_first(self):
+        records = [{"url": "a", "n": 1}, {"url": "b", "n": 2}, {"url": "a", "n": 3}]
+        assert dedupe_by(records, "url") == [{"url": "a", "n": 1}, {"url": "b", "n": 2}]
+
+    def test_chat_urls_from_source_skips_seen(self, chats_html):
+        seen = {"https://poe.com/chat/conv0000"}
+        found = chat_urls_from_source(chats_html, [r"(\/chat\/[A-Za-z0-9_-]+)"], seen)
+        urls = [url for url, _ in found]
+
+        assert "https://poe.com/chat/conv0000" not in urls
+        assert "https://poe.com/chat/hiddenconv9" in urls
+        assert len(urls) == len(set(urls))
+        assert "https://poe.com/chat/conv0000" in seen
+
+
+class TestPoeAPIClientExtraction:
+    """Test PoeAPIClient list/detail extraction on fixture pages."""
+
+    def _client(self, driver):
+        from poe_search.api import client as client_module
+        from poe_search.api.waits import WaitStrategy
+
+        with patch.object(client_module, "SELENIUM_AVAILABLE", True):
+            client = client_module.PoeAPIClient(token="test")
+        client.driver = driver
+        client.waits = WaitStrategy(driver, timeout=0.05, poll_interval=0, timings=client.timings)
+        client.extractor = DomExtractor(driver, timings=client.timings)
+        return client
+
+    def test_get_conversation_list(self, chats_html):
+        driver = FixtureDriver(chats_html)
+        conversations = self._client(driver).get_conversation_list(limit=100)
+
+        urls = [c["url"] for c in conversations]
+        assert len(urls) == len(set(urls))
+        assert "https://poe.com/chat/conv0059" in urls
+        assert "https://poe.com/chat/hiddenconv9" in urls
+
+    def test_get_conversation_details(self, conversation_html):
+        driver = FixtureDriver(conversation_html)
+        conv = self._client(driver).get_conversation_details("https://poe.com/chat/sorting")
+
+        assert conv.title == "Sorting lists"
+        assert conv.bot == "Claude-3-Opus"
+        assert len(conv.messages) == 40
+        assert conv.messages[0].role == "user"
+        assert conv.messages[0].content.startswith("How do I sort")
+
+
+class TestExtractionBenchmark:
+    """Compare WebDriver round trips and wall time on a recorded page."""
+
+    LATENCY = 0.002  # seconds per simulated WebDriver HTTP round trip
+
+    def test_single_pass_beats_per_element(self, chats_html):
+        legacy_driver = FixtureDriver(chats_html, latency=self.LATENCY)
+        start = time.perf_counter()
+        legacy = legacy_conversation_links(legacy_driver)
+        legacy_seconds = time.perf_counter() - start
+
+        fast_driver = FixtureDriver(chats_html, latency=self.LATENCY)
+        start = time.perf_counter()
+        fast = single_pass_conversation_links(fast_driver)
+        fast_seconds = time.perf_counter() - start
+
+        print(
+            f"\nlegacy: {legacy_driver.round_trips} round trips, {legacy_seconds * 1000:.1f} ms; "
+            f"single-pass: {fast_driver.round_trips} round trip, {fast_seconds * 1000:.1f} ms"
+        )
+        assert fast == legacy
+        assert fast_driver.round_trips == 1
+        assert legacy_driver.round_trips > 100
+        assert fast_seconds < legacy_seconds / 10
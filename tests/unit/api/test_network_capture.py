@@ -0,0 +1,164 @@
+"""
+Tests for GraphQL network capture.
+
+A recorded CDP performance log (``fixtures/cdp_chat_log.json``) is replayed
+through a fake driver, so no browser is needed.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from poe_search.api.network_capture import GraphQLCapture, poe_time_to_iso
+from poe_search.api.waits import WaitStrategy
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class ReplayDriver:
+    """Fake Chrome driver that replays a recorded CDP log."""
+
+    def __init__(self, recording):
+        self.performance_log = list(recording["entries"])
+        self.bodies = recording["bodies"]
+        self.log_types = ["performance"]
+        self.cdp_commands = []
+        self.current_url = "https://poe.com/chats"
+        self.title = "Poe"
+
+    def get(self, url):
+        self.current_url = url
+
+    def get_log(self, log_type):
+        entries, self.performance_log = self.performance_log, []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append(cmd)
+        if cmd == "Network.getResponseBody":
+            return self.bodies[params["requestId"]]
+        return {}
+
+    def execute_script(self, script, *args):
+        if "readyState" in script:
+            return "complete"
+        return 1000
+
+
+@pytest.fixture
+def recording():
+    return json.loads((FIXTURES / "cdp_chat_log.json").read_text(encoding="utf-8"))
+
+
+class TestPoeTimeToIso:
+    """Test timestamp normalization."""
+
+    @pytest.mark.parametrize("value", [1718000000, 1718000000000, 1718000000000000])
+    def test_detects_unit_by_magnitude(self, value):
+        assert poe_time_to_iso(value) == "2024-06-10T06:13:20+00:00"
+
+    def test_passes_iso_strings_through(self):
+        assert poe_time_to_iso("2024-06-10T06:13:20Z") == "2024-06-10T06:13:20Z"
+
+    def test_missing_values(self):
+        assert poe_time_to_iso(None) is None
+        assert poe_time_to_iso("") is None
+
+
+class TestGraphQLCapture:
+    """Test replaying recorded gql_POST traffic."""
+
+    def test_poll_collects_conversations(self, recording):
+        driver = ReplayDriver(recording)
+        capture = GraphQLCapture(driver)
+        assert capture.enable()
+
+        capture.poll()
+
+        conversations = capture.get_conversations()
+        assert [c["id"] for c in conversations] == ["regexhelp", "sorting", "recipes"]
+        assert conversations[0]["bot"] == "GPT-4o"
+        assert conversations[0]["chat_id"] == 102
+        # only gql_POST bodies are fetched; the failed request is dropped
+        assert driver.cdp_commands.count("Network.getResponseBody") == 2
+        assert not capture._pending
+
+    def test_messages_keep_real_ids_and_timestamps(self, recording):
+        capture = GraphQLCapture(ReplayDriver(recording))
+        capture.poll()
+
+        messages = capture.get_messages("sorting")
+        assert [m["id"] for m in messages] == ["5000", "5001", "5002", "5003"]
+        assert [m["role"] for m in messages] == ["user", "bot", "user", "bot"]
+        assert messages[0]["timestamp"] == "2024-06-10T06:13:20+00:00"
+        assert messages[1]["bot"] == "Claude-3-Opus"
+        assert messages[0]["bot"] is None
+
+    def test_conversation_falls_back_to_message_times(self):
+        capture = GraphQLCapture(driver=None)
+        capture.ingest({"chat": {"chatCode": "abc", "messages": [
+            {"messageId": 1, "text": "hi", "author": "human", "creationTime": 1718000000000000},
+            {"messageId": 2, "text": "hello", "author": "a2", "creationTime": 1718000060000000},
+        ]}})
+
+        conv = capture.get_conversation("abc")
+        assert conv["title"] == "Untitled Conversation"
+        assert conv["created_at"] == "2024-06-10T06:13:20+00:00"
+        assert conv["updated_at"] == "2024-06-10T06:14:20+00:00"
+        assert conv["message_count"] == 2
+        assert conv["messages"][1]["bot"] == "a2"
+
+    def test_receives_events_drained_by_wait_strategy(self, recording):
+        driver = ReplayDriver(recording)
+        waits = WaitStrategy(driver, timeout=1, poll_interval=0.01, quiet_period=0.02)
+        capture = GraphQLCapture(driver)
+        capture.attach(waits)
+        capture.attach(waits)
+
+        assert waits.network_idle()
+
+        assert len(waits.cdp_listeners) == 1
+        assert len(capture.get_messages("sorting")) == 4
+
+    def test_poll_reads_through_attached_wait_strategy(self, recording):
+        driver = ReplayDriver(recording)
+        waits = WaitStrategy(driver, timeout=1, poll_interval=0.01, quiet_period=0.02)
+        capture = GraphQLCapture(driver)
+        capture.attach(waits)
+
+        assert capture.poll() == len(recording["entries"])
+
+        assert len(capture.get_messages("sorting")) == 4
+        # The wait strategy saw the same events, so no request looks in flight
+        assert not waits._inflight
+        assert waits.network_idle(timeout=0.2)
+
+
+class TestPoeAPIClientCapture:
+    """Test PoeAPIClient building conversations from captured responses."""
+
+    def test_get_conversation_details_uses_capture(self, recording):
+        from poe_search.api import client as client_module
+        from poe_search.api.extraction import DomExtractor
+
+        driver = ReplayDriver(recording)
+        with patch.object(client_module, "SELENIUM_AVAILABLE", True):
+            client = client_module.PoeAPIClient(token="test", capture_network=True)
+        client.driver = driver
+        client.waits = WaitStrategy(driver, timeout=0.05, poll_interval=0, timings=client.timings)
+        client.extractor = DomExtractor(driver, timings=client.timings)
+        client.capture = GraphQLCapture(driver)
+        client.capture.attach(client.waits)
+
+        conv = client.get_conversation_details("https://poe.com/chat/sorting")
+
+        assert conv.id == "sorting"
+        assert conv.title == "Sorting lists"
+        assert conv.bot == "Claude-3-Opus"
+        assert [m.message_id for m in conv.messages] == ["5000", "5001", "5002", "5003"]
+        assert conv.messages[0].role == "user"
+        assert conv.messages[1].role == "assistant"
+        assert conv.created_at.isoformat() == "2024-06-10T06:13:20+00:00"
+        assert conv.updated_at.isoformat() == "2024-06-10T07:13:20+00:00"
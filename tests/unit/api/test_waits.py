@@ -0,0 +1,174 @@
+"""
+Tests for the event-driven wait strategies used by the Selenium scrapers.
+
+A scripted fake driver stands in for Selenium, so no browser is needed.
+"""
+
+import json
+import time
+
+import pytest
+
+from poe_search.api.waits import StepTimings, WaitStrategy, poll_until
+
+
+class FakeDriver:
+    """Minimal driver that answers execute_script from a handler."""
+
+    def __init__(self, handler, log_types=(), performance_log=None):
+        self.handler = handler
+        self.log_types = list(log_types)
+        self.performance_log = list(performance_log or [])
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return self.handler(script, *args)
+
+    def get_log(self, log_type):
+        entries, self.performance_log = self.performance_log, []
+        return entries
+
+
+def cdp_entry(method, request_id):
+    return {"message": json.dumps({"message": {"method": method, "params": {"requestId": request_id}}})}
+
+
+class TestPollUntil:
+    """Test the generic polling helper."""
+
+    def test_returns_first_truthy_value(self):
+        calls = iter([None, 0, "ready"])
+        assert poll_until(lambda: next(calls), timeout=1, poll_interval=0) == "ready"
+
+    def test_times_out(self):
+        start = time.monotonic()
+        assert poll_until(lambda: False, timeout=0.05, poll_interval=0.01) is None
+        assert time.monotonic() - start < 1
+
+    def test_exceptions_count_as_not_ready(self):
+        calls = iter([RuntimeError("stale"), True])
+
+        def condition():
+            value = next(calls)
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        assert poll_until(condition, timeout=1, poll_interval=0) is True
+
+
+class TestWaitStrategy:
+    """Test DOM and network wait conditions."""
+
+    def test_document_ready_records_timing(self):
+        states = iter(["loading", "interactive", "complete"])
+        driver = FakeDriver(lambda script, *a: next(states))
+        waits = WaitStrategy(driver, timeout=1, poll_interval=0)
+
+        assert waits.document_ready()
+        assert waits.timings.steps[0]["step"] == "document_ready"
+        assert waits.timings.steps[0]["ok"] is True
+
+    def test_any_selector_uses_single_round_trip_per_poll(self):
+        driver = FakeDriver(lambda script, selectors: selectors[1])
+        waits = WaitStrategy(driver, timeout=1, poll_interval=0)
+
+        assert waits.any_selector(["article", "main"]) == "main"
+        assert len(driver.scripts) == 1
+
+    def test_content_stable_waits_for_quiet_period(self):
+        quiet = iter([0, 100, 600])
+
+        def handler(script, *args):
+            return next(quiet)
+
+        waits = WaitStrategy(FakeDriver(handler), timeout=1, poll_interval=0, quiet_period=0.5)
+        assert waits.content_stable()
+
+    def test_content_stable_times_out_on_busy_page(self):
+        waits = WaitStrategy(FakeDriver(lambda s, *a: 0), timeout=0.05, poll_interval=0.01)
+        assert not waits.content_stable()
+        assert waits.timings.steps[-1]["ok"] is False
+
+    def test_scroll_until_stable_stops_when_height_stops_growing(self):
+        heights = iter([2000, 3000, 3000])
+        state = {"height": 1000}
+
+        def handler(script, *args):
+            if "scrollTo" in script:
+                state["height"] = next(heights, state["height"])
+                return None
+            return state["height"]
+
+        waits = WaitStrategy(FakeDriver(handler), poll_interval=0)
+        grown = waits.scroll_until_stable(max_loops=10, step_timeout=0.05)
+
+        assert grown == 2
+        assert "scroll_until_stable" in waits.timings.summary()
+
+    def test_network_idle_tracks_cdp_requests(self):
+        driver = FakeDriver(
+            lambda s, *a: 0,
+            log_types=["performance"],
+            performance_log=[
+                cdp_entry("Network.requestWillBeSent", "1"),
+                cdp_entry("Network.loadingFinished", "1"),
+            ],
+        )
+        waits = WaitStrategy(driver, timeout=1, poll_interval=0.01, quiet_period=0.02)
+
+        assert waits.network_idle()
+        assert waits.timings.steps[-1]["source"] == "cdp"
+        assert not waits._inflight
+
+    def test_network_idle_not_reached_with_pending_request(self):
+        driver = FakeDriver(
+            lambda s, *a: 0,
+            log_types=["performance"],
+            performance_log=[cdp_entry("Network.requestWillBeSent", "1")],
+        )
+        waits = WaitStrategy(driver, timeout=0.05, poll_interval=0.01, quiet_period=0.01)
+
+        assert not waits.network_idle()
+
+    def test_page_loaded_forgets_requests_of_the_previous_page(self):
+        driver = FakeDriver(
+            lambda s, *a: "complete" if "readyState" in s else 0,
+            log_types=["performance"],
+            performance_log=[cdp_entry("Network.requestWillBeSent", "1")],
+        )
+        waits = WaitStrategy(driver, timeout=0.05, poll_interval=0.01, quiet_period=0.01)
+        assert not waits.network_idle()
+
+        driver.performance_log = [
+            cdp_entry("Network.requestWillBeSent", "2"),
+            cdp_entry("Network.loadingFinished", "2"),
+        ]
+        waits.page_loaded()
+
+        assert waits.network_idle()
+        assert not waits._inflight
+
+    def test_network_idle_falls_back_to_resource_timing(self):
+        waits = WaitStrategy(FakeDriver(lambda s, *a: 12), timeout=1, poll_interval=0.01, quiet_period=0.02)
+
+        assert waits.network_idle()
+        assert waits.timings.steps[-1]["source"] == "resource_timing"
+
+
+class TestStepTimings:
+    """Test timing instrumentation."""
+
+    def test_summary_accumulates_by_step(self):
+        timings = StepTimings()
+        for _ in range(2):
+            with timings.step("load"):
+                pass
+        with timings.step("extract") as record:
+            record["count"] = 3
+
+        summary = timings.summary()
+        assert set(summary) == {"load", "extract"}
+        assert timings.total() == pytest.approx(sum(summary.values()))
+        assert timings.steps[-1]["count"] == 3
@@ -0,0 +1,156 @@
+"""Tests for the SQL analytics layer."""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+from functools import partial
+
+import pytest
+
+from poe_search.storage.analytics import ConversationAnalytics, summarize_conversations
+from poe_search.storage.database import Database, to_epoch_ms
+from tests.conftest import make_conversation
+
+NOW = datetime(2024, 3, 31, 12, 0, tzinfo=timezone.utc)
+NOW_MS = int(NOW.timestamp() * 1000)
+
+chat = partial(make_conversation, category="Programming", messages=2)
+
+
+CONVERSATIONS = [
+    chat(1, "2024-03-30T09:00:00", messages=4),
+    chat(2, "2024-03-30T23:30:00Z", bot="GPT-4", messages=6),
+    chat(3, "2024-03-30T10:00:00+00:00", bot="GPT-4", category="Writing"),
+    chat(4, "2024-03-20T10:00:00", category=None, messages=10),
+    chat(5, "2023-06-01T10:00:00", bot="Gemini", messages=1),
+    chat(6, "not a date", bot="Gemini", messages=3),
+]
+
+
+@pytest.fixture
+def analytics(temp_db):
+    temp_db.save_conversations_bulk(CONVERSATIONS)
+    return ConversationAnalytics(temp_db)
+
+
+class TestEpochColumns:
+    """Test the derived columns the aggregations run on."""
+
+    def test_to_epoch_ms(self):
+        assert to_epoch_ms("2024-03-30T23:30:00Z") == to_epoch_ms("2024-03-30T23:30:00")
+        assert to_epoch_ms("2024-03-31T12:00:00+00:00") == NOW_MS
+        assert to_epoch_ms("garbage") is None
+        assert to_epoch_ms(None) is None
+
+    def test_existing_database_backfilled(self, tmp_path):
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE conversations (
+                id TEXT PRIMARY KEY, bot TEXT NOT NULL, title TEXT,
+                created_at TEXT NOT NULL, updated_at TEXT NOT NULL,
+                message_count INTEGER DEFAULT 0, data TEXT, UNIQUE(id)
+            )
+        """)
+        conversation = CONVERSATIONS[2]
+        conn.execute(
+            "INSERT INTO conversations VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ("conv_3", "GPT-4", "t", conversation["created_at"], conversation["created_at"], 2,
+             json.dumps(conversation)),
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(f"sqlite:///{path}")
+
+        with db._get_connection() as conn:
+            row = conn.execute("SELECT created_ts, category FROM conversations").fetchone()
+        assert tuple(row) == (to_epoch_ms("2024-03-30T10:00:00+00:00"), "Writing")
+
+
+class TestDashboard:
+    """Test the aggregations against the Python reference implementation."""
+
+    @pytest.mark.parametrize("days", [None, 7, 30])
+    def test_matches_python_summary(self, analytics, days):
+        sql = analytics.dashboard(days=days, now_ms=NOW_MS)
+        python = summarize_conversations(CONVERSATIONS, days=days, now_ms=NOW_MS)
+        assert sql == python
+
+    def test_all_time(self, analytics):
+        summary = analytics.dashboard(now_ms=NOW_MS)
+
+        assert summary["overview"] == {
+            "total_conversations": 6,
+            "total_messages": 26,
+            "avg_messages": 26 / 6,
+            "most_used_bot": "Claude",
+            "recent_conversations": 3,
+            "largest_conversation": 10,
+        }
+        assert [(b["name"], b["conversations"]) for b in summary["bots"]] == [
+            ("Claude", 2), ("GPT-4", 2), ("Gemini", 2)
+        ]
+        assert {c["name"] for c in summary["categories"]} == {"Programming", "Writing", "Uncategorized"}
+        # Unparseable dates count in totals but not in the timeline
+        assert summary["timeline"] == [
+            {"date": "2024-03-30", "conversations": 3, "messages": 12, "top_bot": "GPT-4"},
+            {"date": "2024-03-20", "conversations": 1, "messages": 10, "top_bot": "Claude"},
+            {"date": "2023-06-01", "conversations": 1, "messages": 1, "top_bot": "Gemini"},
+        ]
+
+    def test_time_range(self, analytics):
+        summary = analytics.dashboard(days=7, now_ms=NOW_MS)
+
+        assert summary["overview"]["total_conversations"] == 3
+        assert {c["name"]: c["percentage"] for c in summary["categories"]} == pytest.approx(
+            {"Programming": 200 / 3, "Writing": 100 / 3}
+        )
+
+    def test_empty_names_fold_into_placeholders(self, temp_db):
+        conversations = [
+            chat(1, "2024-03-30T09:00:00", category=""),
+            chat(2, "2024-03-30T10:00:00", category=None),
+            chat(3, "2024-03-30T11:00:00", category="Uncategorized", bot=""),
+            chat(4, "2024-03-30T12:00:00", category="Tech", bot=""),
+        ]
+        temp_db.save_conversations_bulk(conversations)
+        analytics = ConversationAnalytics(temp_db)
+
+        summary = analytics.dashboard(now_ms=NOW_MS)
+
+        assert [(c["name"], c["conversations"]) for c in analytics.category_breakdown()] == [
+            ("Uncategorized", 3), ("Tech", 1)
+        ]
+        assert [(b["name"], b["conversations"]) for b in summary["bots"]] == [
+            ("Claude", 2), ("Unknown", 2)
+        ]
+        assert summary["timeline"][0]["top_bot"] == "Claude"
+        assert summary == summarize_conversations(conversations, now_ms=NOW_MS)
+
+    def test_empty_database(self, temp_db):
+        summary = ConversationAnalytics(temp_db).dashboard()
+        assert summary["overview"]["total_conversations"] == 0
+        assert summary["overview"]["most_used_bot"] is None
+        assert summary["bots"] == summary["timeline"] == []
+
+    def test_queries_only_read_covering_index(self, analytics):
+        statements = []
+        get_connection = analytics.database._get_connection
+
+        def traced_connection():
+            conn = get_connection()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        analytics.database._get_connection = traced_connection
+        analytics.dashboard(days=30, now_ms=NOW_MS)
+        analytics.database._get_connection = get_connection
+
+        assert len(statements) == 5
+        with get_connection() as conn:
+            for statement in statements:
+                plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + statement)]
+                scans = [step for step in plan if "conversations" in step]
+                assert scans
+                assert all("COVERING INDEX idx_conversations_created_ts" in step for step in scans), plan
@@ -0,0 +1,267 @@
+"""Tests for parallel batch categorization."""
+
+import os
+import time
+
+import pytest
+
+from poe_search.search.categorizer import BatchCategorizer, CategoryRule, RuleCategorizer, default_rules
+from tests.conftest import make_conversation
+
+TEXTS = [
+    "Debugging a python function that raises an error",
+    "My doctor changed the dosage of my medication",
+    "A meditation and prayer practice for the soul",
+    "Which movie or tv show should I watch tonight",
+    "Hello there",
+]
+
+
+def chat(index, category=None):
+    return make_conversation(
+        index, "2024-03-04T09:00:00", title=f"Chat {index}", category=category, width=5,
+        messages=[("user", TEXTS[index % len(TEXTS)]), ("bot", "Sure.")],
+    )
+
+
+def rollup_categories(database):
+    with database._get_connection() as conn:
+        return dict(conn.execute(
+            "SELECT category, SUM(conversations) FROM daily_rollups GROUP BY category"
+        ).fetchall())
+
+
+@pytest.fixture
+def database(temp_db):
+    temp_db.save_conversations_bulk(
+        [chat(i) for i in range(20)] + [chat(20, category="Personal")]
+    )
+    return temp_db
+
+
+class TestConversationTexts:
+    """Test streaming conversation text from the database."""
+
+    def test_chunks(self, database):
+        chunks = list(database.iter_conversation_texts(chunk_size=8))
+        assert [len(chunk) for chunk in chunks] == [8, 8, 5]
+        conversation_id, category, text = chunks[0][1]
+        assert conversation_id == "conv_00001"
+        assert category is None
+        assert text == f"Chat 1 {TEXTS[1]} Sure."
+
+    def test_filters(self, database):
+        uncategorized = [item for chunk in database.iter_conversation_texts(uncategorized_only=True)
+                         for item in chunk]
+        assert len(uncategorized) == 20
+
+        ids = ["conv_00020", "conv_00003", "missing", "conv_00003"]
+        chunks = list(database.iter_conversation_texts(ids, chunk_size=1))
+        assert [item[0] for chunk in chunks for item in chunk] == ["conv_00003", "conv_00020"]
+
+    def test_placeholder_categories_count_as_uncategorized(self, database):
+        database.save_conversations_bulk([
+            chat(21, category=""),
+            chat(22, category="Uncategorized"),
+        ])
+        ids = [item[0] for chunk in database.iter_conversation_texts(uncategorized_only=True)
+               for item in chunk]
+        assert len(ids) == 22
+        assert {"conv_00021", "conv_00022"} <= set(ids)
+        assert "conv_00020" not in ids
+
+        stats = BatchCategorizer(database, workers=1).run()
+        assert stats["total"] == 22
+        assert database.get_conversation("conv_00021")["category"] == "Medical"
+        assert database.get_conversation("conv_00022")["category"] == "Spiritual"
+
+    def test_writes_between_chunks(self, database):
+        # No read transaction is held across chunks
+        for chunk in database.iter_conversation_texts(uncategorized_only=True, chunk_size=4):
+            database.set_conversation_categories({item[0]: "Seen" for item in chunk})
+        assert database.count_conversations(category="Seen") == 20
+
+
+class TestSetCategories:
+    """Test the bulk category write."""
+
+    def test_updates_column_data_and_rollups(self, database):
+        updated = database.set_conversation_categories({"conv_00001": "Medical", "conv_00020": None})
+        assert updated == 2
+
+        assert database.get_conversation("conv_00001")["category"] == "Medical"
+        assert database.get_conversation("conv_00020")["category"] is None
+        assert database.count_conversations(category="Uncategorized") == 20
+        assert rollup_categories(database) == {"": 20, "Medical": 1}
+
+        database.rebuild_rollups()
+        assert rollup_categories(database) == {"": 20, "Medical": 1}
+
+    def test_uncategorized_filter_matches_placeholder_categories(self, database):
+        database.save_conversations_bulk([
+            chat(21, category=""),
+            chat(22, category="Uncategorized"),
+        ])
+
+        assert database.count_conversations(category="Uncategorized") == 22
+        ids = {c["id"] for c in database.get_conversations(category="Uncategorized")}
+        assert {"conv_00021", "conv_00022"} <= ids
+        assert "conv_00020" not in ids
+
+    def test_single_update(self, database):
+        assert database.update_conversation_category("conv_00002", "Spiritual")
+        assert not database.update_conversation_category("missing", "Spiritual")
+        assert database.get_conversation("conv_00002")["category"] == "Spiritual"
+
+
+class TestBatchCategorizer:
+    """Test the categorization pipeline."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_single_conversation_scoring(self, database, workers):
+        expected = {}
+        categorizer = RuleCategorizer()
+        for chunk in database.iter_conversation_texts(uncategorized_only=True):
+            for conversation_id, _category, text in chunk:
+                category, confidence = categorizer.categorize(text)
+                if category and confidence >= 0.5:
+                    expected[conversation_id] = category
+
+        written = {}
+        stats = BatchCategorizer(
+            database, workers=workers, chunk_size=3, on_categorized=written.update
+        ).run()
+
+        assert written == expected
+        assert stats == {
+            "total": 20, "categorized": len(expected), "unchanged": 20 - len(expected),
+            "skipped": 0, "failed": 0, "interrupted": 0,
+        }
+        stored = {c["id"]: c["category"] for c in database.get_conversations()}
+        assert all(stored[conversation_id] == category for conversation_id, category in expected.items())
+        assert stored["conv_00020"] == "Personal"
+        assert stored["conv_00004"] is None
+
+    def test_recategorize_given_ids(self, database):
+        stats = BatchCategorizer(database, workers=1).run(["conv_00020"], uncategorized_only=False)
+        assert stats["categorized"] == 1
+        assert database.get_conversation("conv_00020")["category"] == "Technical"
+
+    def test_stop(self, database):
+        stats = BatchCategorizer(database, workers=1, chunk_size=5, should_stop=lambda: True).run()
+        assert stats["interrupted"] == 1
+        assert stats["categorized"] == 0
+
+    def test_progress_is_throttled(self, database):
+        now = [0.0]
+        reports = []
+
+        def clock():
+            now[0] += 0.1
+            return now[0]
+
+        BatchCategorizer(
+            database, workers=1, chunk_size=1, clock=clock,
+            progress_callback=lambda message, percent: reports.append(percent),
+        ).run()
+
+        # 20 chunks, one report per 0.25 s of a clock advancing 0.1 s per check
+        assert len(reports) == 8
+        assert reports[-1] == 100
+        assert reports == sorted(reports)
+
+
+
+class TestIncremental:
+    """Test that runs only re-score changed conversations."""
+
+    def run(self, database, **options):
+        return BatchCategorizer(database, workers=1, chunk_size=4, **options).run()
+
+    def test_second_run_reads_nothing(self, database):
+        first = self.run(database)
+        assert first["total"] == 20
+        assert BatchCategorizer(database).stale_count() == 0
+
+        second = self.run(database)
+        assert second["total"] == 0
+        assert second["categorized"] + second["unchanged"] + second["skipped"] == 0
+
+    def test_changed_conversation_is_rescored(self, database):
+        self.run(database)
+        conversation = chat(4)  # "Hello there": not categorized
+        conversation["messages"].append({
+            "id": "conv_00004_2", "role": "user", "content": "Which film won the award?",
+            "timestamp": conversation["created_at"],
+        })
+        conversation["message_count"] = 3
+        conversation["updated_at"] = "2024-03-05T09:00:00"
+        database.save_conversation(conversation)
+
+        assert BatchCategorizer(database).stale_count() == 1
+        stats = self.run(database)
+        assert (stats["total"], stats["categorized"]) == (1, 1)
+        assert database.get_conversation("conv_00004")["category"] == "Entertainment"
+
+    def test_touched_but_unchanged_text_is_not_rescored(self, database):
+        self.run(database)
+        conversation = chat(3)
+        conversation["updated_at"] = "2024-03-05T09:00:00"
+        database.save_conversation(conversation)
+
+        stats = self.run(database)
+        assert (stats["total"], stats["skipped"], stats["categorized"]) == (1, 1, 0)
+        assert self.run(database)["total"] == 0
+
+    def test_rule_edit_rescores_automatic_categories_only(self, database):
+        self.run(database)
+        database.update_conversation_category("conv_00001", "Personal")  # set by hand
+
+        rules = default_rules()
+        rules.append(CategoryRule("Greetings", "Greetings", ["hello"], r"\bhello\b", confidence=0.9))
+        categorizer = BatchCategorizer(database, rules=rules, workers=1)
+        # Every conversation except the hand-categorized ones
+        assert categorizer.stale_count() == 19
+        assert categorizer.stale_count(uncategorized_only=False) == 21
+
+        stats = categorizer.run()
+        assert stats["total"] == 19
+        stored = {c["id"]: c["category"] for c in database.get_conversations()}
+        assert stored["conv_00004"] == "Greetings"
+        assert stored["conv_00001"] == "Personal"
+        assert stored["conv_00020"] == "Personal"
+        assert stored["conv_00000"] == "Technical"
+
+    def test_state_is_recorded(self, database):
+        self.run(database)
+        states = database.get_categorization_states(["conv_00000", "conv_00004", "conv_00020"])
+        assert set(states) == {"conv_00000", "conv_00004"}
+        assert states["conv_00000"]["category"] == "Technical"
+        assert states["conv_00000"]["confidence"] >= 0.5
+        assert states["conv_00004"]["category"] is None
+        assert states["conv_00000"]["message_count"] == 2
+
+    def test_full_run_ignores_state(self, database):
+        self.run(database)
+        stats = BatchCategorizer(database, workers=1).run(incremental=False)
+        assert stats["total"] == 20
+        assert stats["skipped"] == 0
+
+
+def test_process_pool_benchmark(temp_db):
+    """Compare scoring in one process with a process pool (faster given the cores)."""
+    filler = " ".join(["lorem ipsum dolor sit amet"] * 100)
+    conversations = [chat(i) for i in range(1000)]
+    for conversation in conversations:
+        conversation["messages"][1]["content"] = filler
+    temp_db.save_conversations_bulk(conversations)
+
+    timings = {}
+    for workers in (1, 4):
+        temp_db.set_conversation_categories({c["id"]: None for c in conversations})
+        start = time.perf_counter()
+        stats = BatchCategorizer(temp_db, workers=workers).run(incremental=False)
+        timings[workers] = time.perf_counter() - start
+        assert stats["categorized"] == 800
+
+    print(f"\nserial: {timings[1]:.2f} s, 4 processes: {timings[4]:.2f} s ({os.cpu_count()} CPUs)")
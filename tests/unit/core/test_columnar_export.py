@@ -0,0 +1,137 @@
+"""Tests for Parquet/Arrow export and import."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from poe_search.export.exporter import ConversationExporter
+from poe_search.storage.database import Database
+from tests.conftest import make_conversation
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from poe_search.export.columnar import ColumnarExporter, ColumnarImporter  # noqa: E402
+
+
+def chat(index, messages=4):
+    day = f"2024-01-{index % 28 + 1:02d}"
+    bot = ["Claude", "GPT-4", "Gemini"][index % 3]
+    return make_conversation(
+        index, f"{day}T10:00:00+00:00", f"{day}T11:00:00+00:00",
+        bot=bot,
+        width=5,
+        category=["Programming", "Writing"][index % 2],
+        url=f"https://poe.com/chat/conv_{index:05d}",
+        messages=[
+            {
+                "role": "user" if m % 2 == 0 else "bot",
+                "content": f"Message {m} of conversation {index} about sorting algorithms",
+                "timestamp": f"{day}T10:{m:02d}:00+00:00",
+                "bot": None if m % 2 == 0 else bot,
+            }
+            for m in range(messages)
+        ],
+    )
+
+
+@pytest.fixture
+def filled_db(temp_db):
+    temp_db.save_conversations_bulk(chat(i) for i in range(50))
+    return temp_db
+
+
+@pytest.fixture
+def other_db():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    yield Database(f"sqlite:///{db_path}")
+    Path(db_path).unlink(missing_ok=True)
+
+
+class TestColumnarExport:
+    """Test the table layout of columnar exports."""
+
+    def test_parquet_tables(self, filled_db, tmp_path):
+        stats = ColumnarExporter(filled_db).export(str(tmp_path), row_group_size=20)
+
+        assert stats == {"conversations": 50, "messages": 200}
+        conversations = pq.ParquetFile(str(tmp_path / "conversations.parquet"))
+        messages = pq.ParquetFile(str(tmp_path / "messages.parquet"))
+        assert conversations.metadata.num_row_groups == 3
+        assert messages.metadata.num_row_groups == 10
+
+        table = conversations.read()
+        for column in ("bot", "category"):
+            assert pa.types.is_dictionary(table.schema.field(column).type)
+        assert pa.types.is_dictionary(messages.schema_arrow.field("role").type)
+        assert pa.types.is_timestamp(table.schema.field("created_at").type)
+        assert set(table.column("bot").to_pylist()) == {"Claude", "GPT-4", "Gemini"}
+
+    def test_filters_apply(self, filled_db, tmp_path):
+        stats = ColumnarExporter(filled_db).export(str(tmp_path), bot="Claude")
+        assert stats["conversations"] == 17
+
+    def test_smaller_than_csv(self, filled_db, tmp_path):
+        ColumnarExporter(filled_db).export(str(tmp_path / "columnar"))
+        ConversationExporter(filled_db).export_from_database(str(tmp_path / "out.csv"), "csv")
+
+        columnar_size = sum(p.stat().st_size for p in (tmp_path / "columnar").iterdir())
+        assert columnar_size < (tmp_path / "out.csv").stat().st_size
+
+    def test_unsupported_format(self, filled_db, tmp_path):
+        with pytest.raises(ValueError):
+            ColumnarExporter(filled_db).export(str(tmp_path), format="orc")
+
+
+class TestColumnarImport:
+    """Test importing columnar exports back into a database."""
+
+    @pytest.mark.parametrize("format", ["parquet", "feather"])
+    def test_round_trip(self, filled_db, other_db, tmp_path, format):
+        ColumnarExporter(filled_db).export(str(tmp_path), format=format, row_group_size=7)
+
+        stats = ColumnarImporter(other_db).import_path(str(tmp_path), batch_size=16)
+
+        assert stats == {"conversations": 50, "messages": 200}
+        original = filled_db.get_conversation("conv_00007")
+        imported = other_db.get_conversation("conv_00007")
+        assert imported == original
+        assert other_db.search_messages("sorting", limit=500)
+        assert {b["id"]: b["conversation_count"] for b in other_db.get_bots()} == {
+            "Claude": 17, "GPT-4": 17, "Gemini": 16
+        }
+
+    def test_timestamps_in_any_stored_form(self, temp_db, tmp_path):
+        conversation = chat(1, messages=2)
+        conversation["created_at"] = "2024/01/02"
+        conversation["updated_at"] = 1704189600  # 2024-01-02T10:00:00Z in epoch seconds
+        conversation["messages"][0]["timestamp"] = "2024-01-02 10:00:00"
+        temp_db.save_conversations_bulk([conversation])
+
+        ColumnarExporter(temp_db).export(str(tmp_path))
+
+        row = pq.read_table(tmp_path / "conversations.parquet").to_pylist()[0]
+        assert row["created_at"].isoformat() == "2024-01-02T00:00:00+00:00"
+        assert row["updated_at"].isoformat() == "2024-01-02T10:00:00+00:00"
+        message = pq.read_table(tmp_path / "messages.parquet").to_pylist()[0]
+        assert message["timestamp"].isoformat() == "2024-01-02T10:00:00+00:00"
+
+    def test_missing_tables(self, other_db, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ColumnarImporter(other_db).import_path(str(tmp_path))
+
+
+class TestBulkSave:
+    """Test Database.save_conversations_bulk."""
+
+    def test_replaces_existing_conversations(self, temp_db):
+        temp_db.save_conversations_bulk([chat(1, messages=4)])
+        temp_db.save_conversations_bulk([chat(1, messages=2)])
+
+        with temp_db._get_connection() as conn:
+            messages = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+            indexed = conn.execute("SELECT COUNT(*) FROM messages_fts").fetchone()[0]
+        assert messages == indexed == 2
+        assert temp_db.get_conversation("conv_00001")["message_count"] == 2
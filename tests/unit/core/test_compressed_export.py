@@ -0,0 +1,137 @@
+"""Tests for compressed and split exports."""
+
+import gzip
+import hashlib
+import json
+import lzma
+
+import pytest
+
+from poe_search.export.compression import ZSTD_AVAILABLE, compressed_path, part_path
+from poe_search.export.exporter import ConversationExporter
+from tests.conftest import make_conversation
+
+
+def noise(seed, size):
+    """Hex text that compresses about as well as real prose."""
+    digest = hashlib.sha256(seed.encode()).hexdigest()
+    blocks = [hashlib.sha256(f"{digest}{i}".encode()).hexdigest() for i in range(size // 64 + 1)]
+    return "".join(blocks)[:size]
+
+
+def chat(index, content_size=200):
+    return make_conversation(
+        index, "2024-01-01T10:00:00", "2024-01-02T10:00:00",
+        bot="Claude" if index % 2 else "GPT-4",
+        width=6,
+        messages=[
+            ("user" if m % 2 == 0 else "bot",
+             f"Message {m} about export archives " + noise(f"{index}_{m}", content_size))
+            for m in range(2)
+        ],
+    )
+
+
+def fill_database(db, count, **kwargs):
+    db.save_conversations_bulk(chat(i, **kwargs) for i in range(count))
+
+DECOMPRESS = {"gzip": gzip.decompress, "xz": lzma.decompress}
+
+
+def decompress_parts(paths, compression):
+    return b"".join(DECOMPRESS[compression](path.read_bytes()) for path in paths)
+
+
+class TestPaths:
+    """Test output naming."""
+
+    def test_suffix_appended_once(self):
+        assert compressed_path("out.json", "gzip").name == "out.json.gz"
+        assert compressed_path("out.json.gz", "gzip").name == "out.json.gz"
+        assert compressed_path("out.json", None).name == "out.json"
+
+    def test_part_numbers_before_extension(self, tmp_path):
+        assert part_path(tmp_path / "out.ndjson.zst", "zstd", 2).name == "out.part002.ndjson.zst"
+        assert part_path(tmp_path / "out.csv", None, 1).name == "out.part001.csv"
+
+    def test_unknown_compression(self, temp_db, tmp_path):
+        with pytest.raises(ValueError):
+            ConversationExporter(temp_db).export([], str(tmp_path / "out.json"), compression="lz4")
+
+
+class TestCompressedExport:
+    """Test that every format round-trips through compression."""
+
+    @pytest.mark.parametrize("compression", ["gzip", "xz"])
+    @pytest.mark.parametrize("format", ["json", "ndjson", "csv", "markdown"])
+    def test_matches_uncompressed(self, temp_db, tmp_path, compression, format):
+        conversations = [chat(i) for i in range(20)]
+        exporter = ConversationExporter(temp_db)
+        exporter.export(conversations, str(tmp_path / f"plain.{format}"), format)
+        plain = (tmp_path / f"plain.{format}").read_bytes()
+
+        count = exporter.export(
+            iter(conversations), str(tmp_path / f"out.{format}"), format,
+            count=20, compression=compression,
+        )
+
+        assert count == 20
+        assert [p.name for p in exporter.output_paths] == [
+            compressed_path(f"out.{format}", compression).name
+        ]
+        data = decompress_parts(exporter.output_paths, compression)
+        if format in ("json", "markdown"):
+            # Only the export timestamp line may differ
+            assert len(data.splitlines()) == len(plain.splitlines())
+            assert data.splitlines()[3:] == plain.splitlines()[3:]
+        else:
+            assert data == plain
+        assert exporter.output_paths[0].stat().st_size < len(plain) / 2
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_zstd_multithreaded(self, temp_db, tmp_path):
+        import zstandard
+
+        fill_database(temp_db, 200)
+        exporter = ConversationExporter(temp_db)
+        exporter.export_from_database(str(tmp_path / "out.ndjson"), "ndjson", compression="zstd")
+
+        path = exporter.output_paths[0]
+        assert path.name == "out.ndjson.zst"
+        with zstandard.ZstdDecompressor().stream_reader(open(path, "rb")) as reader:
+            lines = reader.read().decode("utf-8").splitlines()
+        assert len(lines) == 200
+
+    def test_empty_export_is_valid_archive(self, temp_db, tmp_path):
+        exporter = ConversationExporter(temp_db)
+        exporter.export([], str(tmp_path / "empty.ndjson"), "ndjson", compression="gzip")
+        assert gzip.decompress(exporter.output_paths[0].read_bytes()) == b""
+
+
+class TestSplitExport:
+    """Test size-bounded parts."""
+
+    @pytest.mark.parametrize("compression", ["gzip", "xz", None])
+    def test_parts_concatenate_to_export(self, temp_db, tmp_path, compression):
+        fill_database(temp_db, 300, content_size=2000)
+        exporter = ConversationExporter(temp_db)
+        exporter.export_from_database(str(tmp_path / "whole.ndjson"), "ndjson")
+        whole = (tmp_path / "whole.ndjson").read_bytes()
+
+        part_size = 64 * 1024 if compression else 256 * 1024
+        exporter.export_from_database(
+            str(tmp_path / "split.ndjson"), "ndjson",
+            compression=compression, max_part_size=part_size,
+        )
+
+        paths = exporter.output_paths
+        assert len(paths) > 1
+        assert paths[0].name.startswith("split.part001.ndjson")
+        if compression:
+            assert decompress_parts(paths, compression) == whole
+            # Every part is a complete stream on its own
+            json.loads(DECOMPRESS[compression](paths[0].read_bytes()).splitlines()[0])
+        else:
+            assert b"".join(p.read_bytes() for p in paths) == whole
+        # Bounded up to what the compressor and write buffer still held
+        assert all(p.stat().st_size <= part_size * 3 for p in paths[:-1])
@@ -0,0 +1,224 @@
+"""Tests for the shared in-memory conversation catalog."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from poe_search.gui.catalog import ConversationCatalog
+from poe_search.gui.conversation_manager import ConversationManager
+from tests.conftest import make_conversation
+
+BASE = datetime(2024, 3, 4, 10, 0, tzinfo=timezone.utc)
+
+
+def timeit(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def chat(index, bot="Claude", category=None, **fields):
+    fields.setdefault("created_at", BASE + timedelta(days=index))
+    fields.setdefault("updated_at", BASE + timedelta(days=index % 3))
+    return make_conversation(
+        index, bot=bot, category=category, width=3, messages=[("user", "hi")] * (index % 4), **fields
+    )
+
+
+@pytest.fixture
+def conversations():
+    return [
+        chat(
+            i,
+            bot="GPT-4" if i % 3 == 0 else "Claude",
+            category="Technical" if i % 4 == 0 else None,
+        )
+        for i in range(20)
+    ]
+
+
+@pytest.fixture
+def catalog(conversations):
+    return ConversationCatalog(conversations)
+
+
+class TestCatalog:
+    """Test column storage, selection and sorting."""
+
+    def test_rows_are_the_given_dicts(self, catalog, conversations):
+        assert len(catalog) == 20
+        assert catalog.get("conv_005") is conversations[5]
+        assert all(a is b for a, b in zip(catalog.view(), conversations))
+        assert catalog.value(5, "message_count") == 1
+        assert catalog.value(5, "category") is None
+
+    def test_strings_are_encoded_once(self, catalog):
+        assert len(catalog._strings["bot"]) == 3  # Missing, Claude, GPT-4
+        assert catalog.counts("bot") == {"GPT-4": 7, "Claude": 13}
+        assert catalog.counts("category") == {"Technical": 5, None: 15}
+
+    def test_select(self, catalog, conversations):
+        rows = catalog.select(bot="GPT-4", category="Technical")
+        assert catalog.view(rows).ids() == ["conv_000", "conv_012"]
+        assert len(catalog.select(category="Uncategorized")) == 15
+        assert len(catalog.select(bot="Nobody")) == 0
+
+        rows = catalog.select(start=BASE + timedelta(days=5), end=BASE + timedelta(days=7))
+        assert catalog.view(rows).ids() == ["conv_005", "conv_006", "conv_007"]
+        assert catalog.view(catalog.select(title="conversation 1")).ids()[:2] == ["conv_001", "conv_010"]
+
+    def test_select_within_rows(self, catalog):
+        rows = catalog.select(bot="Claude")
+        assert list(catalog.select(category="Technical", rows=rows)) == [4, 8, 16]
+
+    @pytest.mark.parametrize("key", ["updated_ts", "created_ts", "message_count", "bot", "category", "title"])
+    @pytest.mark.parametrize("descending", [True, False])
+    def test_sort_matches_python(self, catalog, conversations, key, descending):
+        rows = catalog.sort(range(len(catalog)), key, descending)
+
+        def value(row):
+            return catalog.value(row, key)
+
+        present = sorted((r for r in range(20) if value(r) is not None), key=value, reverse=descending)
+        missing = [r for r in range(20) if value(r) is None]
+        expected = present + missing if descending else missing + present
+        # Stable: equal values keep catalog order
+        assert [value(r) for r in rows] == [value(r) for r in expected]
+        assert sorted(rows) == list(range(20))
+
+    def test_sort_by_function(self, catalog):
+        rows = catalog.sort(range(len(catalog)), lambda c: c["title"], descending=True)
+        assert catalog.conversation_id(rows[0]) == "conv_009"
+
+    def test_search_result_timestamps(self):
+        catalog = ConversationCatalog([{"id": "a", "ts": 1000}, {"id": "b", "created_ts": 5, "ts": 2000}])
+        assert catalog.value(0, "created_ts") == 1000
+        assert catalog.value(1, "created_ts") == 5
+        assert catalog.value(0, "updated_ts") is None
+
+    def test_defaults(self):
+        catalog = ConversationCatalog([{"id": "a"}, {"id": "b", "bot": ""}], defaults={"bot": "Assistant"})
+        assert catalog.counts("bot") == {"Assistant": 2}
+
+
+class TestChanges:
+    """Test change notifications and updates."""
+
+    def test_notifications(self, catalog):
+        changes = []
+        catalog.subscribe(changes.append)
+
+        catalog.set_category(["conv_001", "missing"], "Coding")
+        catalog.upsert([chat(1, bot="Gemini"), chat(30)])
+        catalog.remove(["conv_002"])
+        catalog.load([])
+
+        assert [(c.kind, c.ids) for c in changes] == [
+            ("update", ("conv_001",)),
+            ("update", ("conv_001", "conv_030")),
+            ("remove", ("conv_002",)),
+            ("reset", ()),
+        ]
+
+        catalog.unsubscribe(changes.append)
+        catalog.load([chat(1)])
+        assert len(changes) == 4
+
+    def test_set_category_updates_dict(self, catalog, conversations):
+        catalog.set_category(["conv_001"], "Coding")
+        assert conversations[1]["category"] == "Coding"
+        assert catalog.view(catalog.select(category="Coding")).ids() == ["conv_001"]
+
+    def test_upsert_and_remove(self, catalog):
+        catalog.upsert([chat(1, bot="Gemini"), chat(30)])
+        assert len(catalog) == 21
+        assert catalog.value(catalog.row_of("conv_001"), "bot") == "Gemini"
+
+        catalog.remove(["conv_000", "conv_030"])
+        assert len(catalog) == 19
+        assert "conv_000" not in catalog
+        assert catalog.row_of("conv_001") == 0
+        assert catalog.view(catalog.select(bot="Gemini")).ids() == ["conv_001"]
+
+    def test_bound_listener_held_weakly(self, catalog):
+        class Widget:
+            def __init__(self):
+                self.changes = 0
+
+            def on_changed(self, change):
+                self.changes += 1
+
+        widget = Widget()
+        catalog.subscribe(widget.on_changed)
+        catalog.load([])
+        assert widget.changes == 1
+
+        del widget
+        catalog.load([])
+        assert catalog._listeners == []
+
+
+class TestIndexes:
+    """Test the bot, category and day indexes."""
+
+    FILTERS = [
+        {"bot": "GPT-4"},
+        {"category": "Technical"},
+        {"category": "Uncategorized"},
+        {"bot": "Claude", "category": "Technical"},
+        {"start": BASE + timedelta(days=3, hours=1), "end": BASE + timedelta(days=9)},
+        {"bot": "GPT-4", "start": BASE + timedelta(days=6)},
+        {"end": BASE + timedelta(days=2)},
+        {"bot": "Nobody"},
+    ]
+
+    def assert_indexes_match_scan(self, catalog):
+        for filters in self.FILTERS:
+            scanned = catalog.select(rows=range(len(catalog)), **filters)
+            assert list(catalog.select(**filters)) == list(scanned), filters
+
+    def test_indexed_select_matches_scan(self, catalog):
+        self.assert_indexes_match_scan(catalog)
+
+    def test_indexes_follow_changes(self, catalog):
+        catalog.set_category(["conv_000", "conv_001"], "Personal")
+        catalog.upsert([
+            chat(3, bot="Claude", created_at=(BASE + timedelta(days=40)).isoformat()),
+            chat(50, bot="GPT-4", category="Technical"),
+        ])
+        self.assert_indexes_match_scan(catalog)
+
+        catalog.remove(["conv_004", "conv_012"])
+        self.assert_indexes_match_scan(catalog)
+        assert catalog.view(catalog.select(bot="GPT-4", category="Technical")).ids() == ["conv_050"]
+        assert catalog.view(catalog.select(category="Personal")).ids() == ["conv_000", "conv_001"]
+
+    def test_bulk_lookup(self):
+        catalog = ConversationCatalog(chat(i) for i in range(5000))
+        ids = [f"conv_{i:03d}" for i in range(4999, -1, -2)] + ["missing"]
+        found = catalog.get_many(ids)
+        assert [c["id"] for c in found] == ids[:-1]
+
+    def test_rare_bot_select_is_not_a_scan(self):
+        catalog = ConversationCatalog(
+            chat(i, bot="Rare" if i % 1000 == 0 else "Claude") for i in range(50000)
+        )
+        scan = timeit(lambda: catalog.select(rows=range(len(catalog)), bot="Rare"))
+        indexed = timeit(lambda: catalog.select(bot="Rare"))
+        assert catalog.view(catalog.select(bot="Rare")).ids()[:2] == ["conv_000", "conv_1000"]
+        assert indexed * 10 < scan
+
+
+def test_manager_filters_without_copying(conversations):
+    manager = ConversationManager(ConversationCatalog())
+    manager.set_conversations(conversations)
+
+    filtered = manager.filter_conversations(search_text="conversation 1", bot_filter="🤖 GPT-4")
+    assert filtered.ids() == ["conv_012", "conv_015", "conv_018"]
+    assert filtered[0] is conversations[12]
+    assert manager.get_conversations() is filtered
+    assert manager.get_conversation_by_id("conv_003") is conversations[3]
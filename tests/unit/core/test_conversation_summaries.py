@@ -0,0 +1,106 @@
+"""Tests for keyset-paged conversation summaries."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from poe_search.storage.database import SUMMARY_COLUMNS, SUMMARY_SORT_KEYS
+from tests.conftest import make_conversation
+
+BASE = datetime(2024, 3, 4, 10, 0, tzinfo=timezone.utc)
+
+
+def chat(index, bot="Claude", category=None, title=None, updated_at=None):
+    return make_conversation(
+        index, BASE + timedelta(hours=index), updated_at or BASE + timedelta(days=index % 11),
+        bot=bot,
+        title=f"Conversation {index % 7}" if title is None else title,
+        category=category,
+        width=3,
+        messages=index % 5,
+    )
+
+
+@pytest.fixture
+def database(temp_db):
+    conversations = [
+        chat(
+            i,
+            bot="GPT-4" if i % 3 == 0 else "Claude",
+            category="Technical" if i % 4 == 0 else None,
+        )
+        for i in range(60)
+    ]
+    # Missing sort values must still be paged through
+    conversations += [chat(100 + i, updated_at="not a date") for i in range(4)]
+    conversations.append(chat(200, title=""))
+    temp_db.save_conversations_bulk(conversations)
+    return temp_db
+
+
+def all_pages(database, page_size, sort, descending, **filters):
+    rows, after = [], None
+    while True:
+        page = database.get_conversation_summaries(
+            sort=sort, descending=descending, limit=page_size, after=after, **filters
+        )
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        after = (page[-1][sort], page[-1]["id"])
+
+
+def expected_order(database, sort, descending, **filters):
+    conversations = database.get_conversations(**filters)
+    present = sorted(
+        (c for c in conversations if c.get(sort) is not None),
+        key=lambda c: (c[sort], c["id"]),
+        reverse=descending,
+    )
+    missing = sorted(
+        (c for c in conversations if c.get(sort) is None),
+        key=lambda c: c["id"],
+        reverse=descending,
+    )
+    ordered = present + missing if descending else missing + present
+    return [c["id"] for c in ordered]
+
+
+class TestSummaryPaging:
+    """Test that pages cover the result set exactly once, in order."""
+
+    @pytest.mark.parametrize("sort", SUMMARY_SORT_KEYS)
+    @pytest.mark.parametrize("descending", [True, False])
+    def test_pages_match_full_sort(self, database, sort, descending):
+        rows = all_pages(database, 9, sort, descending)
+        assert [r["id"] for r in rows] == expected_order(database, sort, descending)
+        assert len(rows) == 65
+
+    def test_filters(self, database):
+        rows = all_pages(database, 4, "updated_ts", True, bot="GPT-4", category="Technical")
+        assert [r["id"] for r in rows] == expected_order(
+            database, "updated_ts", True, bot="GPT-4", category="Technical"
+        )
+        assert {r["bot"] for r in rows} == {"GPT-4"}
+        assert len(rows) == database.count_conversations(bot="GPT-4", category="Technical")
+
+    def test_only_summary_columns(self, database):
+        row = database.get_conversation_summaries(limit=1)[0]
+        assert tuple(row) == SUMMARY_COLUMNS
+        assert "messages" not in row
+
+    def test_invalid_sort(self, database):
+        with pytest.raises(ValueError):
+            database.get_conversation_summaries(sort="data")
+
+    def test_default_page_uses_index(self, database):
+        with database._get_connection() as conn:
+            plan = " ".join(
+                row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT id FROM conversations WHERE 1=1"
+                    " AND ((updated_ts, id) < (?, ?) OR updated_ts IS NULL)"
+                    " ORDER BY updated_ts DESC, id DESC LIMIT 10",
+                    [0, ""],
+                )
+            )
+        assert "idx_conversations_updated_ts" in plan
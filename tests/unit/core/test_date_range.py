@@ -0,0 +1,139 @@
+"""Tests for date range paging and the date histogram."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from poe_search.search.engine import SearchEngine
+from tests.conftest import make_conversation
+
+BASE = datetime(2024, 3, 4, 10, 0, tzinfo=timezone.utc)  # A Monday
+
+
+def chat(index, created_at, bot="Claude"):
+    # Update order is unrelated to creation order
+    return make_conversation(index, created_at, BASE + timedelta(days=1000 - index), bot=bot, width=3)
+
+
+@pytest.fixture
+def database(temp_db):
+    conversations = [
+        chat(i, BASE + timedelta(hours=6 * i), bot="GPT-4" if i % 3 == 0 else "Claude")
+        for i in range(40)
+    ]
+    # Same creation time: pages must still be disjoint
+    conversations += [chat(100 + i, BASE + timedelta(days=2)) for i in range(5)]
+    # Far in the past, behind many recently updated conversations
+    conversations.append(chat(200, datetime(2020, 1, 1, tzinfo=timezone.utc)))
+    conversations.append({**chat(201, BASE), "created_at": "not a date"})
+    temp_db.save_conversations_bulk(conversations)
+    return temp_db
+
+
+def all_pages(database, page_size, **kwargs):
+    pages, after = [], None
+    while True:
+        page = database.get_conversations_by_date(limit=page_size, after=after, **kwargs)
+        if not page:
+            return pages
+        pages.append([c["id"] for c in page])
+        after = (page[-1]["created_ts"], page[-1]["id"])
+
+
+class TestKeysetPaging:
+    """Test range queries with keyset pagination."""
+
+    @pytest.mark.parametrize("ascending", [False, True])
+    def test_pages_cover_range_once(self, database, ascending):
+        pages = all_pages(database, 7, ascending=ascending)
+        ids = [conversation_id for page in pages for conversation_id in page]
+
+        expected = sorted(
+            (c["created_ts"], c["id"])
+            for c in database.get_conversations()
+            if c["created_ts"] is not None
+        )
+        if not ascending:
+            expected.reverse()
+        assert ids == [conversation_id for _, conversation_id in expected]
+        assert len(ids) == 46
+        assert all(len(page) == 7 for page in pages[:-1])
+
+    def test_range_and_bot(self, database):
+        start, end = BASE + timedelta(days=1), BASE + timedelta(days=3)
+        ids = [
+            c["id"]
+            for c in database.get_conversations_by_date(start=start, end=end, bot="GPT-4", limit=100)
+        ]
+        assert ids == ["conv_012", "conv_009", "conv_006"]
+
+    def test_past_range_found(self, database):
+        engine = SearchEngine(database)
+        results = engine.search_by_date_range(
+            datetime(2019, 1, 1, tzinfo=timezone.utc), datetime(2021, 1, 1, tzinfo=timezone.utc)
+        )
+        assert [r["id"] for r in results] == ["conv_200"]
+        assert results[0]["date"] == "2020-01-01"
+
+    def test_engine_paging(self, database):
+        engine = SearchEngine(database)
+        first = engine.search_by_date_range(BASE, BASE + timedelta(days=30), limit=5, ascending=True)
+        second = engine.search_by_date_range(
+            BASE, BASE + timedelta(days=30), limit=5, ascending=True,
+            after=(first[-1]["created_ts"], first[-1]["id"]),
+        )
+        assert [c["id"] for c in first] == ["conv_000", "conv_001", "conv_002", "conv_003", "conv_004"]
+        assert second[0]["id"] == "conv_005"
+
+    def test_page_query_uses_index(self, database):
+        where, params = database._conversation_filters(start=BASE)
+        with database._get_connection() as conn:
+            plan = " ".join(
+                row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM conversations" + where
+                    + " AND (created_ts, id) < (?, ?) ORDER BY created_ts DESC, id DESC LIMIT 10",
+                    params + [0, ""],
+                )
+            )
+        assert "idx_conversations_created_ts" in plan
+        assert "USE TEMP B-TREE FOR ORDER BY" not in plan
+
+
+class TestHistogram:
+    """Test the date histogram."""
+
+    def test_day_buckets(self, database):
+        histogram = database.get_date_histogram(start=BASE, end=BASE + timedelta(days=3, hours=23))
+        assert [(b["label"], b["count"]) for b in histogram] == [
+            ("2024-03-04", 3),  # 10:00, 16:00, 22:00
+            ("2024-03-05", 4),
+            ("2024-03-06", 9),  # Includes the five created at the same instant
+            ("2024-03-07", 4),
+            ("2024-03-08", 1),  # 04:00, before the 09:00 end
+        ]
+        assert histogram[0]["start_ts"] == int(datetime(2024, 3, 4, tzinfo=timezone.utc).timestamp() * 1000)
+
+    @pytest.mark.parametrize("bucket, expected", [
+        ("week", [("2019-12-30", 1), ("2024-03-04", 32), ("2024-03-11", 13)]),
+        ("month", [("2020-01", 1), ("2024-03", 45)]),
+        ("year", [("2020", 1), ("2024", 45)]),
+    ])
+    def test_coarse_buckets(self, database, bucket, expected):
+        histogram = database.get_date_histogram(bucket=bucket)
+        assert [(b["label"], b["count"]) for b in histogram] == expected
+
+    def test_hour_buckets_and_bot(self, database):
+        histogram = SearchEngine(database).date_histogram(
+            BASE, BASE + timedelta(days=1), bucket="hour", bot="GPT-4"
+        )
+        assert [(b["label"], b["count"]) for b in histogram] == [
+            ("2024-03-04 10:00", 1),
+            ("2024-03-05 04:00", 1),
+        ]
+
+    def test_total_matches_count(self, database):
+        assert sum(b["count"] for b in database.get_date_histogram(bucket="month")) == 46
+
+    def test_invalid_bucket(self, database):
+        with pytest.raises(ValueError):
+            database.get_date_histogram(bucket="minute")
@@ -0,0 +1,143 @@
+"""Tests for importing exports back into the database."""
+
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from poe_search.export.exporter import ConversationExporter
+from poe_search.export.importer import ConversationImporter, detect_format, iter_json_conversations
+from poe_search.export.sharded import ShardedExporter
+from poe_search.storage.database import Database
+from tests.conftest import make_conversation
+
+
+def chat(index, updated_at="2024-01-02T10:00:00"):
+    return make_conversation(
+        index, updated_at=updated_at, bot=["Claude", "GPT-4"][index % 2],
+        title=f"Conversation {index} \"quoted\" ünïcode", width=5,
+        messages=[(role, f"Message {m} about recursion [1, 2] {{braces}}")
+                  for m, role in enumerate(["user", "bot"])],
+    )
+
+
+@pytest.fixture
+def source_db(temp_db):
+    temp_db.save_conversations_bulk(chat(i) for i in range(40))
+    return temp_db
+
+
+@pytest.fixture
+def target_db():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = f.name
+    yield Database(f"sqlite:///{db_path}")
+    Path(db_path).unlink(missing_ok=True)
+
+
+class TestIncrementalJSON:
+    """Test the stdlib streaming JSON parser."""
+
+    def test_tiny_chunks(self):
+        document = {"exported_at": "now", "conversation_count": 3,
+                    "conversations": [chat(i) for i in range(3)], "trailer": 1.5}
+        text = json.dumps(document, indent=2, ensure_ascii=False)
+
+        conversations = list(iter_json_conversations(io.StringIO(text), chunk_size=7))
+
+        assert conversations == document["conversations"]
+
+    def test_bare_array_and_empty(self):
+        assert [c["id"] for c in iter_json_conversations(io.StringIO('[{"id": 1}, {"id": 2}]'))] == [1, 2]
+        assert list(iter_json_conversations(io.StringIO('{"conversations": []}'))) == []
+
+    def test_truncated_document(self):
+        with pytest.raises(ValueError):
+            list(iter_json_conversations(io.StringIO('{"conversations": [{"id": 1}, {"id"'), chunk_size=4))
+
+
+class TestRoundTrip:
+    """Test export -> import round trips."""
+
+    @pytest.mark.parametrize("format,compression", [
+        ("json", None), ("ndjson", None), ("json", "gzip"), ("ndjson", "xz"),
+    ])
+    def test_round_trip(self, source_db, target_db, tmp_path, format, compression):
+        exporter = ConversationExporter(source_db)
+        exporter.export_from_database(str(tmp_path / f"out.{format}"), format, compression=compression)
+
+        progress = []
+        stats = ConversationImporter(target_db).import_paths(
+            exporter.output_paths, batch_size=16,
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+        assert stats == {"read": 40, "imported": 40, "skipped": 0, "messages": 80}
+        assert target_db.get_conversation("conv_00007") == source_db.get_conversation("conv_00007")
+        assert len(target_db.search_messages("recursion", limit=500)) == 80
+        read, bytes_read, total_bytes = progress[-1]
+        assert read == 40 and bytes_read == total_bytes > 0
+
+    def test_split_parts(self, source_db, target_db, tmp_path):
+        exporter = ConversationExporter(source_db)
+        exporter.export_from_database(
+            str(tmp_path / "out.json"), "json", max_part_size=4096
+        )
+        assert len(exporter.output_paths) > 1
+
+        # Any one part brings in the whole export
+        stats = ConversationImporter(target_db).import_paths([exporter.output_paths[1]])
+        assert stats["imported"] == 40
+
+    def test_sharded_directory(self, source_db, target_db, tmp_path):
+        ShardedExporter(source_db).export(str(tmp_path), format="ndjson", shard_by="bot")
+
+        assert detect_format(tmp_path) == "sharded"
+        assert ConversationImporter(target_db).import_paths([tmp_path])["imported"] == 40
+
+    def test_sharded_markdown_rejected(self, source_db, target_db, tmp_path):
+        ShardedExporter(source_db).export(str(tmp_path), format="markdown", shard_by="bot")
+        with pytest.raises(ValueError):
+            ConversationImporter(target_db).import_paths([tmp_path])
+
+
+class TestConflictPolicies:
+    """Test replace, skip and newer."""
+
+    def _import(self, db, tmp_path, conversations, on_conflict):
+        path = tmp_path / "in.ndjson"
+        path.write_text("\n".join(json.dumps(c) for c in conversations), encoding="utf-8")
+        return ConversationImporter(db).import_paths([path], on_conflict=on_conflict)
+
+    @pytest.mark.parametrize("on_conflict,expected_title,imported", [
+        ("replace", "Older copy", 2),
+        ("skip", "Conversation 1 \"quoted\" ünïcode", 1),
+        ("newer", "Conversation 1 \"quoted\" ünïcode", 1),
+    ])
+    def test_policies(self, source_db, tmp_path, on_conflict, expected_title, imported):
+        older = chat(1, updated_at="2023-12-01T00:00:00")
+        older["title"] = "Older copy"
+        stats = self._import(source_db, tmp_path, [older, chat(100)], on_conflict)
+
+        assert stats["imported"] == imported
+        assert stats["skipped"] == 2 - imported
+        assert source_db.get_conversation("conv_00001")["title"] == expected_title
+        assert source_db.get_conversation("conv_00100") is not None
+
+    def test_newer_replaces(self, source_db, tmp_path):
+        newer = chat(1, updated_at="2024-06-01T00:00:00")
+        newer["messages"] = newer["messages"][:1]
+        stats = self._import(source_db, tmp_path, [newer], "newer")
+
+        assert stats["imported"] == 1
+        with source_db._get_connection() as conn:
+            count = conn.execute(
+                "SELECT COUNT(*) FROM messages_fts WHERE conversation_id = 'conv_00001'"
+            ).fetchone()[0]
+        assert count == 1
+
+    def test_unknown_policy(self, source_db):
+        with pytest.raises(ValueError):
+            source_db.save_conversations_bulk([], on_conflict="merge")
@@ -0,0 +1,58 @@
+"""Tests that local commands start without importing the heavy optional stacks."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import poe_search
+
+pytest.importorskip("click")
+pytest.importorskip("rich")
+
+# Browser, GUI and network clients, and the optional export/learning stacks
+HEAVY_MODULES = ("selenium", "PyQt6", "httpx", "fastapi_poe", "sklearn", "scipy", "pyarrow")
+
+# Cumulative import time, in seconds, with generous headroom for slow machines
+BUDGETS = {"poe_search.client": 0.5, "poe_search.cli": 1.0}
+
+
+def import_profile(module):
+    """Import a module in a fresh interpreter; return its import times and modules."""
+    env = dict(os.environ, PYTHONPATH=str(Path(poe_search.__file__).parents[1]))
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    # The first run compiles bytecode, which would count against the budget
+    subprocess.run([sys.executable, "-c", f"import {module}"], env=env, check=True)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative) / 1e6
+    return times, set(result.stdout.split())
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_startup_imports(module):
+    times, modules = import_profile(module)
+    heavy = sorted({name.split(".")[0] for name in modules} & set(HEAVY_MODULES))
+    assert heavy == []
+
+    print(f"\n{module}: {times[module]:.3f} s")
+    assert times[module] < BUDGETS[module]
+
+
+def test_api_client_is_resolved_lazily():
+    import poe_search.client
+
+    assert "PoeAPIClient" not in vars(poe_search.client)
+    from poe_search.api.client import PoeAPIClient
+
+    assert poe_search.client.PoeAPIClient is PoeAPIClient
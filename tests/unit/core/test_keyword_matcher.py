@@ -0,0 +1,98 @@
+"""Tests for the compiled multi-keyword matcher."""
+
+import random
+import time
+
+import pytest
+
+from poe_search.search import KeywordMatcher
+
+# Overlapping on purpose: prefixes, keywords inside keywords, shared suffixes
+GROUPS = {
+    "Technical": ["code", "programming", "python", "api", "git", "github", "debug", "error", "data structure"],
+    "Creative": ["art", "artistic", "creative", "creative writing", "write", "music", "design"],
+    "Education": ["study", "learn", "research", "math", "history", "lesson"],
+    "Business": ["business", "market", "marketing", "sales", "career", "work", "research"],
+    "Entertainment": ["music", "game", "gaming", "movie", "tv", "show"],
+}
+
+FILLER = ("the a of and to in is it you that was for on are with as they be at one have this from "
+          "or had by hot word but what some we can out other were all there when up use your how").split()
+
+
+def naive_counts(groups, text):
+    """What the rules computed before: one substring test per keyword."""
+    counts = {}
+    for label, keywords in groups.items():
+        text_lower = text.lower()
+        matches = sum(1 for keyword in keywords if keyword.lower() in text_lower)
+        if matches:
+            counts[label] = matches
+    return counts
+
+
+def make_texts(count, seed=7):
+    rng = random.Random(seed)
+    keywords = [k for ks in GROUPS.values() for k in ks] + ["Python", "GitHub", "smart", "debugger", "gamer"]
+    texts = []
+    for _ in range(count):
+        words = [
+            rng.choice(keywords) if rng.random() < 0.08 else rng.choice(FILLER)
+            for _ in range(rng.randint(5, 40))
+        ]
+        texts.append(rng.choice(["", " ", "-"]).join(words))
+    return texts
+
+
+class TestKeywordMatcher:
+    """Test that one pass finds what per-keyword tests find."""
+
+    def test_counts_match_substring_tests(self):
+        matcher = KeywordMatcher(GROUPS)
+        for text in make_texts(3000):
+            assert matcher.counts(text) == naive_counts(GROUPS, text), text
+
+    def test_nested_and_overlapping_keywords(self):
+        matcher = KeywordMatcher(GROUPS)
+        assert matcher.found("Creative Writing, artistic") == {"creative", "creative writing", "art", "artistic"}
+        assert matcher.found("githubs") == {"git", "github"}
+        assert matcher.found("smartmarketing") == {"art", "market", "marketing"}
+
+    def test_first_follows_precedence(self):
+        matcher = KeywordMatcher(GROUPS)
+        assert matcher.first("some music") == "Creative"
+        assert matcher.first("a research paper") == "Education"
+        assert matcher.first("nothing here") is None
+
+    def test_keyword_in_several_groups(self):
+        matcher = KeywordMatcher({"a": ["x", "y"], "b": ["y"], "c": ["y", "y"]})
+        assert matcher.counts("Y") == {"a": 1, "b": 1, "c": 2}
+
+    def test_empty(self):
+        assert KeywordMatcher({}).counts("anything") == {}
+        assert KeywordMatcher({"a": [""]}).found("anything") == set()
+        assert KeywordMatcher(GROUPS).counts("") == {}
+
+    def test_special_characters(self):
+        matcher = KeywordMatcher({"lang": ["c++", "c#", ".net", "a.b"]})
+        assert matcher.found("I like C++ and .NET") == {"c++", ".net"}
+        assert matcher.found("axb") == set()
+
+
+@pytest.mark.parametrize("conversations", [100_000])
+def test_benchmark(conversations):
+    """Categorize 100k conversations: one pass against one test per keyword per rule."""
+    texts = make_texts(conversations, seed=11)
+    matcher = KeywordMatcher(GROUPS)
+
+    start = time.perf_counter()
+    expected = [naive_counts(GROUPS, text) for text in texts]
+    naive_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    counts = [matcher.counts(text) for text in texts]
+    matcher_time = time.perf_counter() - start
+
+    print(f"\n{conversations} conversations: per-keyword {naive_time:.2f}s, compiled {matcher_time:.2f}s")
+    assert counts == expected
+    assert matcher_time < naive_time
@@ -0,0 +1,79 @@
+"""Tests for paging the messages of a conversation."""
+
+import pytest
+
+from tests.conftest import make_conversation
+
+
+def chat(index, message_count):
+    return make_conversation(index, "2024-03-04T10:00:00Z", messages=[
+        # Same timestamp for all: order comes from the save order
+        {"role": "user" if position % 2 == 0 else "bot", "content": f"Message {position}",
+         "sender": "Reader" if position % 2 == 0 else None}
+        for position in range(message_count)
+    ])
+
+
+@pytest.fixture
+def database(temp_db):
+    temp_db.save_conversations_bulk([chat(1, 250), chat(2, 3)])
+    temp_db.save_conversation(chat(3, 0))
+    return temp_db
+
+
+def page_back(database, conversation_id, page_size):
+    pages, before = [], None
+    while True:
+        page = database.get_messages(conversation_id, limit=page_size, before=before)
+        if not page:
+            return pages
+        pages.append(page)
+        before = page[0]["seq"]
+
+
+class TestMessagePaging:
+    """Test reading messages newest page first."""
+
+    def test_pages_cover_conversation_in_order(self, database):
+        pages = page_back(database, "conv_1", 100)
+        assert [len(page) for page in pages] == [100, 100, 50]
+
+        messages = [message for page in reversed(pages) for message in page]
+        assert [m["content"] for m in messages] == [f"Message {i}" for i in range(250)]
+        assert pages[0][-1]["id"] == "conv_1_249"
+
+    def test_all_messages(self, database):
+        messages = database.get_messages("conv_2")
+        assert [m["id"] for m in messages] == ["conv_2_0", "conv_2_1", "conv_2_2"]
+        assert messages[0]["sender"] == "Reader"
+        assert messages[0]["ts"] is not None
+        assert database.get_messages("conv_3") == []
+
+    def test_count(self, database):
+        assert database.count_messages("conv_1") == 250
+        assert database.count_messages("conv_3") == 0
+        assert database.count_messages("missing") == 0
+
+    def test_resaved_conversation_keeps_order(self, database):
+        database.save_conversation(chat(2, 4))
+        assert [m["id"] for m in database.get_messages("conv_2")] == [
+            "conv_2_0", "conv_2_1", "conv_2_2", "conv_2_3"
+        ]
+
+    def test_page_uses_index(self, database):
+        with database._get_connection() as conn:
+            plan = " ".join(
+                row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT rowid AS seq, * FROM messages"
+                    " WHERE conversation_id = ? AND rowid < ? ORDER BY rowid DESC LIMIT 100",
+                    ["conv_1", 1000],
+                )
+            )
+        assert "idx_messages_conversation_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_summary_by_id(database):
+    summaries = database.get_conversation_summaries(conversation_id="conv_2", limit=1)
+    assert [s["id"] for s in summaries] == ["conv_2"]
+    assert summaries[0]["message_count"] == 3
@@ -0,0 +1,191 @@
+"""Tests for the daily analytics rollups."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from functools import partial
+
+import pytest
+
+from poe_search.storage.database import Database
+from tests.conftest import make_conversation
+
+
+chat = partial(make_conversation, category="Programming", messages=[("user", "Hello"), ("bot", "Hi there")])
+
+
+CONVERSATIONS = [
+    chat(1, "2024-03-04T09:00:00"),
+    chat(2, "2024-03-04T23:30:00Z", bot="GPT-4", messages=[("user", "abc")]),
+    chat(3, "2024-03-10T10:00:00", category=None),
+    chat(4, "2024-04-02T10:00:00", bot="GPT-4", category="Writing"),
+    chat(5, "2023-06-01T10:00:00", bot="Gemini"),
+    chat(6, "not a date", bot="Gemini"),
+]
+
+
+def rollup_rows(database):
+    with database._get_connection() as conn:
+        return conn.execute(
+            "SELECT day, bot, category, conversations, messages, user_messages, characters "
+            "FROM daily_rollups ORDER BY day, bot, category"
+        ).fetchall()
+
+
+@pytest.fixture
+def database(temp_db):
+    temp_db.save_conversations_bulk(CONVERSATIONS)
+    return temp_db
+
+
+class TestRollupMaintenance:
+    """Test that the rollups follow every write path."""
+
+    def test_bulk_insert_matches_rebuild(self, database):
+        incremental = [tuple(row) for row in rollup_rows(database)]
+        assert database.rebuild_rollups() == len(incremental)
+        assert [tuple(row) for row in rollup_rows(database)] == incremental
+
+    def test_totals(self, database):
+        totals = database.get_rollups()
+        # The unparseable created_at is not rolled up
+        assert totals["conversations"] == 5
+        assert totals["messages"] == 9
+        assert totals["user_messages"] == 5
+        assert totals["characters"] == 4 * len("HelloHi there") + len("abc")
+        assert totals["bots"] == 3
+
+    def test_save_conversation_replaces_contribution(self, database):
+        moved = chat(1, "2024-04-02T12:00:00", bot="GPT-4", category="Writing",
+                                  messages=[("user", "a"), ("user", "b"), ("bot", "c")])
+        database.save_conversation(moved)
+
+        march = database.get_rollups(start="2024-03-01", end="2024-03-31", group_by="day")
+        assert [(row["day"], row["conversations"]) for row in march] == [
+            ("2024-03-04", 1),
+            ("2024-03-10", 1),
+        ]
+        april = database.get_rollups(start="2024-04-01", end="2024-04-30")
+        assert april["conversations"] == 2
+        assert april["user_messages"] == 3
+
+        before = [tuple(row) for row in rollup_rows(database)]
+        database.rebuild_rollups()
+        assert [tuple(row) for row in rollup_rows(database)] == before
+
+    def test_bulk_policies(self, database):
+        database.save_conversations_bulk([chat(3, "2024-03-10T10:00:00")], on_conflict="skip")
+        assert database.get_rollups()["conversations"] == 5
+
+        database.save_conversations_bulk([chat(3, "2024-03-11T10:00:00", messages=[])])
+        assert database.get_rollups()["conversations"] == 5
+        assert database.get_rollups(start="2024-03-10", end="2024-03-10")["conversations"] == 0
+        assert database.get_rollups(start="2024-03-11", end="2024-03-11")["conversations"] == 1
+        assert not [row for row in rollup_rows(database) if row["conversations"] <= 0]
+
+    def test_save_message(self, database):
+        database.save_message(
+            {"id": "msg_extra", "role": "user", "content": "more", "timestamp": "2024-03-04T10:00:00"},
+            "conv_1",
+        )
+        totals = database.get_rollups(start="2024-03-04", end="2024-03-04", bot="Claude")
+        assert totals["user_messages"] == 2
+        assert totals["characters"] == len("HelloHi theremore")
+
+    def test_existing_database_backfilled(self, tmp_path):
+        path = tmp_path / "old.db"
+        Database(f"sqlite:///{path}").save_conversations_bulk(CONVERSATIONS)
+        conn = sqlite3.connect(path)
+        conn.execute("DROP TABLE daily_rollups")
+        conn.commit()
+        conn.close()
+
+        assert Database(f"sqlite:///{path}").get_rollups()["conversations"] == 5
+
+    def test_rollups_without_nonempty_column_rebuilt(self, tmp_path):
+        path = tmp_path / "old.db"
+        Database(f"sqlite:///{path}").save_conversations_bulk(
+            CONVERSATIONS + [chat(7, "2024-03-04T10:00:00", messages=[])]
+        )
+        conn = sqlite3.connect(path)
+        conn.execute("ALTER TABLE daily_rollups DROP COLUMN nonempty")
+        conn.commit()
+        conn.close()
+
+        database = Database(f"sqlite:///{path}")
+        with database._get_connection() as conn:
+            nonempty = conn.execute("SELECT SUM(nonempty) FROM daily_rollups").fetchone()[0]
+        assert nonempty == 5
+
+
+class TestRollupQueries:
+    """Test period queries served from the rollups."""
+
+    @pytest.mark.parametrize("group_by, expected", [
+        ("day", [("2023-06-01", 1), ("2024-03-04", 2), ("2024-03-10", 1), ("2024-04-02", 1)]),
+        ("week", [("2023-05-29", 1), ("2024-03-04", 3), ("2024-04-01", 1)]),
+        ("month", [("2023-06", 1), ("2024-03", 3), ("2024-04", 1)]),
+        ("year", [("2023", 1), ("2024", 4)]),
+        ("bot", [("Claude", 2), ("GPT-4", 2), ("Gemini", 1)]),
+        ("category", [(None, 1), ("Programming", 3), ("Writing", 1)]),
+    ])
+    def test_group_by(self, database, group_by, expected):
+        rows = database.get_rollups(group_by=group_by)
+        assert [(row[group_by], row["conversations"]) for row in rows] == expected
+
+    def test_range_and_filters(self, database):
+        totals = database.get_rollups(start="2024-03-04T18:00:00", end=datetime(2024, 3, 10))
+        assert totals["conversations"] == 3
+        assert database.get_rollups(category="")["conversations"] == 1
+        assert database.get_rollups(bot="GPT-4", category="Writing")["conversations"] == 1
+
+    def test_invalid_arguments(self, database):
+        with pytest.raises(ValueError):
+            database.get_rollups(group_by="hour")
+        with pytest.raises(ValueError):
+            database.get_rollups(start="yesterday")
+
+    def test_get_analytics_period(self, temp_db):
+        now = datetime.now(timezone.utc)
+        temp_db.save_conversations_bulk([
+            chat(1, now.isoformat()),
+            chat(2, (now - timedelta(days=3)).isoformat(), bot="GPT-4",
+                              messages=[("user", "a"), ("bot", "b"), ("user", "c"), ("bot", "d")]),
+            chat(3, (now - timedelta(days=100)).isoformat()),
+        ])
+
+        week = temp_db.get_analytics(period="week")
+        assert week["total_conversations"] == 2
+        assert week["active_bots"] == 2
+        assert week["messages_sent"] == 3
+        assert week["avg_conversation_length"] == 3.0
+
+        assert temp_db.get_analytics(period="year")["total_conversations"] == 3
+
+    def test_get_analytics_keeps_field_meanings(self, temp_db):
+        now = datetime.now(timezone.utc)
+        old = chat(1, (now - timedelta(days=10)).isoformat(), messages=[("user", "a")])
+        # A recent user message in an older conversation counts as sent
+        old["messages"].append({
+            "id": "msg_1_late", "role": "user", "content": "b",
+            "timestamp": (now - timedelta(hours=2)).isoformat(),
+        })
+        old["message_count"] = 2
+        temp_db.save_conversations_bulk([
+            old,
+            chat(2, (now - timedelta(hours=1)).isoformat()),
+            chat(3, (now - timedelta(hours=2)).isoformat(), messages=[]),
+            # Before the start of the day period
+            chat(4, (now - timedelta(hours=30)).isoformat(), bot="GPT-4"),
+        ])
+
+        day = temp_db.get_analytics(period="day")
+        assert day["total_conversations"] == 2
+        assert day["active_bots"] == 1
+        assert day["messages_sent"] == 2
+        # Conversations without messages are not averaged in
+        assert day["avg_conversation_length"] == 2.0
+
+        week = temp_db.get_analytics(period="week")
+        assert week["total_conversations"] == 3
+        assert week["messages_sent"] == 3
+        assert week["characters"] == 2 * len("HelloHi there")
@@ -0,0 +1,134 @@
+"""Tests for parallel per-shard exports."""
+
+import gzip
+import json
+
+import pytest
+
+from poe_search.export.sharded import MANIFEST_NAME, ShardedExporter, shard_name
+from tests.conftest import make_conversation
+
+
+def chat(index, title=None):
+    return make_conversation(
+        index, f"2024-{index % 3 + 1:02d}-05T10:00:00+00:00",
+        f"2024-{index % 3 + 1:02d}-06T10:{index % 60:02d}:00+00:00",
+        bot=["Claude", "GPT-4", "Gemini"][index % 3], title=title or f"Conversation {index}: a/b?",
+        width=4, category=["Programming", "Writing"][index % 2],
+        messages=[
+            {"role": "user", "content": f"Question {index}", "timestamp": "2024-01-05T10:00:00"},
+            {"role": "bot", "content": f"Answer {index}", "timestamp": "2024-01-05T10:01:00"},
+        ],
+    )
+
+
+@pytest.fixture
+def filled_db(temp_db):
+    temp_db.save_conversations_bulk(chat(i) for i in range(12))
+    return temp_db
+
+
+def read_manifest(directory):
+    return json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+
+
+class TestShardNames:
+    """Test deterministic, filesystem-safe shard names."""
+
+    def test_names(self):
+        conversation = chat(4)
+        assert shard_name(conversation, "conversation") == "Conversation 4_ a_b__conv_0004"
+        assert shard_name(conversation, "bot") == "GPT-4"
+        assert shard_name(conversation, "category") == "Programming"
+        assert shard_name(conversation, "month") == "2024-02"
+        assert shard_name({"created_at": None}, "month") == "unknown"
+
+    def test_month_is_the_utc_month_of_any_timestamp(self):
+        assert shard_name({"created_at": "2024/03/05"}, "month") == "2024-03"
+        assert shard_name({"created_at": 1709251200}, "month") == "2024-03"  # 2024-03-01T00:00Z
+        assert shard_name({"created_at": "2024-02-29T23:30:00-05:00"}, "month") == "2024-03"
+        # The stored created_ts wins over the text
+        assert shard_name({"created_at": "garbage", "created_ts": 1709251200000}, "month") == "2024-03"
+
+    def test_unknown_key(self):
+        with pytest.raises(ValueError):
+            shard_name(chat(1), "weekday")
+
+
+class TestShardedExport:
+    """Test writing, skipping and removing shards."""
+
+    def test_one_file_per_conversation(self, filled_db, tmp_path):
+        stats = ShardedExporter(filled_db).export(str(tmp_path), workers=4)
+
+        assert stats == {"conversations": 12, "shards": 12, "written": 12,
+                         "skipped": 0, "removed": 0, "failed": 0}
+        manifest = read_manifest(tmp_path)
+        assert len(manifest["conversations"]) == 12
+        entry = next(c for c in manifest["conversations"] if c["id"] == "conv_0003")
+        text = (tmp_path / entry["file"]).read_text(encoding="utf-8")
+        assert "Question 3" in text and "Question 4" not in text
+
+    @pytest.mark.parametrize("shard_by,files", [
+        ("bot", {"Claude.ndjson", "GPT-4.ndjson", "Gemini.ndjson"}),
+        ("category", {"Programming.ndjson", "Writing.ndjson"}),
+        ("month", {"2024-01.ndjson", "2024-02.ndjson", "2024-03.ndjson"}),
+    ])
+    def test_grouped_shards(self, filled_db, tmp_path, shard_by, files):
+        ShardedExporter(filled_db).export(str(tmp_path), format="ndjson", shard_by=shard_by)
+
+        assert {p.name for p in tmp_path.iterdir()} == files | {MANIFEST_NAME}
+        lines = [
+            json.loads(line)
+            for name in files
+            for line in (tmp_path / name).read_text(encoding="utf-8").splitlines()
+        ]
+        assert sorted(c["id"] for c in lines) == [f"conv_{i:04d}" for i in range(12)]
+
+    def test_reexport_rewrites_only_changed(self, filled_db, tmp_path):
+        exporter = ShardedExporter(filled_db)
+        exporter.export(str(tmp_path), format="json", shard_by="bot")
+        claude = tmp_path / "Claude.json"
+        gemini = tmp_path / "Gemini.json"
+        gemini_mtime = gemini.stat().st_mtime_ns
+
+        filled_db.save_conversations_bulk([chat(0, title="Renamed")])
+        stats = exporter.export(str(tmp_path), format="json", shard_by="bot")
+
+        assert (stats["written"], stats["skipped"]) == (1, 2)
+        assert "Renamed" in claude.read_text(encoding="utf-8")
+        assert gemini.stat().st_mtime_ns == gemini_mtime
+
+        assert exporter.export(str(tmp_path), format="json", shard_by="bot", force=True)["written"] == 3
+
+    def test_missing_file_is_rewritten(self, filled_db, tmp_path):
+        exporter = ShardedExporter(filled_db)
+        exporter.export(str(tmp_path), format="csv", shard_by="category")
+        (tmp_path / "Writing.csv").unlink()
+
+        stats = exporter.export(str(tmp_path), format="csv", shard_by="category")
+        assert (stats["written"], stats["skipped"]) == (1, 1)
+        assert (tmp_path / "Writing.csv").exists()
+
+    def test_stale_shards_removed(self, filled_db, tmp_path):
+        exporter = ShardedExporter(filled_db)
+        exporter.export(str(tmp_path), format="markdown", shard_by="bot")
+
+        stats = exporter.export(str(tmp_path), format="markdown", shard_by="bot", bot="Claude")
+
+        assert stats["removed"] == 2
+        assert {p.name for p in tmp_path.iterdir()} == {"Claude.md", MANIFEST_NAME}
+
+    def test_compressed_process_pool(self, filled_db, tmp_path):
+        stats = ShardedExporter(filled_db).export(
+            str(tmp_path), format="ndjson", shard_by="month",
+            compression="gzip", use_processes=True, workers=2,
+        )
+
+        assert stats["written"] == 3
+        lines = gzip.decompress((tmp_path / "2024-01.ndjson.gz").read_bytes()).splitlines()
+        assert len(lines) == 4
+
+    def test_unsupported_format(self, filled_db, tmp_path):
+        with pytest.raises(ValueError):
+            ShardedExporter(filled_db).export(str(tmp_path), format="parquet")
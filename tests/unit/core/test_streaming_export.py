@@ -0,0 +1,177 @@
+"""Tests for the streaming conversation exporter."""
+
+import csv
+import json
+import tracemalloc
+
+import pytest
+
+from poe_search.export.exporter import ConversationExporter
+from tests.conftest import make_conversation
+
+
+def chat(index, messages=4, content_size=200):
+    return make_conversation(
+        index, f"2024-01-01T10:{index % 60:02d}:00", f"2024-01-02T10:{index % 60:02d}:00",
+        bot="Claude" if index % 2 else "GPT-4",
+        title=f"Conversation {index} – naïve ünïcode",
+        width=6,
+        messages=[
+            {
+                "role": "user" if m % 2 == 0 else "bot",
+                "content": f"Message {m} with *markdown*\nand a newline " + "x" * content_size,
+                "timestamp": f"2024-01-01T10:{m:02d}:00",
+            }
+            for m in range(messages)
+        ],
+    )
+
+
+def fill_database(db, count, **kwargs):
+    """Insert conversations directly, bypassing per-row bot bookkeeping."""
+    with db._get_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO conversations
+            (id, bot, title, created_at, updated_at, message_count, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (c["id"], c["bot"], c["title"], c["created_at"], c["updated_at"],
+                 c["message_count"], json.dumps(c))
+                for c in (chat(i, **kwargs) for i in range(count))
+            ),
+        )
+        conn.commit()
+
+
+class TestStreamingFormats:
+    """Test each format written from an iterable."""
+
+    def test_json_matches_json_dump(self, temp_db, tmp_path):
+        conversations = [chat(i) for i in range(5)]
+        path = tmp_path / "out.json"
+
+        assert ConversationExporter(temp_db).export(conversations, str(path), "json") == 5
+
+        text = path.read_text(encoding="utf-8")
+        data = json.loads(text)
+        expected = json.dumps(
+            {
+                "exported_at": data["exported_at"],
+                "conversation_count": 5,
+                "conversations": conversations,
+            },
+            indent=2,
+            ensure_ascii=False,
+        )
+        assert text == expected
+
+    @pytest.mark.parametrize("conversations", [[], iter([])])
+    def test_empty_json_export(self, temp_db, tmp_path, conversations):
+        path = tmp_path / "empty.json"
+        ConversationExporter(temp_db).export(conversations, str(path), "json")
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["conversations"] == []
+        assert data["conversation_count"] == 0
+
+    def test_json_from_generator_writes_count_last(self, temp_db, tmp_path):
+        path = tmp_path / "gen.json"
+        ConversationExporter(temp_db).export(
+            (chat(i) for i in range(3)), str(path), "json"
+        )
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert list(data) == ["exported_at", "conversations", "conversation_count"]
+        assert data["conversation_count"] == 3
+
+    def test_ndjson(self, temp_db, tmp_path):
+        path = tmp_path / "out.ndjson"
+        ConversationExporter(temp_db).export(
+            (chat(i) for i in range(3)), str(path), "ndjson"
+        )
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["conv_000000", "conv_000001", "conv_000002"]
+
+    def test_csv_one_row_per_message(self, temp_db, tmp_path):
+        path = tmp_path / "out.csv"
+        conversations = [chat(0), chat(1, messages=0)]
+        ConversationExporter(temp_db).export(iter(conversations), str(path), "csv")
+
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0][0] == "conversation_id"
+        assert len(rows) == 1 + 4 + 1
+        assert rows[1][8].startswith("Message 0 with *markdown*\nand a newline")
+
+    def test_markdown(self, temp_db, tmp_path):
+        path = tmp_path / "out.md"
+        ConversationExporter(temp_db).export([chat(0)], str(path), "markdown")
+
+        text = path.read_text(encoding="utf-8")
+        assert "Total conversations: 1\n\n---\n\n## Conversation 1:" in text
+        assert "\\*markdown\\*" in text
+
+    def test_unsupported_format(self, temp_db, tmp_path):
+        with pytest.raises(ValueError):
+            ConversationExporter(temp_db).export([], str(tmp_path / "out.xml"), "xml")
+
+
+class TestExportFromDatabase:
+    """Test streaming straight from the database."""
+
+    def test_filters_and_order(self, temp_db, tmp_path):
+        fill_database(temp_db, 20)
+        path = tmp_path / "claude.ndjson"
+
+        count = ConversationExporter(temp_db).export_from_database(
+            str(path), "ndjson", chunk_size=3, bot="Claude"
+        )
+
+        exported = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert count == len(exported) == 10
+        assert {c["bot"] for c in exported} == {"Claude"}
+        assert exported[0]["messages"][0]["id"].endswith("_0")
+
+    def test_single_conversation(self, temp_db, tmp_path):
+        fill_database(temp_db, 5)
+        path = tmp_path / "one.json"
+
+        ConversationExporter(temp_db).export_from_database(
+            str(path), "json", conversation_id="conv_000003"
+        )
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["conversation_count"] == 1
+        assert data["conversations"][0]["id"] == "conv_000003"
+
+
+class TestExportMemoryBenchmark:
+    """Peak memory of a streamed export must not grow with archive size."""
+
+    def _peak(self, db, path, format):
+        tracemalloc.start()
+        try:
+            ConversationExporter(db).export_from_database(str(path), format, chunk_size=100)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    @pytest.mark.parametrize("format", ["json", "ndjson", "csv", "markdown"])
+    def test_peak_memory_constant(self, temp_db, tmp_path, format):
+        fill_database(temp_db, 200)
+        small_peak = self._peak(temp_db, tmp_path / f"small.{format}", format)
+
+        fill_more = 3000
+        with temp_db._get_connection() as conn:
+            conn.execute("DELETE FROM conversations")
+            conn.commit()
+        fill_database(temp_db, fill_more)
+        large_peak = self._peak(temp_db, tmp_path / f"large.{format}", format)
+
+        archive_size = (tmp_path / f"large.{format}").stat().st_size
+        # 15x the data, roughly the same peak; far below the archive size
+        assert large_peak < small_peak * 1.5 + 256 * 1024
+        assert large_peak < archive_size / 5
@@ -0,0 +1,169 @@
+"""Tests for the background sync daemon."""
+
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from poe_search.sync.daemon import SyncDaemon, SyncLock, SyncLockError, query_daemon
+
+
+class FakeDatabase:
+    """Database holding at most one unfinished sync job."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.unfinished_job = None
+
+    def get_resumable_sync_job(self):
+        return self.unfinished_job
+
+
+class FakeClient:
+    """Client whose syncs block until released."""
+
+    def __init__(self, db_path):
+        self.database = FakeDatabase(db_path)
+        self.release = threading.Event()
+        self.syncs = 0
+        self.resumes = []
+
+    def resume_sync(self, job_id, **options):
+        # The job keeps failing: it stays unfinished
+        self.resumes.append(job_id)
+        return {"job_id": job_id, "new": 0, "updated": 0, "failed": 1,
+                "skipped": 1, "total": 2, "status": self.database.unfinished_job["status"]}
+
+    def sync(self, days, limit, progress_callback, on_synced, should_stop):
+        self.syncs += 1
+        progress_callback("Syncing conversation 1/2", 0)
+        on_synced({"id": "a"})
+        self.release.wait(5)
+        on_synced({"id": "b"})
+        return {"job_id": self.syncs, "new": 2, "updated": 0, "failed": 0,
+                "skipped": 0, "total": 2, "status": "completed"}
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def workdir():
+    # Short path: Unix socket paths are limited to ~100 characters
+    path = Path(tempfile.mkdtemp(prefix="poe"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class TestSyncLock:
+    """Test the database file lock."""
+
+    def test_second_holder_rejected(self, workdir):
+        first = SyncLock(workdir / "poe.db")
+        second = SyncLock(workdir / "poe.db")
+
+        with first:
+            with pytest.raises(SyncLockError):
+                second.acquire()
+        second.acquire()
+        assert second.locked
+        second.release()
+
+
+class TestSyncDaemon:
+    """Test scheduling, coalescing and the status endpoint."""
+
+    def _start(self, workdir, client, **kwargs):
+        sync_daemon = SyncDaemon(client, socket_path=workdir / "d.sock", **kwargs)
+        thread = threading.Thread(target=sync_daemon.run, daemon=True)
+        thread.start()
+        assert wait_for(lambda: (workdir / "d.sock").exists())
+        return sync_daemon, thread
+
+    def test_triggers_coalesce_while_syncing(self, workdir):
+        client = FakeClient(workdir / "poe.db")
+        sync_daemon, thread = self._start(workdir, client, interval=3600)
+        socket_path = workdir / "d.sock"
+
+        assert wait_for(lambda: client.syncs == 1)
+        status = query_daemon("status", socket_path)["status"]
+        assert status["state"] == "syncing"
+        assert status["current"]["synced"] == 1
+        assert status["progress"]["message"] == "Syncing conversation 1/2"
+
+        # First trigger queues a follow-up run, the rest are coalesced into it
+        assert query_daemon("sync", socket_path)["queued"] is True
+        assert query_daemon("sync", socket_path)["queued"] is False
+        assert query_daemon("sync", socket_path)["queued"] is False
+
+        client.release.set()
+        assert wait_for(lambda: sync_daemon.status["runs"] == 2)
+        status = query_daemon("status", socket_path)["status"]
+        assert client.syncs == 2
+        assert client.resumes == []
+        assert status["coalesced_triggers"] == 2
+        assert status["conversations_synced"] == 4
+        assert status["throughput"] > 0
+        assert status["last_run"]["stats"]["new"] == 2
+
+        assert query_daemon("stop", socket_path)["ok"]
+        thread.join(5)
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+        assert not sync_daemon.lock.locked
+
+    def test_runs_on_interval(self, workdir):
+        client = FakeClient(workdir / "poe.db")
+        client.release.set()
+        sync_daemon, thread = self._start(workdir, client, interval=0.05, run_on_start=False)
+
+        assert wait_for(lambda: client.syncs >= 2)
+        sync_daemon.stop()
+        thread.join(5)
+        assert not thread.is_alive()
+
+    def test_failed_job_does_not_block_new_syncs(self, workdir):
+        client = FakeClient(workdir / "poe.db")
+        client.release.set()
+        client.database.unfinished_job = {"id": 7, "status": "failed"}
+        sync_daemon = SyncDaemon(client, max_failed_resumes=2)
+
+        for _ in range(4):
+            sync_daemon._run_sync()
+
+        # Every run looks for new conversations; the failed job is retried twice
+        assert client.syncs == 4
+        assert client.resumes == [7, 7]
+        assert sync_daemon.status["last_run"]["resumed"] is None
+        assert sync_daemon.status["failed_runs"] == 2
+
+    def test_interrupted_job_is_always_resumed(self, workdir):
+        client = FakeClient(workdir / "poe.db")
+        client.release.set()
+        client.database.unfinished_job = {"id": 3, "status": "interrupted"}
+        sync_daemon = SyncDaemon(client, max_failed_resumes=0)
+
+        sync_daemon._run_sync()
+        sync_daemon._run_sync()
+        assert client.resumes == [3, 3]
+        assert client.syncs == 2
+        assert sync_daemon.status["last_run"]["resumed"]["job_id"] == 3
+
+    def test_refuses_locked_database(self, workdir):
+        client = FakeClient(workdir / "poe.db")
+        with SyncLock(workdir / "poe.db"):
+            with pytest.raises(SyncLockError):
+                SyncDaemon(client, socket_path=workdir / "d.sock").run()
+
+    def test_unknown_command(self, workdir):
+        sync_daemon = SyncDaemon(FakeClient(workdir / "poe.db"))
+        assert sync_daemon.handle_command("reboot")["ok"] is False
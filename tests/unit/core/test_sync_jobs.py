@@ -0,0 +1,192 @@
+"""Tests for resumable, checkpointed sync jobs."""
+
+import pytest
+
+from poe_search.sync.jobs import RetryPolicy, SyncJobRunner
+from tests.conftest import make_conversation
+
+
+class FakeClock:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class Fetcher:
+    """Fetch function that fails according to a script."""
+
+    def __init__(self, failures=None):
+        self.failures = dict(failures or {})
+        self.calls = []
+
+    def __call__(self, item):
+        conversation_id = item["conversation_id"]
+        self.calls.append(conversation_id)
+        remaining = self.failures.get(conversation_id)
+        if remaining:
+            error, count = remaining
+            if count:
+                self.failures[conversation_id] = (error, count - 1)
+                raise error
+        return make_conversation(conversation_id, bot="a2", messages=[("user", "Hello")])
+
+
+def make_runner(db, fetch, clock, **kwargs):
+    kwargs.setdefault("retry_policy", RetryPolicy(max_attempts=3, base_delay=5, max_delay=60))
+    return SyncJobRunner(db, fetch, sleep=clock.sleep, clock=clock.time, **kwargs)
+
+
+class TestRetryPolicy:
+    """Test backoff calculation."""
+
+    def test_exponential_backoff_is_capped(self):
+        policy = RetryPolicy(base_delay=5, max_delay=30)
+        assert [policy.delay(n) for n in range(1, 6)] == [5, 10, 20, 30, 30]
+
+    def test_from_settings_without_retries(self):
+        class Settings:
+            retry_failed_syncs = False
+            max_retry_attempts = 5
+
+        assert RetryPolicy.from_settings(Settings()).max_attempts == 1
+
+
+class TestSyncJobRunner:
+    """Test running and resuming sync jobs."""
+
+    def test_start_checkpoints_and_syncs(self, temp_db):
+        clock = FakeClock()
+        synced = []
+        runner = make_runner(temp_db, Fetcher(), clock, on_synced=synced.append)
+
+        stats = runner.start(["a", "b", {"id": "c", "url": "https://poe.com/chat/c"}, "a"])
+
+        assert stats["status"] == "completed"
+        assert stats["new"] == 3 and stats["total"] == 3
+        assert [c["id"] for c in synced] == ["a", "b", "c"]
+        job = temp_db.get_sync_job(stats["job_id"])
+        assert job["status"] == "completed" and job["finished_at"]
+        assert job["counts"] == {"done": 3}
+        assert temp_db.get_sync_job_items(stats["job_id"])[2]["url"] == "https://poe.com/chat/c"
+
+    def test_failed_items_retried_with_backoff(self, temp_db):
+        clock = FakeClock()
+        fetch = Fetcher({"b": (ConnectionError("network drop"), 2)})
+        stats = make_runner(temp_db, fetch, clock).start(["a", "b", "c"])
+
+        assert stats["status"] == "completed"
+        assert fetch.calls == ["a", "b", "c", "b", "b"]
+        assert sum(clock.slept) == pytest.approx(5 + 10)
+        item = temp_db.get_sync_job_items(stats["job_id"])[1]
+        assert item["attempts"] == 3 and item["status"] == "done"
+
+    def test_exhausted_retries_leave_job_resumable(self, temp_db):
+        clock = FakeClock()
+        fetch = Fetcher({"b": (RuntimeError("rate limit"), 3)})
+        stats = make_runner(temp_db, fetch, clock).start(["a", "b"])
+
+        assert stats["status"] == "failed"
+        assert stats["failed"] == 1
+        assert temp_db.get_resumable_sync_job()["id"] == stats["job_id"]
+
+        # Resume retries only the failed conversation
+        fetch.calls.clear()
+        stats = make_runner(temp_db, fetch, clock).resume()
+        assert fetch.calls == ["b"]
+        assert stats["status"] == "completed"
+        assert stats["skipped"] == 1 and stats["new"] == 1
+        assert temp_db.get_resumable_sync_job() is None
+
+    def test_resume_after_crash(self, temp_db):
+        clock = FakeClock()
+        fetch = Fetcher({"c": (KeyboardInterrupt(), 1)})
+
+        with pytest.raises(KeyboardInterrupt):
+            make_runner(temp_db, fetch, clock).start(["a", "b", "c", "d"])
+
+        job = temp_db.get_resumable_sync_job()
+        assert job["status"] == "interrupted"
+        assert job["counts"] == {"done": 2, "pending": 2}
+
+        fetch.calls.clear()
+        stats = make_runner(temp_db, fetch, clock).resume()
+        assert fetch.calls == ["c", "d"]
+        assert stats["skipped"] == 2 and stats["new"] == 2
+        assert temp_db.get_conversation_count() == 4
+
+    def test_stop_request_interrupts_job(self, temp_db):
+        clock = FakeClock()
+        fetch = Fetcher()
+        runner = make_runner(temp_db, fetch, clock, should_stop=lambda: len(fetch.calls) >= 1)
+
+        stats = runner.start(["a", "b"])
+
+        assert stats["status"] == "interrupted"
+        assert temp_db.get_sync_job(stats["job_id"])["counts"] == {"done": 1, "pending": 1}
+
+    def test_resume_without_jobs(self, temp_db):
+        assert make_runner(temp_db, Fetcher(), FakeClock()).resume() is None
+
+    def test_existing_conversations_counted_as_updated(self, temp_db):
+        temp_db.save_conversation(make_conversation("a", bot="a2", messages=[("user", "Hello")]))
+        stats = make_runner(temp_db, Fetcher(), FakeClock()).start(["a", "b"])
+
+        assert stats["updated"] == 1 and stats["new"] == 1
+
+
+class TestPoeSearchClientSync:
+    """Test the client-level sync entry points."""
+
+    def test_sync_and_resume(self, temp_db):
+        from datetime import datetime
+        from unittest.mock import Mock
+
+        from poe_search.api.client import Conversation, Message
+        from poe_search.client import PoeSearchClient
+
+        broken = {"flaky"}
+
+        def details(url):
+            if url.rsplit("/", 1)[-1] in broken:
+                raise ConnectionError("driver died")
+            stamp = datetime(2024, 1, 1, 10, 0)
+            return Conversation(
+                id=url.rsplit("/", 1)[-1], title="Sorting", bot="Claude-3-Opus",
+                messages=[Message("user", "How do I sort?", stamp),
+                          Message("assistant", "Use sorted().", stamp, "Claude-3-Opus", "m2")],
+                created_at=stamp, url=url,
+            )
+
+        api = Mock()
+        api.get_conversation_list.return_value = [
+            {"id": "ok", "url": "https://poe.com/chat/ok", "title": "Sorting"},
+            {"id": "flaky", "url": "https://poe.com/chat/flaky", "title": "Flaky"},
+        ]
+        api.get_conversation_details.side_effect = details
+
+        client = PoeSearchClient()
+        client._database = temp_db
+        client._api_client = api
+        client.config = Mock(sync=Mock(retry_failed_syncs=False))
+
+        stats = client.sync(days=7, limit=10)
+        assert stats["new"] == 1 and stats["failed"] == 1 and stats["status"] == "failed"
+
+        stored = temp_db.get_conversation("ok")
+        assert stored["message_count"] == 2
+        assert [m["role"] for m in stored["messages"]] == ["user", "bot"]
+        assert [m["id"] for m in stored["messages"]] == ["ok_0", "m2"]
+
+        broken.clear()
+        stats = client.resume_sync()
+        assert stats["status"] == "completed" and stats["skipped"] == 1
+        assert client.resume_sync() is None
@@ -0,0 +1,142 @@
+"""Tests for the learned TF-IDF category classifier."""
+
+import random
+
+import pytest
+
+pytest.importorskip("sklearn")
+
+from poe_search.search.categorizer import BatchCategorizer, RuleCategorizer  # noqa: E402
+from poe_search.search.classifier import TextClassifier, evaluate  # noqa: E402
+from tests.conftest import make_conversation  # noqa: E402
+
+# Topic words, some of them rule keywords; "Cooking" has no keyword rule at all
+VOCABULARY = {
+    "Technical": ["python", "debug", "stack trace", "refactor", "compiler", "docker", "regex"],
+    "Medical": ["doctor", "symptom", "blood pressure", "migraine", "vaccine", "fever"],
+    "Cooking": ["recipe", "oven", "simmer", "garlic", "sourdough", "braise", "marinade"],
+    "Business": ["marketing", "finance", "quarterly", "invoice", "stakeholder", "roadmap"],
+}
+FILLER = ["please", "could", "you", "explain", "this", "again", "thanks", "today", "about", "my"]
+
+
+def make_text(rng, category, words=40):
+    topic = VOCABULARY[category]
+    return " ".join(rng.choice(topic) if rng.random() < 0.25 else rng.choice(FILLER) for _ in range(words))
+
+
+def make_dataset(count, seed=0):
+    rng = random.Random(seed)
+    categories = sorted(VOCABULARY)
+    labels = [categories[i % len(categories)] for i in range(count)]
+    return [make_text(rng, label) for label in labels], labels
+
+
+def chat(index, text, category):
+    return make_conversation(index, "2024-03-04T09:00:00", title="", width=5,
+                             category=category, messages=[("user", text)])
+
+
+@pytest.fixture
+def trained():
+    texts, labels = make_dataset(400)
+    classifier = TextClassifier(n_features=2 ** 16)
+    classifier.fit(texts, labels)
+    return classifier
+
+
+class TestTextClassifier:
+    """Test training, prediction and persistence."""
+
+    def test_predicts_with_confidence(self, trained):
+        texts, labels = make_dataset(100, seed=1)
+        predictions = trained.predict(texts + [""])
+        assert predictions[-1] == (None, 0.0)
+        assert sum(category == label for (category, _), label in zip(predictions, labels)) >= 95
+        assert all(0.0 < confidence <= 1.0 for _, confidence in predictions[:-1])
+        assert trained.categorize("simmer the garlic in the oven")[0] == "Cooking"
+
+    def test_needs_two_categories(self):
+        with pytest.raises(ValueError):
+            TextClassifier().fit(["a", "b"], ["Cooking", "Cooking"])
+
+    def test_partial_fit(self, trained):
+        version = trained.version
+        trained.partial_fit(["invoice budget"], ["Business"])
+        assert trained.version != version
+        with pytest.raises(ValueError):
+            trained.partial_fit(["a poem"], ["Poetry"])
+
+    def test_save_and_load(self, trained, tmp_path):
+        path = tmp_path / "model.pkl"
+        trained.save(path)
+        loaded = TextClassifier.load(path)
+        texts, _ = make_dataset(20, seed=2)
+        assert loaded.predict(texts) == trained.predict(texts)
+        assert loaded.version == trained.version
+
+    def test_load_refuses_other_format(self, trained, tmp_path):
+        import pickle
+
+        path = tmp_path / "model.pkl"
+        path.write_bytes(pickle.dumps({"format": 0, "classifier": trained}))
+        with pytest.raises(ValueError):
+            TextClassifier.load(path)
+
+
+class TestTrainFromDatabase:
+    """Test training from labelled conversations and incremental retraining."""
+
+    @pytest.fixture
+    def database(self, temp_db):
+        texts, labels = make_dataset(200)
+        temp_db.save_conversations_bulk([
+            chat(i, text, label) for i, (text, label) in enumerate(zip(texts, labels))
+        ])
+        return temp_db
+
+    def test_incremental_retraining(self, database):
+        classifier = TextClassifier(n_features=2 ** 16)
+        assert classifier.train(database)["mode"] == "full"
+        assert classifier.train(database)["mode"] == "unchanged"
+
+        rng = random.Random(5)
+        database.save_conversation(chat(500, make_text(rng, "Cooking"), "Cooking"))
+        stats = classifier.train(database)
+        assert (stats["mode"], stats["new"], stats["examples"]) == ("incremental", 1, 201)
+
+        # A new category, or a relabelled example, needs a full training
+        database.save_conversation(chat(501, "sonnet stanza rhyme", "Poetry"))
+        assert classifier.train(database)["mode"] == "full"
+        database.update_conversation_category("conv_00000", "Medical")
+        assert classifier.train(database)["mode"] == "full"
+
+    def test_categorized_conversations_are_not_examples(self, database):
+        classifier = TextClassifier(n_features=2 ** 16)
+        classifier.train(database)
+        database.save_conversation(chat(600, "garlic oven recipe", None))
+        BatchCategorizer(database, categorizer=classifier, workers=1).run()
+
+        assert database.get_conversation("conv_00600")["category"] == "Cooking"
+        assert classifier.train(database)["mode"] == "unchanged"
+
+
+def test_compare_with_rules():
+    """The classifier is more accurate than the keyword rules, and faster on long texts."""
+    train_texts, train_labels = make_dataset(2000)
+    test_texts, test_labels = make_dataset(1000, seed=3)
+    test_texts = [text + " " + " ".join(FILLER * 20) for text in test_texts]
+
+    classifier = TextClassifier()
+    classifier.fit(train_texts, train_labels)
+
+    learned = evaluate(classifier, test_texts, test_labels)
+    rules = evaluate(RuleCategorizer(), test_texts, test_labels)
+    print(
+        f"\nclassifier: {learned['accuracy']:.0%} accurate in {learned['seconds']:.2f} s, "
+        f"rules: {rules['accuracy']:.0%} accurate in {rules['seconds']:.2f} s"
+    )
+
+    assert learned["accuracy"] > 0.95
+    assert learned["accuracy"] > rules["accuracy"] + 0.3
+    assert learned["seconds"] < rules["seconds"]
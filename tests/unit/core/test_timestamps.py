@@ -0,0 +1,179 @@
+"""Tests for the epoch-millisecond timestamp columns."""
+
+import sqlite3
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from poe_search.search.engine import SearchEngine
+from poe_search.storage.database import Database
+from poe_search.utils.timestamps import format_epoch_ms, from_epoch_ms, to_epoch_ms
+from tests.conftest import make_conversation
+
+MARCH_30 = int(datetime(2024, 3, 30, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def chat(index, created_at, updated_at=None, bot="Claude"):
+    return make_conversation(index, created_at, updated_at, bot=bot,
+                             messages=[("user", f"Message {index}")])
+
+
+# Mixed formats, as they arrive from the API, imports and the sample data
+CONVERSATIONS = [
+    chat(1, "2024-03-30T00:00:00Z", "2024-04-02T08:00:00Z"),
+    chat(2, "2024-03-30 12:00:00", "2024-04-01T09:00:00+02:00"),
+    chat(3, "2024-01-15T10:00:00+00:00", "2024-04-03T00:00:00", bot="GPT-4"),
+    chat(4, "2023-06-01T10:00:00.123456", "2023-06-02T10:00:00"),
+    chat(5, "not a date", "also not a date"),
+]
+
+
+@pytest.fixture
+def database(temp_db):
+    temp_db.save_conversations_bulk(CONVERSATIONS)
+    return temp_db
+
+
+class TestParser:
+    """Test the canonical timestamp parser."""
+
+    @pytest.mark.parametrize("value", [
+        "2024-03-30T00:00:00Z",
+        "2024-03-30T00:00:00+00:00",
+        "2024-03-30T02:00:00+02:00",
+        "2024-03-30T00:00:00",
+        "2024-03-30 00:00:00",
+        "2024/03/30",
+        "2024-03-30",
+        " 2024-03-30T00:00:00Z ",
+        datetime(2024, 3, 30),
+        datetime(2024, 3, 30, tzinfo=timezone.utc),
+        date(2024, 3, 30),
+        MARCH_30,
+        MARCH_30 / 1000,
+        str(MARCH_30 // 1000),
+    ])
+    def test_formats(self, value):
+        assert to_epoch_ms(value) == MARCH_30
+
+    @pytest.mark.parametrize("value", [None, "", "garbage", True, [], "2024-13-45"])
+    def test_unparseable(self, value):
+        assert to_epoch_ms(value) is None
+
+    def test_formatting(self):
+        assert from_epoch_ms(MARCH_30) == datetime(2024, 3, 30, tzinfo=timezone.utc)
+        assert from_epoch_ms(None) is None
+        assert format_epoch_ms(MARCH_30 + 90 * 60 * 1000) == "2024-03-30 01:30"
+        assert format_epoch_ms(None, default="n/a") == "n/a"
+
+
+class TestColumns:
+    """Test that ingest and migration populate the integer columns."""
+
+    def test_populated_on_ingest(self, database):
+        with database._get_connection() as conn:
+            conversations = dict(conn.execute("SELECT id, updated_ts FROM conversations").fetchall())
+            messages = dict(conn.execute("SELECT id, ts FROM messages").fetchall())
+
+        assert conversations["conv_2"] == to_epoch_ms("2024-04-01T07:00:00Z")
+        assert conversations["conv_5"] is None
+        assert messages["conv_2_0"] == MARCH_30 + 12 * 60 * 60 * 1000
+        assert messages["conv_4_0"] == to_epoch_ms("2023-06-01T10:00:00.123Z")
+
+        conversation = database.get_conversation("conv_1")
+        assert conversation["created_ts"] == MARCH_30
+
+    def test_save_conversation_and_message(self, temp_db):
+        temp_db.save_conversation(chat(1, "2024-03-30T00:00:00Z"))
+        temp_db.save_message(
+            {"id": "msg_extra", "role": "bot", "content": "Hi", "timestamp": "2024-03-30 00:00:05"},
+            "conv_1",
+        )
+        with temp_db._get_connection() as conn:
+            rows = conn.execute("SELECT id, ts FROM messages ORDER BY ts").fetchall()
+        assert [tuple(row) for row in rows] == [("conv_1_0", MARCH_30), ("msg_extra", MARCH_30 + 5000)]
+        assert temp_db.get_conversations()[0]["updated_ts"] == MARCH_30
+
+    def test_existing_database_backfilled(self, tmp_path):
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE conversations (
+                id TEXT PRIMARY KEY, bot TEXT NOT NULL, title TEXT,
+                created_at TEXT NOT NULL, updated_at TEXT NOT NULL,
+                message_count INTEGER DEFAULT 0, data TEXT, UNIQUE(id)
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE messages (
+                id TEXT PRIMARY KEY, conversation_id TEXT NOT NULL, role TEXT NOT NULL,
+                content TEXT NOT NULL, timestamp TEXT NOT NULL, bot TEXT, data TEXT, UNIQUE(id)
+            )
+        """)
+        conn.execute(
+            "INSERT INTO conversations VALUES ('c1', 'Claude', 't', ?, ?, 1, '{}')",
+            ("2024-03-30T00:00:00Z", "2024-03-30 10:00:00"),
+        )
+        conn.execute(
+            "INSERT INTO messages VALUES ('m1', 'c1', 'user', 'x', '2024-03-30T00:00:00', NULL, '{}')"
+        )
+        conn.commit()
+        conn.close()
+
+        database = Database(f"sqlite:///{path}")
+        with database._get_connection() as conn:
+            assert tuple(conn.execute("SELECT created_ts, updated_ts FROM conversations").fetchone()) == (
+                MARCH_30, MARCH_30 + 10 * 60 * 60 * 1000
+            )
+            assert conn.execute("SELECT ts FROM messages").fetchone()[0] == MARCH_30
+
+
+class TestQueries:
+    """Test that filtering and sorting compare integers in SQL."""
+
+    def test_sorted_by_updated_ts(self, database):
+        # Text order would put conv_2 ("2024-04-01T09:00:00+02:00") after conv_3
+        ids = [c["id"] for c in database.get_conversations()]
+        assert ids == ["conv_3", "conv_1", "conv_2", "conv_4", "conv_5"]
+        assert [c["id"] for c in database.iter_conversations(limit=2)] == ["conv_3", "conv_1"]
+
+    def test_date_range(self, database):
+        march_30 = database.get_conversations(start="2024-03-30", end=datetime(2024, 3, 30, 23, 59))
+        assert {c["id"] for c in march_30} == {"conv_1", "conv_2"}
+        assert database.count_conversations(end="2024-03-30T00:00:00Z") == 3
+        assert database.count_conversations(start=MARCH_30, bot="GPT-4") == 0
+        with pytest.raises(ValueError):
+            database.get_conversations(start="garbage")
+
+    def test_days_filter(self, temp_db):
+        now = datetime.now(timezone.utc)
+        temp_db.save_conversations_bulk([
+            chat(1, (now - timedelta(days=2)).isoformat()),
+            chat(2, (now - timedelta(days=10)).strftime("%Y-%m-%d %H:%M:%S")),
+        ])
+        assert [c["id"] for c in temp_db.get_conversations(days=7)] == ["conv_1"]
+        assert temp_db.count_conversations(days=30) == 2
+
+    def test_search_by_date_range_reaches_old_conversations(self, database):
+        engine = SearchEngine(database)
+        results = engine.search_by_date_range(
+            datetime(2023, 1, 1, tzinfo=timezone.utc), datetime(2023, 12, 31), limit=1
+        )
+        assert [r["id"] for r in results] == ["conv_4"]
+
+    def test_filters_use_indexes(self, database):
+        where, params = database._conversation_filters(start=MARCH_30)
+        with database._get_connection() as conn:
+            range_plan = " ".join(
+                row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT id FROM conversations" + where, params
+                )
+            )
+            sort_plan = " ".join(
+                row[3] for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM conversations ORDER BY updated_ts DESC LIMIT 10"
+                )
+            )
+        assert "created_ts" in range_plan
+        assert "idx_conversations_updated_ts" in sort_plan
+        assert "TEMP B-TREE" not in sort_plan
@@ -0,0 +1,62 @@
+"""Tests for the startup timeline and the database warm-up."""
+
+from poe_search.gui.startup import FIRST_PAINT, INTERACTIVE, StartupTimeline
+
+
+def make_clock(*times):
+    ticks = iter(times)
+    return lambda: next(ticks)
+
+
+class TestStartupTimeline:
+    """Test recording and logging startup phases."""
+
+    def test_marks_are_relative_to_the_start(self):
+        timeline = StartupTimeline(clock=make_clock(0.0, 0.2, 0.5, 0.6, 0.9))
+        assert timeline.mark("application") == 0.2
+        assert timeline.mark("window") == 0.5
+        assert timeline.mark("window") == 0.5  # The first time counts
+        timeline.mark(FIRST_PAINT)
+        timeline.mark(INTERACTIVE)
+
+        assert timeline.time_to_first_paint == 0.6
+        assert timeline.time_to_interactive == 0.9
+        assert timeline.summary() == (
+            "GUI startup: application 0.200 s, window 0.500 s, first_paint 0.600 s, interactive 0.900 s"
+        )
+
+    def test_later_phases_are_logged(self, caplog):
+        timeline = StartupTimeline("Launcher", clock=make_clock(0.0, 0.1, 0.3, 1.2))
+        with caplog.at_level("INFO", logger="poe_search.gui.startup"):
+            timeline.mark("window")
+            timeline.mark(INTERACTIVE)
+            timeline.mark("database_ready")
+        assert [record.getMessage() for record in caplog.records] == [
+            "Launcher startup: database_ready at 1.200 s"
+        ]
+
+    def test_empty_summary(self):
+        assert StartupTimeline(clock=make_clock(0.0)).summary() == "GUI startup: no phases"
+        assert StartupTimeline(clock=make_clock(0.0)).time_to_interactive is None
+
+
+def test_database_warm_up(temp_db):
+    assert temp_db.warm_up() == {"conversations": 0, "messages": 0, "bots": 0}
+
+    created_at = "2024-03-04T09:00:00"
+    temp_db.save_conversations_bulk([
+        {
+            "id": f"conv_{i}",
+            "bot": "Claude" if i % 2 else "GPT-4",
+            "title": f"Chat {i}",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "message_count": 2,
+            "messages": [
+                {"id": f"msg_{i}_{j}", "role": "user", "content": "Hi", "timestamp": created_at}
+                for j in range(2)
+            ],
+        }
+        for i in range(5)
+    ])
+    assert temp_db.warm_up() == {"conversations": 5, "messages": 10, "bots": 2}
@@ -13,6 +13,7 @@ import sys
 import os
 import asyncio
 import logging
+import tempfile
 from pathlib import Path
 
 # Add the src directory to the Python path
@@ -80,21 +81,15 @@ def test_direct_api_client():
         logger.error(traceback.format_exc())
         return False
 
-def test_database_manager():
+def test_database_manager(tmp_path):
     """Test the database manager functionality."""
     logger.info("=== Testing Database Manager ===")
     
     try:
         from poe_search.storage.database_manager import DatabaseManager
         
-        # Use test database
-        test_db_path = project_root / "data" / "test_sync.db"
-        test_db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Remove existing test database
-        if test_db_path.exists():
-            test_db_path.unlink()
-            
+        # Use a throwaway test database
+        test_db_path = Path(tmp_path) / "test_sync.db"
         db_manager = DatabaseManager(str(test_db_path))
         logger.info("✅ Database manager created")
         
@@ -141,7 +136,7 @@ def test_database_manager():
         logger.error(traceback.format_exc())
         return False
 
-def test_sync_worker():
+def test_sync_worker(tmp_path):
     """Test the sync worker functionality."""
     logger.info("=== Testing Sync Worker ===")
     
@@ -168,14 +163,8 @@ def test_sync_worker():
             'p_b_cookie': tokens['p_b']
         }
         
-        # Create database manager
-        test_db_path = project_root / "data" / "test_sync_worker.db"
-        test_db_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Remove existing test database
-        if test_db_path.exists():
-            test_db_path.unlink()
-            
+        # Create database manager on a throwaway database
+        test_db_path = Path(tmp_path) / "test_sync_worker.db"
         db_manager = DatabaseManager(str(test_db_path))
         
         # Create sync worker
@@ -247,11 +236,12 @@ def main():
     """Run all sync tests."""
     logger.info("Starting sync functionality tests...")
     
-    results = {
-        "Direct API Client": test_direct_api_client(),
-        "Database Manager": test_database_manager(),
-        "Sync Worker": test_sync_worker()
-    }
+    with tempfile.TemporaryDirectory() as tmp_path:
+        results = {
+            "Direct API Client": test_direct_api_client(),
+            "Database Manager": test_database_manager(tmp_path),
+            "Sync Worker": test_sync_worker(tmp_path)
+        }
     
     logger.info("\n=== Test Results ===")
     all_passed = True